@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Benchmark the replay compression codecs.
+
+Every replay in `replays/` (or the files given on the command line) is
+serialised once and then compressed/decompressed in memory with each codec
+spec. Compress time, decompress time and ratio are averaged over all inputs.
+When no replays exist a synthetic ten-minute session is generated instead.
+
+Usage:
+    python .development/benchmark_replay_codecs.py
+    python .development/benchmark_replay_codecs.py replays/replay_123.json.gz
+    python .development/benchmark_replay_codecs.py --codecs none gzip:1 lzma:6
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# pylint: disable=wrong-import-position
+from modul.replay_system import (ReplayManager, ReplayRecorder, _open_replay,
+                                 parse_compression)
+
+DEFAULT_SPECS = ["none", "gzip:1", "gzip:6", "gzip:9", "bz2:9", "lzma:0", "lzma:6"]
+
+
+def synthetic_replay_bytes(seconds: int = 600) -> bytes:
+    """Return the JSON payload of a generated replay."""
+    rng = random.Random(42)
+    recorder = ReplayRecorder(compression="none")
+    recorder.start_recording("normal", "standard")
+    recorder.start_time = 0.0
+    asteroids = [{"x": rng.uniform(0, 1280), "y": rng.uniform(0, 720), "radius": 40} for _ in range(12)]
+    for i in range(seconds * 30):
+        for asteroid in asteroids:
+            asteroid["x"] = (asteroid["x"] + rng.uniform(-3, 3)) % 1280
+            asteroid["y"] = (asteroid["y"] + rng.uniform(-3, 3)) % 720
+        recorder.record_frame({
+            "player_x": 640 + 200 * rng.random(), "player_y": 360 + 100 * rng.random(),
+            "player_rotation": rng.uniform(0, 360), "player_vx": rng.uniform(-5, 5),
+            "player_vy": rng.uniform(-5, 5), "score": i * 3, "lives": 3, "level": 1 + i // 1800,
+            "asteroids": asteroids,
+        }, i / 30)
+    replay_data = {"metadata": recorder.metadata, "frames": [vars(f) for f in recorder.frames], "events": []}
+    return json.dumps(replay_data, separators=(",", ":")).encode("utf-8")
+
+
+def load_payloads(paths):
+    """Read the decompressed JSON bytes of every replay in `paths`."""
+    payloads = []
+    for path in paths:
+        with _open_replay(path, "rb") as f:
+            payloads.append(f.read())
+    return payloads
+
+
+def benchmark(payloads, specs, repeat: int):
+    """Return ``(spec, compress_s, decompress_s, ratio)`` rows."""
+    rows = []
+    raw_total = sum(len(p) for p in payloads)
+    for spec in specs:
+        codec, level = parse_compression(spec)
+        compress_time = decompress_time = 0.0
+        packed_total = 0
+        for payload in payloads:
+            for _ in range(repeat):
+                started = time.perf_counter()
+                packed = codec.compress(payload, level)
+                compress_time += time.perf_counter() - started
+                started = time.perf_counter()
+                codec.decompress(packed)
+                decompress_time += time.perf_counter() - started
+            packed_total += len(packed)
+        runs = repeat * len(payloads)
+        rows.append((spec, compress_time / runs, decompress_time / runs, raw_total / max(1, packed_total)))
+    return rows
+
+
+def main(argv=None):
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description="Benchmark replay compression codecs")
+    parser.add_argument("replays", nargs="*", help="Replay files (default: everything in replays/)")
+    parser.add_argument("--codecs", nargs="+", default=DEFAULT_SPECS, help="Codec specs to compare")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per replay and codec")
+    args = parser.parse_args(argv)
+
+    paths = args.replays or [r["filepath"] for r in ReplayManager().list_replays()]
+    payloads = load_payloads(paths) if paths else [synthetic_replay_bytes()]
+    source = f"{len(payloads)} replay(s)" if paths else "synthetic 10 minute replay"
+    print(f"Input: {source}, {sum(len(p) for p in payloads) / 1024:.0f} KiB uncompressed")
+
+    print(f"{'codec':<10}{'compress ms':>14}{'decompress ms':>16}{'ratio':>9}")
+    for spec, compress_s, decompress_s, ratio in benchmark(payloads, args.codecs, args.repeat):
+        print(f"{spec:<10}{compress_s * 1000:>14.1f}{decompress_s * 1000:>16.1f}{ratio:>9.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Report or apply the replay retention policy.
+
+By default this is a dry run printing which replays would be pruned or
+compacted and how many bytes pruning reclaims. Budget values default to the
+user's settings.json.
+
+Usage:
+    python .development/replay_retention.py
+    python .development/replay_retention.py --max-count 20 --keep-top 5
+    python .development/replay_retention.py --apply
+"""
+import argparse
+import logging
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# pylint: disable=wrong-import-position
+from modul.replay_system import ReplayManager, RetentionPolicy
+from modul.settings import Settings
+
+
+def main(argv=None):
+    """Print the retention plan and optionally apply it."""
+    parser = argparse.ArgumentParser(description="Prune and compact saved replays")
+    parser.add_argument("--replays-dir", default="replays", help="Replay directory")
+    parser.add_argument("--max-count", type=int, help="Maximum number of replays (0 = unlimited)")
+    parser.add_argument("--max-megabytes", type=float, help="Maximum total size in MiB (0 = unlimited)")
+    parser.add_argument("--keep-top", type=int, help="Best-scoring replays that are never touched")
+    parser.add_argument("--keep-recent", type=int, help="Newest replays that are never touched")
+    parser.add_argument("--compact-fps", type=float, help="Frame rate for compacted replays")
+    parser.add_argument("--compact-compression", help="Codec for compacted replays, e.g. lzma:6")
+    parser.add_argument("--apply", action="store_true", help="Delete and rewrite files instead of a dry run")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    policy = RetentionPolicy.from_settings(Settings())
+    overrides = {
+        "max_count": args.max_count,
+        "keep_top": args.keep_top,
+        "keep_recent": args.keep_recent,
+        "compact_frame_rate_hz": args.compact_fps,
+        "compact_compression": args.compact_compression,
+    }
+    for name, value in overrides.items():
+        if value is not None:
+            setattr(policy, name, value)
+    if args.max_megabytes is not None:
+        policy.max_bytes = int(args.max_megabytes * 1024 * 1024)
+
+    manager = ReplayManager()
+    manager.replays_dir = args.replays_dir
+    plan = manager.enforce_retention(policy, dry_run=not args.apply)
+    print(("Applied: " if args.apply else "Dry run: ") + plan.summary())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,7 +3,6 @@
 import argparse
 import logging
 import math
-import random
 import sys
 import time
 
@@ -21,26 +20,43 @@ from modul.achievements import AchievementSystem
 from modul.asteroid import Asteroid, EnemyShip
 from modul.asteroidfield import AsteroidField
 from modul.audio_enhancements import AudioEnhancementManager, SoundTheme
+from modul.automation import AutomationServer
 from modul.boss import Boss
 from modul.bossprojectile import BossProjectile
+from modul.fixed_step import FixedStepper, capture_positions, interpolated
+from modul.flight_recorder import KILL_CAM_SECONDS, FlightRecorder, KillCam
+from modul.freeze_frame import FROZEN_STATES, FreezeFrame
+from modul.game_clock import game_clock
+from modul.ghost_racer import GhostRacer
 from modul.groups import collidable, drawable, updatable
 from modul.help_screen import HelpScreen
 from modul.highscore import HighscoreDisplay, HighscoreInput, HighscoreManager
+from modul.input_utils import key_name_to_keycode
 from modul.menu import (AchievementsMenu, ControlsMenu, CreditsScreen,
                         DifficultyMenu, GameOverScreen, LanguageMenu, MainMenu,
                         OptionsMenu, PauseMenu, ShipSelectionMenu,
                         SoundTestMenu, TTSVoiceMenu, VoiceAnnouncementsMenu)
-from modul.particle import Particle
+from modul.particle import Particle, particle_pool
 from modul.performance_profiler import PerformanceProfiler
 from modul.player import Player
+from modul import rng
+from modul.quick_save import QUICK_SAVE_SYNC_INTERVAL, QuickSave, RunState
 from modul.powerup import PowerUp
 from modul.replay_system import ReplayManager, ReplayPlayer, ReplayRecorder
-from modul.replay_ui import ReplayListMenu, ReplayViewer
+from modul.replay_ui import ReplayListMenu, ReplayViewer, draw_replay_frame
 from modul.session_stats import SessionStats
 from modul.settings import Settings
-from modul.ships import ship_manager
+from modul.simulation import (MAX_ENEMY_SHIPS, advance_level,
+                              collect_powerups, collide_asteroids,
+                              collide_enemies, deflect_enemies,
+                              next_spawn_interval, resolve_asteroid_collisions,
+                              spawn_enemy_ship, update_boss, update_entities,
+                              wrap_positions)
+from modul.ships import ship_manager, ship_sprites
 from modul.shot import Shot
+from modul.snapshot import restore_world, snapshot_world
 from modul.sounds import Sounds, asset_path
+from modul.sprite_batch import SpriteBatch
 from modul.starfield import MenuStarfield, Starfield
 from modul.stats_dashboard import StatsDashboard
 from modul.tutorial import Tutorial
@@ -76,6 +92,10 @@ Examples:
   python main.py --debug          # Start with debug logging
   python main.py --skip-intro     # Skip main menu
   python main.py --windowed       # Force windowed mode
+  python main.py --seed 1234      # Reproducible run
+  python main.py --time-scale 0.5 # Slow motion
+  python main.py --fps 144        # Render at a 144 Hz display's rate
+  python main.py --automation 7777  # Accept scripted control on 127.0.0.1:7777
         """
     )
     parser.add_argument('--version', action='version', version=f'Ajitroids v{__version__}')
@@ -85,6 +105,14 @@ Examples:
     mode_group.add_argument('--windowed', action='store_true', help='Start in windowed mode')
     mode_group.add_argument('--fullscreen', action='store_true', help='Start in fullscreen mode')
     parser.add_argument('--log-file', type=str, help='Write logs to specified file')
+    parser.add_argument('--seed', type=int, help='Run seed for reproducible games (default: random per run)')
+    parser.add_argument('--fps', type=int, default=C.TARGET_FPS,
+                        help=f'Frame rate cap (0 for uncapped, default {C.TARGET_FPS}); gameplay always steps at {C.SIMULATION_TICK_RATE} Hz')
+    parser.add_argument('--time-scale', type=float, default=1.0,
+                        help='Game speed multiplier, e.g. 0.5 for slow motion or 2 for fast forward')
+    parser.add_argument('--automation', metavar='ADDRESS',
+                        help='Start the local automation server on a loopback port (7777, 127.0.0.1:7777) '
+                             'or Unix socket (unix:/tmp/ajitroids.sock); off by default')
 
     return parser.parse_args()
 
@@ -134,6 +162,7 @@ def main(args=None):
 
     global show_fps
     show_fps = args.debug
+    game_clock.set_scale(args.time_scale)
 
     pygame.init()
 
@@ -288,6 +317,254 @@ def main(args=None):
     replay_list_menu = ReplayListMenu(replay_manager)
     replay_player = ReplayPlayer()
     replay_viewer = ReplayViewer(replay_player)
+    ghost_racer = None
+    flight_recorder = FlightRecorder()
+    fixed_step = FixedStepper()
+    previous_positions = {}
+    sprite_batch = SpriteBatch()
+    freeze_frame = FreezeFrame(sprite_batch)
+    kill_cam = KillCam()
+    quick_save = QuickSave()
+    last_replay_sync = 0.0
+
+    def current_run_state():
+        """Return the run in progress as a `RunState`."""
+        return RunState(player, updatable, drawable, particles, asteroid_field,
+                        (updatable, drawable, collidable), score, lives, level,
+                        current_enemy_ships, None, boss_active, game_clock.now,
+                        last_spawn_time, spawn_interval)
+
+    def quick_save_run():
+        """Write the run in progress to the quick-save; returns the time taken in ms."""
+        return quick_save.save(current_run_state(), replay_recorder, difficulty, player.ship_type)
+
+    def quick_restart_game():
+        """Quickly restart the game without going through menus."""
+        global score, lives, level, boss_active, boss_defeated_timer, boss_defeated_message
+        global powerups_collected, asteroids_destroyed, shields_used, triple_shots_used, speed_boosts_used
+        nonlocal last_spawn_time, spawn_interval, current_enemy_ships, level_up_timer, level_up_text
+        nonlocal ghost_racer, last_replay_sync
+
+        # Stop any ongoing replay recording
+        if replay_recorder.recording:
+            replay_recorder.stop_recording(score, level)
+            try:
+                saved_path = replay_recorder.save_replay()
+                logger.info(f"Replay saved before restart: {saved_path}")
+            except OSError as e:
+                logger.error(f"Failed to save replay: {e}")
+
+        # Reset game state
+        score = 0
+        lives = PLAYER_LIVES
+        level = 1
+        level_up_timer = 0
+        level_up_text = ""
+        boss_active = False
+        boss_defeated_timer = 0
+        boss_defeated_message = ""
+
+        # Reset tracking stats
+        powerups_collected = 0
+        asteroids_destroyed = 0
+        shields_used = 0
+        triple_shots_used = 0
+        speed_boosts_used = 0
+
+        # The new run draws from freshly seeded streams, so its replay seed reproduces it
+        run_seed = rng.seed_run(args.seed)
+
+        # Reset enemy spawn timers
+        last_spawn_time = game_clock.now
+        spawn_interval = next_spawn_interval()
+        current_enemy_ships = []
+
+        # Clear all game objects in one pass
+        for group in (asteroids, powerups, shots, particles, collidable, updatable):
+            for obj in list(group):
+                if obj is player:
+                    continue
+                obj.kill()
+
+        # Respawn player
+        if player:
+            player.respawn()
+            player.position.x = RESPAWN_POSITION_X
+            player.position.y = RESPAWN_POSITION_Y
+            player.velocity.update(0, 0)
+            player.rotation = 0
+
+        # Start new game session
+        session_stats.start_game()
+        particle_pool.reset_stats()
+
+        # Start new replay recording
+        selected_ship = ship_manager.current_ship
+        replay_recorder.start_recording(difficulty, selected_ship)
+        quick_save.begin_run()
+        last_replay_sync = game_clock.now
+        flight_recorder.clear()
+
+        # The ghost races against the new run from its start
+        if ghost_racer:
+            ghost_racer.close()
+        ghost_racer = None
+        if game_settings.ghost_racing_enabled:
+            ghost_racer = GhostRacer.for_personal_best(replay_manager, difficulty, selected_ship)
+
+        # Spawn initial asteroids
+        for _ in range(3):
+            asteroid_field.spawn_random()
+
+        logger.info(f"Quick restart: Game restarted - Seed: {run_seed}")
+        return "playing"
+
+    def player_hit():
+        """Take a life from the player; losing the last one ends the run."""
+        global game_state, lives
+        nonlocal ghost_racer
+
+        if game_state != "playing":
+            return
+        lives -= 1
+        sounds.play_player_hit()
+        Particle.create_ship_explosion(player.position.x, player.position.y)
+
+        if lives > 0:
+            session_stats.record_life_lost()
+            player.respawn()
+            return
+
+        logger.info(f"Game Over! Final Score: {score}, Level: {level}")
+        session_stats.end_game(score, level)
+
+        # Stop and save replay
+        replay_recorder.stop_recording(score, level, game_over=True)
+        if ghost_racer:
+            ghost_racer.close()
+            ghost_racer = None
+        try:
+            saved_path = replay_recorder.save_replay()
+            logger.info(f"Replay saved: {saved_path}")
+            # Keep replays/ within the disk budget without stalling the game
+            replay_manager.enforce_retention_async()
+        except Exception as e:
+            logger.error(f"Failed to save replay: {e}")
+
+        sounds.play_game_over()
+        audio_enhancements.trigger_announcement("game_over", priority=10.0)
+        game_over_screen.set_score(score)
+        game_over_screen.fade_in = True
+        game_over_screen.background_alpha = 0
+        game_state = "game_over"
+
+    def capture_frame_data():
+        """Serialize the visible world as a replay frame."""
+        def _serialize_position(obj, radius_default=8, extra=None):
+            data = {
+                'x': getattr(obj.position, 'x', 0.0),
+                'y': getattr(obj.position, 'y', 0.0),
+                'radius': getattr(obj, 'radius', radius_default),
+            }
+            if extra:
+                data.update(extra)
+            return data
+
+        asteroids_data = [_serialize_position(a, radius_default=12) for a in asteroids]
+        enemies_data = [_serialize_position(e, radius_default=14) for e in current_enemy_ships]
+        shots_data = [_serialize_position(s, radius_default=4) for s in shots]
+        powerups_data = [_serialize_position(p, radius_default=6, extra={'type': getattr(p, 'type', 'unknown')}) for p in powerups]
+
+        return {
+            'player_x': player.position.x,
+            'player_y': player.position.y,
+            'player_rotation': player.rotation,
+            'player_vx': player.velocity.x,
+            'player_vy': player.velocity.y,
+            'score': score,
+            'lives': lives,
+            'level': level,
+            'asteroids': asteroids_data,
+            'enemies': enemies_data,
+            'shots': shots_data,
+            'powerups': powerups_data,
+            'particles': [],
+        }
+
+    automation = None
+    if args.automation:
+        try:
+            automation = AutomationServer(args.automation)
+        except (OSError, ValueError) as e:
+            logger.error(f"Automation server not started: {e}")
+
+    def handle_automation(request):
+        """Execute one automation request inside the frame loop."""
+        global game_state
+        command, params = request.command, request.params
+        if command == "input":
+            actions = params.get("actions")
+            if actions is not None and not isinstance(actions, dict):
+                automation.reply(request, error="'actions' must be an object or null")
+                return
+            # None hands control back to the keyboard
+            automation.actions = None if actions is None else {str(k): bool(v) for k, v in actions.items()}
+            player.input_state = automation.actions
+            automation.reply(request, {"actions": automation.actions})
+        elif command == "key":
+            keycode = key_name_to_keycode(str(params.get("key", "")))
+            if not isinstance(keycode, int):
+                automation.reply(request, error=f"Unknown key '{params.get('key')}'")
+                return
+            # Handled by the event loop next frame, exactly like a real key press
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=keycode, mod=0, unicode="", scancode=0))
+            pygame.event.post(pygame.event.Event(pygame.KEYUP, key=keycode, mod=0, unicode="", scancode=0))
+            automation.reply(request, {"key": params["key"]})
+        elif command == "set_state":
+            activations = {
+                "main_menu": main_menu.activate,
+                "difficulty_select": difficulty_menu.activate,
+                "ship_selection": ship_selection_menu.activate,
+                "playing": None,
+                "pause": pause_menu.activate,
+                "help": help_screen.activate,
+                "options": options_menu.activate,
+                "controls": controls_menu.activate,
+                "language": language_menu.activate,
+                "sound_test": sound_test_menu.activate,
+                "replay_list": replay_list_menu.activate,
+                "statistics": stats_dashboard.activate,
+                "highscore_display": None,
+                "tutorial": None,
+            }
+            state = params.get("state")
+            if state not in activations:
+                automation.reply(request, error=f"Cannot switch to '{state}'; use one of {sorted(activations)}")
+                return
+            game_state = state
+            if activations[state]:
+                activations[state]()
+            automation.reply(request, {"game_state": game_state})
+        elif command == "world":
+            world_format = params.get("format", "json")
+            if world_format == "binary":
+                automation.reply(request, {"game_state": game_state, "format": "binary"},
+                                 payload=snapshot_world(current_run_state()))
+            elif world_format == "json":
+                data = capture_frame_data()
+                data.update(game_state=game_state, difficulty=difficulty, time=game_clock.now,
+                            boss_active=boss_active, seed=rng.run_seed())
+                automation.reply(request, data)
+            else:
+                automation.reply(request, error=f"Unknown world format '{world_format}'")
+        elif command == "profiler":
+            enabled = params.get("enabled")
+            if enabled is None or bool(enabled) != performance_profiler.enabled:
+                performance_profiler.toggle()
+            automation.reply(request, {"enabled": performance_profiler.enabled,
+                                       "summary": performance_profiler.get_summary()})
+        else:
+            automation.reply(request, error=f"Unknown command '{command}'")
 
     global difficulty
     difficulty = "normal"
@@ -323,20 +600,37 @@ def main(args=None):
     toggle_message = None
     toggle_message_timer = 0
 
-    last_spawn_time = time.time()
-    spawn_interval = random.uniform(10, 30)
-    max_enemy_ships = {"easy": 1, "normal": 2, "hard": 3}
+    last_spawn_time = game_clock.now
+    spawn_interval = next_spawn_interval()
+    max_enemy_ships = MAX_ENEMY_SHIPS
     current_enemy_ships = []
 
     while True:
+        if automation:
+            for request in automation.poll():
+                try:
+                    handle_automation(request)
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    logger.exception("Automation request '%s' failed", request.command)
+                    automation.reply(request, error=str(e))
+            if automation.actions is not None:
+                player.input_state = automation.actions
+
         events = pygame.event.get()
         for event in events:
             if event.type == pygame.QUIT:
                 logger.info("Game closing...")
+                if game_state in ("playing", "help", "pause", "pause_confirm", "pause_restart_confirm") and lives > 0:
+                    try:
+                        quick_save_run()
+                    except Exception as e:  # pylint: disable=broad-exception-caught
+                        logger.error(f"Failed to quick-save run: {e}")
                 if game_state in ("playing", "help"):
                     session_stats.end_game(score, level)
                 if args.debug:
                     logger.info("\n" + session_stats.get_formatted_summary())
+                if automation:
+                    automation.close()
                 return
 
             if event.type == pygame.KEYDOWN:
@@ -368,6 +662,19 @@ def main(args=None):
                     show_fps = not show_fps
                     toggle_message = "FPS Display Enabled" if show_fps else "FPS Display Disabled"
                     toggle_message_timer = 2
+                elif event.key in (pygame.K_F6, pygame.K_F7) and args.debug:
+                    factor = 0.5 if event.key == pygame.K_F6 else 2.0
+                    game_clock.set_scale(game_clock.scale * factor)
+                    toggle_message = f"Time Scale {game_clock.scale:g}x"
+                    toggle_message_timer = 2
+                elif event.key == pygame.K_F5 and game_state == "playing":
+                    try:
+                        save_ms = quick_save_run()
+                        toggle_message = f"Game Saved ({save_ms:.0f} ms)"
+                    except Exception as e:  # pylint: disable=broad-exception-caught
+                        logger.error(f"Failed to quick-save run: {e}")
+                        toggle_message = "Quick Save Failed"
+                    toggle_message_timer = 2
                 elif event.key in (pygame.K_h, pygame.K_F1) and game_state == "playing":
                     game_state = "help"
                     help_screen.activate()
@@ -383,20 +690,24 @@ def main(args=None):
             if toggle_message_timer <= 0:
                 toggle_message = None
 
-        if game_state == "playing" and event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
-                game_state = "pause"
-                pause_menu.activate()
-            elif event.key == pygame.K_r:
-                # Quick restart with 'R' key
-                game_state = quick_restart_game()
+        for event in events:
+            if game_state == "playing" and event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    game_state = "pause"
+                    pause_menu.activate()
+                elif event.key == pygame.K_r:
+                    # Quick restart with 'R' key
+                    game_state = quick_restart_game()
 
         screen.fill("black")
+        if game_state not in FROZEN_STATES:
+            freeze_frame.invalidate()
 
         if game_state == "main_menu":
             menu_starfield.update(dt)
             menu_starfield.draw(screen)
 
+            main_menu.set_continue_available(quick_save.available)
             action = main_menu.update(dt, events)
             main_menu.draw(screen)
 
@@ -417,6 +728,45 @@ def main(args=None):
                 game_state = "difficulty_select"
                 difficulty_menu.activate()
 
+            elif action == "continue_game":
+                saved_run = quick_save.load()
+                if saved_run is None:
+                    quick_save.clear()
+                    toggle_message = "Saved Game Could Not Be Loaded"
+                    toggle_message_timer = 2
+                else:
+                    difficulty = saved_run.difficulty
+                    selected_ship = saved_run.ship_type
+                    for particle in list(particles):
+                        particle.kill()
+                    if player in updatable:
+                        player.kill()
+                    player = Player(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2, selected_ship)
+                    player.sounds = sounds
+                    run_state = RunState(player, updatable, drawable, particles, asteroid_field,
+                                         (updatable, drawable, collidable), 0, 0, 1)
+                    # Reseeds the cosmetic streams; the snapshot restores the gameplay ones
+                    rng.seed_run(saved_run.replay_metadata.get('seed'))
+                    restore_world(run_state, saved_run.world)
+                    score, lives, level = run_state.score, run_state.lives, run_state.level
+                    current_enemy_ships = run_state.enemies
+                    boss, boss_active = run_state.boss, run_state.boss_active
+                    # Keep the remaining wait until the next enemy spawn
+                    last_spawn_time = game_clock.now - (run_state.time - run_state.last_spawn_time)
+                    spawn_interval = run_state.spawn_interval
+
+                    saved_run.apply_to_recorder(replay_recorder)
+                    last_replay_sync = game_clock.now
+                    flight_recorder.clear()
+                    fixed_step.reset()
+                    particle_pool.reset_stats()
+                    if ghost_racer:
+                        ghost_racer.close()
+                    ghost_racer = None
+                    session_stats.start_game()
+                    logger.info(f"Continuing saved run - Difficulty: {difficulty}, Ship: {selected_ship}, Score: {score}")
+                    game_state = "playing"
+
             elif action == "tutorial":
                 game_state = "tutorial"
 
@@ -442,6 +792,8 @@ def main(args=None):
                 credits_screen.scroll_position = SCREEN_HEIGHT
 
             elif action == "exit":
+                if automation:
+                    automation.close()
                 return
 
             elif action == "achievements":
@@ -481,8 +833,7 @@ def main(args=None):
                 main_menu.activate()
 
         elif game_state == "pause_confirm":
-            for obj in drawable:
-                obj.draw(screen)
+            freeze_frame.draw(screen, drawable)
 
             # Reuse pause menu backdrop and then draw confirmation prompt
             pause_menu.draw(screen)
@@ -516,8 +867,7 @@ def main(args=None):
                         game_state = "pause"
 
         elif game_state == "pause_restart_confirm":
-            for obj in drawable:
-                obj.draw(screen)
+            freeze_frame.draw(screen, drawable)
 
             pause_menu.draw(screen)
 
@@ -546,9 +896,10 @@ def main(args=None):
                         game_state = "playing"
                         score = 0
                         lives = PLAYER_LIVES
+                        particle_pool.reset_stats()
 
-                        last_spawn_time = time.time()
-                        spawn_interval = random.uniform(10, 30)
+                        last_spawn_time = game_clock.now
+                        spawn_interval = next_spawn_interval()
                         current_enemy_ships = []
 
                         for asteroid in list(asteroids):
@@ -590,13 +941,28 @@ def main(args=None):
                 # Start tracking session statistics
                 session_stats.start_game()
 
+                # Every run draws from streams seeded by one run seed, stored in the replay
+                run_seed = rng.seed_run(args.seed)
+
                 # Start recording replay
                 replay_recorder.start_recording(difficulty, selected_ship)
-
-                logger.info(f"Game started - Difficulty: {difficulty}, Ship: {selected_ship}")
-
-                last_spawn_time = time.time()
-                spawn_interval = random.uniform(10, 30)
+                flight_recorder.clear()
+                fixed_step.reset()
+                particle_pool.reset_stats()
+                quick_save.begin_run()
+                last_replay_sync = game_clock.now
+
+                # Race against the personal best when enabled
+                if ghost_racer:
+                    ghost_racer.close()
+                ghost_racer = None
+                if game_settings.ghost_racing_enabled:
+                    ghost_racer = GhostRacer.for_personal_best(replay_manager, difficulty, selected_ship)
+
+                logger.info(f"Game started - Difficulty: {difficulty}, Ship: {selected_ship}, Seed: {run_seed}")
+
+                last_spawn_time = game_clock.now
+                spawn_interval = next_spawn_interval()
                 current_enemy_ships = []
 
                 for asteroid in list(asteroids):
@@ -643,8 +1009,7 @@ def main(args=None):
                 main_menu.activate()
 
         elif game_state == "pause":
-            for obj in drawable:
-                obj.draw(screen)
+            freeze_frame.draw(screen, drawable)
 
             action = pause_menu.update(dt, events)
             pause_menu.draw(screen)
@@ -789,8 +1154,10 @@ def main(args=None):
                 main_menu.activate()
 
         elif game_state == "playing":
-            # Cache current time for this frame
-            current_frame_time = time.time()
+            # Game time only advances while playing, so pauses leave no gap
+            dt = game_clock.tick(dt)
+            fixed_step.add(dt, game_clock.scale)
+            current_frame_time = game_clock.now
 
             # Update performance profiler
             object_groups = {
@@ -800,7 +1167,7 @@ def main(args=None):
                 'powerups': powerups,
                 'enemies': current_enemy_ships
             }
-            performance_profiler.update(dt, clock, object_groups)
+            performance_profiler.update(dt, clock, object_groups, particle_pool.stats(), ship_sprites.stats())
 
             # Update audio enhancements with game state
             game_state_dict = {
@@ -815,321 +1182,103 @@ def main(args=None):
             starfield.update(dt)
             starfield.draw(screen)
 
-            asteroid_field.update(dt)
+            # Advance gameplay in fixed steps; drawing below interpolates between them
+            while game_state == "playing" and fixed_step.step():
+                step_dt = fixed_step.step_dt
+                step_time = game_clock.now - fixed_step.accumulator
+                # Particles are short-lived and too small for interpolation to show
+                capture_positions(drawable, previous_positions, exclude=(Particle,))
 
-            if current_frame_time - last_spawn_time > spawn_interval:
-                if len(current_enemy_ships) < max_enemy_ships[difficulty]:
-                    enemy_ship = EnemyShip(random.randint(0, SCREEN_WIDTH), random.randint(0, SCREEN_HEIGHT), 30)
-                    updatable.add(enemy_ship)
-                    drawable.add(enemy_ship)
-                    collidable.add(enemy_ship)
-                    current_enemy_ships.append(enemy_ship)
-                    last_spawn_time = current_frame_time
-                    spawn_interval = random.uniform(10, 30)
-                    logger.debug(f"EnemyShip spawned! Current count: {len(current_enemy_ships)}, Max: {max_enemy_ships[difficulty]}")
+                asteroid_field.update(step_dt)
 
-            current_enemy_ships = [ship for ship in current_enemy_ships if ship in updatable]
+                if step_time - last_spawn_time > spawn_interval:
+                    if len(current_enemy_ships) < max_enemy_ships[difficulty]:
+                        spawn_enemy_ship(current_enemy_ships, (updatable, drawable, collidable))
+                        last_spawn_time = step_time
+                        spawn_interval = next_spawn_interval()
+                        logger.debug(f"EnemyShip spawned! Current count: {len(current_enemy_ships)}, Max: {max_enemy_ships[difficulty]}")
 
-            for obj in updatable:
-                if isinstance(obj, EnemyShip):
-                    obj.update(dt, player.position)
-                else:
-                    obj.update(dt)
-
-            asteroid_list = list(asteroids)
-            for i in range(len(asteroid_list)):
-                a1 = asteroid_list[i]
-                for j in range(i + 1, len(asteroid_list)):
-                    a2 = asteroid_list[j]
-                    dx = a2.position.x - a1.position.x
-                    dy = a2.position.y - a1.position.y
-                    dist = math.hypot(dx, dy)
-                    min_dist = a1.radius + a2.radius
-                    if dist < min_dist and dist > 0:
-
-                        overlap = min_dist - dist
-                        nx = dx / dist
-                        ny = dy / dist
-                        a1.position.x -= nx * overlap / 2
-                        a1.position.y -= ny * overlap / 2
-                        a2.position.x += nx * overlap / 2
-                        a2.position.y += ny * overlap / 2
-
-                        v1 = a1.velocity
-                        v2 = a2.velocity
-                        a1.velocity, a2.velocity = v2, v1
-
-            for asteroid in asteroids:
-                if asteroid.collides_with(player) and not player.invincible and not player.shield_active:
-                    lives -= 1
-                    sounds.play_player_hit()
-                    Particle.create_ship_explosion(player.position.x, player.position.y)
-
-                    if lives <= 0:
-                        logger.info(f"Game Over! Final Score: {score}, Level: {level}")
-                        session_stats.end_game(score, level)
-
-                        # Stop and save replay
-                        replay_recorder.stop_recording(score, level)
-                        try:
-                            saved_path = replay_recorder.save_replay()
-                            logger.info(f"Replay saved: {saved_path}")
-                        except Exception as e:
-                            logger.error(f"Failed to save replay: {e}")
-
-                        sounds.play_game_over()
-                        audio_enhancements.trigger_announcement("game_over", priority=10.0)
-                        game_over_screen.set_score(score)
-                        game_over_screen.fade_in = True
-                        game_over_screen.background_alpha = 0
-                        game_state = "game_over"
-                    else:
-                        session_stats.record_life_lost()
-                        player.respawn()
+                current_enemy_ships = [ship for ship in current_enemy_ships if ship in updatable]
 
-                for shot in shots:
-                    if asteroid.collides_with(shot):
-                        sounds.play_explosion()
-
-                        original_size = asteroid.radius
-                        is_large_asteroid = original_size >= ASTEROID_MIN_RADIUS * 2
-                        is_medium_asteroid = ASTEROID_MIN_RADIUS < original_size < ASTEROID_MIN_RADIUS * 2
-
-                        if is_large_asteroid:
-                            base_score = SCORE_LARGE
-                        elif is_medium_asteroid:
-                            base_score = SCORE_MEDIUM
-                        else:
-                            base_score = SCORE_SMALL
-
-                        type_multiplier = ASTEROID_TYPE_SCORE_MULTIPLIERS.get(asteroid.asteroid_type, 1.0)
-                        score += int(round(base_score * type_multiplier))
-
-                        Particle.create_asteroid_explosion(asteroid.position.x, asteroid.position.y)
-
-                        if not achievement_system.is_unlocked("First Blood"):
-                            achievement_system.unlock("First Blood")
-
-                        asteroids_destroyed += 1
-                        session_stats.record_asteroid_destroyed()
-
-                        if asteroids_destroyed >= 1000 and not achievement_system.is_unlocked("Asteroid Hunter"):
-                            achievement_system.unlock("Asteroid Hunter")
-
-                        if score >= 250000 and not achievement_system.is_unlocked("High Scorer"):
-                            achievement_system.unlock("High Scorer")
-
-                        if is_large_asteroid and random.random() < POWERUP_SPAWN_CHANCE:
-                            if len(powerups) < POWERUP_MAX_COUNT:
-                                powerup_type = random.choice(POWERUP_TYPES)
-                                PowerUp(asteroid.position.x, asteroid.position.y, powerup_type)
-                                print(f"Power-Up {powerup_type} appears from large asteroid!")
-
-                        asteroid.split()
-                        shot.kill()
-                        break
-
-            for obj in list(collidable):
-                if isinstance(obj, EnemyShip):
-
-                    if obj.collides_with(player) and not player.invincible and not player.shield_active:
-                        lives -= 1
-                        sounds.play_player_hit()
-                        Particle.create_ship_explosion(player.position.x, player.position.y)
-                        obj.split()
-
-                        if obj in current_enemy_ships:
-                            current_enemy_ships.remove(obj)
-
-                        if lives <= 0:
-                            logger.info(f"Game Over! Final Score: {score}, Level: {level}")
-                            session_stats.end_game(score, level)
-                            sounds.play_game_over()
-                            game_over_screen.set_score(score)
-                            game_over_screen.fade_in = True
-                            game_over_screen.background_alpha = 0
-                            game_state = "game_over"
-                        else:
-                            session_stats.record_life_lost()
-                            player.respawn()
-
-                    for shot in shots:
-                        if obj.collides_with(shot):
-                            sounds.play_explosion()
-                            score += SCORE_MEDIUM
-                            session_stats.record_enemy_destroyed()
-                            obj.split()
-                            shot.kill()
+                update_entities(updatable, player, step_dt)
+                resolve_asteroid_collisions(asteroids)
 
-                            if obj in current_enemy_ships:
-                                current_enemy_ships.remove(obj)
-                            logger.debug(f"EnemyShip destroyed! Remaining count: {len(current_enemy_ships)}")
-                            break
+                for event in collide_asteroids(asteroids, shots, powerups, player, player_hit):
+                    sounds.play_explosion()
+                    score += event.data["points"]
 
-            for enemy_ship in current_enemy_ships:
-                for asteroid in asteroids:
-                    if enemy_ship.collides_with(asteroid):
-                        speed = enemy_ship.velocity.length()
-                        enemy_ship.velocity = pygame.Vector2(random.uniform(-1, 1), random.uniform(-1, 1)).normalize() * speed
-                        logger.debug("EnemyShip changed direction due to asteroid collision.")
+                    if not achievement_system.is_unlocked("First Blood"):
+                        achievement_system.unlock("First Blood")
 
-            for obj in updatable:
-                if not hasattr(obj, "position"):
-                    continue
+                    asteroids_destroyed += 1
+                    session_stats.record_asteroid_destroyed()
 
-                if isinstance(obj, Shot):
-                    if (
-                        obj.position.x < 0
-                        or obj.position.x > SCREEN_WIDTH
-                        or obj.position.y < 0
-                        or obj.position.y > SCREEN_HEIGHT
-                    ):
-                        obj.kill()
-                    continue
+                    if asteroids_destroyed >= 1000 and not achievement_system.is_unlocked("Asteroid Hunter"):
+                        achievement_system.unlock("Asteroid Hunter")
 
-                if obj.position.x < 0:
-                    obj.position.x = SCREEN_WIDTH
-                elif obj.position.x > SCREEN_WIDTH:
-                    obj.position.x = 0
-                if obj.position.y < 0:
-                    obj.position.y = SCREEN_HEIGHT
-                elif obj.position.y > SCREEN_HEIGHT:
-                    obj.position.y = 0
-
-            # Record replay frame
-            if replay_recorder.recording and player:
-                def _serialize_position(obj, radius_default=8, extra=None):
-                    data = {
-                        'x': getattr(obj.position, 'x', 0.0),
-                        'y': getattr(obj.position, 'y', 0.0),
-                        'radius': getattr(obj, 'radius', radius_default),
-                    }
-                    if extra:
-                        data.update(extra)
-                    return data
-
-                asteroids_data = [_serialize_position(a, radius_default=12) for a in asteroids]
-                enemies_data = [_serialize_position(e, radius_default=14) for e in current_enemy_ships]
-                shots_data = [_serialize_position(s, radius_default=4) for s in shots]
-                powerups_data = [_serialize_position(p, radius_default=6, extra={'type': getattr(p, 'type', 'unknown')}) for p in powerups]
-
-                game_state_data = {
-                    'player_x': player.position.x,
-                    'player_y': player.position.y,
-                    'player_rotation': player.rotation,
-                    'player_vx': player.velocity.x,
-                    'player_vy': player.velocity.y,
-                    'score': score,
-                    'lives': lives,
-                    'level': level,
-                    'asteroids': asteroids_data,
-                    'enemies': enemies_data,
-                    'shots': shots_data,
-                    'powerups': powerups_data,
-                    'particles': [],
-                }
-                replay_recorder.record_frame(game_state_data, current_frame_time)
-
-            for obj in drawable:
-                obj.draw(screen)
+                    if score >= 250000 and not achievement_system.is_unlocked("High Scorer"):
+                        achievement_system.unlock("High Scorer")
 
-            score_text = font.render(f"Score: {score}", True, (255, 255, 255))
-            score_rect = score_text.get_rect(topleft=(20, 20))
-            screen.blit(score_text, score_rect)
+                    if event.data["powerup"]:
+                        print(f"Power-Up {event.data['powerup']} appears from large asteroid!")
 
-            lives_text = font.render(f"Lives: {lives}", True, (255, 255, 255))
-            lives_rect = lives_text.get_rect(topleft=(20, 50))
-            screen.blit(lives_text, lives_rect)
+                for event in collide_enemies(current_enemy_ships, shots, player, player_hit):
+                    sounds.play_explosion()
+                    score += event.data["points"]
+                    session_stats.record_enemy_destroyed()
+                    logger.debug(f"EnemyShip destroyed! Remaining count: {len(current_enemy_ships)}")
 
-            level_text = font.render(f"Level: {level}", True, (200, 200, 200))
-            level_rect = level_text.get_rect(topleft=(20, 80))
-            screen.blit(level_text, level_rect)
+                deflect_enemies(current_enemy_ships, asteroids)
+                wrap_positions(updatable)
 
-            difficulty_color = {"easy": (0, 255, 0), "normal": (255, 255, 0), "hard": (255, 0, 0)}.get(
-                difficulty, (200, 200, 200)
-            )
+                for event in advance_level(score, level, asteroids, asteroid_field):
+                    if event.kind == "boss_spawned":
+                        boss = event.data["boss"]
+                        boss_active = True
+                        level_up_text = "BOSS FIGHT!"
+                        level_up_timer = LEVEL_UP_DISPLAY_TIME * 2
+                        print(f"Boss fight started at level {event.data['level']}!")
+                        sounds.play_boss_music()
+                        audio_enhancements.trigger_announcement("boss_incoming", priority=10.0)
+                        continue
 
-            difficulty_text = font.render(f"Difficulty: {difficulty.capitalize()}", True, difficulty_color)
-            difficulty_rect = difficulty_text.get_rect(topleft=(20, 110))
-            screen.blit(difficulty_text, difficulty_rect)
+                    level = event.data["level"]
 
-            if player:
-                player.draw_weapon_hud(screen)
+                    if level == 50:
+                        if difficulty == "easy" and not ship_manager.is_ship_unlocked("speedster"):
+                            ship_manager.unlock_ship_with_notification("speedster", achievement_notifications.add_notification)
+                        elif difficulty == "normal" and not ship_manager.is_ship_unlocked("tank"):
+                            ship_manager.unlock_ship_with_notification("tank", achievement_notifications.add_notification)
+                        elif difficulty == "hard" and not ship_manager.is_ship_unlocked("destroyer"):
+                            ship_manager.unlock_ship_with_notification("destroyer", achievement_notifications.add_notification)
 
-            current_level = min(score // POINTS_PER_LEVEL + 1, MAX_LEVEL)
-
-            if current_level > level:
-                if current_level % BOSS_LEVEL_INTERVAL == 0:
-                    boss = Boss(current_level)
-                    boss_active = True
-                    boss_projectiles = pygame.sprite.Group()
-                    level_up_text = "BOSS FIGHT!"
-                    level_up_timer = LEVEL_UP_DISPLAY_TIME * 2
-                    for asteroid in list(asteroids):
-                        asteroid.kill()
-                    print(f"Boss fight started at level {current_level}!")
-                    sounds.play_boss_music()
-                    audio_enhancements.trigger_announcement("boss_incoming", priority=10.0)
-
-                level = current_level
-
-                if level == 50:
-                    if difficulty == "easy" and not ship_manager.is_ship_unlocked("speedster"):
-                        ship_manager.unlock_ship_with_notification("speedster", achievement_notifications.add_notification)
-                    elif difficulty == "normal" and not ship_manager.is_ship_unlocked("tank"):
-                        ship_manager.unlock_ship_with_notification("tank", achievement_notifications.add_notification)
-                    elif difficulty == "hard" and not ship_manager.is_ship_unlocked("destroyer"):
-                        ship_manager.unlock_ship_with_notification("destroyer", achievement_notifications.add_notification)
-
-                if level >= 666 and not achievement_system.is_unlocked("Level Master"):
-                    achievement_system.unlock("Level Master")
-
-                if level <= 10:
-                    asteroid_field.asteroid_count = min(BASE_ASTEROID_COUNT + (level - 1) * ASTEROID_COUNT_PER_LEVEL, 12)
-                    asteroid_field.spawn_interval = max(BASE_SPAWN_INTERVAL - (level - 1) * SPAWN_INTERVAL_REDUCTION, 1.0)
-
-                if level_up_timer <= 0:
-                    level_up_timer = LEVEL_UP_DISPLAY_TIME
-                    level_up_text = f"LEVEL {level}!"
-
-                sounds.play_level_up()
-                audio_enhancements.trigger_announcement("level_up", priority=8.0)
-
-                print(
-                    f"Level up! Now level {level}, asteroids: {asteroid_field.asteroid_count}, interval: {asteroid_field.spawn_interval}"
-                )
+                    if level >= 666 and not achievement_system.is_unlocked("Level Master"):
+                        achievement_system.unlock("Level Master")
 
-            if level_up_timer > 0:
-                level_up_timer -= dt
+                    if level_up_timer <= 0:
+                        level_up_timer = LEVEL_UP_DISPLAY_TIME
+                        level_up_text = f"LEVEL {level}!"
 
-                size = int(72 * (1 + 0.2 * math.sin(level_up_timer * 10)))
+                    sounds.play_level_up()
+                    audio_enhancements.trigger_announcement("level_up", priority=8.0)
 
-                level_font = pygame.font.Font(None, size)
-                level_surf = level_font.render(level_up_text, True, (255, 215, 0))
-                level_rect = level_surf.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 3))
-
-                alpha = int(255 * min(1, level_up_timer / (LEVEL_UP_DISPLAY_TIME / 2)))
-                if level_up_timer < LEVEL_UP_DISPLAY_TIME / 2:
-                    level_surf.set_alpha(alpha)
-
-                screen.blit(level_surf, level_rect)
-
-            for powerup in powerups:
-                if powerup.collides_with(player):
-                    player.activate_powerup(powerup.type)
-                    powerup.kill()
+                    print(
+                        f"Level up! Now level {level}, asteroids: {asteroid_field.asteroid_count}, interval: {asteroid_field.spawn_interval}"
+                    )
 
+                for event in collect_powerups(powerups, player):
+                    powerup_type = event.data["type"]
                     powerups_collected += 1
                     session_stats.record_powerup_collected()
 
                     # Trigger powerup announcement
-                    if powerup.type == "shield":
+                    if powerup_type == "shield":
                         audio_enhancements.trigger_announcement("shield_active", priority=6.0)
                         shields_used += 1
-                    elif powerup.type == "triple_shot":
+                    elif powerup_type == "triple_shot":
                         audio_enhancements.trigger_announcement("new_weapon", priority=6.0)
                         triple_shots_used += 1
-                    elif powerup.type == "speed_boost":
+                    elif powerup_type == "speed_boost":
                         audio_enhancements.trigger_announcement("powerup", priority=5.0)
                         speed_boosts_used += 1
                     else:
@@ -1147,61 +1296,25 @@ def main(args=None):
                     if triple_shots_used >= 20 and not achievement_system.is_unlocked("Triple Threat"):
                         achievement_system.unlock("Triple Threat")
 
-            if current_level > level and current_level % BOSS_LEVEL_INTERVAL == 0:
-                boss = Boss(current_level)
-                boss_active = True
-                boss_projectiles = pygame.sprite.Group()
-                level_message = "BOSS FIGHT!"
-                level_message_timer = LEVEL_UP_DISPLAY_TIME
-                for asteroid in list(asteroids):
-                    asteroid.kill()
+                if boss_active and boss in updatable:
+                    for event in update_boss(boss, step_dt, player, updatable, shots, step_time):
+                        if event.kind == "boss_attack":
+                            # Ring attacks sound every projectile, a targeted volley once
+                            shoot_sounds = event.data["projectiles"] if event.data["type"] != "targeted" else 1
+                            for _ in range(shoot_sounds):
+                                sounds.play_enemy_shoot()
+
+                        elif event.kind == "boss_hit":
+                            sounds.play_hit()
 
-            if boss_active and boss in updatable:
-                boss_attack = boss.update(dt, player.position)
-
-                if boss_attack:
-                    if boss_attack["type"] == "circle":
-                        for i in range(boss_attack["count"]):
-                            angle = math.radians(i * (360 / boss_attack["count"]))
-                            velocity = pygame.Vector2(math.cos(angle), math.sin(angle)) * BOSS_PROJECTILE_SPEED
-                            BossProjectile(boss.position.x, boss.position.y, velocity, "normal")
-                            sounds.play_enemy_shoot()
-
-                    elif boss_attack["type"] == "spiral":
-                        base_angle = pygame.time.get_ticks() % 360
-                        for i in range(boss_attack["count"]):
-                            angle = math.radians(base_angle + i * (360 / boss_attack["count"]))
-                            velocity = pygame.Vector2(math.cos(angle), math.sin(angle)) * BOSS_PROJECTILE_SPEED
-                            BossProjectile(boss.position.x, boss.position.y, velocity, "normal")
-                            sounds.play_enemy_shoot()
-
-                    elif boss_attack["type"] == "targeted":
-                        if player in updatable:
-                            direction = (player.position - boss.position).normalize()
-
-                            velocity = direction * BOSS_PROJECTILE_SPEED
-                            BossProjectile(boss.position.x, boss.position.y, velocity, "homing")
-
-                            for i in range(1, boss_attack["count"]):
-                                offset = 10 * i if i % 2 == 0 else -10 * i
-                                offset_dir = direction.rotate(offset)
-                                BossProjectile(boss.position.x, boss.position.y, offset_dir * BOSS_PROJECTILE_SPEED, "normal")
-                        sounds.play_enemy_shoot()
-
-                for shot in shots:
-                    if boss.collides_with(shot):
-                        boss_defeated = boss.take_damage(shot.damage)
-                        shot.kill()
-                        sounds.play_hit()
-
-                        if boss_defeated:
+                        elif event.kind == "boss_defeated":
                             # Play boss death sound effect (ensure asset present)
                             try:
                                 sounds.play_boss_death()
                             except pygame.error:
                                 pass
 
-                            score += BOSS_SCORE
+                            score += event.data["points"]
                             boss_active = False
                             session_stats.record_boss_defeated()
 
@@ -1216,6 +1329,73 @@ def main(args=None):
                             boss_defeated_timer = 3.0
                             boss_defeated_message = "BOSS DEFEATED! +1 LIFE!"
 
+            # Record replay frame (the flight recorder keeps the last seconds even when not recording)
+            if player:
+                game_state_data = capture_frame_data()
+                if replay_recorder.recording:
+                    replay_recorder.record_frame(game_state_data, current_frame_time)
+                flight_recorder.record(game_state_data, current_frame_time)
+
+            if game_state == "game_over":
+                # The run is over; nothing is left to continue
+                quick_save.clear()
+                # Show the last seconds before death before the game over screen
+                if kill_cam.start(flight_recorder.frames(KILL_CAM_SECONDS)):
+                    game_state = "kill_cam"
+            elif replay_recorder.recording and current_frame_time - last_replay_sync > QUICK_SAVE_SYNC_INTERVAL:
+                # Journal replay frames as they accumulate so quick-saves stay fast
+                try:
+                    quick_save.sync_replay(replay_recorder)
+                except OSError as e:
+                    logger.warning(f"Failed to journal replay frames: {e}")
+                last_replay_sync = current_frame_time
+
+            if ghost_racer and replay_recorder.recording:
+                ghost_racer.update(current_frame_time - replay_recorder.start_time)
+                ghost_racer.draw(screen)
+
+            with interpolated(drawable, previous_positions, fixed_step.alpha):
+                # Particles and shots are drawn in batches, after everything else
+                sprite_batch.draw(screen, drawable)
+
+            score_text = font.render(f"Score: {score}", True, (255, 255, 255))
+            score_rect = score_text.get_rect(topleft=(20, 20))
+            screen.blit(score_text, score_rect)
+
+            lives_text = font.render(f"Lives: {lives}", True, (255, 255, 255))
+            lives_rect = lives_text.get_rect(topleft=(20, 50))
+            screen.blit(lives_text, lives_rect)
+
+            level_text = font.render(f"Level: {level}", True, (200, 200, 200))
+            level_rect = level_text.get_rect(topleft=(20, 80))
+            screen.blit(level_text, level_rect)
+
+            difficulty_color = {"easy": (0, 255, 0), "normal": (255, 255, 0), "hard": (255, 0, 0)}.get(
+                difficulty, (200, 200, 200)
+            )
+
+            difficulty_text = font.render(f"Difficulty: {difficulty.capitalize()}", True, difficulty_color)
+            difficulty_rect = difficulty_text.get_rect(topleft=(20, 110))
+            screen.blit(difficulty_text, difficulty_rect)
+
+            if player:
+                player.draw_weapon_hud(screen)
+
+            if level_up_timer > 0:
+                level_up_timer -= dt
+
+                size = int(72 * (1 + 0.2 * math.sin(level_up_timer * 10)))
+
+                level_font = pygame.font.Font(None, size)
+                level_surf = level_font.render(level_up_text, True, (255, 215, 0))
+                level_rect = level_surf.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 3))
+
+                alpha = int(255 * min(1, level_up_timer / (LEVEL_UP_DISPLAY_TIME / 2)))
+                if level_up_timer < LEVEL_UP_DISPLAY_TIME / 2:
+                    level_surf.set_alpha(alpha)
+
+                screen.blit(level_surf, level_rect)
+
             achievement_notifications.update(dt)
             achievement_notifications.draw(screen)
 
@@ -1264,6 +1444,11 @@ def main(args=None):
                 game_state = "main_menu"
                 main_menu.activate()
 
+        elif game_state == "kill_cam":
+            kill_cam.draw(screen, font)
+            if kill_cam.update(dt, events):
+                game_state = "game_over"
+
         elif game_state == "game_over":
             menu_starfield.update(dt)
             menu_starfield.draw(screen)
@@ -1333,44 +1518,7 @@ def main(args=None):
             # Get current frame
             frame = replay_player.get_current_frame()
             if frame:
-                # Draw player
-                pygame.draw.circle(screen, (0, 200, 255), (int(frame.player_pos[0]), int(frame.player_pos[1])), 10)
-
-                # Draw asteroids
-                for a in frame.asteroids:
-                    x = int(a.get('x', 0))
-                    y = int(a.get('y', 0))
-                    r = int(a.get('radius', 12))
-                    pygame.draw.circle(screen, (180, 180, 180), (x, y), r, 2)
-
-                # Draw enemies
-                for e in frame.enemies:
-                    x = int(e.get('x', 0))
-                    y = int(e.get('y', 0))
-                    r = int(e.get('radius', 14))
-                    pygame.draw.circle(screen, (255, 80, 80), (x, y), r, 2)
-
-                # Draw shots
-                for s in frame.shots:
-                    x = int(s.get('x', 0))
-                    y = int(s.get('y', 0))
-                    pygame.draw.circle(screen, (255, 255, 0), (x, y), 3)
-
-                # Draw powerups
-                for p in frame.powerups:
-                    x = int(p.get('x', 0))
-                    y = int(p.get('y', 0))
-                    pygame.draw.circle(screen, (0, 255, 0), (x, y), 6, 1)
-
-                # HUD text
-                score_text = font.render(f"Score: {frame.score}", True, (255, 255, 255))
-                screen.blit(score_text, (20, 20))
-
-                lives_text = font.render(f"Lives: {frame.lives}", True, (255, 255, 255))
-                screen.blit(lives_text, (20, 50))
-
-                level_text = font.render(f"Level: {frame.level}", True, (200, 200, 200))
-                screen.blit(level_text, (20, 80))
+                draw_replay_frame(screen, frame, font)
 
             # Draw replay HUD
             replay_viewer.draw_hud(screen)
@@ -1382,8 +1530,7 @@ def main(args=None):
 
         elif game_state == "help":
             # Keep game objects visible in background
-            for obj in drawable:
-                obj.draw(screen)
+            freeze_frame.draw(screen, drawable)
 
             action = help_screen.update(dt, events)
             help_screen.draw(screen)
@@ -1468,7 +1615,15 @@ def main(args=None):
 
         pygame.display.flip()
 
-        dt = clock.tick(60) / 1000.0
+        dt = clock.tick(args.fps) / 1000.0
+        if automation:
+            automation.record_frame(dt)
+
+        # Keep the seconds leading up to a long frame for later inspection
+        if args.debug and game_state == "playing":
+            hitch_path = flight_recorder.check_hitch(dt, time.time())
+            if hitch_path:
+                logger.warning(f"Frame took {dt * 1000:.0f} ms; flight recorder dumped to {hitch_path}")
 
 
 def player_hit():
@@ -1511,73 +1666,6 @@ def toggle_fullscreen():
         print("Switched to windowed mode")
 
 
-def quick_restart_game():
-    """Quickly restart the game without going through menus."""
-    global score, lives, level, last_spawn_time, spawn_interval, current_enemy_ships
-    global level_up_timer, level_up_text, boss_active, boss_defeated_timer, boss_defeated_message
-    global powerups_collected, asteroids_destroyed, shields_used, triple_shots_used, speed_boosts_used
-
-    # Stop any ongoing replay recording
-    if replay_recorder.recording:
-        replay_recorder.stop_recording(score, level)
-        try:
-            saved_path = replay_recorder.save_replay()
-            logger.info(f"Replay saved before restart: {saved_path}")
-        except OSError as e:
-            logger.error(f"Failed to save replay: {e}")
-
-    # Reset game state
-    score = 0
-    lives = PLAYER_LIVES
-    level = 1
-    level_up_timer = 0
-    level_up_text = ""
-    boss_active = False
-    boss_defeated_timer = 0
-    boss_defeated_message = ""
-
-    # Reset tracking stats
-    powerups_collected = 0
-    asteroids_destroyed = 0
-    shields_used = 0
-    triple_shots_used = 0
-    speed_boosts_used = 0
-
-    # Reset enemy spawn timers
-    last_spawn_time = time.time()
-    spawn_interval = random.uniform(10, 30)
-    current_enemy_ships = []
-
-    # Clear all game objects in one pass
-    for group in (asteroids, powerups, shots, particles, collidable, updatable):
-        for obj in list(group):
-            if obj is player:
-                continue
-            obj.kill()
-
-    # Respawn player
-    if player:
-        player.respawn()
-        player.position.x = RESPAWN_POSITION_X
-        player.position.y = RESPAWN_POSITION_Y
-        player.velocity.update(0, 0)
-        player.rotation = 0
-
-    # Start new game session
-    session_stats.start_game()
-
-    # Start new replay recording
-    selected_ship = ship_manager.current_ship
-    replay_recorder.start_recording(difficulty, selected_ship)
-
-    # Spawn initial asteroids
-    for _ in range(3):
-        asteroid_field.spawn_random()
-
-    logger.info("Quick restart: Game restarted")
-    return "playing"
-
-
 if __name__ == "__main__":
     args = parse_arguments()
     try:
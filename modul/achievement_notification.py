@@ -1,6 +1,5 @@
 """Achievement notification visuals and manager."""
 
-import time
 import pygame
 import modul.constants as C
 try:
@@ -14,33 +13,39 @@ except (ImportError, ModuleNotFoundError):  # pragma: no cover - fallback when i
 class AchievementNotification:
     """Visual notification for unlocked achievements, including animation and display logic."""
 
-    def __init__(self, achievement_name, achievement_description):
+    WIDTH = 320
+    HEIGHT = 80
+
+    def __init__(self, achievement_name, achievement_description, fonts=None):
         """Initialize an AchievementNotification.
 
         Args:
             achievement_name (str): Achievement name.
             achievement_description (str): Achievement description.
+            fonts (tuple, optional): Shared (title, description) fonts; created
+                on first draw when omitted.
         """
         self.name = achievement_name
         self.description = achievement_description
         self.display_time = 4.0
         self.fade_time = 1.0
-        self.start_time = time.time()
+        # Game seconds since the notification appeared, advanced by update()
+        self.elapsed = 0.0
         self.animation_progress = 0.0
         self.is_fading_out = False
         self.target_x = C.SCREEN_WIDTH - 350
         self.target_y = 80
         self.current_x = C.SCREEN_WIDTH
         self.current_y = self.target_y
-        self.title_font = pygame.font.Font(None, 32)
-        self.desc_font = pygame.font.Font(None, 20)
+        self.title_font, self.desc_font = fonts or (None, None)
         self.sound_played = False
+        # Panel with text, rendered on first draw; only position and alpha animate
+        self._panel = None
 
-    def update(self, _dt):
-        """Update animation progress; `_dt` accepted for API compatibility."""
-        current_time = time.time()
-        elapsed = current_time - self.start_time
-
+    def update(self, dt):
+        """Advance the animation by `dt` game seconds; returns False once expired."""
+        self.elapsed += dt
+        elapsed = self.elapsed
 
         if elapsed < self.fade_time:
             self.animation_progress = elapsed / self.fade_time
@@ -66,56 +71,43 @@ class AchievementNotification:
         """Ease out cubic animation function."""
         return 1 - (1 - t) ** 3
 
-    def draw(self, screen):
-        """Draw the achievement notification on the screen with fade effects."""
-        if self.animation_progress <= 0:
-            return
-
-        notification_width = 320
-        notification_height = 80
-        alpha = int(255 * self.animation_progress)
-        bg_surface = pygame.Surface((notification_width, notification_height), pygame.SRCALPHA)
+    def _render_panel(self):
+        """Render the gradient panel, border and text at full opacity."""
+        if self.title_font is None:
+            self.title_font = pygame.font.Font(None, 32)
+            self.desc_font = pygame.font.Font(None, 20)
+        width, height = self.WIDTH, self.HEIGHT
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
 
-        for i in range(notification_height):
-            gradient_alpha = int(alpha * 0.9 * (1 - i / notification_height * 0.3))
-            color = (20, 20, 60, gradient_alpha)
-            pygame.draw.rect(bg_surface, color, (0, i, notification_width, 1))
+        for i in range(height):
+            gradient_alpha = int(255 * 0.9 * (1 - i / height * 0.3))
+            panel.fill((20, 20, 60, gradient_alpha), (0, i, width, 1))
 
-        border_color = (255, 215, 0, alpha)
-        pygame.draw.rect(bg_surface, border_color, (0, 0, notification_width, notification_height), 3)
+        pygame.draw.rect(panel, (255, 215, 0), (0, 0, width, height), 3)
 
-        rect_x = int(self.current_x)
-        rect_y = int(self.current_y)
-        screen.blit(bg_surface, (rect_x, rect_y))
+        header_surf = self.title_font.render(gettext("achievement_unlocked"), True, (255, 215, 0))
+        panel.blit(header_surf, header_surf.get_rect(center=(width // 2, 20)))
 
-        header_color = (255, 215, 0, alpha)
-        header_text = gettext("achievement_unlocked")
-        header_surf = self.title_font.render(header_text, True, header_color)
-        header_rect = header_surf.get_rect(center=(rect_x + notification_width // 2, rect_y + 20))
-
-        if alpha < 255:
-            header_surf.set_alpha(alpha)
-        screen.blit(header_surf, header_rect)
-
-        name_color = (255, 255, 255, alpha)
-        name_surf = self.desc_font.render(self.name, True, name_color)
-        name_rect = name_surf.get_rect(center=(rect_x + notification_width // 2, rect_y + 45))
-
-        if alpha < 255:
-            name_surf.set_alpha(alpha)
-        screen.blit(name_surf, name_rect)
+        name_surf = self.desc_font.render(self.name, True, (255, 255, 255))
+        panel.blit(name_surf, name_surf.get_rect(center=(width // 2, 45)))
 
         desc_text = self.description
         if len(desc_text) > 35:
             desc_text = desc_text[:32] + "..."
 
-        desc_color = (200, 200, 200, alpha)
-        desc_surf = self.desc_font.render(desc_text, True, desc_color)
-        desc_rect = desc_surf.get_rect(center=(rect_x + notification_width // 2, rect_y + 65))
+        desc_surf = self.desc_font.render(desc_text, True, (200, 200, 200))
+        panel.blit(desc_surf, desc_surf.get_rect(center=(width // 2, 65)))
+        return panel
+
+    def draw(self, screen):
+        """Draw the achievement notification on the screen with fade effects."""
+        if self.animation_progress <= 0:
+            return
 
-        if alpha < 255:
-            desc_surf.set_alpha(alpha)
-        screen.blit(desc_surf, desc_rect)
+        if self._panel is None:
+            self._panel = self._render_panel()
+        self._panel.set_alpha(int(255 * self.animation_progress))
+        screen.blit(self._panel, (int(self.current_x), int(self.current_y)))
 
 
 class AchievementNotificationManager:
@@ -125,6 +117,8 @@ class AchievementNotificationManager:
         self.notifications = []
         self.max_notifications = 3
         self.sounds = sounds
+        # (title, description) fonts shared by all notifications
+        self.fonts = None
 
     def set_sounds(self, sounds):
         """Set the sounds object for playing achievement sounds."""
@@ -135,7 +129,9 @@ class AchievementNotificationManager:
         for notification in self.notifications:
             if notification.name == achievement_name:
                 return
-        notification = AchievementNotification(achievement_name, achievement_description)
+        if self.fonts is None:
+            self.fonts = (pygame.font.Font(None, 32), pygame.font.Font(None, 20))
+        notification = AchievementNotification(achievement_name, achievement_description, self.fonts)
         notification.target_y = 80 + len(self.notifications) * 90
         notification.current_y = notification.target_y
         self.notifications.append(notification)
@@ -1,10 +1,10 @@
 """Module modul.asteroid — minimal module docstring."""
 
 import math
-import random
 import pygame
 import logging
 
+from modul import rng
 from modul.circleshape import CircleShape
 from modul.constants import (ASTEROID_CRYSTAL_SPLIT_COUNT,
                              ASTEROID_ICE_VELOCITY_MULTIPLIER,
@@ -18,6 +18,7 @@ from modul.constants import (ASTEROID_CRYSTAL_SPLIT_COUNT,
 from modul.groups import collidable, drawable, updatable
 from modul.particle import Particle
 from modul.powerup import PowerUp
+from modul.ships import ship_sprites
 from modul.shot import Shot
 
 # Toggle to enable verbose enemy-ship debug output during development.
@@ -25,6 +26,10 @@ from modul.shot import Shot
 DEBUG = False
 logger = logging.getLogger(__name__)
 
+_asteroid_rng = rng.stream(rng.ASTEROIDS)
+_powerup_rng = rng.stream(rng.POWERUPS)
+_enemy_rng = rng.stream(rng.ENEMIES)
+
 
 class Asteroid(CircleShape, pygame.sprite.Sprite):
     """Represents an asteroid in the game with various types and behaviors."""
@@ -84,7 +89,7 @@ class Asteroid(CircleShape, pygame.sprite.Sprite):
         vertices = []
         for i in range(ASTEROID_VERTICES):
             angle = (i / ASTEROID_VERTICES) * 2 * math.pi
-            distance = self.radius * (1 - ASTEROID_IRREGULARITY + random.random() * ASTEROID_IRREGULARITY * 2)
+            distance = self.radius * (1 - ASTEROID_IRREGULARITY + _asteroid_rng.random() * ASTEROID_IRREGULARITY * 2)
             x = math.cos(angle) * distance
             y = math.sin(angle) * distance
             vertices.append((x, y))
@@ -193,7 +198,7 @@ class Asteroid(CircleShape, pygame.sprite.Sprite):
         # PowerUp spawn logic
         powerup_group = collidable
         powerups_count = len([sprite for sprite in powerup_group if isinstance(sprite, PowerUp)])
-        if random.random() < POWERUP_SPAWN_CHANCE and powerups_count < POWERUP_MAX_COUNT:
+        if _powerup_rng.random() < POWERUP_SPAWN_CHANCE and powerups_count < POWERUP_MAX_COUNT:
             PowerUp(self.position.x, self.position.y)
 
         # If minimum size, do not split further
@@ -207,7 +212,7 @@ class Asteroid(CircleShape, pygame.sprite.Sprite):
         if new_radius < ASTEROID_MIN_RADIUS:
             new_radius = ASTEROID_MIN_RADIUS
 
-        base_angle = random.uniform(20, 50)
+        base_angle = _asteroid_rng.uniform(20, 50)
         split_count = ASTEROID_CRYSTAL_SPLIT_COUNT if self.asteroid_type == ASTEROID_TYPE_CRYSTAL else 2
         velocity_multiplier = ASTEROID_ICE_VELOCITY_MULTIPLIER if self.asteroid_type == ASTEROID_TYPE_ICE else 1.2
         containers = getattr(type(self), 'containers', ())
@@ -219,7 +224,7 @@ class Asteroid(CircleShape, pygame.sprite.Sprite):
             else:
                 angle = base_angle if i == 0 else -base_angle
             velocity = self.velocity.rotate(angle) * velocity_multiplier
-            rotation_speed = (random.uniform(-0.25, 0.25) + self.velocity.length() * math.sin(math.radians(angle))) * 0.1
+            rotation_speed = (_asteroid_rng.uniform(-0.25, 0.25) + self.velocity.length() * math.sin(math.radians(angle))) * 0.1
             # Ensure children have strictly smaller radius
             child_radius = new_radius
             if child_radius >= self.radius:
@@ -244,10 +249,10 @@ class EnemyShip(CircleShape):
         """Initialize an enemy ship with position and size."""
         super().__init__(x, y, radius)
         self.radius = PLAYER_RADIUS
-        self.rotation_speed = random.uniform(-0.1, 0.1)
+        self.rotation_speed = _enemy_rng.uniform(-0.1, 0.1)
         self.rotation = 0
         # Ensure velocity is nonzero for tests
-        self.velocity = pygame.Vector2(random.choice([-1, 1]) * random.uniform(30, 60), random.choice([-1, 1]) * random.uniform(30, 60))
+        self.velocity = pygame.Vector2(_enemy_rng.choice([-1, 1]) * _enemy_rng.uniform(30, 60), _enemy_rng.choice([-1, 1]) * _enemy_rng.uniform(30, 60))
 
     def update(self, dt, player_position=None):
         """Update enemy ship position, rotation, and pursuit behavior."""
@@ -278,7 +283,8 @@ class EnemyShip(CircleShape):
                     logger.debug("EnemyShip moving towards player! Distance: %s", distance_to_player)
 
             else:
-                self.velocity *= 0.8
+                # Slow down by 0.8 per 1/60 s, independent of the step length
+                self.velocity *= 0.8 ** (dt * 60)
 
         if DEBUG:
             logger.debug("EnemyShip Position: %s, Velocity: %s", self.position, self.velocity)
@@ -295,7 +301,15 @@ class EnemyShip(CircleShape):
         self.kill()
 
     def draw(self, screen):
-        """Draw the enemy ship as a rotated polygon."""
+        """Draw the enemy ship from the ship sprite cache."""
+        ship_sprites.draw(
+            screen, self.position.x, self.position.y, math.degrees(self.rotation),
+            ("enemy", self.radius), math.ceil(self.radius) + 3, self._draw_hull,
+        )
+
+    def _draw_hull(self, surface, x, y, rotation):
+        """Draw the hull as a polygon centred on (x, y), rotated by `rotation` degrees."""
+        angle = math.radians(rotation)
         points = [
             (0, -self.radius),
             (-self.radius * 0.8, self.radius * 0.5),
@@ -306,14 +320,14 @@ class EnemyShip(CircleShape):
 
         rotated_points = [
             (
-                math.cos(self.rotation) * x - math.sin(self.rotation) * y,
-                math.sin(self.rotation) * x + math.cos(self.rotation) * y,
+                math.cos(angle) * px - math.sin(angle) * py,
+                math.sin(angle) * px + math.cos(angle) * py,
             )
-            for x, y in points
+            for px, py in points
         ]
 
-        points = [(self.position.x + x, self.position.y + y) for x, y in rotated_points]
-        pygame.draw.polygon(screen, "red", points, 2)
+        points = [(x + px, y + py) for px, py in rotated_points]
+        pygame.draw.polygon(surface, "red", points, 2)
 
     def kill(self):
         """Remove the enemy ship from all groups with explosion effect."""
@@ -1,10 +1,12 @@
 """AsteroidField generation and management."""
 
-import random
 import pygame
 import modul.constants as C
+from modul import rng
 from modul.asteroid import Asteroid
 
+_rng = rng.stream(rng.ASTEROIDS)
+
 
 class AsteroidField:
     """Manages asteroid spawning and field generation."""
@@ -35,7 +37,7 @@ class AsteroidField:
 
     def spawn(self, radius, position, velocity):
         """Spawn an asteroid at the given position with velocity."""
-        asteroid_type = random.choices(
+        asteroid_type = _rng.choices(
             list(C.ASTEROID_TYPE_WEIGHTS.keys()),
             weights=list(C.ASTEROID_TYPE_WEIGHTS.values())
         )[0]
@@ -64,14 +66,14 @@ class AsteroidField:
 
     def spawn_random(self):
         """Spawn a random asteroid from screen edges."""
-        edge_index = random.randint(0, 3)
+        edge_index = _rng.randint(0, 3)
 
-        rand_pos = random.random()
+        rand_pos = _rng.random()
 
         direction = self.edges[edge_index][0]
 
         position = self.edges[edge_index][1](rand_pos)
 
-        velocity = direction.rotate(random.uniform(-45, 45)) * random.uniform(30, 70)
+        velocity = direction.rotate(_rng.uniform(-45, 45)) * _rng.uniform(30, 70)
 
         self.spawn(C.ASTEROID_MAX_RADIUS, position, velocity)
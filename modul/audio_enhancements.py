@@ -12,6 +12,9 @@ from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import pygame
+
+from modul.game_clock import GameClock, game_clock
+
 try:
     import pyttsx3 as ttsdriver
     TTS_AVAILABLE = True
@@ -126,13 +129,14 @@ class DynamicMusicSystem:
 class VoiceAnnouncement:
     """Manages voice announcements for game events"""
 
-    def __init__(self):
-        """Initialize voice announcement system."""
+    def __init__(self, clock: Optional[GameClock] = None):
+        """Initialize voice announcement system; gaps are measured on `clock`."""
+        self.clock = clock or game_clock
         self.announcement_queue: List[Tuple[str, float]] = []  # (text, priority)
         self.current_announcement: Optional[str] = None
         self.announcement_timer = 0.0
         self.min_announcement_gap = 1.5  # Minimum seconds between announcements
-        self.last_announcement_time = 0.0
+        self.last_announcement_time = float("-inf")
         self.enabled = True
         self.tts_engine = None
         self.tts_initialized = False
@@ -191,7 +195,7 @@ class VoiceAnnouncement:
         if not self.announcement_enabled.get(event_type, True):
             return
 
-        current_time = time.time()
+        current_time = self.clock.now
         if current_time - self.last_announcement_time < self.min_announcement_gap:
             # Queue for later if too soon
             self.announcement_queue.append((event_type, priority))
@@ -213,7 +217,7 @@ class VoiceAnnouncement:
 
             self.current_announcement = announcement_text
             self.announcement_timer = 2.0  # Display text for 2 seconds
-            self.last_announcement_time = time.time()
+            self.last_announcement_time = self.clock.now
 
         except Exception as e:  # pylint: disable=broad-exception-caught
             print(f"Error playing announcement: {e}")
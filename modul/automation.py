@@ -0,0 +1,390 @@
+"""Local automation server for scripted test sessions.
+
+When the game is started with ``--automation ADDRESS`` it listens on a Unix
+socket (``unix:/path/to.sock``) or a loopback TCP port (``127.0.0.1:7777``
+or just ``7777``) for newline-delimited JSON requests::
+
+    {"id": 1, "cmd": "input", "actions": {"thrust": true, "shoot": true}}
+
+and answers each with one JSON line::
+
+    {"id": 1, "ok": true, "result": {...}}
+
+A response carrying binary data (e.g. ``world`` with ``"format": "binary"``)
+has a ``payload_bytes`` field and is followed directly by that many raw bytes.
+
+The server never blocks the frame loop: all sockets are non-blocking and
+`AutomationServer.poll` is called once per frame, reading whatever has
+arrived, flushing pending output and returning the complete requests. The
+game executes them in the loop, so commands see and change the same state
+as the keyboard does. ``ping`` and ``frame_stats`` are answered by the
+server itself; everything else is up to the caller.
+
+Usage:
+    python -m modul.automation 7777 '{"cmd": "frame_stats"}'
+"""
+
+import argparse
+import json
+import logging
+import os
+import selectors
+import socket
+import stat
+import sys
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Frames kept for `frame_stats` (10 s at 60 fps)
+FRAME_HISTORY = 600
+MAX_CLIENTS = 4
+# A longer line is a broken client; it is disconnected
+MAX_REQUEST_BYTES = 64 * 1024
+# Bounds the work one frame can be asked to do
+MAX_REQUESTS_PER_POLL = 32
+_RECV_SIZE = 65536
+_LOOPBACK_HOSTS = ("127.0.0.1", "localhost", "::1")
+
+Address = Union[str, Tuple[str, int]]
+
+
+def parse_address(spec: str) -> Tuple[int, Address]:
+    """Parse ``unix:PATH``, ``HOST:PORT`` or ``PORT`` into (family, address).
+
+    Only loopback hosts are accepted; the server is a local test tool and
+    must not be reachable from the network.
+    """
+    if spec.startswith("unix:"):
+        if not hasattr(socket, "AF_UNIX"):
+            raise ValueError("Unix sockets are not available on this platform")
+        path = spec[len("unix:"):]
+        if not path:
+            raise ValueError("Missing socket path in automation address")
+        return socket.AF_UNIX, path
+    host, _, port = spec.rpartition(":")
+    host = host.strip("[]") or "127.0.0.1"
+    if host not in _LOOPBACK_HOSTS:
+        raise ValueError(f"Automation server only listens on loopback, not '{host}'")
+    try:
+        port_number = int(port)
+    except ValueError:
+        raise ValueError(f"Invalid automation port '{port}'") from None
+    if not 0 <= port_number <= 65535:
+        raise ValueError(f"Invalid automation port '{port}'")
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    return family, (host, port_number)
+
+
+@dataclass
+class AutomationRequest:
+    """One decoded request, to be answered with `AutomationServer.reply`."""
+    client: Any
+    id: Any
+    command: str
+    params: Dict[str, Any] = field(default_factory=dict)
+
+
+class _Client:
+    """A connected socket and its pending input and output."""
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.inbuf = bytearray()
+        self.outbuf = bytearray()
+        self.closed = False
+
+
+class AutomationServer:
+    """Non-blocking JSON-lines control server, polled once per frame."""
+
+    def __init__(self, address: str, max_clients: int = MAX_CLIENTS):
+        """Listen on `address` (see `parse_address`) right away."""
+        self.family, self.address = parse_address(address)
+        self.max_clients = max_clients
+        self.clients: List[_Client] = []
+        self.frame_times: Deque[float] = deque(maxlen=FRAME_HISTORY)
+        # Actions injected by the `input` command; None leaves the keyboard in control
+        self.actions: Optional[Dict[str, bool]] = None
+        self.requests_handled = 0
+        self._selector = selectors.DefaultSelector()
+        self._listener = self._listen()
+        self._selector.register(self._listener, selectors.EVENT_READ, None)
+        logger.info("Automation server listening on %s", self.describe())
+
+    def _listen(self) -> socket.socket:
+        """Create the listening socket."""
+        sock = socket.socket(self.family, socket.SOCK_STREAM)
+        try:
+            if self.family == socket.AF_UNIX:
+                self._remove_stale_socket()
+                sock.bind(self.address)
+                # Other local users must not be able to drive the game
+                os.chmod(self.address, 0o600)
+            else:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                sock.bind(self.address)
+                self.address = sock.getsockname()[:2]
+            sock.listen(self.max_clients)
+            sock.setblocking(False)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def _remove_stale_socket(self):
+        """Delete a socket file left behind by a previous run."""
+        try:
+            mode = os.stat(self.address).st_mode
+        except FileNotFoundError:
+            return
+        if not stat.S_ISSOCK(mode):
+            raise OSError(f"'{self.address}' exists and is not a socket")
+        os.remove(self.address)
+
+    def describe(self) -> str:
+        """Return the address in the form accepted by `parse_address`."""
+        if self.family == socket.AF_UNIX:
+            return f"unix:{self.address}"
+        host, port = self.address
+        return f"[{host}]:{port}" if ":" in host else f"{host}:{port}"
+
+    def poll(self) -> List[AutomationRequest]:
+        """Accept, read and write without blocking; return the complete requests."""
+        for key, events in self._selector.select(timeout=0):
+            if key.data is None:
+                self._accept()
+                continue
+            client = key.data
+            if events & selectors.EVENT_READ:
+                self._read(client)
+            if events & selectors.EVENT_WRITE and not client.closed:
+                self._flush(client)
+
+        requests = []
+        for client in list(self.clients):
+            while not client.closed and len(requests) < MAX_REQUESTS_PER_POLL:
+                newline = client.inbuf.find(b"\n")
+                if newline < 0:
+                    break
+                line = bytes(client.inbuf[:newline])
+                del client.inbuf[:newline + 1]
+                request = self._decode(client, line)
+                if request is not None:
+                    requests.append(request)
+        return requests
+
+    def _accept(self):
+        """Accept a pending connection, refusing it when the server is full."""
+        try:
+            sock, _ = self._listener.accept()
+        except (BlockingIOError, InterruptedError):
+            return
+        if len(self.clients) >= self.max_clients:
+            logger.warning("Automation client refused: %d clients connected", len(self.clients))
+            sock.close()
+            return
+        sock.setblocking(False)
+        client = _Client(sock)
+        self.clients.append(client)
+        self._selector.register(sock, selectors.EVENT_READ, client)
+        logger.info("Automation client connected")
+
+    def _read(self, client: _Client):
+        """Append whatever the client has sent to its input buffer."""
+        try:
+            data = client.sock.recv(_RECV_SIZE)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as e:
+            logger.warning("Automation client read failed: %s", e)
+            self._drop(client)
+            return
+        if not data:
+            self._drop(client)
+            return
+        client.inbuf += data
+        if len(client.inbuf) > MAX_REQUEST_BYTES and b"\n" not in client.inbuf:
+            logger.warning("Automation request exceeds %d bytes; disconnecting client", MAX_REQUEST_BYTES)
+            self._drop(client)
+
+    def _decode(self, client: _Client, line: bytes) -> Optional[AutomationRequest]:
+        """Parse one request line; answers built-in commands and errors directly."""
+        if not line.strip():
+            return None
+        try:
+            message = json.loads(line)
+            if not isinstance(message, dict):
+                raise ValueError("request must be a JSON object")
+            command = message.pop("cmd", None)
+            if not isinstance(command, str):
+                raise ValueError("'cmd' must be a string")
+        except (ValueError, KeyError) as e:
+            self._send(client, {"id": None, "ok": False, "error": f"Bad request: {e}"})
+            return None
+        request = AutomationRequest(client, message.pop("id", None), command, message)
+        if command == "ping":
+            self.reply(request, {"pong": True})
+            return None
+        if command == "frame_stats":
+            self.reply(request, self.frame_stats())
+            return None
+        return request
+
+    def reply(self, request: AutomationRequest, result: Any = None, error: Optional[str] = None,
+              payload: Optional[bytes] = None):
+        """Answer `request` with `result`, or with `error` if given."""
+        self.requests_handled += 1
+        if error is not None:
+            message = {"id": request.id, "ok": False, "error": error}
+        else:
+            message = {"id": request.id, "ok": True, "result": result}
+            if payload is not None:
+                message["payload_bytes"] = len(payload)
+        self._send(request.client, message, payload)
+
+    def _send(self, client: _Client, message: Dict[str, Any], payload: Optional[bytes] = None):
+        """Queue a response and try to write it immediately."""
+        if client.closed:
+            return
+        client.outbuf += json.dumps(message, separators=(",", ":"), default=str).encode("utf-8") + b"\n"
+        if payload:
+            client.outbuf += payload
+        self._flush(client)
+
+    def _flush(self, client: _Client):
+        """Write as much pending output as the socket accepts."""
+        try:
+            while client.outbuf:
+                sent = client.sock.send(client.outbuf)
+                del client.outbuf[:sent]
+        except (BlockingIOError, InterruptedError):
+            pass
+        except OSError as e:
+            logger.warning("Automation client write failed: %s", e)
+            self._drop(client)
+            return
+        # Only ask for write readiness while output is waiting
+        events = selectors.EVENT_READ | (selectors.EVENT_WRITE if client.outbuf else 0)
+        self._selector.modify(client.sock, events, client)
+
+    def _drop(self, client: _Client):
+        """Disconnect a client."""
+        if client.closed:
+            return
+        client.closed = True
+        try:
+            self._selector.unregister(client.sock)
+        except (KeyError, ValueError):
+            pass
+        client.sock.close()
+        self.clients.remove(client)
+        logger.info("Automation client disconnected")
+
+    def record_frame(self, dt: float):
+        """Record the real duration of a frame in seconds."""
+        self.frame_times.append(dt)
+
+    def frame_stats(self) -> Dict[str, float]:
+        """Summarize the recorded frame times in milliseconds."""
+        if not self.frame_times:
+            return {"frames": 0}
+        times = sorted(self.frame_times)
+        count = len(times)
+        average = sum(times) / count
+
+        def percentile(p):
+            return times[min(count - 1, int(p * count))] * 1000
+
+        return {
+            "frames": count,
+            "fps": 1.0 / average if average > 0 else 0.0,
+            "avg_ms": average * 1000,
+            "min_ms": times[0] * 1000,
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+            "p99_ms": percentile(0.99),
+            "max_ms": times[-1] * 1000,
+        }
+
+    def close(self):
+        """Disconnect all clients and stop listening."""
+        for client in list(self.clients):
+            self._drop(client)
+        self._selector.unregister(self._listener)
+        self._listener.close()
+        self._selector.close()
+        if self.family == socket.AF_UNIX:
+            try:
+                os.remove(self.address)
+            except FileNotFoundError:
+                pass
+
+
+class AutomationClient:
+    """Blocking client for scripts and tests."""
+
+    def __init__(self, address: str, timeout: float = 5.0):
+        """Connect to a server listening on `address`."""
+        family, target = parse_address(address)
+        self.sock = socket.socket(family, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        self.sock.connect(target)
+        self._file = self.sock.makefile("rb")
+        self._next_id = 1
+
+    def send(self, command: str, **params) -> int:
+        """Send a request without waiting; returns its id."""
+        request_id = self._next_id
+        self._next_id += 1
+        message = dict(params, cmd=command, id=request_id)
+        self.sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+        return request_id
+
+    def receive(self) -> Dict[str, Any]:
+        """Read one response; a binary payload is returned under ``"payload"``."""
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("Automation server closed the connection")
+        response = json.loads(line)
+        size = response.get("payload_bytes")
+        if size:
+            response["payload"] = self._file.read(size)
+        return response
+
+    def request(self, command: str, **params) -> Dict[str, Any]:
+        """Send a request and wait for its response."""
+        self.send(command, **params)
+        return self.receive()
+
+    def close(self):
+        """Close the connection."""
+        self._file.close()
+        self.sock.close()
+
+
+def main(argv=None):
+    """Send requests to a running game and print the responses."""
+    parser = argparse.ArgumentParser(description="Send commands to a game started with --automation")
+    parser.add_argument("address", help="Server address, e.g. 7777 or unix:/tmp/ajitroids.sock")
+    parser.add_argument("requests", nargs="+", help='JSON requests, e.g. \'{"cmd": "frame_stats"}\'')
+    args = parser.parse_args(argv)
+
+    client = AutomationClient(args.address)
+    try:
+        for text in args.requests:
+            message = json.loads(text)
+            response = client.request(message.pop("cmd"), **message)
+            payload = response.pop("payload", None)
+            print(json.dumps(response, indent=2))
+            if payload is not None:
+                print(f"<{len(payload)} bytes of binary payload>")
+    finally:
+        client.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
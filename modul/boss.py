@@ -1,12 +1,14 @@
 """Boss enemy behavior, spawning and attack logic."""
 
 import math
-import random
 import pygame
 import modul.constants as C
+from modul import rng
 from modul.circleshape import CircleShape
 from modul.particle import Particle
 
+_rng = rng.stream(rng.BOSS)
+
 
 class Boss(CircleShape):
     """Boss enemy with health, movement, and attack patterns."""
@@ -73,7 +75,7 @@ class Boss(CircleShape):
             if self.movement_timer % 1.5 < dt:
                 margin = 100
                 self.target_position = pygame.Vector2(
-                    random.randint(margin, C.SCREEN_WIDTH - margin), random.randint(margin, C.SCREEN_HEIGHT - margin)
+                    _rng.randint(margin, C.SCREEN_WIDTH - margin), _rng.randint(margin, C.SCREEN_HEIGHT - margin)
                 )
             self._move_towards(self.target_position, C.BOSS_MOVE_SPEED * 0.7)
         elif self.movement_phase == "chase" and player_position:
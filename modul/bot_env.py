@@ -0,0 +1,451 @@
+"""Bot training environment on top of the headless simulation.
+
+`AjitroidsEnv` wraps a `GameWorld` in the familiar ``reset(seed)`` /
+``step(action)`` interface. Observations are flat ``float32`` NumPy arrays:
+the player's state followed by the K nearest asteroids and the K nearest
+enemies (enemy ships, the boss and its projectiles), each relative to the
+player on the wrapping playfield. The reward is the score gained during the
+step.
+
+`VectorEnv` runs many environments across worker processes. Workers write
+observations, rewards and done flags straight into shared memory, so a step
+only sends the actions and a short acknowledgement through the pipes.
+
+Usage:
+    python -m modul.bot_env bench --envs 16 --workers 1 2 4 8
+"""
+
+import argparse
+import logging
+import math
+import multiprocessing
+import os
+import sys
+import time
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import pygame
+
+import modul.constants as C
+from modul import rng
+from modul.bossprojectile import BossProjectile
+from modul.raster_obs import RasterRenderer
+from modul.simulation import ACTIONS, GameWorld
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is listed in requirements.txt
+    np = None
+
+logger = logging.getLogger(__name__)
+
+# Discrete action table: index -> held actions
+ACTION_TABLE: Tuple[Tuple[str, ...], ...] = (
+    (),
+    ("rotate_left",),
+    ("rotate_right",),
+    ("thrust",),
+    ("reverse",),
+    ("shoot",),
+    ("thrust", "shoot"),
+    ("rotate_left", "shoot"),
+    ("rotate_right", "shoot"),
+    ("rotate_left", "thrust"),
+    ("rotate_right", "thrust"),
+    ("switch_weapon",),
+)
+
+PLAYER_FEATURES = 9
+ENTITY_FEATURES = 6
+DEFAULT_K_ASTEROIDS = 8
+DEFAULT_K_ENEMIES = 4
+
+_HALF_WIDTH = C.SCREEN_WIDTH / 2
+_HALF_HEIGHT = C.SCREEN_HEIGHT / 2
+_SPEED_SCALE = float(C.PLAYER_MAX_SPEED)
+
+# The environment whose gameplay state currently lives in the shared entity
+# containers and random streams of this process
+_active_env: Optional["AjitroidsEnv"] = None
+
+
+def _require_numpy():
+    """Raise a helpful error when numpy is missing."""
+    if np is None:
+        raise RuntimeError("The bot environment requires numpy (pip install -r requirements.txt)")
+
+
+def observation_size(k_asteroids: int = DEFAULT_K_ASTEROIDS, k_enemies: int = DEFAULT_K_ENEMIES) -> int:
+    """Return the length of an observation vector."""
+    return PLAYER_FEATURES + (k_asteroids + k_enemies) * ENTITY_FEATURES
+
+
+def _wrapped_delta(dx: float, dy: float) -> Tuple[float, float]:
+    """Return the shortest offset on the wrapping playfield."""
+    if dx > _HALF_WIDTH:
+        dx -= C.SCREEN_WIDTH
+    elif dx < -_HALF_WIDTH:
+        dx += C.SCREEN_WIDTH
+    if dy > _HALF_HEIGHT:
+        dy -= C.SCREEN_HEIGHT
+    elif dy < -_HALF_HEIGHT:
+        dy += C.SCREEN_HEIGHT
+    return dx, dy
+
+
+def _action_mapping(action) -> Dict[str, bool]:
+    """Convert a table index, action mapping or per-action flags to a mapping."""
+    if isinstance(action, dict):
+        return {name: bool(action.get(name, False)) for name in ACTIONS}
+    if isinstance(action, (int, np.integer)):
+        held = ACTION_TABLE[int(action)]
+        return {name: name in held for name in ACTIONS}
+    flags = list(action)
+    if len(flags) != len(ACTIONS):
+        raise ValueError(f"Expected {len(ACTIONS)} action flags, got {len(flags)}")
+    return {name: bool(flag) for name, flag in zip(ACTIONS, flags)}
+
+
+class AjitroidsEnv:
+    """Single headless game exposed as a reinforcement learning environment."""
+
+    def __init__(
+        self,
+        difficulty: str = "normal",
+        ship_type: str = "standard",
+        k_asteroids: int = DEFAULT_K_ASTEROIDS,
+        k_enemies: int = DEFAULT_K_ENEMIES,
+        frame_skip: int = 1,
+        max_steps: int = 0,
+        life_penalty: float = 0.0,
+    ):
+        """Configure the environment; call `reset` before stepping.
+
+        Each `step` holds the action for `frame_skip` simulation ticks.
+        Episodes are truncated after `max_steps` steps (0 for no limit), and
+        `life_penalty` is subtracted from the reward for every life lost.
+        """
+        _require_numpy()
+        self.difficulty = difficulty
+        self.ship_type = ship_type
+        self.k_asteroids = k_asteroids
+        self.k_enemies = k_enemies
+        self.frame_skip = max(1, frame_skip)
+        self.max_steps = max_steps
+        self.life_penalty = life_penalty
+        self.observation_size = observation_size(k_asteroids, k_enemies)
+        self.action_count = len(ACTION_TABLE)
+        self.world: Optional[GameWorld] = None
+        self.steps = 0
+        self._rng_state: Optional[Dict[str, tuple]] = None
+        self._renderer: Optional[RasterRenderer] = None
+
+    def _park_active(self):
+        """Save the random streams of the environment that is live right now."""
+        if _active_env is not None and _active_env is not self and _active_env.world is not None:
+            _active_env._rng_state = rng.get_state()  # pylint: disable=protected-access
+
+    def _activate(self):
+        """Make this environment's world and random streams the live ones.
+
+        Several environments can share a process; the entity containers and
+        random streams are per process, so they are swapped on demand.
+        """
+        global _active_env  # pylint: disable=global-statement
+        if _active_env is self:
+            return
+        self._park_active()
+        if self._rng_state is not None:
+            rng.set_state(self._rng_state)
+        self.world.bind()
+        _active_env = self
+
+    def reset(self, seed: Optional[int] = None) -> Tuple[Any, Dict[str, Any]]:
+        """Start a new episode and return ``(observation, info)``."""
+        global _active_env  # pylint: disable=global-statement
+        self._park_active()
+        seed = rng.new_seed() if seed is None else seed
+        self.world = GameWorld(self.difficulty, self.ship_type, seed=seed)
+        self._rng_state = None
+        _active_env = self
+        self.steps = 0
+        return self.observe(), {"seed": seed}
+
+    def step(self, action) -> Tuple[Any, float, bool, bool, Dict[str, Any]]:
+        """Apply `action` and return ``(observation, reward, terminated, truncated, info)``.
+
+        `action` is an index into `ACTION_TABLE`, a mapping of action names
+        or a sequence of one flag per entry in `simulation.ACTIONS`.
+        """
+        if self.world is None:
+            raise RuntimeError("Call reset() before step()")
+        self._activate()
+        world = self.world
+        world.set_actions(_action_mapping(action))
+        score, lives = world.score, world.lives
+        for _ in range(self.frame_skip):
+            world.step()
+            if world.game_over:
+                break
+        self.steps += 1
+        reward = float(world.score - score)
+        if world.lives < lives:
+            reward -= self.life_penalty * (lives - world.lives)
+        terminated = world.game_over
+        truncated = not terminated and self.max_steps > 0 and self.steps >= self.max_steps
+        info = {"score": world.score, "lives": world.lives, "level": world.level, "tick": world.tick}
+        return self.observe(), reward, terminated, truncated, info
+
+    def observe(self, out=None):
+        """Write the current observation into `out` (or a new array) and return it."""
+        obs = np.zeros(self.observation_size, dtype=np.float32) if out is None else out
+        if out is not None:
+            obs.fill(0.0)
+        world = self.world
+        player = world.player
+        px, py = player.position.x, player.position.y
+        rotation = math.radians(player.rotation)
+        obs[:PLAYER_FEATURES] = (
+            px / C.SCREEN_WIDTH,
+            py / C.SCREEN_HEIGHT,
+            player.velocity.x / _SPEED_SCALE,
+            player.velocity.y / _SPEED_SCALE,
+            math.sin(rotation),
+            math.cos(rotation),
+            world.lives / C.PLAYER_LIVES,
+            float(player.shield_active),
+            float(player.invincible),
+        )
+        offset = self._write_nearest(obs, PLAYER_FEATURES, world.asteroids, self.k_asteroids, px, py)
+        enemies: List[Any] = list(world.enemies)
+        if world.boss_active and world.boss is not None:
+            enemies.append(world.boss)
+        enemies.extend(obj for obj in world.updatable if isinstance(obj, BossProjectile))
+        self._write_nearest(obs, offset, enemies, self.k_enemies, px, py)
+        return obs
+
+    def render(self, size: Tuple[int, int] = (84, 84), grayscale: bool = True):
+        """Return the playfield as a small ``uint8`` image for pixel-based agents."""
+        if self._renderer is None or (self._renderer.width, self._renderer.height) != tuple(size) \
+                or self._renderer.grayscale != grayscale:
+            self._renderer = RasterRenderer(size, grayscale)
+        return self._renderer.render(self.world)
+
+    @staticmethod
+    def _write_nearest(obs, offset: int, entities, k: int, px: float, py: float) -> int:
+        """Fill `k` entity slots from `offset` with the nearest `entities`."""
+        if k <= 0:
+            return offset
+        nearest = []
+        for entity in entities:
+            dx, dy = _wrapped_delta(entity.position.x - px, entity.position.y - py)
+            nearest.append((dx * dx + dy * dy, dx, dy, entity))
+        nearest.sort(key=lambda item: item[0])
+        for _, dx, dy, entity in nearest[:k]:
+            velocity = getattr(entity, "velocity", None)
+            obs[offset:offset + ENTITY_FEATURES] = (
+                dx / C.SCREEN_WIDTH,
+                dy / C.SCREEN_HEIGHT,
+                velocity.x / _SPEED_SCALE if velocity is not None else 0.0,
+                velocity.y / _SPEED_SCALE if velocity is not None else 0.0,
+                entity.radius / C.ASTEROID_MAX_RADIUS,
+                1.0,
+            )
+            offset += ENTITY_FEATURES
+        return offset + (k - min(k, len(nearest))) * ENTITY_FEATURES
+
+
+def _worker(conn, shm_names, num_envs, env_range, env_kwargs, obs_size):
+    """Step a slice of the vectorized environments in a child process."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    logging.getLogger().setLevel(logging.WARNING)
+    pygame.init()
+    buffers = [shared_memory.SharedMemory(name=name) for name in shm_names]
+    try:
+        obs = np.ndarray((num_envs, obs_size), dtype=np.float32, buffer=buffers[0].buf)
+        rewards = np.ndarray((num_envs,), dtype=np.float32, buffer=buffers[1].buf)
+        dones = np.ndarray((num_envs, 2), dtype=np.bool_, buffer=buffers[2].buf)
+        start, stop = env_range
+        envs = [AjitroidsEnv(**env_kwargs) for _ in range(start, stop)]
+        # Seed of each env's current episode; None when reset without a seed
+        seeds: List[Optional[int]] = [None] * len(envs)
+        while True:
+            command, payload = conn.recv()
+            if command == "reset":
+                infos = []
+                for i, env in enumerate(envs):
+                    obs[start + i], info = env.reset(payload[i])
+                    seeds[i] = payload[i]
+                    infos.append(info)
+                dones[start:stop] = False
+                conn.send(infos)
+            elif command == "step":
+                infos = []
+                for i, env in enumerate(envs):
+                    observation, reward, terminated, truncated, info = env.step(payload[i])
+                    if terminated or truncated:
+                        info["final_observation"] = observation
+                        # Later episodes of a seeded env continue its own sequence
+                        if seeds[i] is not None:
+                            seeds[i] += num_envs
+                        observation, reset_info = env.reset(seeds[i])
+                        info["reset_seed"] = reset_info["seed"]
+                    obs[start + i] = observation
+                    rewards[start + i] = reward
+                    dones[start + i] = (terminated, truncated)
+                    infos.append(info)
+                conn.send(infos)
+            elif command == "close":
+                break
+    finally:
+        for buffer in buffers:
+            buffer.close()
+        conn.close()
+
+
+class VectorEnv:
+    """Steps `num_envs` environments in `num_workers` processes.
+
+    Finished episodes reset automatically; the last observation of the
+    finished episode is passed in ``info["final_observation"]`` and the seed
+    of the new episode in ``info["reset_seed"]``.
+    """
+
+    def __init__(self, num_envs: int, num_workers: Optional[int] = None, **env_kwargs):
+        """Start the workers; `env_kwargs` are passed to every `AjitroidsEnv`."""
+        _require_numpy()
+        self.num_envs = num_envs
+        self.num_workers = max(1, min(num_envs, num_workers or os.cpu_count() or 1))
+        self.observation_size = observation_size(
+            env_kwargs.get("k_asteroids", DEFAULT_K_ASTEROIDS), env_kwargs.get("k_enemies", DEFAULT_K_ENEMIES))
+        self.action_count = len(ACTION_TABLE)
+
+        self._buffers = [
+            shared_memory.SharedMemory(create=True, size=num_envs * self.observation_size * 4),
+            shared_memory.SharedMemory(create=True, size=num_envs * 4),
+            shared_memory.SharedMemory(create=True, size=num_envs * 2),
+        ]
+        self.observations = np.ndarray((num_envs, self.observation_size), dtype=np.float32, buffer=self._buffers[0].buf)
+        self.rewards = np.ndarray((num_envs,), dtype=np.float32, buffer=self._buffers[1].buf)
+        self._dones = np.ndarray((num_envs, 2), dtype=np.bool_, buffer=self._buffers[2].buf)
+
+        # Workers import pygame again; keep its banner out of the output
+        os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+        context = multiprocessing.get_context("spawn")
+        bounds = [round(i * num_envs / self.num_workers) for i in range(self.num_workers + 1)]
+        self._ranges = list(zip(bounds[:-1], bounds[1:]))
+        self._pipes = []
+        self._processes = []
+        names = [buffer.name for buffer in self._buffers]
+        for env_range in self._ranges:
+            parent, child = context.Pipe()
+            process = context.Process(
+                target=_worker, args=(child, names, num_envs, env_range, env_kwargs, self.observation_size), daemon=True)
+            process.start()
+            child.close()
+            self._pipes.append(parent)
+            self._processes.append(process)
+        self.closed = False
+
+    def _broadcast(self, command: str, values: Sequence) -> List[Dict[str, Any]]:
+        """Send each worker its slice of `values` and collect the infos."""
+        for pipe, (start, stop) in zip(self._pipes, self._ranges):
+            pipe.send((command, list(values[start:stop])))
+        infos: List[Dict[str, Any]] = []
+        for pipe in self._pipes:
+            infos.extend(pipe.recv())
+        return infos
+
+    def reset(self, seed: Optional[int] = None):
+        """Reset all environments; env ``i`` is seeded with ``seed + i``.
+
+        Its automatic resets continue with ``seed + i + k * num_envs`` for
+        the ``k``-th later episode, so every episode of a seeded run is
+        reproducible and no two envs share a seed.
+        """
+        seeds = [None if seed is None else seed + i for i in range(self.num_envs)]
+        infos = self._broadcast("reset", seeds)
+        return self.observations.copy(), infos
+
+    def step(self, actions: Sequence):
+        """Step every environment with its action from `actions`.
+
+        Returns ``(observations, rewards, terminated, truncated, infos)``.
+        The arrays are copies; `observations` and `rewards` attributes are
+        views of the shared buffers for callers that want to avoid copying.
+        """
+        infos = self._broadcast("step", actions)
+        return (self.observations.copy(), self.rewards.copy(),
+                self._dones[:, 0].copy(), self._dones[:, 1].copy(), infos)
+
+    def close(self):
+        """Stop the workers and free the shared memory."""
+        if self.closed:
+            return
+        self.closed = True
+        for pipe in self._pipes:
+            try:
+                pipe.send(("close", None))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        for buffer in self._buffers:
+            buffer.close()
+            buffer.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def benchmark(num_envs: int, workers: Sequence[int], steps: int, seed: int = 0) -> List[Tuple[int, float]]:
+    """Return aggregate environment steps per second for each worker count."""
+    results = []
+    for count in workers:
+        with VectorEnv(num_envs, count) as envs:
+            envs.reset(seed)
+            action_rng = np.random.default_rng(seed)
+            # Warm up so worker start-up is not counted
+            envs.step(action_rng.integers(0, envs.action_count, num_envs))
+            started = time.perf_counter()
+            for _ in range(steps):
+                envs.step(action_rng.integers(0, envs.action_count, num_envs))
+            elapsed = time.perf_counter() - started
+        results.append((envs.num_workers, steps * num_envs / elapsed))
+    return results
+
+
+def parse_arguments(argv=None):
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Ajitroids bot environment tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+    bench = commands.add_parser("bench", help="Measure vectorized steps per second")
+    bench.add_argument("--envs", type=int, default=16, help="Number of environments")
+    bench.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="Worker counts to compare")
+    bench.add_argument("--steps", type=int, default=500, help="Vector steps per measurement")
+    bench.add_argument("--seed", type=int, default=0, help="Base seed")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    args = parse_arguments(argv)
+    logging.basicConfig(level=logging.WARNING)
+    _require_numpy()
+    print(f"{'workers':>8} {'steps/s':>12} {'speedup':>8}")
+    baseline = None
+    for count, rate in benchmark(args.envs, args.workers, args.steps, args.seed):
+        baseline = baseline or rate
+        print(f"{count:>8} {rate:>12,.0f} {rate / baseline:>7.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,6 +4,11 @@ import random
 
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
+TARGET_FPS = 60
+# Gameplay advances in fixed steps at this rate, independent of the frame rate
+SIMULATION_TICK_RATE = 120
+# Catch-up limit after a slow frame; any time beyond it is dropped
+MAX_SIMULATION_STEPS = 8
 ASTEROID_MIN_RADIUS = 20
 ASTEROID_KINDS = 3
 ASTEROID_SPAWN_RATE = 0.8
@@ -57,6 +62,10 @@ PLAYER_FRICTION = 0.02
 PLAYER_ROTATION_SPEED = 180
 PLAYER_SHOOT_SPEED = 500
 PLAYER_SHOOT_COOLDOWN = 0.3
+# Ships are drawn from sprites pre-rasterized every this many degrees;
+# False draws them with exact vector geometry instead
+SHIP_SPRITE_ANGLE_STEP = 2.0
+SHIP_SPRITE_CACHE = True
 SHOT_RADIUS = 5
 SCORE_LARGE = 20
 SCORE_MEDIUM = 50
@@ -67,15 +76,29 @@ RESPAWN_POSITION_X = SCREEN_WIDTH / 2
 RESPAWN_POSITION_Y = SCREEN_HEIGHT / 2
 EXPLOSION_PARTICLES = 15
 PARTICLE_COLORS = ["white", "yellow", "red"]
-STAR_COUNT = 100
+PARTICLE_SIZE = 2
+# Live particles allowed at once; bursts shrink as the count approaches it
+MAX_LIVE_PARTICLES = 600
+# Fraction of the budget in use at which bursts start using fewer, larger particles
+PARTICLE_LOD_START = 0.5
+PARTICLE_LOD_MIN_BURST = 4
+STAR_COUNT = 2000
 STAR_SIZES = [1, 2, 3]
+# Most stars are single pixels so a dense field stays a backdrop
+STAR_SIZE_WEIGHTS = [0.75, 0.2, 0.05]
 STAR_COLORS = ["white", "lightblue", "yellow"]
+# Frozen playfield behind the pause and help overlays: downscale factor for the
+# blur (1 = sharp) and fraction of brightness taken away (0 = none)
+PAUSE_BACKDROP_BLUR = 1
+PAUSE_BACKDROP_DIM = 0.0
 COLLISION_DEBUG = False
 
 POWERUP_RADIUS = 15
 POWERUP_SPAWN_CHANCE = 0.3
 POWERUP_MAX_COUNT = 3
 POWERUP_LIFETIME = 15.0
+# Pre-rendered icon sizes between the smallest and the full pulse
+POWERUP_PULSE_STEPS = 8
 SHIELD_DURATION = 3.0
 POWERUP_TYPES = ["shield", "triple_shot", "rapid_fire", "laser_weapon", "missile_weapon", "shotgun_weapon"]
 POWERUP_COLORS = {
@@ -104,6 +127,8 @@ MENU_TITLE_COLOR = "cyan"
 MENU_ITEM_SPACING = 50
 MENU_TRANSITION_SPEED = 0.5
 MENU_BACKGROUND_ALPHA = 180
+# Hover animation frames pre-rendered per menu item
+MENU_HOVER_STEPS = 8
 
 MENU_BUTTON_WIDTH = 300
 MENU_BUTTON_HEIGHT = 50
@@ -0,0 +1,302 @@
+"""Determinism checker for the gameplay simulation.
+
+A seeded, headless `GameWorld` is driven by a scripted input sequence. After
+every tick the world is quantized (positions and velocities to 1/100 px) and
+hashed per entity category with CRC32; the category hashes are chained into
+a rolling hash. Two traces agree exactly when the simulation produced the
+same quantized state on every tick, and the first tick whose rolling hash
+differs pinpoints where behaviour changed.
+
+Usage:
+    # Run the same seed twice in one process
+    python -m modul.determinism check --seed 7 --ticks 7200
+
+    # Compare two code revisions: record on each checkout, then compare
+    python -m modul.determinism record --seed 7 -o before.json.gz
+    python -m modul.determinism record --seed 7 -o after.json.gz
+    python -m modul.determinism compare before.json.gz after.json.gz
+"""
+
+import argparse
+import gzip
+import json
+import logging
+import os
+import random
+import sys
+import zlib
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import pygame
+
+import modul.constants as C
+from modul.simulation import ACTIONS, MAX_ENEMY_SHIPS, GameWorld
+
+logger = logging.getLogger(__name__)
+
+CATEGORIES = ("stats", "player", "asteroids", "shots", "powerups", "enemies", "boss")
+QUANTIZE_SCALE = 100
+# One minute of game time
+DEFAULT_TICKS = 60 * C.SIMULATION_TICK_RATE
+# How long the scripted pilot holds each action combination (1/3 s)
+SCRIPT_HOLD_TICKS = C.SIMULATION_TICK_RATE // 3
+
+_ASTEROID_TYPES = {name: i for i, name in enumerate(C.ASTEROID_TYPES)}
+_POWERUP_TYPES = {name: i for i, name in enumerate(C.POWERUP_TYPES)}
+_SHOT_TYPES = {name: i for i, name in enumerate(C.WEAPON_COLORS)}
+
+
+def _q(value: float) -> int:
+    """Quantize a float to an integer grid."""
+    return int(round(value * QUANTIZE_SCALE))
+
+
+def quantize_world(world: GameWorld) -> Dict[str, List[Tuple[int, ...]]]:
+    """Return the world's gameplay state as integer tuples per category."""
+    player = world.player
+    boss = world.boss if world.boss_active and world.boss is not None else None
+    return {
+        "stats": [(world.score, world.lives, world.level)],
+        "player": [(
+            _q(player.position.x), _q(player.position.y), _q(player.rotation),
+            _q(player.velocity.x), _q(player.velocity.y),
+            int(player.invincible), int(player.shield_active),
+        )],
+        "asteroids": [
+            (_q(a.position.x), _q(a.position.y), _q(a.velocity.x), _q(a.velocity.y),
+             int(a.radius), _ASTEROID_TYPES.get(a.asteroid_type, -1), a.health)
+            for a in world.asteroids
+        ],
+        "shots": [
+            (_q(s.position.x), _q(s.position.y), _q(s.velocity.x), _q(s.velocity.y),
+             _SHOT_TYPES.get(s.shot_type, -1))
+            for s in world.shots
+        ],
+        "powerups": [
+            (_q(p.position.x), _q(p.position.y), _POWERUP_TYPES.get(p.type, -1))
+            for p in world.powerups
+        ],
+        "enemies": [
+            (_q(e.position.x), _q(e.position.y), _q(e.velocity.x), _q(e.velocity.y))
+            for e in world.enemies
+        ],
+        "boss": [(_q(boss.position.x), _q(boss.position.y), boss.health)] if boss else [],
+    }
+
+
+def hash_state(state: Dict[str, List[Tuple[int, ...]]]) -> Tuple[int, ...]:
+    """Return one CRC32 per category of a quantized state."""
+    hashes = []
+    for category in CATEGORIES:
+        entities = state[category]
+        values = array("q", [len(entities)])
+        for entity in entities:
+            values.extend(entity)
+        hashes.append(zlib.crc32(values.tobytes()))
+    return tuple(hashes)
+
+
+def scripted_actions(seed: int) -> Iterator[Dict[str, bool]]:
+    """Yield a reproducible pilot input per tick.
+
+    Uses its own generator so the input never consumes the game's random
+    numbers.
+    """
+    rng = random.Random(seed)
+    while True:
+        actions = {action: rng.random() < 0.4 for action in ACTIONS}
+        actions["shoot"] = rng.random() < 0.8
+        actions["switch_weapon"] = rng.random() < 0.05
+        for _ in range(SCRIPT_HOLD_TICKS):
+            yield actions
+
+
+@dataclass
+class Trace:
+    """Per-tick hashes of one simulation run."""
+    seed: int
+    difficulty: str
+    ship_type: str
+    rolling: List[int] = field(default_factory=list)
+    categories: List[Tuple[int, ...]] = field(default_factory=list)
+    states: Optional[List[Dict[str, List[Tuple[int, ...]]]]] = None
+
+    @property
+    def ticks(self) -> int:
+        """Number of ticks recorded."""
+        return len(self.rolling)
+
+    def to_dict(self) -> Dict:
+        """Return a JSON-serialisable representation."""
+        return {
+            "seed": self.seed,
+            "difficulty": self.difficulty,
+            "ship_type": self.ship_type,
+            "category_names": list(CATEGORIES),
+            "rolling": self.rolling,
+            "categories": [list(c) for c in self.categories],
+            "states": self.states,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Trace":
+        """Rebuild a trace written by `to_dict`."""
+        states = data.get("states")
+        if states is not None:
+            states = [{k: [tuple(e) for e in v] for k, v in state.items()} for state in states]
+        return cls(
+            seed=data["seed"],
+            difficulty=data["difficulty"],
+            ship_type=data["ship_type"],
+            rolling=list(data["rolling"]),
+            categories=[tuple(c) for c in data["categories"]],
+            states=states,
+        )
+
+
+@dataclass
+class Divergence:
+    """First point at which two traces disagree."""
+    tick: int
+    category: Optional[str]
+    entity_index: Optional[int] = None
+    expected: Optional[Tuple[int, ...]] = None
+    actual: Optional[Tuple[int, ...]] = None
+
+    def describe(self) -> str:
+        """Return a one-line explanation."""
+        if self.category is None:
+            return f"Traces have different lengths; first missing tick is {self.tick}"
+        text = f"First divergence at tick {self.tick} in {self.category}"
+        if self.entity_index is not None:
+            text += f" (entity {self.entity_index}: {self.expected} != {self.actual})"
+        return text
+
+
+def run_trace(
+    seed: int,
+    ticks: int = DEFAULT_TICKS,
+    difficulty: str = "normal",
+    ship_type: str = "standard",
+    keep_states: bool = False,
+) -> Trace:
+    """Simulate `ticks` ticks from `seed` and return their hashes.
+
+    The run stops early on game over. With `keep_states` the quantized
+    state of every tick is stored too, so a divergence can be traced to a
+    single entity.
+    """
+    world = GameWorld(difficulty, ship_type, seed=seed)
+    pilot = scripted_actions(seed)
+    trace = Trace(seed, difficulty, ship_type, states=[] if keep_states else None)
+    rolling = 0
+    for _ in range(ticks):
+        world.set_actions(next(pilot))
+        world.step()
+        state = quantize_world(world)
+        hashes = hash_state(state)
+        rolling = zlib.crc32(array("Q", hashes).tobytes(), rolling)
+        trace.rolling.append(rolling)
+        trace.categories.append(hashes)
+        if trace.states is not None:
+            trace.states.append(state)
+        if world.game_over:
+            break
+    return trace
+
+
+def _first_entity_difference(
+    expected: Sequence[Tuple[int, ...]], actual: Sequence[Tuple[int, ...]]
+) -> Tuple[int, Optional[Tuple[int, ...]], Optional[Tuple[int, ...]]]:
+    """Return the index and values of the first differing entity."""
+    for index in range(max(len(expected), len(actual))):
+        a = expected[index] if index < len(expected) else None
+        b = actual[index] if index < len(actual) else None
+        if a != b:
+            return index, a, b
+    return 0, None, None
+
+
+def compare_traces(expected: Trace, actual: Trace) -> Optional[Divergence]:
+    """Return the first `Divergence` between two traces, or None if identical."""
+    for tick, (a, b) in enumerate(zip(expected.rolling, actual.rolling)):
+        if a == b:
+            continue
+        cat_a, cat_b = expected.categories[tick], actual.categories[tick]
+        index = next(i for i, (x, y) in enumerate(zip(cat_a, cat_b)) if x != y)
+        category = CATEGORIES[index]
+        divergence = Divergence(tick, category)
+        if expected.states is not None and actual.states is not None:
+            divergence.entity_index, divergence.expected, divergence.actual = _first_entity_difference(
+                expected.states[tick][category], actual.states[tick][category])
+        return divergence
+    if expected.ticks != actual.ticks:
+        return Divergence(min(expected.ticks, actual.ticks), None)
+    return None
+
+
+def save_trace(trace: Trace, path: str):
+    """Write a trace as gzip-compressed JSON."""
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump(trace.to_dict(), f, separators=(",", ":"))
+
+
+def load_trace(path: str) -> Trace:
+    """Read a trace written by `save_trace`."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return Trace.from_dict(json.load(f))
+
+
+def parse_arguments(argv=None):
+    """Parse command-line arguments for the checker."""
+    parser = argparse.ArgumentParser(description="Check that the Ajitroids simulation is deterministic")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add_run_options(p):
+        p.add_argument("--seed", type=int, default=1, help="Run seed")
+        p.add_argument("--ticks", type=int, default=DEFAULT_TICKS, help=f"Ticks to simulate ({C.SIMULATION_TICK_RATE} per second)")
+        p.add_argument("--difficulty", default="normal", choices=sorted(MAX_ENEMY_SHIPS))
+        p.add_argument("--ship", default="standard", help="Ship type")
+        p.add_argument("--states", action="store_true", help="Keep full per-tick states to name the diverging entity")
+
+    check = sub.add_parser("check", help="Run the same seed twice and compare")
+    add_run_options(check)
+    record = sub.add_parser("record", help="Record a trace to a file")
+    add_run_options(record)
+    record.add_argument("-o", "--output", required=True, help="Trace file (.json.gz)")
+    compare = sub.add_parser("compare", help="Compare two recorded traces")
+    compare.add_argument("expected")
+    compare.add_argument("actual")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Command-line entry point; returns 1 when traces diverge."""
+    args = parse_arguments(argv)
+    logging.basicConfig(level=logging.WARNING)
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+
+    if args.command == "compare":
+        expected, actual = load_trace(args.expected), load_trace(args.actual)
+    else:
+        expected = run_trace(args.seed, args.ticks, args.difficulty, args.ship, keep_states=args.states)
+        if args.command == "record":
+            save_trace(expected, args.output)
+            print(f"Recorded {expected.ticks} ticks (final hash {expected.rolling[-1]:08x}) to {args.output}")
+            return 0
+        actual = run_trace(args.seed, args.ticks, args.difficulty, args.ship, keep_states=args.states)
+
+    divergence = compare_traces(expected, actual)
+    if divergence is None:
+        print(f"Deterministic: {expected.ticks} ticks match (final hash {expected.rolling[-1]:08x})")
+        return 0
+    print(divergence.describe())
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
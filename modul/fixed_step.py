@@ -0,0 +1,130 @@
+"""Fixed-timestep simulation with interpolated rendering.
+
+The game loop renders at whatever rate the display allows, but gameplay
+always advances in steps of exactly ``1 / tick_rate`` seconds. Frame time is
+collected in an accumulator and consumed one step at a time; after a long
+frame at most `max_steps` steps' worth of real time runs and the remainder
+is dropped, so a stall slows the game down instead of snowballing into ever
+longer frames. Fast-forward raises the budget with the time scale.
+
+Because rendering happens between steps, sprites are drawn at positions
+interpolated between their last two simulated states (`interpolated`).
+"""
+
+import logging
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+import pygame
+
+import modul.constants as C
+
+logger = logging.getLogger(__name__)
+
+# Movement larger than this between two steps is a screen wrap or a teleport
+# (respawn) and is drawn at the new position instead of sweeping across
+_MAX_INTERPOLATION_DISTANCE = min(C.SCREEN_WIDTH, C.SCREEN_HEIGHT) / 2
+
+
+class FixedStepper:
+    """Accumulates frame time and hands it out in fixed simulation steps."""
+
+    def __init__(self, tick_rate: int = C.SIMULATION_TICK_RATE, max_steps: int = C.MAX_SIMULATION_STEPS):
+        """Step at `tick_rate` Hz, running at most `max_steps` steps per frame."""
+        self.step_dt = 1.0 / tick_rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.steps_this_frame = 0
+        self.dropped_time = 0.0
+
+    def add(self, dt: float, scale: float = 1.0):
+        """Add `dt` seconds of game time to be simulated this frame.
+
+        `scale` is the game clock's time scale: the cap applies to real time,
+        so at 8x up to ``8 * max_steps`` steps run in one frame.
+        """
+        self.accumulator += max(0.0, dt)
+        self.steps_this_frame = 0
+        budget = self.max_steps * self.step_dt * max(1.0, scale)
+        if self.accumulator > budget:
+            dropped = self.accumulator - budget
+            self.dropped_time += dropped
+            self.accumulator = budget
+            logger.debug("Simulation fell behind; dropped %.1f ms", dropped * 1000)
+
+    def step(self) -> bool:
+        """Consume one step if enough time has accumulated; returns True if so."""
+        if self.accumulator < self.step_dt:
+            return False
+        self.accumulator -= self.step_dt
+        self.steps_this_frame += 1
+        return True
+
+    @property
+    def alpha(self) -> float:
+        """Fraction of a step between the last simulated state and now (0..1)."""
+        return min(1.0, self.accumulator / self.step_dt)
+
+    def reset(self):
+        """Discard accumulated time, e.g. when a run starts or resumes."""
+        self.accumulator = 0.0
+        self.steps_this_frame = 0
+
+
+def capture_positions(
+    sprites: Iterable[pygame.sprite.Sprite],
+    previous: Optional[Dict[pygame.sprite.Sprite, pygame.Vector2]] = None,
+    exclude: Tuple[type, ...] = (),
+) -> Dict[pygame.sprite.Sprite, pygame.Vector2]:
+    """Return a copy of each sprite's position, taken before a step.
+
+    Passing the dict from the previous step as `previous` updates its
+    vectors in place and drops sprites that are gone, so capturing every
+    step only allocates for new sprites. Instances of the `exclude` classes
+    are not captured and are drawn at their simulated position.
+    """
+    if previous is None:
+        previous = {}
+    captured = 0
+    for sprite in sprites:
+        if exclude and isinstance(sprite, exclude):
+            continue
+        position = getattr(sprite, "position", None)
+        if position is None:
+            continue
+        before = previous.get(sprite)
+        if before is None:
+            previous[sprite] = pygame.Vector2(position)
+        else:
+            before.update(position)
+        captured += 1
+    if len(previous) > captured:
+        live = set(sprites)
+        for sprite in [sprite for sprite in previous if sprite not in live]:
+            del previous[sprite]
+    return previous
+
+
+@contextmanager
+def interpolated(
+    sprites: Iterable[pygame.sprite.Sprite],
+    previous: Dict[pygame.sprite.Sprite, pygame.Vector2],
+    alpha: float,
+) -> Iterator[None]:
+    """Temporarily move `sprites` to their interpolated positions for drawing."""
+    moved = []
+    if alpha < 1.0:
+        for sprite in sprites:
+            before = previous.get(sprite)
+            if before is None:
+                continue
+            current = pygame.Vector2(sprite.position)
+            if before.distance_to(current) > _MAX_INTERPOLATION_DISTANCE:
+                continue
+            sprite.position.update(before.lerp(current, alpha))
+            moved.append((sprite, current))
+    try:
+        yield
+    finally:
+        for sprite, current in moved:
+            sprite.position.update(current)
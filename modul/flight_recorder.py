@@ -0,0 +1,231 @@
+"""Flight recorder: a fixed-size ring buffer of recent world state.
+
+Unlike `ReplayRecorder`, which keeps a whole run, the flight recorder only
+holds the last few seconds. All storage is preallocated `array` buffers sized
+from the duration, the sample rate and a per-category entity cap, so memory
+never grows and recording a frame costs the same at minute one and minute
+sixty. Its contents can be replayed as a kill-cam or dumped as a regular
+replay file when the game hitches.
+"""
+
+import logging
+import os
+import time
+from array import array
+from typing import Any, Dict, List, Optional
+
+import pygame
+
+from modul.replay_system import GameFrame, _write_replay, parse_compression
+from modul.replay_ui import draw_replay_frame
+
+logger = logging.getLogger(__name__)
+
+FLIGHT_RECORDER_SECONDS = 5.0
+FLIGHT_RECORDER_RATE_HZ = 60
+# Entities beyond these caps are dropped from the recording (not the game)
+FLIGHT_RECORDER_CAPS = {"asteroids": 64, "enemies": 8, "shots": 64, "powerups": 8}
+ENTITY_FIELDS = 3  # x, y, radius
+PLAYER_FIELDS = 5  # x, y, rotation, vx, vy
+HITCH_THRESHOLD = 0.1
+HITCH_DUMP_COOLDOWN = 10.0
+FLIGHT_RECORDER_DIR = os.path.join("replays", "flight_recorder")
+KILL_CAM_SECONDS = 3.0
+KILL_CAM_SPEED = 0.5
+
+
+class FlightRecorder:
+    """Constant-memory ring buffer of the last `seconds` of gameplay."""
+
+    def __init__(
+        self,
+        seconds: float = FLIGHT_RECORDER_SECONDS,
+        rate_hz: int = FLIGHT_RECORDER_RATE_HZ,
+        caps: Optional[Dict[str, int]] = None,
+    ):
+        """Preallocate buffers for ``seconds * rate_hz`` frames.
+
+        Frames offered faster than `rate_hz` are skipped, so the buffer spans
+        `seconds` whatever the frame rate.
+        """
+        self.capacity = max(1, int(seconds * rate_hz))
+        self.frame_interval = 1.0 / rate_hz
+        self._next_time = float("-inf")
+        self.caps = dict(caps or FLIGHT_RECORDER_CAPS)
+        self.timestamps = array("d", bytes(8 * self.capacity))
+        self.player = array("f", bytes(4 * self.capacity * PLAYER_FIELDS))
+        self.stats = array("i", bytes(4 * self.capacity * 3))
+        self.counts = {name: array("H", bytes(2 * self.capacity)) for name in self.caps}
+        self.entities = {
+            name: array("f", bytes(4 * self.capacity * cap * ENTITY_FIELDS)) for name, cap in self.caps.items()
+        }
+        self.head = 0
+        self.size = 0
+        self._last_dump_time = float("-inf")
+
+    @property
+    def memory_bytes(self) -> int:
+        """Total bytes held by the preallocated buffers."""
+        buffers = [self.timestamps, self.player, self.stats, *self.counts.values(), *self.entities.values()]
+        return sum(buf.itemsize * len(buf) for buf in buffers)
+
+    def clear(self):
+        """Forget all recorded frames (buffers stay allocated)."""
+        self.head = 0
+        self.size = 0
+        self._next_time = float("-inf")
+
+    def record(self, game_state: Dict[str, Any], timestamp: float) -> bool:
+        """Store one frame, overwriting the oldest when full.
+
+        `game_state` uses the same keys as `ReplayRecorder.record_frame`.
+        Returns False when the frame came too soon after the previous one.
+        """
+        # A quarter interval of slack keeps frame-time jitter at the sample rate from dropping frames
+        if timestamp + self.frame_interval * 0.25 < self._next_time:
+            return False
+        self._next_time = max(self._next_time, timestamp - self.frame_interval) + self.frame_interval
+        slot = self.head
+        self.timestamps[slot] = timestamp
+        base = slot * PLAYER_FIELDS
+        self.player[base] = game_state['player_x']
+        self.player[base + 1] = game_state['player_y']
+        self.player[base + 2] = game_state['player_rotation']
+        self.player[base + 3] = game_state['player_vx']
+        self.player[base + 4] = game_state['player_vy']
+        self.stats[slot * 3] = game_state['score']
+        self.stats[slot * 3 + 1] = game_state['lives']
+        self.stats[slot * 3 + 2] = game_state['level']
+
+        for name, cap in self.caps.items():
+            items = game_state.get(name) or ()
+            count = min(len(items), cap)
+            buf = self.entities[name]
+            offset = slot * cap * ENTITY_FIELDS
+            for i in range(count):
+                item = items[i]
+                buf[offset] = item.get('x', 0.0)
+                buf[offset + 1] = item.get('y', 0.0)
+                buf[offset + 2] = item.get('radius', 0.0)
+                offset += ENTITY_FIELDS
+            self.counts[name][slot] = count
+
+        self.head = (slot + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+        return True
+
+    def _frame(self, slot: int, start_time: float) -> GameFrame:
+        """Materialise the frame stored in `slot`."""
+        p = slot * PLAYER_FIELDS
+        lists: Dict[str, List[Dict[str, float]]] = {}
+        for name, cap in self.caps.items():
+            buf = self.entities[name]
+            offset = slot * cap * ENTITY_FIELDS
+            lists[name] = [
+                {'x': buf[i], 'y': buf[i + 1], 'radius': buf[i + 2]}
+                for i in range(offset, offset + self.counts[name][slot] * ENTITY_FIELDS, ENTITY_FIELDS)
+            ]
+        return GameFrame(
+            timestamp=self.timestamps[slot] - start_time,
+            player_pos=(self.player[p], self.player[p + 1]),
+            player_rotation=self.player[p + 2],
+            player_velocity=(self.player[p + 3], self.player[p + 4]),
+            score=self.stats[slot * 3],
+            lives=self.stats[slot * 3 + 1],
+            level=self.stats[slot * 3 + 2],
+            **lists,
+        )
+
+    def frames(self, seconds: Optional[float] = None) -> List[GameFrame]:
+        """Return recorded frames oldest first, timestamps relative to the first.
+
+        With `seconds`, only the most recent `seconds` are returned.
+        """
+        if self.size == 0:
+            return []
+        slots = [(self.head - self.size + i) % self.capacity for i in range(self.size)]
+        if seconds is not None:
+            cutoff = self.timestamps[slots[-1]] - seconds
+            slots = [s for s in slots if self.timestamps[s] >= cutoff]
+        start_time = self.timestamps[slots[0]]
+        return [self._frame(slot, start_time) for slot in slots]
+
+    def dump(self, directory: str = FLIGHT_RECORDER_DIR, reason: str = "manual") -> Optional[str]:
+        """Write the buffered seconds as a replay file and return its path."""
+        frames = self.frames()
+        if not frames:
+            return None
+        os.makedirs(directory, exist_ok=True)
+        codec, level = parse_compression('gzip:1')
+        filepath = os.path.join(directory, f"flight_{int(time.time() * 1000)}_{reason}{codec.extension}")
+        metadata = {
+            'version': '1.1',
+            'format': 'json',
+            'source': 'flight_recorder',
+            'reason': reason,
+            'duration': frames[-1].timestamp,
+            'frame_count': len(frames),
+            'compression': codec.name,
+            'compression_level': level,
+        }
+        replay_data = {
+            'metadata': metadata,
+            'frames': [vars(frame) for frame in frames],
+            'events': [],
+        }
+        _write_replay(filepath, replay_data, codec, level)
+        logger.info("Flight recorder dumped %d frames to %s", len(frames), filepath)
+        return filepath
+
+    def check_hitch(self, dt: float, now: float, threshold: float = HITCH_THRESHOLD) -> Optional[str]:
+        """Dump the buffer when a frame took longer than `threshold` seconds.
+
+        Dumps are rate-limited so a slow machine does not flood the disk.
+        """
+        if dt <= threshold or now - self._last_dump_time < HITCH_DUMP_COOLDOWN:
+            return None
+        self._last_dump_time = now
+        try:
+            return self.dump(reason=f"hitch{int(dt * 1000)}ms")
+        except OSError as e:
+            logger.warning("Failed to dump flight recorder: %s", e)
+            return None
+
+
+class KillCam:
+    """Slow-motion instant replay of the seconds before the player died."""
+
+    def __init__(self, speed: float = KILL_CAM_SPEED):
+        """Create an idle kill-cam."""
+        self.speed = speed
+        self.frames: List[GameFrame] = []
+        self.elapsed = 0.0
+        self.index = 0
+        self.label_font = None
+
+    def start(self, frames: List[GameFrame]) -> bool:
+        """Begin playing `frames`; returns False when there is nothing to show."""
+        self.frames = frames
+        self.elapsed = 0.0
+        self.index = 0
+        return bool(frames)
+
+    def update(self, dt: float, events) -> bool:
+        """Advance playback; returns True once finished or skipped."""
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                return True
+        self.elapsed += dt * self.speed
+        while self.index + 1 < len(self.frames) and self.frames[self.index + 1].timestamp <= self.elapsed:
+            self.index += 1
+        return not self.frames or self.elapsed > self.frames[-1].timestamp
+
+    def draw(self, screen, font):
+        """Draw the current frame with a KILL CAM label."""
+        if not self.frames:
+            return
+        draw_replay_frame(screen, self.frames[self.index], font)
+        if self.label_font is None:
+            self.label_font = pygame.font.Font(None, 48)
+        label = self.label_font.render("KILL CAM", True, (255, 80, 80))
+        screen.blit(label, label.get_rect(midtop=(screen.get_width() / 2, 20)))
@@ -0,0 +1,57 @@
+"""Frozen playfield shown behind the pause and help overlays.
+
+While the game is paused nothing on the playfield moves, yet redrawing every
+sprite each frame costs as much as a running frame. `FreezeFrame` renders the
+playfield once when a paused state is entered, optionally blurred (scaled
+down and back up with `pygame.transform.smoothscale`) and dimmed, and blits
+that single surface until the paused states are left.
+"""
+
+import pygame
+
+import modul.constants as C
+
+# States that show the frozen playfield
+FROZEN_STATES = frozenset({"pause", "pause_confirm", "pause_restart_confirm", "help"})
+
+
+class FreezeFrame:
+    """Caches a snapshot of the playfield for paused states."""
+
+    def __init__(self, batch=None, blur=C.PAUSE_BACKDROP_BLUR, dim=C.PAUSE_BACKDROP_DIM):
+        """Draw snapshots with `batch` (a `SpriteBatch`) when given."""
+        self.batch = batch
+        self.blur = max(1, int(blur))
+        self.dim = min(1.0, max(0.0, dim))
+        self.surface = None
+
+    def capture(self, size, sprites):
+        """Render `sprites` on a black surface of `size` and keep it."""
+        surface = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        if self.batch is not None:
+            self.batch.draw(surface, sprites)
+        else:
+            for sprite in sprites:
+                sprite.draw(surface)
+        if self.blur > 1:
+            width, height = size
+            small = pygame.transform.smoothscale(
+                surface, (max(1, width // self.blur), max(1, height // self.blur)))
+            surface = pygame.transform.smoothscale(small, size)
+        if self.dim:
+            level = round(255 * (1.0 - self.dim))
+            surface.fill((level, level, level), special_flags=pygame.BLEND_RGB_MULT)
+        self.surface = surface
+        return surface
+
+    def draw(self, screen, sprites):
+        """Blit the snapshot, capturing it from `sprites` on first use."""
+        if self.surface is None or self.surface.get_size() != screen.get_size():
+            self.capture(screen.get_size(), sprites)
+        screen.blit(self.surface, (0, 0))
+
+    def invalidate(self):
+        """Drop the snapshot so the next paused state captures a fresh one."""
+        self.surface = None
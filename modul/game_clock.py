@@ -0,0 +1,80 @@
+"""Game time, advanced explicitly by the game loop.
+
+Gameplay timers read `GameClock.now` instead of `time.time()`, so game time
+stops while the game is paused, runs slower or faster with the time scale,
+and is unaffected by wall-clock adjustments. A headless simulation advances
+its own clock by fixed steps and can run as fast as the CPU allows while
+producing exactly the same timings as real-time play.
+
+The interactive game uses the shared `game_clock` instance; components that
+take a ``clock`` argument fall back to it when none is given.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+MIN_TIME_SCALE = 0.05
+MAX_TIME_SCALE = 50.0
+
+
+class GameClock:
+    """Monotonic game time with pause and time scale."""
+
+    def __init__(self, scale: float = 1.0, max_step: float = 0.0):
+        """Create a clock at time zero.
+
+        `max_step` caps the real seconds a single `tick` may advance
+        (0 disables the cap), so a long stall does not turn into a jump.
+        """
+        self.now = 0.0
+        self.scale = 1.0
+        self.set_scale(scale)
+        self.max_step = max_step
+        self.paused = False
+        self.last_dt = 0.0
+
+    def tick(self, real_dt: float) -> float:
+        """Advance by `real_dt` wall seconds and return the game seconds elapsed."""
+        real_dt = max(0.0, real_dt)
+        if self.max_step > 0:
+            real_dt = min(real_dt, self.max_step)
+        self.last_dt = 0.0 if self.paused else real_dt * self.scale
+        self.now += self.last_dt
+        return self.last_dt
+
+    def advance(self, dt: float) -> float:
+        """Advance by exactly `dt` game seconds, ignoring pause and scale."""
+        self.last_dt = max(0.0, dt)
+        self.now += self.last_dt
+        return self.last_dt
+
+    def pause(self):
+        """Stop game time."""
+        self.paused = True
+
+    def resume(self):
+        """Let game time run again."""
+        self.paused = False
+
+    def toggle_pause(self) -> bool:
+        """Pause or resume; returns True if the clock is now paused."""
+        self.paused = not self.paused
+        return self.paused
+
+    def set_scale(self, scale: float) -> float:
+        """Set the time scale (1.0 real time, <1 slow motion, >1 fast forward)."""
+        clamped = min(MAX_TIME_SCALE, max(MIN_TIME_SCALE, float(scale)))
+        if clamped != scale:
+            logger.warning("Time scale %s out of range, using %s", scale, clamped)
+        self.scale = clamped
+        return self.scale
+
+    def reset(self, now: float = 0.0):
+        """Set game time to `now` and resume at the current scale."""
+        self.now = now
+        self.paused = False
+        self.last_dt = 0.0
+
+
+game_clock = GameClock()
@@ -0,0 +1,128 @@
+"""Ghost racing: replay a personal-best run as a translucent ship.
+
+The replay is decoded incrementally with `ReplayStreamReader`, so at most two
+frames are held in memory. Each game frame only advances the stream up to the
+current time and blits a cached, pre-rotated ghost sprite.
+"""
+
+import logging
+import time
+from typing import Any, Dict, Iterator, Optional
+
+import pygame
+
+from modul.constants import PLAYER_RADIUS
+from modul.replay_system import ReplayManager, ReplayStreamReader
+
+logger = logging.getLogger(__name__)
+
+GHOST_COLOR = (140, 200, 255)
+GHOST_ALPHA = 110
+# Rotation is snapped to this many degrees so sprites can be cached
+GHOST_ANGLE_STEP = 5
+
+
+class GhostRacer:
+    """Streams a saved replay and draws its ship alongside live play."""
+
+    def __init__(self, replay_path: str, color=GHOST_COLOR, alpha: int = GHOST_ALPHA):
+        """Open `replay_path` for streaming; frames are decoded on demand."""
+        self.replay_path = replay_path
+        self._reader = ReplayStreamReader(replay_path)
+        self.metadata: Dict[str, Any] = self._reader.metadata
+        self._frames: Iterator[Dict[str, Any]] = self._reader.iter_frames()
+        self._prev: Optional[Dict[str, Any]] = None
+        self._next: Optional[Dict[str, Any]] = self._next_frame()
+        self.finished = self._next is None
+        self.position: Optional[pygame.Vector2] = None
+        self.rotation = 0.0
+        self.color = (*color, alpha)
+        self._sprites: Dict[int, pygame.Surface] = {}
+        # Smoothed update+draw cost, for the performance overlay/budget checks
+        self.frame_cost_ms = 0.0
+        self._update_cost_ms = 0.0
+
+    @classmethod
+    def for_personal_best(
+        cls,
+        manager: ReplayManager,
+        difficulty: Optional[str] = None,
+        ship_type: Optional[str] = None,
+    ) -> Optional["GhostRacer"]:
+        """Return a ghost for the best matching replay, or None if there is none."""
+        path = manager.find_personal_best(difficulty, ship_type)
+        if not path:
+            return None
+        try:
+            return cls(path)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning("Could not open ghost replay '%s': %s", path, e)
+            return None
+
+    def _next_frame(self) -> Optional[Dict[str, Any]]:
+        """Decode the next frame from the stream, or None at the end."""
+        try:
+            return next(self._frames)
+        except StopIteration:
+            return None
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning("Ghost replay stream failed: %s", e)
+            return None
+
+    def update(self, elapsed: float):
+        """Advance the ghost to `elapsed` seconds since the run started."""
+        started = time.perf_counter()
+        while self._next is not None and self._next.get('timestamp', 0.0) <= elapsed:
+            self._prev = self._next
+            self._next = self._next_frame()
+        if self._next is None and not self.finished:
+            self.finished = True
+            self.close()
+
+        if self._prev is not None:
+            x, y = self._prev['player_pos']
+            self.rotation = self._prev.get('player_rotation', 0.0)
+            if self._next is not None:
+                # Interpolate between the 30 Hz samples for smooth motion
+                t0, t1 = self._prev['timestamp'], self._next['timestamp']
+                nx, ny = self._next['player_pos']
+                # Skip interpolating across screen wraps
+                if t1 > t0 and abs(nx - x) < 200 and abs(ny - y) < 200:
+                    k = (elapsed - t0) / (t1 - t0)
+                    x, y = x + (nx - x) * k, y + (ny - y) * k
+            self.position = pygame.Vector2(x, y)
+        self._update_cost_ms = (time.perf_counter() - started) * 1000
+
+    def _sprite(self, rotation: float) -> pygame.Surface:
+        """Return the cached ghost sprite for `rotation` (snapped)."""
+        key = int(round(rotation / GHOST_ANGLE_STEP)) * GHOST_ANGLE_STEP % 360
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            size = PLAYER_RADIUS * 2 + 4
+            sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+            center = pygame.Vector2(size / 2, size / 2)
+            forward = pygame.Vector2(0, -1).rotate(key)
+            right = pygame.Vector2(1, 0).rotate(key) * PLAYER_RADIUS / 1.5
+            points = [
+                center + forward * PLAYER_RADIUS,
+                center - forward * PLAYER_RADIUS - right,
+                center - forward * PLAYER_RADIUS + right,
+            ]
+            pygame.draw.polygon(sprite, self.color, points)
+            pygame.draw.polygon(sprite, (*self.color[:3], min(255, self.color[3] * 2)), points, 2)
+            self._sprites[key] = sprite
+        return sprite
+
+    def draw(self, screen: pygame.Surface):
+        """Blit the ghost ship at its current position."""
+        if self.position is None or self.finished:
+            return
+        started = time.perf_counter()
+        sprite = self._sprite(self.rotation)
+        screen.blit(sprite, sprite.get_rect(center=(int(self.position.x), int(self.position.y))))
+        cost = self._update_cost_ms + (time.perf_counter() - started) * 1000
+        self.frame_cost_ms = self.frame_cost_ms * 0.9 + cost * 0.1
+
+    def close(self):
+        """Release the underlying replay file."""
+        self._reader.close()
@@ -1,6 +1,7 @@
 """Help screen showing keyboard shortcuts and game information."""
 import pygame
 from modul.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+from modul.static_layer import StaticLayer, draw_backdrop
 try:
     from modul import input_utils  # type: ignore
 except (ImportError, ModuleNotFoundError):  # pragma: no cover - provide minimal stub for tests
@@ -51,6 +52,8 @@ class HelpScreen:
         ]
 
         self.background_alpha = 200
+        # Everything but the backdrop, rendered once per language
+        self._layer = StaticLayer(self._render_page)
 
     def _ensure_fonts(self):
         """Ensure pygame fonts are initialized and cached on the instance."""
@@ -97,16 +100,18 @@ class HelpScreen:
             return
 
         # Semi-transparent background
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(self.background_alpha)
-        overlay.fill((0, 0, 0))
-        screen.blit(overlay, (0, 0))
+        draw_backdrop(screen, self.background_alpha)
 
+        # The translated title identifies the language the page was rendered in
+        self._layer.draw(screen, gettext("help"))
+
+    def _render_page(self, layer):
+        """Render title, shortcuts, tips and footer onto the layer."""
         # Title
         title_label = gettext("help").upper()
         title_surface = self.title_font.render(title_label, True, (255, 215, 0))
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH / 2, 60))
-        screen.blit(title_surface, title_rect)
+        layer.blit(title_surface, title_rect)
 
         # Draw shortcuts in columns
         y_pos = 140
@@ -115,18 +120,18 @@ class HelpScreen:
         for section_title, shortcuts in self.shortcuts:
             # Section title
             section_surface = self.section_font.render(gettext(section_title.lower().replace(' ', '_')), True, (100, 200, 255))
-            screen.blit(section_surface, (x_left, y_pos))
+            layer.blit(section_surface, (x_left, y_pos))
             y_pos += 50
 
             # Shortcuts
             for key, description in shortcuts:
                 # Key name (highlighted)
                 key_surface = self.text_font.render(gettext(key), True, (255, 255, 0))
-                screen.blit(key_surface, (x_left + 20, y_pos))
+                layer.blit(key_surface, (x_left + 20, y_pos))
 
                 # Description
                 desc_surface = self.text_font.render(f"- {gettext(description)}", True, (200, 200, 200))
-                screen.blit(desc_surface, (x_left + 250, y_pos))
+                layer.blit(desc_surface, (x_left + 250, y_pos))
 
                 y_pos += 35
 
@@ -135,7 +140,7 @@ class HelpScreen:
         # Tips section
         y_pos += 10
         tips_title = self.section_font.render(gettext("tips").upper(), True, (100, 200, 255))
-        screen.blit(tips_title, (x_left, y_pos))
+        layer.blit(tips_title, (x_left, y_pos))
         y_pos += 50
 
         tips = [
@@ -148,7 +153,7 @@ class HelpScreen:
 
         for tip in tips:
             tip_surface = self.text_font.render(tip, True, (180, 180, 180))
-            screen.blit(tip_surface, (x_left + 20, y_pos))
+            layer.blit(tip_surface, (x_left + 20, y_pos))
             y_pos += 35
 
         # Footer
@@ -157,4 +162,4 @@ class HelpScreen:
         footer_rect = footer_surface.get_rect(
             center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT - 30)
         )
-        screen.blit(footer_surface, footer_rect)
+        layer.blit(footer_surface, footer_rect)
@@ -5,6 +5,7 @@ import os
 import random
 import pygame
 import modul.constants as C
+from modul.static_layer import StaticLayer, draw_backdrop
 try:
     from modul.i18n import gettext
 except (ImportError, ModuleNotFoundError):  # pragma: no cover - fallback when i18n unavailable
@@ -191,6 +192,10 @@ class HighscoreDisplay:
             "y": C.SCREEN_HEIGHT - 60,
         }
         self.input_cooldown = 0
+        # Title and entries, rendered again when the list or language changes
+        self._layer = StaticLayer(self._render_list)
+        # Back button text per (hover step, label)
+        self._button_renders = {}
 
     def update(self, dt, events):
         """Update fade-in animation and button hover effects."""
@@ -218,14 +223,10 @@ class HighscoreDisplay:
 
         return None
 
-    def draw(self, screen):
-        """Draw the highscore display screen."""
-        overlay = pygame.Surface((C.SCREEN_WIDTH, C.SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, self.background_alpha))
-        screen.blit(overlay, (0, 0))
-
+    def _render_list(self, layer):
+        """Render the title and the highscore entries onto `layer`."""
         title_text = self.font_title.render(gettext("highscores"), True, pygame.Color("white"))
-        screen.blit(title_text, (C.SCREEN_WIDTH // 2 - title_text.get_width() // 2, 50))
+        layer.blit(title_text, (C.SCREEN_WIDTH // 2 - title_text.get_width() // 2, 50))
 
         for i, entry in enumerate(self.highscore_manager.highscores):
             if i == 0:
@@ -245,37 +246,29 @@ class HighscoreDisplay:
             x_score = C.SCREEN_WIDTH * 3 // 4
             y = 150 + i * 40
 
-            screen.blit(rank_text, (x_rank, y))
-            screen.blit(name_text, (x_name, y))
-            screen.blit(score_text, (x_score, y))
+            layer.blit(rank_text, (x_rank, y))
+            layer.blit(name_text, (x_name, y))
+            layer.blit(score_text, (x_score, y))
+
+    def _button_text(self, label, hover_animation):
+        """Return the back button text at the nearest pre-rendered hover step."""
+        step = max(0, min(C.MENU_HOVER_STEPS, round(hover_animation * C.MENU_HOVER_STEPS)))
+        text = self._button_renders.get((step, label))
+        if text is None:
+            hover = step / C.MENU_HOVER_STEPS
+            color = pygame.Color(C.MENU_UNSELECTED_COLOR).lerp(C.MENU_SELECTED_COLOR, hover)
+            scaled_font = pygame.font.Font(None, int(C.MENU_ITEM_FONT_SIZE * (1.0 + 0.2 * hover)))
+            text = self._button_renders[(step, label)] = scaled_font.render(label, True, color)
+        return text
 
-        button = self.back_button
-        color = pygame.Color(C.MENU_UNSELECTED_COLOR)
-        selected_color = pygame.Color(C.MENU_SELECTED_COLOR)
-        r = max(
-            0,
-            min(
-                255,
-                int(color.r + (selected_color.r - color.r) * button["hover_animation"]),
-            ),
-        )
-        g = max(
-            0,
-            min(
-                255,
-                int(color.g + (selected_color.g - color.g) * button["hover_animation"]),
-            ),
-        )
-        b = max(
-            0,
-            min(
-                255,
-                int(color.b + (selected_color.b - color.b) * button["hover_animation"]),
-            ),
-        )
-        size_multiplier = 1.0 + 0.2 * button["hover_animation"]
-        scaled_font = pygame.font.Font(None, int(C.MENU_ITEM_FONT_SIZE * size_multiplier))
+    def draw(self, screen):
+        """Draw the highscore display screen."""
+        draw_backdrop(screen, self.background_alpha)
 
-        button_text = scaled_font.render(gettext(button["text"]), True, (r, g, b))
+        entries = tuple((entry['name'], entry['score']) for entry in self.highscore_manager.highscores)
+        self._layer.draw(screen, (gettext("highscores"), entries))
+
+        button = self.back_button
+        button_text = self._button_text(gettext(button["text"]), button["hover_animation"])
         button_rect = button_text.get_rect(center=(C.SCREEN_WIDTH // 2, button["y"]))
         screen.blit(button_text, button_rect)
@@ -5,6 +5,7 @@ import pygame
 import modul.constants as C
 from modul.version import __version__
 from modul.ships import ShipRenderer, ship_manager
+from modul.static_layer import StaticLayer, draw_backdrop
 from modul import input_utils
 
 # Backwards-compatibility: expose uppercase constants into module globals
@@ -44,6 +45,9 @@ class MenuItem:
         self.opacity = 255
         self.delay = 0
         self.shortcut = shortcut
+        # Rendered text per (hover step, font); dropped when the text changes
+        self._renders = {}
+        self._rendered_text = text
 
     def update(self, dt):
         """Update the item's animation and opacity state."""
@@ -56,19 +60,23 @@ class MenuItem:
                 self.delay = 0
                 self.opacity = 255
 
+    def _render(self, step, font):
+        """Render the text at hover animation step `step`."""
+        hover = step / C.MENU_HOVER_STEPS
+        color = pygame.Color(C.MENU_UNSELECTED_COLOR).lerp(C.MENU_SELECTED_COLOR, hover)
+        if font is None:
+            font = pygame.font.Font(None, int(C.MENU_ITEM_FONT_SIZE * (1.0 + 0.2 * hover)))
+        return font.render(self.text, True, color)
+
     def draw(self, screen, position, font=None):
         """Draw the menu item at the given position. Accepts optional font argument."""
-        color = pygame.Color(C.MENU_UNSELECTED_COLOR)
-        selected_color = pygame.Color(C.MENU_SELECTED_COLOR)
-        r = max(0, min(255, int(color.r + (selected_color.r - color.r) * self.hover_animation)))
-        g = max(0, min(255, int(color.g + (selected_color.g - color.g) * self.hover_animation)))
-        b = max(0, min(255, int(color.b + (selected_color.b - color.b) * self.hover_animation)))
-        size_multiplier = 1.0 + 0.2 * self.hover_animation
-        if font is None:
-            scaled_font = pygame.font.Font(None, int(C.MENU_ITEM_FONT_SIZE * size_multiplier))
-        else:
-            scaled_font = font
-        text_surface = scaled_font.render(self.text, True, (r, g, b))
+        if self.text != self._rendered_text:
+            self._renders.clear()
+            self._rendered_text = self.text
+        step = max(0, min(C.MENU_HOVER_STEPS, round(self.hover_animation * C.MENU_HOVER_STEPS)))
+        text_surface = self._renders.get((step, font))
+        if text_surface is None:
+            text_surface = self._renders[(step, font)] = self._render(step, font)
         text_rect = text_surface.get_rect(center=(position[0], position[1]))
         screen.blit(text_surface, text_rect)
         return text_rect
@@ -88,6 +96,8 @@ class Menu:
         self.fade_in = False
         self.input_cooldown = 0
         self.sounds = sounds
+        self._title_surface = None
+        self._title_text = None
 
     def add_item(self, text, action, shortcut=None):
         """Add a new item to the menu."""
@@ -199,13 +209,18 @@ class Menu:
                     logger = logging.getLogger(__name__)
                 logger.debug("Exception in play_menu_move in _select_previous: %s", e, exc_info=True)
 
+    def _rendered_title(self):
+        """Return the title surface, rendered again only when the title changes."""
+        if self._title_text != self.title:
+            self._title_surface = self.title_font.render(self.title, True, pygame.Color(C.MENU_TITLE_COLOR))
+            self._title_text = self.title
+        return self._title_surface
+
     def draw(self, screen):
         """Draw the menu and its items on the screen."""
-        background = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-        background.fill((0, 0, 0, self.background_alpha))
-        screen.blit(background, (0, 0))
+        draw_backdrop(screen, self.background_alpha)
 
-        title_surf = self.title_font.render(self.title, True, pygame.Color(C.MENU_TITLE_COLOR))
+        title_surf = self._rendered_title()
         title_rect = title_surf.get_rect(center=(C.SCREEN_WIDTH / 2, C.SCREEN_HEIGHT / 8))
         screen.blit(title_surf, title_rect)
 
@@ -231,13 +246,30 @@ class MainMenu(Menu):
         self.add_item(gettext("options"), "options")
         self.add_item(gettext("credits"), "credits")
         self.add_item(gettext("exit"), "exit")
+        self._version_surface = None
+
+    def set_continue_available(self, available):
+        """Show or hide the "Continue" entry for a quick-saved run."""
+        has_item = bool(self.items) and self.items[0].action == "continue_game"
+        if available == has_item:
+            return
+        if available:
+            self.items.insert(0, MenuItem(gettext("continue_game"), "continue_game"))
+        else:
+            self.items.pop(0)
+        for item in self.items:
+            item.selected = False
+        self.selected_index = 0
+        self.items[0].selected = True
 
     def draw(self, screen):
         """Draw the main menu and version info."""
         super().draw(screen)
 
-        version_font = pygame.font.Font(None, int(C.MENU_ITEM_FONT_SIZE / 1.5))
-        version_text = version_font.render(__version__, True, pygame.Color(C.MENU_UNSELECTED_COLOR))
+        if self._version_surface is None:
+            version_font = pygame.font.Font(None, int(C.MENU_ITEM_FONT_SIZE / 1.5))
+            self._version_surface = version_font.render(__version__, True, pygame.Color(C.MENU_UNSELECTED_COLOR))
+        version_text = self._version_surface
         version_rect = version_text.get_rect(bottomright=(C.SCREEN_WIDTH - 20, C.SCREEN_HEIGHT - 20))
         screen.blit(version_text, version_rect)
 
@@ -251,13 +283,14 @@ class PauseMenu(Menu):
         self.add_item(gettext("resume"), "continue")
         self.add_item(gettext("restart"), "restart")
         self.add_item(gettext("main_menu"), "main_menu")
+        self._shortcut_surfaces = []
+        self._shortcut_texts = None
 
     def draw(self, screen):
         """Draw the pause menu and shortcuts."""
         super().draw(screen)
 
         # Show common keyboard shortcuts while paused
-        shortcuts_font = pygame.font.Font(None, int(C.MENU_ITEM_FONT_SIZE * 0.8))
         # Use module-level gettext helper
 
         shortcuts = [
@@ -277,10 +310,16 @@ class PauseMenu(Menu):
             gettext("shortcut_p_screenshot"),
         ]
 
+        # Rendered once, and again only if the translations change
+        if shortcuts != self._shortcut_texts:
+            shortcuts_font = pygame.font.Font(None, int(C.MENU_ITEM_FONT_SIZE * 0.8))
+            self._shortcut_surfaces = [shortcuts_font.render(shortcut, True, (200, 200, 200))
+                                       for shortcut in shortcuts]
+            self._shortcut_texts = shortcuts
+
         shortcuts_x = 30
         shortcuts_y = 150
-        for i, shortcut in enumerate(shortcuts):
-            shortcut_surf = shortcuts_font.render(shortcut, True, (200, 200, 200))
+        for i, shortcut_surf in enumerate(self._shortcut_surfaces):
             screen.blit(shortcut_surf, (shortcuts_x, shortcuts_y + i * 35))
 
 
@@ -309,9 +348,7 @@ class TutorialScreen:
 
     def draw(self, screen):
         """Draw the tutorial instructions on the screen."""
-        background = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-        background.fill((0, 0, 0, self.background_alpha))
-        screen.blit(background, (0, 0))
+        draw_backdrop(screen, self.background_alpha)
 
         title_surf = self.title_font.render(gettext("tutorial_title"), True, pygame.Color(C.MENU_TITLE_COLOR))
         title_rect = title_surf.get_rect(center=(C.SCREEN_WIDTH / 2, 100))
@@ -357,6 +394,10 @@ class OptionsMenu(Menu):
         self.add_item(gettext('sound_volume_format').format(percent=int(settings.sound_volume * 100)), "adjust_sound_volume")
         self.add_item(gettext('fullscreen_on') if settings.fullscreen else gettext('fullscreen_off'), "toggle_fullscreen")
         self.add_item(gettext('controls_menu_label'), "controls")
+        # Ghost racing toggle, only for settings objects exposing the flag
+        if "ghost_racing_enabled" in getattr(settings, "__dict__", {}):
+            ghost_state = gettext('on') if settings.ghost_racing_enabled else gettext('off')
+            self.add_item(f"{gettext('ghost_racing')}: {ghost_state}", "toggle_ghost_racing")
         # Small toggle: whether to show the TTS voice selection directly in Options
         # Only add this toggle if the settings object actually exposes the
         # `show_tts_in_options` attribute so tests that don't include the
@@ -423,6 +464,16 @@ class OptionsMenu(Menu):
             self.items[4].text = gettext('fullscreen_on') if self.settings.fullscreen else gettext('fullscreen_off')
             return None
 
+        elif action == "toggle_ghost_racing":
+            self.settings.ghost_racing_enabled = not self.settings.ghost_racing_enabled
+            self.settings.save()
+            state = gettext('on') if self.settings.ghost_racing_enabled else gettext('off')
+            for item in self.items:
+                if item.action == 'toggle_ghost_racing':
+                    item.text = f"{gettext('ghost_racing')}: {state}"
+                    break
+            return None
+
         elif action == "toggle_show_tts":
             # Toggle whether the TTS voice selection appears in Options
             self.settings.show_tts_in_options = not getattr(self.settings, 'show_tts_in_options', False)
@@ -548,6 +599,9 @@ class CreditsScreen:
         self.background_alpha = 0
         self.fade_in = True
         self.scroll_position = 250
+        self._title_surface = None
+        # All credits lines, rendered once and scrolled by blit offset
+        self._scroll_layer = StaticLayer(self._render_credits)
 
     def update(self, dt, events):
         """Update fade-in, scroll credits, and handle input."""
@@ -566,16 +620,8 @@ class CreditsScreen:
 
         return None
 
-    def draw(self, screen):
-        """Draw the credits text on the screen."""
-        background = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-        background.fill((0, 0, 0, self.background_alpha))
-        screen.blit(background, (0, 0))
-
-        title_surf = self.title_font.render(C.CREDITS_TITLE, True, pygame.Color(C.MENU_TITLE_COLOR))
-        title_rect = title_surf.get_rect(center=(C.SCREEN_WIDTH / 2, 100))
-        screen.blit(title_surf, title_rect)
-
+    def _credits_lines(self):
+        """Return the lines scrolling below the title."""
         credits_lines = [
             C.CREDITS_GAME_NAME,
             "",
@@ -603,17 +649,29 @@ class CreditsScreen:
                 "Thank you for playing!",
             ]
         )
+        return credits_lines
 
-        # Render each credits line centered below the title, with scrolling
-        margin = 20
+    def _render_credits(self, layer):
+        """Render every credits line centered, the first one at y = 0."""
         line_spacing = self.text_font.get_linesize() + 4
+        for i, line in enumerate(self._credits_lines()):
+            surf = self.text_font.render(line, True, pygame.Color("white"))
+            layer.blit(surf, surf.get_rect(centerx=C.SCREEN_WIDTH / 2, y=i * line_spacing))
+
+    def draw(self, screen):
+        """Draw the credits text on the screen."""
+        draw_backdrop(screen, self.background_alpha)
+
+        if self._title_surface is None:
+            self._title_surface = self.title_font.render(C.CREDITS_TITLE, True, pygame.Color(C.MENU_TITLE_COLOR))
+        title_surf = self._title_surface
+        title_rect = title_surf.get_rect(center=(C.SCREEN_WIDTH / 2, 100))
+        screen.blit(title_surf, title_rect)
+
+        margin = 20
         # start below the title and apply scroll position
         current_y = title_rect.bottom + margin + self.scroll_position
-        for line in credits_lines:
-            surf = self.text_font.render(line, True, pygame.Color("white"))
-            rect = surf.get_rect(centerx=C.SCREEN_WIDTH / 2, y=current_y)
-            screen.blit(surf, rect)
-            current_y += line_spacing
+        self._scroll_layer.draw(screen, tuple(self._credits_lines()), (0, current_y))
 
 
 class ControlsMenu(Menu):
@@ -702,6 +760,8 @@ class ControlsMenu(Menu):
         self.capturing = False
         self.capture_action = None
         self.message = ""
+        self._message_surface = None
+        self._message_text = None
 
     def update(self, dt, events):
         # Refresh labels from settings
@@ -769,8 +829,11 @@ class ControlsMenu(Menu):
         """
         super().draw(screen)
         if self.message:
-            font = pygame.font.Font(None, 22)
-            msg = font.render(self.message, True, (200, 200, 200))
+            if self.message != self._message_text:
+                font = pygame.font.Font(None, 22)
+                self._message_surface = font.render(self.message, True, (200, 200, 200))
+                self._message_text = self.message
+            msg = self._message_surface
             rect = msg.get_rect(center=(C.SCREEN_WIDTH / 2, C.SCREEN_HEIGHT - 40))
             screen.blit(msg, rect)
 
@@ -894,9 +957,7 @@ class GameOverScreen:
         Args:
             screen (pygame.Surface): Surface to draw on.
         """
-        background = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-        background.fill((0, 0, 0, self.background_alpha))
-        screen.blit(background, (0, 0))
+        draw_backdrop(screen, self.background_alpha)
 
         try:
             from modul.i18n import gettext
@@ -985,6 +1046,10 @@ class VoiceAnnouncementsMenu:
         self.current_selection = 0
         self.fade_in = True
         self.background_alpha = 0
+        self.title_font = pygame.font.Font(None, C.MENU_TITLE_FONT_SIZE)
+        self.item_font = pygame.font.Font(None, C.MENU_ITEM_FONT_SIZE)
+        # Title and labels, rendered again when a toggle or the selection changes
+        self._layer = StaticLayer(self._render_items)
         self.update_menu_texts()
 
     def update_menu_texts(self):
@@ -1096,18 +1161,13 @@ class VoiceAnnouncementsMenu:
 
         return None
 
-    def draw(self, screen):
-        """Render the voice announcements menu to the provided screen surface."""
-        background = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-        background.fill((0, 0, 0, self.background_alpha))
-        screen.blit(background, (0, 0))
-
-        title_font = pygame.font.Font(None, C.MENU_TITLE_FONT_SIZE)
-        title_surface = title_font.render(self.title, True, pygame.Color(C.MENU_TITLE_COLOR))
+    def _render_items(self, layer):
+        """Render the title and the announcement labels."""
+        title_surface = self.title_font.render(self.title, True, pygame.Color(C.MENU_TITLE_COLOR))
         title_rect = title_surface.get_rect(center=(C.SCREEN_WIDTH / 2, 60))
-        screen.blit(title_surface, title_rect)
+        layer.blit(title_surface, title_rect)
 
-        font = pygame.font.Font(None, C.MENU_ITEM_FONT_SIZE)
+        font = self.item_font
         start_y = 130
 
         visible_count = 0
@@ -1122,10 +1182,16 @@ class VoiceAnnouncementsMenu:
 
             text_surface = font.render(item.text, True, pygame.Color(color))
             text_rect = text_surface.get_rect(center=(C.SCREEN_WIDTH / 2, y))
-            screen.blit(text_surface, text_rect)
+            layer.blit(text_surface, text_rect)
 
             visible_count += 1
 
+    def draw(self, screen):
+        """Render the voice announcements menu to the provided screen surface."""
+        draw_backdrop(screen, self.background_alpha)
+        key = (self.title, tuple(item.text for item in self.items), self.current_selection)
+        self._layer.draw(screen, key)
+
 
 class TTSVoiceMenu(Menu):
     """Menu to select a TTS voice from available system voices."""
@@ -1292,6 +1358,8 @@ class SoundTestMenu:
 
         self.background_alpha = 0
         self.fade_in = False
+        self.title_font = pygame.font.Font(None, C.MENU_TITLE_FONT_SIZE)
+        self._title_surface = None
 
     def activate(self):
         """Reset UI state and flags when the menu is activated."""
@@ -1663,23 +1731,12 @@ class SoundTestMenu:
 
     def draw(self, screen):
         """Implementation detail: see method body for behavior."""
-        background = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-        background.fill((0, 0, 0, self.background_alpha))
-        screen.blit(background, (0, 0))
+        draw_backdrop(screen, self.background_alpha)
 
-        title_font = pygame.font.Font(None, C.MENU_TITLE_FONT_SIZE)
-        title_surface = title_font.render(self.title, True, pygame.Color(C.MENU_TITLE_COLOR))
-        title_rect = title_surface.get_rect(center=(C.SCREEN_WIDTH / 2, 60))
-        screen.blit(title_surface, title_rect)
-
-        indicator_font = pygame.font.Font(None, int(C.MENU_ITEM_FONT_SIZE * 0.7))
-
-        try:
-            from modul.i18n import gettext
-        except Exception:
-            def gettext(key):
-                """Implementation detail: see method body for behavior."""
-                return key
+        if self._title_surface is None:
+            self._title_surface = self.title_font.render(self.title, True, pygame.Color(C.MENU_TITLE_COLOR))
+        title_rect = self._title_surface.get_rect(center=(C.SCREEN_WIDTH / 2, 60))
+        screen.blit(self._title_surface, title_rect)
 
 class TTSVoiceMenu(Menu):
     """Menu to select a TTS voice from available system voices."""
@@ -1779,21 +1836,16 @@ class AchievementsMenu(Menu):
         self.achievement_system = achievement_system
         self.achievement_graphics = getattr(achievement_system, "graphics", {})
         self.add_item(gettext("back"), "back")
-
-    def draw(self, screen):
-        background = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-        background.fill((0, 0, 0, self.background_alpha))
-        screen.blit(background, (0, 0))
-
-        title_font = pygame.font.Font(None, C.MENU_TITLE_FONT_SIZE)
-        title_surf = title_font.render(self.title, True, pygame.Color(C.MENU_TITLE_COLOR))
-        title_rect = title_surf.get_rect(center=(C.SCREEN_WIDTH / 2, C.SCREEN_HEIGHT / 12))
-        screen.blit(title_surf, title_rect)
-
+        self.graphics_font = pygame.font.Font(None, 18)
+        self.name_font = pygame.font.Font(None, 28)
+        self.progress_font = pygame.font.Font(None, 20)
+        # Achievement list and progress, rendered again when an achievement unlocks
+        self._layer = StaticLayer(self._render_achievements)
+
+    def _render_achievements(self, layer):
+        """Render the achievement names, their graphics and the progress line."""
         start_y = C.SCREEN_HEIGHT / 5
         achievement_spacing = 80
-        graphics_font = pygame.font.Font(None, 18)
-        name_font = pygame.font.Font(None, 28)
 
         achievements_per_column = 6
         column_width = C.SCREEN_WIDTH / 2
@@ -1814,34 +1866,43 @@ class AchievementsMenu(Menu):
             else:
                 name_color = pygame.Color("gray")
                 graphic_color = pygame.Color("gray")
+            name_surf = self.name_font.render(achievement.name, True, name_color)
             # Guard: `achievement_graphics` may be a Mock in tests; ensure it's a
             # mapping before using `in` to avoid TypeError when iterating.
             if is_unlocked and isinstance(self.achievement_graphics, dict) and achievement.name in self.achievement_graphics:
                 graphics = self.achievement_graphics[achievement.name]
                 ascii_start_x = center_x - 120
                 for line_idx, line in enumerate(graphics):
-                    graphic_surf = graphics_font.render(line, True, graphic_color)
+                    graphic_surf = self.graphics_font.render(line, True, graphic_color)
                     graphic_rect = graphic_surf.get_rect(topleft=(ascii_start_x, current_y - 8 + line_idx * 10))
-                    screen.blit(graphic_surf, graphic_rect)
+                    layer.blit(graphic_surf, graphic_rect)
                 name_x = center_x - 20
             else:
-                name_surf_temp = name_font.render(achievement.name, True, name_color)
-                name_x = center_x - name_surf_temp.get_width() / 2
-            name_surf = name_font.render(achievement.name, True, name_color)
+                name_x = center_x - name_surf.get_width() / 2
             name_rect = name_surf.get_rect(topleft=(name_x, current_y))
-            screen.blit(name_surf, name_rect)
-
-        back_button_y = C.SCREEN_HEIGHT - 80
-        for i, item in enumerate(self.items):
-            item.draw(screen, (C.SCREEN_WIDTH / 2, back_button_y + i * C.MENU_ITEM_SPACING))
+            layer.blit(name_surf, name_rect)
 
         unlocked_count = sum(1 for achievement in self.achievement_system.achievements if achievement.unlocked)
         total_count = len(self.achievement_system.achievements)
         progress_text = f"Progress: {unlocked_count}/{total_count} Achievements unlocked"
-        progress_font = pygame.font.Font(None, 20)
-        progress_surf = progress_font.render(progress_text, True, pygame.Color("lightblue"))
+        progress_surf = self.progress_font.render(progress_text, True, pygame.Color("lightblue"))
         progress_rect = progress_surf.get_rect(center=(C.SCREEN_WIDTH / 2, C.SCREEN_HEIGHT / 12 + 35))
-        screen.blit(progress_surf, progress_rect)
+        layer.blit(progress_surf, progress_rect)
+
+    def draw(self, screen):
+        draw_backdrop(screen, self.background_alpha)
+
+        title_surf = self._rendered_title()
+        title_rect = title_surf.get_rect(center=(C.SCREEN_WIDTH / 2, C.SCREEN_HEIGHT / 12))
+        screen.blit(title_surf, title_rect)
+
+        achievements = self.achievement_system.achievements
+        key = tuple((achievement.name, achievement.unlocked) for achievement in achievements)
+        self._layer.draw(screen, key)
+
+        back_button_y = C.SCREEN_HEIGHT - 80
+        for i, item in enumerate(self.items):
+            item.draw(screen, (C.SCREEN_WIDTH / 2, back_button_y + i * C.MENU_ITEM_SPACING))
 
     def update(self, dt, events):
         result = super().update(dt, events)
@@ -1862,6 +1923,12 @@ class ShipSelectionMenu(Menu):
         self.selected_ship_index = 0
         self.ships = ship_manager.get_available_ships()
         self.animation_time = 0
+        self.name_font = pygame.font.Font(None, 24)
+        self.detail_font = pygame.font.Font(None, 28)
+        self.small_font = pygame.font.Font(None, 24)
+        self.instruction_font = pygame.font.Font(None, 20)
+        # Names, details and instructions, rendered again when the selection changes
+        self._layer = StaticLayer(self._render_text)
 
     def activate(self):
         """TODO: add docstring."""
@@ -1895,45 +1962,18 @@ class ShipSelectionMenu(Menu):
 
         return None
 
-    def draw(self, screen):
-        """TODO: add docstring."""
-        background = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-        background.fill((0, 0, 0, self.background_alpha))
-        screen.blit(background, (0, 0))
-
-        title_surf = self.title_font.render(self.title, True, pygame.Color(C.MENU_TITLE_COLOR))
-        title_rect = title_surf.get_rect(center=(C.SCREEN_WIDTH / 2, 80))
-        screen.blit(title_surf, title_rect)
-
+    def _ship_row(self):
+        """Yield (index, x, y, ship data) for each ship in the row."""
         ship_y = C.SCREEN_HEIGHT / 2 - 50
         ship_spacing = 200
         start_x = C.SCREEN_WIDTH / 2 - (len(self.ships) - 1) * ship_spacing / 2
-
         for i, ship_id in enumerate(self.ships):
-            ship_data = ship_manager.get_ship_data(ship_id)
-            x = start_x + i * ship_spacing
-
-            if i == self.selected_ship_index:
-                highlight_size = 80 + 10 * math.sin(self.animation_time * 4)
-                pygame.draw.circle(screen, (100, 100, 100, 100), (int(x), int(ship_y)), int(highlight_size), 3)
-
-            if ship_data["unlocked"]:
-
-                base_color = ship_data.get("color", (255, 255, 255))
-                if i == self.selected_ship_index:
-
-                    ship_color = tuple(min(255, int(c * 1.3)) for c in base_color)
-                else:
-                    ship_color = base_color
-                ShipRenderer.draw_ship(screen, x, ship_y, 0, ship_data["shape"], 2.0, ship_color)
-            else:
-
-                lock_color = (100, 100, 100) if i != self.selected_ship_index else (150, 150, 150)
-                ShipRenderer.draw_question_mark(screen, x, ship_y, 2.0, lock_color)
+            yield i, start_x + i * ship_spacing, ship_y, ship_manager.get_ship_data(ship_id)
 
-            name_font = pygame.font.Font(None, 24)
+    def _render_text(self, layer):
+        """Render the lock marks, ship names, the selected ship's details and the instructions."""
+        for i, x, ship_y, ship_data in self._ship_row():
             if ship_data["unlocked"]:
-
                 base_color = ship_data.get("color", (255, 255, 255))
                 if i == self.selected_ship_index:
                     name_color = tuple(min(255, int(c * 1.3)) for c in base_color)
@@ -1941,25 +1981,25 @@ class ShipSelectionMenu(Menu):
                     name_color = base_color
                 name_text = ship_data["name"]
             else:
+                lock_color = (100, 100, 100) if i != self.selected_ship_index else (150, 150, 150)
+                ShipRenderer.draw_question_mark(layer, x, ship_y, 2.0, lock_color)
                 name_color = (100, 100, 100)
                 name_text = "LOCKED"
 
-            name_surf = name_font.render(name_text, True, name_color)
+            name_surf = self.name_font.render(name_text, True, name_color)
             name_rect = name_surf.get_rect(center=(x, ship_y + 60))
-            screen.blit(name_surf, name_rect)
+            layer.blit(name_surf, name_rect)
 
         selected_ship = self.ships[self.selected_ship_index]
         ship_data = ship_manager.get_ship_data(selected_ship)
 
         detail_y = C.SCREEN_HEIGHT - 200
-        detail_font = pygame.font.Font(None, 28)
-        small_font = pygame.font.Font(None, 24)
 
         if ship_data["unlocked"]:
 
-            desc_surf = detail_font.render(ship_data["description"], True, (255, 255, 255))
+            desc_surf = self.detail_font.render(ship_data["description"], True, (255, 255, 255))
             desc_rect = desc_surf.get_rect(center=(C.SCREEN_WIDTH / 2, detail_y))
-            screen.blit(desc_surf, desc_rect)
+            layer.blit(desc_surf, desc_rect)
 
             props = [
                 f"Speed: {ship_data['speed_multiplier']:.1f}x",
@@ -1968,14 +2008,39 @@ class ShipSelectionMenu(Menu):
             ]
 
             for i, prop in enumerate(props):
-                prop_surf = small_font.render(prop, True, (200, 200, 200))
+                prop_surf = self.small_font.render(prop, True, (200, 200, 200))
                 prop_rect = prop_surf.get_rect(center=(C.SCREEN_WIDTH / 2, detail_y + 40 + i * 25))
-                screen.blit(prop_surf, prop_rect)
+                layer.blit(prop_surf, prop_rect)
 
-        instruction_font = pygame.font.Font(None, 20)
         instructions = ["LEFT / RIGHT: Select Ship", "ENTER / SPACE: Confirm Selection", "ESC: Back to Difficulty"]
 
         for i, instruction in enumerate(instructions):
-            instr_surf = instruction_font.render(instruction, True, (150, 150, 150))
+            instr_surf = self.instruction_font.render(instruction, True, (150, 150, 150))
             instr_rect = instr_surf.get_rect(center=(C.SCREEN_WIDTH / 2, C.SCREEN_HEIGHT - 60 + i * 20))
-            screen.blit(instr_surf, instr_rect)
+            layer.blit(instr_surf, instr_rect)
+
+    def draw(self, screen):
+        """Draw the ship row, the selected ship's details and the instructions."""
+        draw_backdrop(screen, self.background_alpha)
+
+        title_surf = self._rendered_title()
+        title_rect = title_surf.get_rect(center=(C.SCREEN_WIDTH / 2, 80))
+        screen.blit(title_surf, title_rect)
+
+        unlocked = []
+        for i, x, ship_y, ship_data in self._ship_row():
+            unlocked.append(ship_data["unlocked"])
+
+            if i == self.selected_ship_index:
+                highlight_size = 80 + 10 * math.sin(self.animation_time * 4)
+                pygame.draw.circle(screen, (100, 100, 100, 100), (int(x), int(ship_y)), int(highlight_size), 3)
+
+            if ship_data["unlocked"]:
+                base_color = ship_data.get("color", (255, 255, 255))
+                if i == self.selected_ship_index:
+                    ship_color = tuple(min(255, int(c * 1.3)) for c in base_color)
+                else:
+                    ship_color = base_color
+                ShipRenderer.draw_ship(screen, x, ship_y, 0, ship_data["shape"], 2.0, ship_color)
+
+        self._layer.draw(screen, (tuple(self.ships), tuple(unlocked), self.selected_ship_index))
@@ -1,8 +1,103 @@
-"""Particle effects used for explosions and visual feedback."""
+"""Particle effects used for explosions and visual feedback.
+
+Explosion particles come from `particle_pool`, which recycles killed
+particles instead of constructing new ones and keeps the number of live
+particles within `MAX_LIVE_PARTICLES`: as the budget fills up, bursts use
+fewer, larger particles, and bursts whose emitter is too far off-screen for
+any particle to become visible are skipped.
+"""
+
+import math
+from collections import deque
 
-import random
 import pygame
 import modul.constants as C
+from modul import rng
+
+# Particles are cosmetic and must not consume gameplay random numbers
+_rng = rng.stream(rng.PARTICLES)
+
+PARTICLE_LIFETIME = 0.5
+# The fastest particle travels 200 px/s for its lifetime; farther out nothing shows
+_OFFSCREEN_MARGIN = 200 * PARTICLE_LIFETIME
+
+
+class ParticlePool:
+    """Recycles particles and enforces the live-particle budget."""
+
+    def __init__(self, budget=C.MAX_LIVE_PARTICLES):
+        """Keep at most `budget` particles alive (and as many spare)."""
+        self.budget = budget
+        self._free = {}
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Zero the counters reported by `stats`."""
+        self.created = 0
+        self.reused = 0
+        self.culled = 0
+        self.skipped_emitters = 0
+
+    def acquire(self, cls, x, y, color):
+        """Return a live particle of `cls`, recycled when one is free."""
+        free = self._free.get(cls)
+        if free:
+            # Oldest first, so a particle killed this very step is not reborn in it
+            particle = free.popleft()
+            particle.reset(x, y, color)
+            self.reused += 1
+        else:
+            particle = cls(x, y, color)
+            self.created += 1
+        return particle
+
+    def release(self, particle):
+        """Take back a killed particle for reuse."""
+        if particle.pooled:
+            return
+        particle.pooled = True
+        free = self._free.setdefault(type(particle), deque())
+        if len(free) < self.budget:
+            free.append(particle)
+
+    def free_count(self):
+        """Number of particles waiting to be reused."""
+        return sum(len(free) for free in self._free.values())
+
+    def plan_burst(self, requested, live):
+        """Return (count, size scale) for a burst of `requested` particles.
+
+        `live` is the number of particles already alive. Past
+        `PARTICLE_LOD_START` of the budget the count falls linearly towards
+        `PARTICLE_LOD_MIN_BURST`, and the particles grow so the burst covers
+        about the same area.
+        """
+        room = self.budget - live
+        if room <= 0:
+            return 0, 1.0
+        count = requested
+        start = self.budget * C.PARTICLE_LOD_START
+        if live > start:
+            fraction = 1.0 - (live - start) / (self.budget - start)
+            count = max(C.PARTICLE_LOD_MIN_BURST, round(requested * fraction))
+        count = min(count, requested, room)
+        return count, math.sqrt(requested / count)
+
+    def stats(self):
+        """Return pool and culling counters for the profiler."""
+        spawned = self.created + self.reused
+        return {
+            'created': self.created,
+            'reused': self.reused,
+            'hit_rate': self.reused / spawned if spawned else 0.0,
+            'culled': self.culled,
+            'skipped_emitters': self.skipped_emitters,
+            'free': self.free_count(),
+            'budget': self.budget,
+        }
+
+
+particle_pool = ParticlePool()
 
 
 class Particle(pygame.sprite.Sprite):
@@ -10,49 +105,80 @@ class Particle(pygame.sprite.Sprite):
     def __init__(self, x, y, color):
         """Initialize a particle with position, velocity, and lifetime."""
         super().__init__()
-        self.position = pygame.Vector2(x, y)
-        speed = random.uniform(50, 150)
-        angle = random.uniform(0, 360)
+        self.position = pygame.Vector2()
         self.velocity = pygame.Vector2()
+        self.reset(x, y, color)
+
+    def reset(self, x, y, color):
+        """(Re)start the particle at (x, y) and add it to its containers."""
+        self.position.update(x, y)
+        speed = _rng.uniform(50, 150)
+        angle = _rng.uniform(0, 360)
         self.velocity.from_polar((speed, angle))
         self.color = color
         self.alpha = 255
-        self.lifetime = 0.5
+        self.lifetime = PARTICLE_LIFETIME
+        self.size = C.PARTICLE_SIZE
+        self.pooled = False
         # Add to containers if set (for test group injection)
         containers = getattr(type(self), 'containers', ())
         if containers:
             for group in containers:
                 group.add(self)
 
+    def kill(self):
+        """Remove the particle from all groups and return it to the pool."""
+        super().kill()
+        particle_pool.release(self)
+
     def update(self, dt):
         """Update particle position, lifetime, and alpha fading."""
         self.position += self.velocity * dt
         self.lifetime -= dt
         if self.lifetime <= 0:
             self.kill()
-        self.alpha = max(0, int(255 * (self.lifetime)))
+        # Fades from opaque to transparent over the particle's lifetime
+        self.alpha = max(0, int(255 * self.lifetime / PARTICLE_LIFETIME))
 
     def draw(self, screen):
         """Draw the particle as a small circle on the screen."""
         pos = (int(self.position.x), int(self.position.y))
-        pygame.draw.circle(screen, self.color, pos, 2)
+        pygame.draw.circle(screen, self.color, pos, self.size)
+
+    @classmethod
+    def _plan_burst(cls, x, y, requested):
+        """Return (count, size) for a burst at (x, y) within the particle budget."""
+        if not (-_OFFSCREEN_MARGIN <= x <= C.SCREEN_WIDTH + _OFFSCREEN_MARGIN
+                and -_OFFSCREEN_MARGIN <= y <= C.SCREEN_HEIGHT + _OFFSCREEN_MARGIN):
+            particle_pool.skipped_emitters += 1
+            particle_pool.culled += requested
+            return 0, C.PARTICLE_SIZE
+        containers = getattr(cls, 'containers', ())
+        live = len(containers[0]) if containers else 0
+        count, scale = particle_pool.plan_burst(requested, live)
+        particle_pool.culled += requested - count
+        return count, max(C.PARTICLE_SIZE, round(C.PARTICLE_SIZE * scale))
 
     @classmethod
     def create_ship_explosion(cls, x, y):
         """Create explosion particles for ship destruction."""
-        for _ in range(C.EXPLOSION_PARTICLES):
-            angle = random.uniform(0, 360)
-            speed = random.uniform(100, 200)
-            particle = cls(x, y, "white")
+        count, size = cls._plan_burst(x, y, C.EXPLOSION_PARTICLES)
+        for _ in range(count):
+            angle = _rng.uniform(0, 360)
+            speed = _rng.uniform(100, 200)
+            particle = particle_pool.acquire(cls, x, y, "white")
             particle.velocity.from_polar((speed, angle))
-            particle.lifetime = 0.5
+            particle.lifetime = PARTICLE_LIFETIME
+            particle.size = size
 
     @classmethod
     def create_asteroid_explosion(cls, x, y):
         """Create explosion particles for asteroid destruction."""
-        for _ in range(C.EXPLOSION_PARTICLES):
-            color = random.choice(C.PARTICLE_COLORS)
-            particle = cls(x, y, color)
-            speed = random.uniform(50, 150)
-            angle = random.uniform(0, 360)
+        count, size = cls._plan_burst(x, y, C.EXPLOSION_PARTICLES)
+        for _ in range(count):
+            color = _rng.choice(C.PARTICLE_COLORS)
+            particle = particle_pool.acquire(cls, x, y, color)
+            speed = _rng.uniform(50, 150)
+            angle = _rng.uniform(0, 360)
             particle.velocity.from_polar((speed, angle))
+            particle.size = size
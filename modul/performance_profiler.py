@@ -4,6 +4,7 @@ This module provides real-time performance metrics display including:
 - FPS (Frames Per Second)
 - Frame time (milliseconds)
 - Object counts (asteroids, shots, particles, etc.)
+- Particle pool hits and culled particles
 - Performance graph visualization
 """
 
@@ -46,6 +47,10 @@ class PerformanceProfiler:
             'enemies': 0,
             'total': 0
         }
+        # Latest `ParticlePool.stats()`, when supplied
+        self.particle_stats = None
+        # Latest `ShipSpriteCache.stats()`, when supplied
+        self.sprite_stats = None
 
         # Graph settings
         self.graph_width = 240
@@ -70,17 +75,22 @@ class PerformanceProfiler:
         self.enabled = not self.enabled
         return self.enabled
 
-    def update(self, dt, clock, object_groups=None):
+    def update(self, dt, clock, object_groups=None, particle_stats=None, sprite_stats=None):
         """Update performance metrics.
 
         Args:
             dt: Delta time in seconds
             clock: pygame.time.Clock instance
             object_groups: Dictionary of sprite groups to count objects
+            particle_stats: Particle pool counters from `ParticlePool.stats()`
+            sprite_stats: Ship sprite cache size from `ShipSpriteCache.stats()`
         """
         if not self.enabled:
             return
 
+        self.particle_stats = particle_stats
+        self.sprite_stats = sprite_stats
+
         # Update FPS
         current_fps = clock.get_fps()
         self.fps_history.append(current_fps)
@@ -157,6 +167,10 @@ class PerformanceProfiler:
         # Draw semi-transparent background
         overlay_width = 260
         overlay_height = 320
+        if self.particle_stats:
+            overlay_height += 40
+        if self.sprite_stats:
+            overlay_height += 18
         overlay_x = screen.get_width() - overlay_width - 10
         overlay_y = screen.get_height() - overlay_height - 10
 
@@ -235,6 +249,33 @@ class PerformanceProfiler:
             self.text_color,
         )
         screen.blit(total_text, (x_offset, y_offset))
+        y_offset += 20
+
+        if self.particle_stats:
+            stats = self.particle_stats
+            pool_text = self.font_small.render(
+                f"Particle pool: {stats['hit_rate']:.0%} reused, {stats['free']} free",
+                True,
+                (200, 200, 200),
+            )
+            screen.blit(pool_text, (x_offset, y_offset))
+            y_offset += 18
+            culled_text = self.font_small.render(
+                f"Culled: {stats['culled']} ({stats['skipped_emitters']} off-screen bursts)",
+                True,
+                (200, 200, 200),
+            )
+            screen.blit(culled_text, (x_offset, y_offset))
+            y_offset += 18
+
+        if self.sprite_stats:
+            stats = self.sprite_stats
+            sprite_text = self.font_small.render(
+                f"Ship sprites: {stats['sprites']} ({stats['bytes'] / 1024:.0f} KB, {stats['hit_rate']:.0%} hits)",
+                True,
+                (200, 200, 200),
+            )
+            screen.blit(sprite_text, (x_offset, y_offset))
 
         # Draw hint at bottom
         hint_y = overlay_y + overlay_height - 20
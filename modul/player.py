@@ -57,6 +57,9 @@ class Player(CircleShape):
         self.current_weapon = C.WEAPON_STANDARD
         self.weapon_switch_timer = 0
         self.weapons = {C.WEAPON_STANDARD: -1, C.WEAPON_LASER: 0, C.WEAPON_MISSILE: 0, C.WEAPON_SHOTGUN: 0}
+        # Optional action -> pressed mapping that replaces keyboard input
+        # (headless simulation, bots); None reads the configured controls
+        self.input_state = None
 
         self.ship_type = ship_type
         self.ship_data = ship_manager.get_ship_data(ship_type)
@@ -117,30 +120,37 @@ class Player(CircleShape):
         c = self.position - forward * self.radius + right
         return [a, b, c]
 
+    def is_action_pressed(self, action):
+        """Return whether `action` is active, from `input_state` or the keyboard."""
+        if self.input_state is not None:
+            return bool(self.input_state.get(action, False))
+        return input_utils.is_action_pressed(action)
+
     def update(self, dt):
         """Update player state, handle input, and powerup timers."""
 
-        if input_utils.is_action_pressed("rotate_left"):
+        if self.is_action_pressed("rotate_left"):
             self.rotate(-self.base_turn_speed * dt)
-        if input_utils.is_action_pressed("rotate_right"):
+        if self.is_action_pressed("rotate_right"):
             self.rotate(self.base_turn_speed * dt)
-        if input_utils.is_action_pressed("thrust"):
+        if self.is_action_pressed("thrust"):
             self.velocity += self.forward() * self.base_speed * dt
-        if input_utils.is_action_pressed("reverse"):
+        if self.is_action_pressed("reverse"):
             self.velocity -= self.forward() * self.base_speed * dt
 
-        if input_utils.is_action_pressed("shoot"):
+        if self.is_action_pressed("shoot"):
             self.shoot()
 
-        if input_utils.is_action_pressed("switch_weapon"):
+        if self.is_action_pressed("switch_weapon"):
             self.cycle_weapon()
 
         max_speed = getattr(self, "max_speed", 400)
         if self.velocity.length() > max_speed:
             self.velocity = self.velocity.normalize() * max_speed
 
+        # Friction is 0.98 per 1/60 s, independent of the step length
         friction = 0.98
-        self.velocity *= friction
+        self.velocity *= friction ** (dt * 60)
 
         self.position += self.velocity * dt
 
@@ -1,21 +1,192 @@
-"""Power-up entities and their behaviors."""
+"""Power-up entities and their behaviors.
+
+Power-up icons are drawn from `powerup_atlas`, which renders each type's
+geometry once per pulse scale (`POWERUP_PULSE_STEPS` frames between 70% and
+full size) and afterwards only blits the frame matching the current pulse.
+The pulse follows the power-up's remaining lifetime, i.e. game time, so it
+stops while paused, follows the time scale and replays identically.
+"""
 
 import math
-import random
 import pygame
 import modul.constants as C
+from modul import rng
 from modul.circleshape import CircleShape
 
+_rng = rng.stream(rng.POWERUPS)
+# Room around the outer circle for the laser beam and line widths
+_ICON_MARGIN = 4
+
+
+def _pulse_scale(lifetime):
+    """Return the icon scale for a power-up with `lifetime` seconds left."""
+    if lifetime > 3.0:
+        return 1.0
+    pulse_frequency = 2.0 + (3.0 - lifetime) * 2
+    age = C.POWERUP_LIFETIME - lifetime
+    return 0.7 + 0.3 * abs(math.sin(pulse_frequency * age))
+
+
+def draw_icon(surface, powerup_type, color, position, draw_radius):
+    """Draw the icon of `powerup_type` centred on `position` (a Vector2)."""
+    pygame.draw.circle(surface, color, position, draw_radius, 2)
+
+    if powerup_type == "shield":
+        pygame.draw.circle(surface, color, position, draw_radius * 0.6, 1)
+
+    elif powerup_type == "triple_shot":
+        center = pygame.Vector2(position)
+        for angle in [-30, 0, 30]:
+            start_point = center
+            angle_offset = angle
+            segment_length = draw_radius * 0.15
+
+            for i in range(5):
+                end_point = start_point + pygame.Vector2(0, -segment_length).rotate(angle_offset)
+                pygame.draw.line(surface, color, start_point, end_point, 2)
+                angle_offset += 5 if angle < 0 else (-5 if angle > 0 else 0)
+                start_point = end_point
+
+        pygame.draw.circle(surface, color, center, draw_radius * 0.2, 1)
+
+    elif powerup_type == "rapid_fire":
+        center = pygame.Vector2(position)
+        hex_points = []
+        for i in range(6):
+            angle = math.radians(i * 60)
+            hex_points.append(
+                (center.x + math.cos(angle) * draw_radius * 0.25, center.y + math.sin(angle) * draw_radius * 0.25)
+            )
+        pygame.draw.polygon(surface, color, hex_points, 1)
+
+        for angle in [30, 90, 150, 210, 270, 330]:
+            points = []
+            radius = draw_radius * 0.25
+            points.append(center + pygame.Vector2(math.cos(math.radians(angle)), math.sin(math.radians(angle))) * radius)
+
+            zigzag = 15
+            distance = draw_radius * 0.6
+            segments = 3
+
+            direction = pygame.Vector2(math.cos(math.radians(angle)), math.sin(math.radians(angle)))
+
+            for i in range(segments):
+                offset_angle = angle + (zigzag if i % 2 == 0 else -zigzag)
+                offset_dir = pygame.Vector2(math.cos(math.radians(offset_angle)), math.sin(math.radians(offset_angle)))
+
+                next_point = points[-1] + offset_dir * (distance / segments)
+                points.append(next_point)
+
+            if len(points) >= 2:
+                for i in range(len(points) - 1):
+                    pygame.draw.line(surface, color, points[i], points[i + 1], 1)
+
+    elif powerup_type == "laser_weapon":
+        rect = pygame.Rect(
+            position.x - draw_radius * 0.25, position.y - draw_radius * 0.6, draw_radius * 0.5, draw_radius * 1.2
+        )
+        pygame.draw.rect(surface, color, rect, 1)
+
+        for i in range(3):
+            y = position.y - draw_radius * 0.4 + i * draw_radius * 0.4
+            pygame.draw.line(
+                surface, color, (position.x - draw_radius * 0.25, y), (position.x + draw_radius * 0.25, y), 1
+            )
+
+        beam_start = position - pygame.Vector2(0, draw_radius * 0.6)
+        beam_end = beam_start - pygame.Vector2(0, draw_radius * 0.3)
+        pygame.draw.line(surface, color, beam_start, beam_end, 3)
+
+    elif powerup_type == "missile_weapon":
+        pygame.draw.line(
+            surface,
+            color,
+            position - pygame.Vector2(0, draw_radius * 0.3),
+            position + pygame.Vector2(0, draw_radius * 0.5),
+            2,
+        )
+
+        head_points = []
+        head_points.append(position - pygame.Vector2(0, draw_radius * 0.6))
+        head_points.append(position - pygame.Vector2(draw_radius * 0.3, draw_radius * 0.3))
+        head_points.append(position - pygame.Vector2(-draw_radius * 0.3, draw_radius * 0.3))
+        pygame.draw.polygon(surface, color, head_points, 1)
+
+        wing_l = []
+        wing_l.append(position + pygame.Vector2(-draw_radius * 0.1, 0))
+        wing_l.append(position + pygame.Vector2(-draw_radius * 0.4, draw_radius * 0.3))
+        wing_l.append(position + pygame.Vector2(-draw_radius * 0.1, draw_radius * 0.3))
+        pygame.draw.polygon(surface, color, wing_l, 1)
+
+        wing_r = []
+        wing_r.append(position + pygame.Vector2(draw_radius * 0.1, 0))
+        wing_r.append(position + pygame.Vector2(draw_radius * 0.4, draw_radius * 0.3))
+        wing_r.append(position + pygame.Vector2(draw_radius * 0.1, draw_radius * 0.3))
+        pygame.draw.polygon(surface, color, wing_r, 1)
+
+    elif powerup_type == "shotgun_weapon":
+        center = pygame.Vector2(position)
+
+        pygame.draw.line(surface, color, center, center - pygame.Vector2(0, draw_radius * 0.6), 2)
+
+        for angle in [-30, 0, 30]:
+            start = center - pygame.Vector2(0, draw_radius * 0.4)
+            direction = pygame.Vector2(0, -1).rotate(angle)
+            end = start + direction * draw_radius * 0.4
+            pygame.draw.line(surface, color, start, end, 2)
+
+
+class PowerUpAtlas:
+    """Pre-rendered power-up icons, one frame per type, colour and pulse step."""
+
+    def __init__(self, radius=C.POWERUP_RADIUS, steps=C.POWERUP_PULSE_STEPS):
+        """Render icons of `radius` at `steps` + 1 scales from 0.7 to 1.0."""
+        self.radius = radius
+        self.steps = max(1, steps)
+        self.half = math.ceil(radius) + _ICON_MARGIN
+        self._frames = {}
+
+    def step(self, scale):
+        """Return the pulse step closest to `scale`."""
+        fraction = (scale - 0.7) / 0.3
+        return min(self.steps, max(0, round(fraction * self.steps)))
+
+    def frame(self, powerup_type, color, step):
+        """Return the icon surface of `powerup_type` at pulse `step`."""
+        key = (powerup_type, color, step)
+        icon = self._frames.get(key)
+        if icon is None:
+            size = 2 * self.half
+            icon = pygame.Surface((size, size), pygame.SRCALPHA)
+            draw_radius = self.radius * (0.7 + 0.3 * step / self.steps)
+            draw_icon(icon, powerup_type, color, pygame.Vector2(self.half, self.half), draw_radius)
+            if pygame.display.get_surface() is not None:
+                icon = icon.convert_alpha()
+            self._frames[key] = icon
+        return icon
+
+    def draw(self, screen, powerup_type, color, position, scale=1.0):
+        """Blit the icon of `powerup_type` at `scale` centred on `position`."""
+        icon = self.frame(powerup_type, color, self.step(scale))
+        screen.blit(icon, (int(position[0]) - self.half, int(position[1]) - self.half))
+
+    def cache_size(self):
+        """Number of pre-rendered frames."""
+        return len(self._frames)
+
+
+powerup_atlas = PowerUpAtlas()
+
 
 class PowerUp(CircleShape):
     """Represents a power-up item that can be collected by the player."""
     def __init__(self, x, y, powerup_type=None):
         """Initialize a power-up with position and type."""
         super().__init__(x, y, C.POWERUP_RADIUS)
-        self.type = powerup_type if powerup_type else random.choice(C.POWERUP_TYPES)
+        self.type = powerup_type if powerup_type else _rng.choice(C.POWERUP_TYPES)
         self.color = C.POWERUP_COLORS[self.type]
         self.rotation = 0
-        self.velocity = pygame.Vector2(random.uniform(-30, 30), random.uniform(-30, 30))
+        self.velocity = pygame.Vector2(_rng.uniform(-30, 30), _rng.uniform(-30, 30))
         self.lifetime = C.POWERUP_LIFETIME
 
     def update(self, dt):
@@ -29,114 +200,8 @@ class PowerUp(CircleShape):
 
     def draw(self, screen):
         """Draw the power-up with pulsing effect based on lifetime."""
-        pulse_scale = 1.0
-        if self.lifetime <= 3.0:
-            pulse_frequency = 2.0 + (3.0 - self.lifetime) * 2
-            pulse_scale = 0.7 + 0.3 * abs(math.sin(pulse_frequency * pygame.time.get_ticks() * 0.001))
-
-        draw_radius = self.radius * pulse_scale
-        pygame.draw.circle(screen, self.color, self.position, draw_radius, 2)
-
-        if self.type == "shield":
-            pygame.draw.circle(screen, self.color, self.position, draw_radius * 0.6, 1)
-
-        elif self.type == "triple_shot":
-            center = pygame.Vector2(self.position)
-            for angle in [-30, 0, 30]:
-                start_point = center
-                angle_offset = angle
-                segment_length = draw_radius * 0.15
-
-                for i in range(5):
-                    end_point = start_point + pygame.Vector2(0, -segment_length).rotate(angle_offset)
-                    pygame.draw.line(screen, self.color, start_point, end_point, 2)
-                    angle_offset += 5 if angle < 0 else (-5 if angle > 0 else 0)
-                    start_point = end_point
-
-            pygame.draw.circle(screen, self.color, center, draw_radius * 0.2, 1)
-
-        elif self.type == "rapid_fire":
-            center = pygame.Vector2(self.position)
-            hex_points = []
-            for i in range(6):
-                angle = math.radians(i * 60)
-                hex_points.append(
-                    (center.x + math.cos(angle) * draw_radius * 0.25, center.y + math.sin(angle) * draw_radius * 0.25)
-                )
-            pygame.draw.polygon(screen, self.color, hex_points, 1)
-
-            for angle in [30, 90, 150, 210, 270, 330]:
-                points = []
-                radius = draw_radius * 0.25
-                points.append(center + pygame.Vector2(math.cos(math.radians(angle)), math.sin(math.radians(angle))) * radius)
-
-                zigzag = 15
-                distance = draw_radius * 0.6
-                segments = 3
-
-                direction = pygame.Vector2(math.cos(math.radians(angle)), math.sin(math.radians(angle)))
-
-                for i in range(segments):
-                    offset_angle = angle + (zigzag if i % 2 == 0 else -zigzag)
-                    offset_dir = pygame.Vector2(math.cos(math.radians(offset_angle)), math.sin(math.radians(offset_angle)))
-
-                    next_point = points[-1] + offset_dir * (distance / segments)
-                    points.append(next_point)
-
-                if len(points) >= 2:
-                    for i in range(len(points) - 1):
-                        pygame.draw.line(screen, self.color, points[i], points[i + 1], 1)
-
-        elif self.type == "laser_weapon":
-            rect = pygame.Rect(
-                self.position.x - draw_radius * 0.25, self.position.y - draw_radius * 0.6, draw_radius * 0.5, draw_radius * 1.2
-            )
-            pygame.draw.rect(screen, self.color, rect, 1)
-
-            for i in range(3):
-                y = self.position.y - draw_radius * 0.4 + i * draw_radius * 0.4
-                pygame.draw.line(
-                    screen, self.color, (self.position.x - draw_radius * 0.25, y), (self.position.x + draw_radius * 0.25, y), 1
-                )
-
-            beam_start = self.position - pygame.Vector2(0, draw_radius * 0.6)
-            beam_end = beam_start - pygame.Vector2(0, draw_radius * 0.3)
-            pygame.draw.line(screen, self.color, beam_start, beam_end, 3)
-
-        elif self.type == "missile_weapon":
-            pygame.draw.line(
-                screen,
-                self.color,
-                self.position - pygame.Vector2(0, draw_radius * 0.3),
-                self.position + pygame.Vector2(0, draw_radius * 0.5),
-                2,
-            )
-
-            head_points = []
-            head_points.append(self.position - pygame.Vector2(0, draw_radius * 0.6))
-            head_points.append(self.position - pygame.Vector2(draw_radius * 0.3, draw_radius * 0.3))
-            head_points.append(self.position - pygame.Vector2(-draw_radius * 0.3, draw_radius * 0.3))
-            pygame.draw.polygon(screen, self.color, head_points, 1)
-
-            wing_l = []
-            wing_l.append(self.position + pygame.Vector2(-draw_radius * 0.1, 0))
-            wing_l.append(self.position + pygame.Vector2(-draw_radius * 0.4, draw_radius * 0.3))
-            wing_l.append(self.position + pygame.Vector2(-draw_radius * 0.1, draw_radius * 0.3))
-            pygame.draw.polygon(screen, self.color, wing_l, 1)
-
-            wing_r = []
-            wing_r.append(self.position + pygame.Vector2(draw_radius * 0.1, 0))
-            wing_r.append(self.position + pygame.Vector2(draw_radius * 0.4, draw_radius * 0.3))
-            wing_r.append(self.position + pygame.Vector2(draw_radius * 0.1, draw_radius * 0.3))
-            pygame.draw.polygon(screen, self.color, wing_r, 1)
-
-        elif self.type == "shotgun_weapon":
-            center = pygame.Vector2(self.position)
-
-            pygame.draw.line(screen, self.color, center, center - pygame.Vector2(0, draw_radius * 0.6), 2)
-
-            for angle in [-30, 0, 30]:
-                start = center - pygame.Vector2(0, draw_radius * 0.4)
-                direction = pygame.Vector2(0, -1).rotate(angle)
-                end = start + direction * draw_radius * 0.4
-                pygame.draw.line(screen, self.color, start, end, 2)
+        pulse_scale = _pulse_scale(self.lifetime)
+        if self.radius == powerup_atlas.radius:
+            powerup_atlas.draw(screen, self.type, self.color, self.position, pulse_scale)
+        else:
+            draw_icon(screen, self.type, self.color, pygame.Vector2(self.position), self.radius * pulse_scale)
@@ -0,0 +1,239 @@
+"""Quick-save and resume of an in-progress run.
+
+A quick-save is two files:
+
+* the state file, rewritten atomically on every save: a small JSON header
+  (difficulty, ship, replay metadata and events, extra loop state) followed by
+  a `modul.snapshot` world blob;
+* an append-only replay journal holding the recorded replay frames in
+  zlib-compressed `marshal` chunks.
+
+The replay of a long run is by far the largest part, so frames are appended
+to the journal as they accumulate (`sync_replay`) and a save only writes the
+frames recorded since the previous sync. That keeps the quit path fast no
+matter how long the run has been going.
+"""
+
+import json
+import logging
+import marshal
+import os
+import struct
+import time
+import uuid
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from modul.replay_system import GameEvent, GameFrame, ReplayRecorder
+from modul.snapshot import SNAPSHOT_MAGIC, SNAPSHOT_VERSION, snapshot_world
+
+logger = logging.getLogger(__name__)
+
+QUICK_SAVE_FILE = "quicksave.bin"
+QUICK_SAVE_VERSION = 1
+# Seconds of play between background appends to the replay journal
+QUICK_SAVE_SYNC_INTERVAL = 10.0
+
+_STATE_MAGIC = b"AJQS"
+_JOURNAL_MAGIC = b"AJQJ"
+_STATE_HEADER = struct.Struct("<4sBI")  # magic, version, meta length
+_JOURNAL_HEADER = struct.Struct("<4sB32s")  # magic, version, run id
+_CHUNK_HEADER = struct.Struct("<II")  # compressed length, frame count
+_FRAME_FIELDS = tuple(GameFrame.__dataclass_fields__)
+
+
+@dataclass
+class RunState:
+    """The interactive game's run in the shape `snapshot_world` expects."""
+    player: Any
+    updatable: Any
+    drawable: Any
+    particles: Any
+    asteroid_field: Any
+    enemy_groups: tuple
+    score: int
+    lives: int
+    level: int
+    enemies: List[Any] = field(default_factory=list)
+    boss: Any = None
+    boss_active: bool = False
+    time: float = 0.0
+    last_spawn_time: float = 0.0
+    spawn_interval: float = 0.0
+    tick: int = 0
+    game_over: bool = False
+
+
+@dataclass
+class SavedRun:
+    """A loaded quick-save."""
+    world: bytes
+    difficulty: str
+    ship_type: str
+    saved_at: float
+    extra: Dict[str, Any]
+    replay_metadata: Dict[str, Any]
+    replay_elapsed: float
+    replay_last_frame_time: float
+    frames: List[GameFrame]
+    events: List[GameEvent]
+
+    def apply_to_recorder(self, recorder: ReplayRecorder):
+        """Resume `recorder` where the saved run left off."""
+        recorder.recording = True
+        recorder.metadata = dict(self.replay_metadata)
+        recorder.frames = list(self.frames)
+        recorder.events = list(self.events)
+        # Shift the start so new timestamps continue from the saved ones
+        recorder.start_time = recorder.clock.now - self.replay_elapsed
+        recorder.last_frame_time = self.replay_last_frame_time
+
+
+class QuickSave:
+    """Writes and reads the quick-save of the current run."""
+
+    def __init__(self, path: str = QUICK_SAVE_FILE):
+        """Use `path` for the state file and ``<path>.frames`` for the journal."""
+        self.path = path
+        self.journal_path = path + ".frames"
+        self.run_id = ""
+        self._journaled = 0
+        self.available = os.path.exists(self.path)
+        self.last_save_ms = 0.0
+
+    def exists(self) -> bool:
+        """Return True when a quick-save is on disk."""
+        self.available = os.path.exists(self.path)
+        return self.available
+
+    def begin_run(self):
+        """Start journaling a new run, discarding any previous quick-save."""
+        self.clear()
+        self.run_id = uuid.uuid4().hex
+
+    def clear(self):
+        """Delete the quick-save files."""
+        for path in (self.path, self.journal_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning("Could not remove quick-save file '%s': %s", path, e)
+        self.run_id = ""
+        self._journaled = 0
+        self.available = False
+
+    def sync_replay(self, recorder: ReplayRecorder) -> int:
+        """Append frames recorded since the last sync; returns how many."""
+        if not self.run_id:
+            return 0
+        pending = recorder.frames[self._journaled:]
+        if not pending:
+            return 0
+        payload = zlib.compress(marshal.dumps([tuple(vars(frame).values()) for frame in pending]), 1)
+        new_journal = self._journaled == 0
+        with open(self.journal_path, "wb" if new_journal else "ab") as f:
+            if new_journal:
+                f.write(_JOURNAL_HEADER.pack(_JOURNAL_MAGIC, QUICK_SAVE_VERSION, self.run_id.encode("ascii")))
+            f.write(_CHUNK_HEADER.pack(len(payload), len(pending)))
+            f.write(payload)
+        self._journaled += len(pending)
+        return len(pending)
+
+    def save(
+        self,
+        run: RunState,
+        recorder: ReplayRecorder,
+        difficulty: str,
+        ship_type: str,
+        extra: Optional[Dict[str, Any]] = None,
+    ) -> float:
+        """Write the run to disk and return the time taken in milliseconds."""
+        started = time.perf_counter()
+        if not self.run_id:
+            self.run_id = uuid.uuid4().hex
+            self._journaled = 0
+        self.sync_replay(recorder)
+
+        meta = {
+            'run_id': self.run_id,
+            'frames': self._journaled,
+            'difficulty': difficulty,
+            'ship_type': ship_type,
+            'saved_at': time.time(),
+            'extra': extra or {},
+            'replay': {
+                'metadata': recorder.metadata,
+                'elapsed': recorder.elapsed() if recorder.recording else 0.0,
+                'last_frame_time': recorder.last_frame_time,
+                'events': [vars(event) for event in recorder.events],
+            },
+        }
+        meta_bytes = json.dumps(meta, separators=(',', ':')).encode("utf-8")
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_STATE_HEADER.pack(_STATE_MAGIC, QUICK_SAVE_VERSION, len(meta_bytes)))
+            f.write(meta_bytes)
+            f.write(snapshot_world(run))
+        os.replace(tmp_path, self.path)
+        self.available = True
+        self.last_save_ms = (time.perf_counter() - started) * 1000
+        logger.info("Quick-saved run in %.1f ms", self.last_save_ms)
+        return self.last_save_ms
+
+    def _read_frames(self, count: int) -> List[GameFrame]:
+        """Read the first `count` journaled frames of the current run."""
+        frames: List[GameFrame] = []
+        if count == 0:
+            return frames
+        with open(self.journal_path, "rb") as f:
+            magic, version, run_id = _JOURNAL_HEADER.unpack(f.read(_JOURNAL_HEADER.size))
+            if magic != _JOURNAL_MAGIC or version != QUICK_SAVE_VERSION or run_id.decode("ascii") != self.run_id:
+                raise ValueError("Replay journal belongs to a different run")
+            while len(frames) < count:
+                header = f.read(_CHUNK_HEADER.size)
+                if len(header) < _CHUNK_HEADER.size:
+                    raise ValueError("Replay journal is truncated")
+                length, _ = _CHUNK_HEADER.unpack(header)
+                for values in marshal.loads(zlib.decompress(f.read(length))):
+                    frames.append(GameFrame(**dict(zip(_FRAME_FIELDS, values))))
+        return frames[:count]
+
+    def load(self) -> Optional[SavedRun]:
+        """Read the quick-save; returns None (and logs) if it is missing or unusable."""
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+            magic, version, meta_len = _STATE_HEADER.unpack_from(data, 0)
+            if magic != _STATE_MAGIC or version != QUICK_SAVE_VERSION:
+                raise ValueError("Not a compatible quick-save")
+            offset = _STATE_HEADER.size
+            meta = json.loads(data[offset:offset + meta_len].decode("utf-8"))
+            world = data[offset + meta_len:]
+            if world[:len(SNAPSHOT_MAGIC) + 1] != SNAPSHOT_MAGIC + bytes([SNAPSHOT_VERSION]):
+                raise ValueError("World snapshot was written by an incompatible version")
+            self.run_id = meta['run_id']
+            frames = self._read_frames(meta['frames'])
+            self._journaled = len(frames)
+            replay = meta['replay']
+            return SavedRun(
+                world=world,
+                difficulty=meta['difficulty'],
+                ship_type=meta['ship_type'],
+                saved_at=meta['saved_at'],
+                extra=meta.get('extra', {}),
+                replay_metadata=replay['metadata'],
+                replay_elapsed=replay['elapsed'],
+                replay_last_frame_time=replay['last_frame_time'],
+                frames=frames,
+                events=[GameEvent(**event) for event in replay['events']],
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError, EOFError, struct.error, zlib.error) as e:
+            logger.warning("Discarding unreadable quick-save '%s': %s", self.path, e)
+            self.run_id = ""
+            self._journaled = 0
+            return None
@@ -0,0 +1,185 @@
+"""Low-resolution raster observations for pixel-based bots.
+
+`RasterRenderer` draws only the gameplay entities of a `GameWorld` straight
+onto a small offscreen surface (84x84 grayscale by default) and exposes it
+as a NumPy array through `pygame.surfarray`. Geometry is taken from the
+entities themselves (`Asteroid.vertices`, `Player.triangle()`) and scaled
+to the target size, so nothing is drawn at full resolution and rescaled.
+The HUD, starfield and particles are never drawn.
+
+Usage:
+    python -m modul.raster_obs --size 84 84 --frames 5000
+"""
+
+import argparse
+import logging
+import math
+import os
+import sys
+import time
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+import modul.constants as C
+from modul.bossprojectile import BossProjectile
+from modul.determinism import scripted_actions
+from modul.powerup import PowerUp
+from modul.shot import Shot
+from modul.simulation import GameWorld
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is listed in requirements.txt
+    np = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZE = (84, 84)
+# Gray level per entity kind; distinct values let an agent tell them apart
+DEFAULT_INTENSITIES: Dict[str, int] = {
+    "player": 255,
+    "enemy": 210,
+    "asteroid": 150,
+    "shot": 110,
+    "powerup": 80,
+}
+_COLORS: Dict[str, Tuple[int, int, int]] = {
+    "player": (255, 255, 255),
+    "enemy": (255, 64, 64),
+    "asteroid": (160, 160, 160),
+    "shot": (255, 255, 0),
+    "powerup": (64, 128, 255),
+}
+
+
+def _require_numpy():
+    """Raise a helpful error when numpy is missing."""
+    if np is None:
+        raise RuntimeError("Raster observations require numpy (pip install -r requirements.txt)")
+
+
+class RasterRenderer:
+    """Renders a world's entities into a small NumPy image."""
+
+    def __init__(
+        self,
+        size: Tuple[int, int] = DEFAULT_SIZE,
+        grayscale: bool = True,
+        intensities: Optional[Dict[str, int]] = None,
+    ):
+        """Render at `size` (width, height), as 8-bit gray or RGB."""
+        _require_numpy()
+        self.width, self.height = size
+        self.grayscale = grayscale
+        self.scale_x = self.width / C.SCREEN_WIDTH
+        self.scale_y = self.height / C.SCREEN_HEIGHT
+        if grayscale:
+            self.surface = pygame.Surface(size, 0, 8)
+            self.surface.set_palette([(i, i, i) for i in range(256)])
+            levels = dict(DEFAULT_INTENSITIES, **(intensities or {}))
+            self.colors = {kind: (level, level, level) for kind, level in levels.items()}
+        else:
+            self.surface = pygame.Surface(size, 0, 24)
+            self.colors = dict(_COLORS)
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Shape of the arrays returned by `render`."""
+        return (self.height, self.width) if self.grayscale else (self.height, self.width, 3)
+
+    def _point(self, x: float, y: float) -> Tuple[float, float]:
+        """Scale a playfield point to the raster."""
+        return x * self.scale_x, y * self.scale_y
+
+    def _circle(self, color, position, radius: float):
+        """Draw a filled circle of playfield `radius` at `position`."""
+        # Entities never shrink below one pixel
+        scaled = max(1.0, radius * (self.scale_x + self.scale_y) / 2)
+        pygame.draw.circle(self.surface, color, self._point(position.x, position.y), scaled)
+
+    def draw_world(self, world):
+        """Draw the gameplay entities of `world` onto the raster surface."""
+        surface = self.surface
+        colors = self.colors
+        sx, sy = self.scale_x, self.scale_y
+        surface.fill((0, 0, 0))
+
+        color = colors["asteroid"]
+        for asteroid in world.asteroids:
+            cos_r, sin_r = math.cos(asteroid.rotation), math.sin(asteroid.rotation)
+            px, py = asteroid.position.x, asteroid.position.y
+            points = [((px + cos_r * x - sin_r * y) * sx, (py + sin_r * x + cos_r * y) * sy)
+                      for x, y in asteroid.vertices]
+            pygame.draw.polygon(surface, color, points)
+
+        for obj in world.updatable:
+            if isinstance(obj, Shot):
+                self._circle(colors["shot"], obj.position, obj.radius)
+            elif isinstance(obj, PowerUp):
+                self._circle(colors["powerup"], obj.position, obj.radius)
+            elif isinstance(obj, BossProjectile):
+                self._circle(colors["enemy"], obj.position, obj.radius)
+
+        color = colors["enemy"]
+        for enemy in world.enemies:
+            self._circle(color, enemy.position, enemy.radius)
+        if world.boss_active and world.boss is not None:
+            self._circle(color, world.boss.position, world.boss.radius)
+
+        player = world.player
+        if player in world.updatable:
+            points = [(p.x * sx, p.y * sy) for p in player.triangle()]
+            pygame.draw.polygon(surface, colors["player"], points)
+
+    def render(self, world, out=None):
+        """Draw `world` and copy the raster into `out` (or a new array), row-major."""
+        self.draw_world(world)
+        if self.grayscale:
+            pixels = pygame.surfarray.pixels2d(self.surface)
+        else:
+            pixels = pygame.surfarray.pixels3d(self.surface)
+        try:
+            # surfarray is indexed [x, y]; observations are [row, column]
+            view = pixels.swapaxes(0, 1)
+            if out is None:
+                return np.array(view, dtype=np.uint8)
+            out[...] = view
+            return out
+        finally:
+            del pixels
+
+
+def main(argv=None):
+    """Measure how many raster frames per second can be produced."""
+    parser = argparse.ArgumentParser(description="Benchmark raster observations")
+    parser.add_argument("--size", type=int, nargs=2, default=list(DEFAULT_SIZE), metavar=("W", "H"))
+    parser.add_argument("--frames", type=int, default=5000, help="Frames to render")
+    parser.add_argument("--rgb", action="store_true", help="Render RGB instead of grayscale")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+
+    world = GameWorld(seed=args.seed)
+    pilot = scripted_actions(args.seed)
+    # Play a minute so the field is populated
+    for _ in range(60 * C.SIMULATION_TICK_RATE):
+        world.set_actions(next(pilot))
+        world.step()
+
+    renderer = RasterRenderer(tuple(args.size), grayscale=not args.rgb)
+    frame = np.zeros(renderer.shape, dtype=np.uint8)
+    started = time.perf_counter()
+    for _ in range(args.frames):
+        renderer.render(world, frame)
+    elapsed = time.perf_counter() - started
+    print(f"{args.frames / elapsed:,.0f} frames/s at {args.size[0]}x{args.size[1]} "
+          f"({'RGB' if args.rgb else 'grayscale'}, {len(world.asteroids)} asteroids)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
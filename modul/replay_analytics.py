@@ -0,0 +1,322 @@
+"""Batch analytics over recorded replays.
+
+Every replay in the replays directory is streamed frame by frame through a
+process pool. Each worker accumulates NumPy histograms for its replay (player
+positions, asteroid density, death locations, time-to-death and score gained
+per minute) and the parent merges them per ``difficulty/ship`` group.
+
+Results are written to a compressed ``.npz`` archive; optional PNG heatmaps
+can be rendered next to it.
+
+Usage:
+    python -m modul.replay_analytics -o replay_stats.npz
+    python -m modul.replay_analytics --replays-dir replays --png-dir heatmaps
+"""
+
+import argparse
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pygame
+
+from modul.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+from modul.replay_system import REPLAY_EXTENSIONS, ReplayManager, ReplayStreamReader
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is listed in requirements.txt
+    np = None
+
+logger = logging.getLogger(__name__)
+
+# Heatmap grid resolution (cells along x, y)
+HEATMAP_BINS = (64, 36)
+# Time-to-death histogram: 10 second buckets up to 10 minutes
+TIME_TO_DEATH_BIN_SECONDS = 10.0
+TIME_TO_DEATH_BINS = 60
+# Score curve length in minutes
+SCORE_CURVE_MINUTES = 60
+# Pending cell indices are flushed into histograms in batches of this size
+_FLUSH_SIZE = 4096
+
+HEATMAP_KEYS = ("player_position", "asteroid_density", "death_locations")
+
+
+def _require_numpy():
+    """Raise a helpful error when numpy is missing."""
+    if np is None:
+        raise RuntimeError("Replay analytics requires numpy (pip install -r requirements.txt)")
+
+
+def group_key(metadata: Dict) -> str:
+    """Return the ``difficulty/ship`` group name for replay metadata."""
+    return f"{metadata.get('difficulty', 'unknown')}/{metadata.get('ship_type', 'unknown')}"
+
+
+def empty_stats() -> Dict[str, "np.ndarray"]:
+    """Return a zeroed set of accumulators."""
+    _require_numpy()
+    return {
+        "player_position": np.zeros(HEATMAP_BINS, dtype=np.int64),
+        "asteroid_density": np.zeros(HEATMAP_BINS, dtype=np.int64),
+        "death_locations": np.zeros(HEATMAP_BINS, dtype=np.int64),
+        "time_to_death": np.zeros(TIME_TO_DEATH_BINS, dtype=np.int64),
+        "score_per_minute": np.zeros(SCORE_CURVE_MINUTES, dtype=np.float64),
+        "runs_per_minute": np.zeros(SCORE_CURVE_MINUTES, dtype=np.int64),
+        "runs": np.zeros(1, dtype=np.int64),
+        "frames": np.zeros(1, dtype=np.int64),
+    }
+
+
+def merge_stats(target: Dict[str, "np.ndarray"], source: Dict[str, "np.ndarray"]):
+    """Add every accumulator of `source` into `target` in place."""
+    for key, values in source.items():
+        target[key] += values
+
+
+class _CellAccumulator:
+    """Buffer grid cell indices and flush them into a histogram in batches."""
+
+    def __init__(self, histogram):
+        self.histogram = histogram
+        self.xs: List[int] = []
+        self.ys: List[int] = []
+        self._cell_w = SCREEN_WIDTH / HEATMAP_BINS[0]
+        self._cell_h = SCREEN_HEIGHT / HEATMAP_BINS[1]
+
+    def add(self, x: float, y: float):
+        """Queue one sample at screen position (x, y)."""
+        ix = int(x / self._cell_w)
+        iy = int(y / self._cell_h)
+        self.xs.append(min(max(ix, 0), HEATMAP_BINS[0] - 1))
+        self.ys.append(min(max(iy, 0), HEATMAP_BINS[1] - 1))
+        if len(self.xs) >= _FLUSH_SIZE:
+            self.flush()
+
+    def flush(self):
+        """Add all queued samples to the histogram."""
+        if self.xs:
+            np.add.at(self.histogram, (np.asarray(self.xs), np.asarray(self.ys)), 1)
+            self.xs.clear()
+            self.ys.clear()
+
+
+def analyze_frames(frames: Iterable[Dict], game_over: bool = False) -> Dict[str, "np.ndarray"]:
+    """Accumulate statistics from an iterable of frame dicts.
+
+    Deaths are counted where the lives drop between frames. The last life
+    is lost after the final frame, so it only counts when `game_over` says
+    the run ended that way rather than by quitting.
+    """
+    stats = empty_stats()
+    player_cells = _CellAccumulator(stats["player_position"])
+    asteroid_cells = _CellAccumulator(stats["asteroid_density"])
+    death_cells = _CellAccumulator(stats["death_locations"])
+
+    previous = None
+    last_death_time = 0.0
+    frame_count = 0
+    for frame in frames:
+        frame_count += 1
+        x, y = frame["player_pos"]
+        player_cells.add(x, y)
+        for asteroid in frame.get("asteroids", ()):
+            asteroid_cells.add(asteroid.get("x", 0.0), asteroid.get("y", 0.0))
+
+        if previous is not None and frame["lives"] < previous["lives"]:
+            # The ship respawns at the centre, so the hit happened where the
+            # previous frame saw it.
+            px, py = previous["player_pos"]
+            death_cells.add(px, py)
+            _add_time_to_death(stats, frame["timestamp"] - last_death_time)
+            last_death_time = frame["timestamp"]
+        previous = frame
+
+        minute = int(frame["timestamp"] // 60)
+        if minute < SCORE_CURVE_MINUTES:
+            stats["score_per_minute"][minute] = frame["score"]
+            stats["runs_per_minute"][minute] = 1
+
+    if previous is not None and game_over:
+        # Losing the last life ends the run before another frame is recorded
+        px, py = previous["player_pos"]
+        death_cells.add(px, py)
+        _add_time_to_death(stats, previous["timestamp"] - last_death_time)
+
+    for accumulator in (player_cells, asteroid_cells, death_cells):
+        accumulator.flush()
+
+    # Convert cumulative score at each minute into score gained per minute
+    reached = stats["runs_per_minute"] > 0
+    cumulative = stats["score_per_minute"][reached]
+    stats["score_per_minute"][reached] = np.diff(cumulative, prepend=0.0)
+
+    stats["frames"][0] = frame_count
+    stats["runs"][0] = 1 if frame_count else 0
+    return stats
+
+
+def _add_time_to_death(stats, seconds: float):
+    """Record one life duration in the time-to-death histogram."""
+    index = min(int(max(seconds, 0.0) // TIME_TO_DEATH_BIN_SECONDS), TIME_TO_DEATH_BINS - 1)
+    stats["time_to_death"][index] += 1
+
+
+def analyze_replay(filepath: str) -> Tuple[str, Dict[str, "np.ndarray"]]:
+    """Stream one replay and return ``(group, stats)``."""
+    with ReplayStreamReader(filepath) as reader:
+        group = group_key(reader.metadata)
+        stats = analyze_frames(reader.iter_frames(), game_over=bool(reader.metadata.get("game_over")))
+    return group, stats
+
+
+def _safe_analyze(filepath: str) -> Optional[Tuple[str, Dict[str, "np.ndarray"]]]:
+    """Analyze a replay, logging and skipping unreadable files."""
+    try:
+        return analyze_replay(filepath)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        logger.warning("Skipping replay '%s': %s", filepath, e)
+        return None
+
+
+def find_replay_files(replays_dir: str) -> List[str]:
+    """Return replay file paths in `replays_dir`, sorted by name."""
+    if not os.path.isdir(replays_dir):
+        return []
+    return sorted(
+        os.path.join(replays_dir, name)
+        for name in os.listdir(replays_dir)
+        if name.endswith(REPLAY_EXTENSIONS)
+    )
+
+
+def analyze_directory(replays_dir: str, workers: Optional[int] = None) -> Dict[str, Dict[str, "np.ndarray"]]:
+    """Analyze every replay in `replays_dir` and merge results per group."""
+    _require_numpy()
+    files = find_replay_files(replays_dir)
+    workers = max(1, workers or os.cpu_count() or 1)
+
+    if workers == 1 or len(files) <= 1:
+        outcomes = map(_safe_analyze, files)
+        return _merge_outcomes(outcomes)
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=min(workers, len(files)), mp_context=context) as pool:
+        return _merge_outcomes(pool.map(_safe_analyze, files))
+
+
+def _merge_outcomes(outcomes) -> Dict[str, Dict[str, "np.ndarray"]]:
+    """Merge per-replay results into per-group totals."""
+    groups: Dict[str, Dict[str, "np.ndarray"]] = {}
+    for outcome in outcomes:
+        if outcome is None:
+            continue
+        group, stats = outcome
+        if group not in groups:
+            groups[group] = empty_stats()
+        merge_stats(groups[group], stats)
+    return groups
+
+
+def save_results(groups: Dict[str, Dict[str, "np.ndarray"]], output_path: str):
+    """Write merged results to a compressed ``.npz`` archive.
+
+    Arrays are stored as ``<difficulty>/<ship>/<statistic>``.
+    """
+    arrays = {
+        f"{group}/{key}": values
+        for group, stats in groups.items()
+        for key, values in stats.items()
+    }
+    arrays["screen_size"] = np.array([SCREEN_WIDTH, SCREEN_HEIGHT])
+    arrays["time_to_death_bin_seconds"] = np.array([TIME_TO_DEATH_BIN_SECONDS])
+    np.savez_compressed(output_path, **arrays)
+
+
+def load_results(path: str) -> Dict[str, Dict[str, "np.ndarray"]]:
+    """Load an archive written by `save_results` back into groups."""
+    _require_numpy()
+    groups: Dict[str, Dict[str, "np.ndarray"]] = {}
+    with np.load(path) as archive:
+        for name in archive.files:
+            if name.count("/") != 2:
+                continue
+            difficulty, ship, key = name.split("/")
+            groups.setdefault(f"{difficulty}/{ship}", {})[key] = archive[name]
+    return groups
+
+
+def heatmap_rgb(histogram) -> "np.ndarray":
+    """Map a 2D count histogram to an RGB ``(x, y, 3)`` uint8 array.
+
+    Counts are log-scaled and coloured from black through red to yellow.
+    """
+    values = np.log1p(histogram.astype(np.float64))
+    peak = values.max()
+    if peak > 0:
+        values /= peak
+    rgb = np.zeros(histogram.shape + (3,), dtype=np.uint8)
+    rgb[..., 0] = np.clip(values * 2.0, 0.0, 1.0) * 255
+    rgb[..., 1] = np.clip(values * 2.0 - 1.0, 0.0, 1.0) * 255
+    return rgb
+
+
+def save_heatmaps(groups: Dict[str, Dict[str, "np.ndarray"]], png_dir: str) -> List[str]:
+    """Render every group heatmap to a screen-sized PNG; return the paths."""
+    os.makedirs(png_dir, exist_ok=True)
+    written = []
+    for group, stats in groups.items():
+        for key in HEATMAP_KEYS:
+            surface = pygame.surfarray.make_surface(heatmap_rgb(stats[key]))
+            surface = pygame.transform.scale(surface, (SCREEN_WIDTH, SCREEN_HEIGHT))
+            path = os.path.join(png_dir, f"{group.replace('/', '_')}_{key}.png")
+            pygame.image.save(surface, path)
+            written.append(path)
+    return written
+
+
+def parse_arguments(argv=None):
+    """Parse command-line arguments for the analytics tool."""
+    parser = argparse.ArgumentParser(description="Aggregate heatmaps and run statistics over recorded replays")
+    parser.add_argument("--replays-dir", default=ReplayManager().replays_dir, help="Directory containing replays")
+    parser.add_argument("-o", "--output", default="replay_stats.npz", help="Output .npz archive")
+    parser.add_argument("--png-dir", help="Also write PNG heatmaps into this directory")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    args = parse_arguments(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    try:
+        _require_numpy()
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    started = time.perf_counter()
+    groups = analyze_directory(args.replays_dir, workers=args.workers)
+    save_results(groups, args.output)
+    elapsed = time.perf_counter() - started
+
+    for group, stats in sorted(groups.items()):
+        runs = int(stats["runs"][0])
+        deaths = int(stats["death_locations"].sum())
+        print(f"{group}: {runs} run(s), {int(stats['frames'][0])} frames, {deaths} death(s)")
+    print(f"Wrote {args.output} in {elapsed:.2f}s")
+
+    if args.png_dir:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        paths = save_heatmaps(groups, args.png_dir)
+        print(f"Wrote {len(paths)} heatmap(s) to {args.png_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,327 @@
+"""Headless replay exporter rendering saved replays to frames or video.
+
+The timeline of a replay is split into contiguous segments that are rendered
+offscreen (SDL dummy video driver) by a process pool. Segments are stitched
+back together in order: as a numbered PNG sequence, or as raw RGB frames piped
+into a local encoder (``ffmpeg``) when one is available.
+
+Usage:
+    python -m modul.replay_export replays/replay_123.json.gz -o export/
+    python -m modul.replay_export replays/replay_123.json.gz --video run.mp4
+"""
+
+import argparse
+import logging
+import math
+import multiprocessing
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+from modul.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+from modul.replay_system import ReplayPlayer
+from modul.replay_ui import draw_replay_frame
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EXPORT_FPS = 30
+PNG_NAME_FORMAT = "frame_{:06d}.png"
+
+
+@dataclass
+class SegmentResult:
+    """Outcome of rendering one contiguous slice of the timeline."""
+    index: int
+    start_frame: int
+    frame_count: int
+    elapsed: float
+    raw_path: Optional[str] = None
+
+
+@dataclass
+class ExportReport:
+    """Summary of an export run."""
+    frames: int
+    workers: int
+    elapsed: float
+    output: str
+    segments: List[SegmentResult] = field(default_factory=list)
+
+    @property
+    def frames_per_second(self) -> float:
+        """Overall rendering throughput."""
+        return self.frames / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def frames_per_second_per_core(self) -> float:
+        """Rendering throughput normalised by the number of workers."""
+        return self.frames_per_second / max(1, self.workers)
+
+    def summary(self) -> str:
+        """Return a human-readable summary line."""
+        return (
+            f"Rendered {self.frames} frames in {self.elapsed:.2f}s "
+            f"({self.frames_per_second:.1f} fps, "
+            f"{self.frames_per_second_per_core:.1f} fps/core on {self.workers} worker(s)) -> {self.output}"
+        )
+
+
+def split_segments(total_frames: int, segment_count: int) -> List[Tuple[int, int]]:
+    """Split ``range(total_frames)`` into at most `segment_count` slices.
+
+    Returns a list of ``(start, stop)`` pairs covering every frame exactly
+    once, in order.
+    """
+    if total_frames <= 0:
+        return []
+    segment_count = max(1, min(segment_count, total_frames))
+    size = math.ceil(total_frames / segment_count)
+    return [(start, min(start + size, total_frames)) for start in range(0, total_frames, size)]
+
+
+# The replay decoded last in this process, as ((path, mtime, size), ReplayPlayer)
+_loaded_replay: Optional[Tuple[Tuple[str, int, int], ReplayPlayer]] = None
+
+
+def _load_replay(replay_path: str) -> ReplayPlayer:
+    """Return the decoded replay at `replay_path`, decoding it once per process."""
+    global _loaded_replay  # pylint: disable=global-statement
+    stat = os.stat(replay_path)
+    key = (os.path.abspath(replay_path), stat.st_mtime_ns, stat.st_size)
+    if _loaded_replay is None or _loaded_replay[0] != key:
+        player = ReplayPlayer()
+        player.load_replay(replay_path)
+        _loaded_replay = (key, player)
+    return _loaded_replay[1]
+
+
+def _init_worker(replay_path: Optional[str] = None):
+    """Prepare a headless pygame instance inside a pool worker.
+
+    With `replay_path` the replay is decoded up front, so segments only
+    time their rendering.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.display.init()
+    pygame.font.init()
+    if replay_path:
+        _load_replay(replay_path)
+
+
+def _render_segment(task: Dict) -> SegmentResult:
+    """Render frames ``[start, stop)`` of a replay and return timing info."""
+    started = time.perf_counter()
+    _init_worker()
+
+    player = _load_replay(task["replay_path"])
+
+    width, height = task["size"]
+    canvas = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    font = pygame.font.Font(None, 36)
+    scaled = canvas if (width, height) == canvas.get_size() else pygame.Surface((width, height))
+
+    raw_file = None
+    if task["raw_dir"]:
+        raw_path = os.path.join(task["raw_dir"], f"segment_{task['index']:05d}.rgb")
+        raw_file = open(raw_path, "wb")  # pylint: disable=consider-using-with
+    else:
+        raw_path = None
+
+    try:
+        for frame_number in range(task["start"], task["stop"]):
+            canvas.fill("black")
+            frame = player.get_frame_at(frame_number / task["fps"])
+            if frame:
+                draw_replay_frame(canvas, frame, font)
+            if scaled is not canvas:
+                pygame.transform.smoothscale(canvas, (width, height), scaled)
+
+            if raw_file:
+                raw_file.write(pygame.image.tobytes(scaled, "RGB"))
+            else:
+                pygame.image.save(scaled, os.path.join(task["output_dir"], PNG_NAME_FORMAT.format(frame_number)))
+    finally:
+        if raw_file:
+            raw_file.close()
+
+    return SegmentResult(
+        index=task["index"],
+        start_frame=task["start"],
+        frame_count=task["stop"] - task["start"],
+        elapsed=time.perf_counter() - started,
+        raw_path=raw_path,
+    )
+
+
+def _replay_duration(replay_path: str) -> float:
+    """Return the duration covered by a replay, in seconds."""
+    player = _load_replay(replay_path)
+    if not player.frames:
+        return 0.0
+    return max(player.metadata.get("duration", 0.0), player.frames[-1].timestamp)
+
+
+def _start_encoder(encoder: str, video_path: str, size: Tuple[int, int], fps: float):
+    """Launch the encoder process reading raw RGB frames from stdin."""
+    width, height = size
+    command = [
+        encoder, "-y", "-loglevel", "error",
+        "-f", "rawvideo", "-pix_fmt", "rgb24",
+        "-s", f"{width}x{height}", "-r", str(fps),
+        "-i", "-",
+        "-pix_fmt", "yuv420p",
+        video_path,
+    ]
+    return subprocess.Popen(command, stdin=subprocess.PIPE)  # pylint: disable=consider-using-with
+
+
+def _stream_segment(result: SegmentResult, sink):
+    """Copy a rendered raw segment into the encoder and remove it."""
+    with open(result.raw_path, "rb") as f:
+        shutil.copyfileobj(f, sink)
+    os.remove(result.raw_path)
+
+
+def export_replay(
+    replay_path: str,
+    output_dir: Optional[str] = None,
+    fps: float = DEFAULT_EXPORT_FPS,
+    workers: Optional[int] = None,
+    scale: float = 1.0,
+    video_path: Optional[str] = None,
+    encoder: str = "ffmpeg",
+) -> ExportReport:
+    """Render a replay offscreen and return an `ExportReport`.
+
+    With `video_path` set and `encoder` found on PATH, frames are piped to
+    the encoder as raw RGB in timeline order. Otherwise a PNG sequence is
+    written to `output_dir`.
+    """
+    if fps <= 0:
+        raise ValueError("fps must be positive")
+
+    workers = max(1, workers or os.cpu_count() or 1)
+    size = (max(1, int(SCREEN_WIDTH * scale)), max(1, int(SCREEN_HEIGHT * scale)))
+    duration = _replay_duration(replay_path)
+    total_frames = int(duration * fps) + 1 if duration > 0 else 0
+
+    encoder_path = shutil.which(encoder) if video_path else None
+    if video_path and not encoder_path:
+        logger.warning("Encoder '%s' not found; falling back to a PNG sequence", encoder)
+        output_dir = output_dir or os.path.splitext(video_path)[0] + "_frames"
+
+    raw_dir = None
+    if encoder_path:
+        raw_dir = tempfile.mkdtemp(prefix="ajitroids_export_")
+    else:
+        output_dir = output_dir or "replay_export"
+        os.makedirs(output_dir, exist_ok=True)
+
+    # Use a few segments per worker so uneven scenes still balance out
+    segments = split_segments(total_frames, workers * 4)
+    tasks = [
+        {
+            "index": i,
+            "start": start,
+            "stop": stop,
+            "replay_path": replay_path,
+            "fps": fps,
+            "size": size,
+            "output_dir": output_dir,
+            "raw_dir": raw_dir,
+        }
+        for i, (start, stop) in enumerate(segments)
+    ]
+
+    started = time.perf_counter()
+    encoder_proc = _start_encoder(encoder_path, video_path, size, fps) if encoder_path else None
+    results: List[SegmentResult] = []
+    try:
+        if workers == 1:
+            outcomes = map(_render_segment, tasks)
+            results = _collect(outcomes, encoder_proc)
+        else:
+            # Spawned workers start with a clean SDL state instead of a forked copy
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                     initializer=_init_worker, initargs=(replay_path,)) as pool:
+                results = _collect(pool.map(_render_segment, tasks), encoder_proc)
+    finally:
+        if encoder_proc:
+            encoder_proc.stdin.close()
+            encoder_proc.wait()
+        if raw_dir:
+            shutil.rmtree(raw_dir, ignore_errors=True)
+
+    report = ExportReport(
+        frames=sum(r.frame_count for r in results),
+        workers=workers,
+        elapsed=time.perf_counter() - started,
+        output=video_path if encoder_path else output_dir,
+        segments=results,
+    )
+    logger.info(report.summary())
+    return report
+
+
+def _collect(outcomes, encoder_proc) -> List[SegmentResult]:
+    """Gather segment results in timeline order, feeding the encoder."""
+    results = []
+    for result in outcomes:
+        # `map` yields in submission order, which is timeline order
+        if encoder_proc:
+            _stream_segment(result, encoder_proc.stdin)
+        results.append(result)
+    return results
+
+
+def parse_arguments(argv=None):
+    """Parse command-line arguments for the exporter."""
+    parser = argparse.ArgumentParser(description="Render an Ajitroids replay to PNG frames or a video file")
+    parser.add_argument("replay", help="Path to a saved replay (.json, .json.gz, .json.bz2 or .json.xz)")
+    parser.add_argument("-o", "--output-dir", help="Directory for the PNG sequence")
+    parser.add_argument("--video", help="Encode to this video file when an encoder is available")
+    parser.add_argument("--encoder", default="ffmpeg", help="Encoder executable (default: ffmpeg)")
+    parser.add_argument("--fps", type=float, default=DEFAULT_EXPORT_FPS, help="Output frame rate")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--scale", type=float, default=1.0, help="Output scale relative to the game resolution")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    args = parse_arguments(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    _init_worker()
+    report = export_replay(
+        args.replay,
+        output_dir=args.output_dir,
+        fps=args.fps,
+        workers=args.workers,
+        scale=args.scale,
+        video_path=args.video,
+        encoder=args.encoder,
+    )
+    for segment in report.segments:
+        logger.info(
+            "  segment %d: %d frames in %.2fs (%.1f fps)",
+            segment.index,
+            segment.frame_count,
+            segment.elapsed,
+            segment.frame_count / segment.elapsed if segment.elapsed > 0 else 0.0,
+        )
+    print(report.summary())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,22 @@
 """Replay system for recording and playing back game sessions."""
+import bisect
+import bz2
 import gzip
+import io
 import json
 import logging
+import lzma
 import os
+import sys
+import threading
 import time
 from dataclasses import asdict, dataclass, field
-from typing import Any, Dict, List, Optional, TextIO, cast
+from typing import (Any, BinaryIO, Callable, Dict, Iterator, List, Optional,
+                    TextIO, Tuple, cast)
+
+from modul import rng
+from modul.game_clock import GameClock, game_clock
+from modul import settings as settings_mod
 
 logger = logging.getLogger(__name__)
 
@@ -26,15 +37,154 @@ def _quantize(value, ndigits: int = QUANTIZE_DIGITS):
     return value
 
 
-def _open_replay(path: str, mode: str = "rt", encoding: str = "utf-8"):
-    """Open replay file with gzip support based on extension.
-
-    When opening text-mode replay files, pass an explicit `encoding` to avoid
-    platform-dependent defaults.
+@dataclass(frozen=True)
+class ReplayCodec:
+    """A stdlib compression format usable for replay files."""
+    name: str
+    extension: str
+    magic: bytes
+    default_level: Optional[int]
+    compress: Callable[[bytes, Optional[int]], bytes]
+    decompress: Callable[[bytes], bytes]
+    open_binary: Callable[[str, str, Optional[int]], BinaryIO]
+
+
+def _plain_open(path, mode, _level):
+    """Open an uncompressed replay file."""
+    return open(path, mode)  # pylint: disable=consider-using-with,unspecified-encoding
+
+
+REPLAY_CODECS: Dict[str, ReplayCodec] = {
+    'none': ReplayCodec(
+        name='none',
+        extension='.json',
+        magic=b'',
+        default_level=None,
+        compress=lambda data, _level: data,
+        decompress=lambda data: data,
+        open_binary=_plain_open,
+    ),
+    'gzip': ReplayCodec(
+        name='gzip',
+        extension='.json.gz',
+        magic=b'\x1f\x8b',
+        default_level=6,
+        compress=lambda data, level: gzip.compress(data, compresslevel=level),
+        decompress=gzip.decompress,
+        open_binary=lambda path, mode, level: gzip.open(path, mode, compresslevel=level if level is not None else 6),
+    ),
+    'bz2': ReplayCodec(
+        name='bz2',
+        extension='.json.bz2',
+        magic=b'BZh',
+        default_level=9,
+        compress=lambda data, level: bz2.compress(data, compresslevel=level),
+        decompress=bz2.decompress,
+        open_binary=lambda path, mode, level: bz2.open(path, mode, compresslevel=level if level is not None else 9),
+    ),
+    'lzma': ReplayCodec(
+        name='lzma',
+        extension='.json.xz',
+        magic=b'\xfd7zXZ\x00',
+        default_level=6,
+        compress=lambda data, level: lzma.compress(data, preset=level),
+        decompress=lzma.decompress,
+        open_binary=lambda path, mode, level: lzma.open(path, mode, preset=level if 'w' in mode else None),
+    ),
+}
+DEFAULT_REPLAY_COMPRESSION = 'gzip:6'
+REPLAY_EXTENSIONS = tuple(codec.extension for codec in REPLAY_CODECS.values())
+_MAGIC_BYTES_LEN = max(len(codec.magic) for codec in REPLAY_CODECS.values())
+
+
+def parse_compression(spec: Optional[str]) -> Tuple[ReplayCodec, Optional[int]]:
+    """Parse a ``"codec[:level]"`` setting such as ``"gzip:9"`` or ``"none"``.
+
+    Unknown codecs or malformed levels fall back to the default so a bad
+    settings file never prevents saving a replay.
+    """
+    if not isinstance(spec, str):
+        if spec is not None:
+            logger.warning("Invalid replay compression %r; using %s", spec, DEFAULT_REPLAY_COMPRESSION)
+        spec = None
+    name, _, level_text = (spec or DEFAULT_REPLAY_COMPRESSION).partition(':')
+    codec = REPLAY_CODECS.get(name.strip().lower())
+    if codec is None:
+        logger.warning("Unknown replay compression '%s'; using %s", spec, DEFAULT_REPLAY_COMPRESSION)
+        return parse_compression(DEFAULT_REPLAY_COMPRESSION)
+    level = codec.default_level
+    if level_text and codec.default_level is not None:
+        try:
+            level = min(9, max(0 if codec.name == 'lzma' else 1, int(level_text)))
+        except ValueError:
+            logger.warning("Invalid replay compression level '%s'", level_text)
+    return codec, level
+
+
+def codec_for_extension(path: str) -> Optional[ReplayCodec]:
+    """Return the codec whose file extension matches `path`, if any."""
+    for codec in REPLAY_CODECS.values():
+        if codec.magic and path.endswith(codec.extension):
+            return codec
+    if path.endswith('.json'):
+        return REPLAY_CODECS['none']
+    return None
+
+
+def detect_codec(path: str) -> ReplayCodec:
+    """Identify the codec of an existing replay file by its magic bytes."""
+    with open(path, 'rb') as f:
+        head = f.read(_MAGIC_BYTES_LEN)
+    for codec in REPLAY_CODECS.values():
+        if codec.magic and head.startswith(codec.magic):
+            return codec
+    return REPLAY_CODECS['none']
+
+
+def _open_replay(
+    path: str,
+    mode: str = "rt",
+    encoding: str = "utf-8",
+    codec: Optional[ReplayCodec] = None,
+    level: Optional[int] = None,
+):
+    """Open a replay file, transparently handling compression.
+
+    When reading, the codec is detected from the file's magic bytes so the
+    extension does not matter. When writing, `codec` wins; otherwise it is
+    chosen from the extension. Text modes use an explicit `encoding` to
+    avoid platform-dependent defaults.
     """
-    if path.endswith(".gz"):
-        return gzip.open(path, mode, encoding=encoding)
-    return open(path, mode, encoding=encoding)
+    if 'r' in mode:
+        codec = detect_codec(path)
+    elif codec is None:
+        codec = codec_for_extension(path) or REPLAY_CODECS['none']
+    binary = codec.open_binary(path, mode.replace('t', '').replace('b', '') + 'b', level)
+    if 'b' in mode:
+        return binary
+    return io.TextIOWrapper(binary, encoding=encoding)
+
+
+def _json_default(obj):
+    """Convert non-JSON objects to serializable format."""
+    if hasattr(obj, "x") and hasattr(obj, "y"):
+        try:
+            return {"x": float(obj.x), "y": float(obj.y)}
+        except (TypeError, ValueError, AttributeError):
+            pass
+    return str(obj)
+
+
+def _write_replay(filepath: str, replay_data: Dict[str, Any], codec: ReplayCodec, level: Optional[int]):
+    """Serialise `replay_data` compactly to `filepath` with `codec`."""
+    with cast(TextIO, _open_replay(filepath, 'wt', codec=codec, level=level)) as f:
+        json.dump(
+            replay_data,
+            f,
+            indent=None,
+            separators=(",", ":"),
+            default=_json_default,
+        )
 
 
 def _quantize_float(value: float) -> float:
@@ -72,11 +222,161 @@ class GameEvent:
     data: Dict[str, Any] = field(default_factory=dict)
 
 
+class ReplayStreamReader:
+    """Incrementally decode a replay file without loading all frames.
+
+    Replays are single JSON documents, so the reader walks the top-level
+    object by hand and decodes one value at a time with
+    `json.JSONDecoder.raw_decode`. Frames are yielded as plain dicts while
+    only a small read buffer is held in memory.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+    _WHITESPACE = " \t\r\n"
+
+    def __init__(self, filepath: str, chunk_size: Optional[int] = None):
+        """Open `filepath` for streaming."""
+        self.filepath = filepath
+        self.chunk_size = chunk_size or self.CHUNK_SIZE
+        self._file = _open_replay(filepath, 'rt')
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._sections: Dict[str, Any] = {}
+        self._items = self._walk()
+
+    def __enter__(self):
+        """Support use as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the underlying file."""
+        self.close()
+
+    def close(self):
+        """Close the underlying file."""
+        self._file.close()
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Metadata dict, read on first access."""
+        if 'metadata' not in self._sections:
+            self._advance_until(lambda: 'metadata' in self._sections)
+        return self._sections.get('metadata', {})
+
+    def iter_frames(self) -> Iterator[Dict[str, Any]]:
+        """Yield the remaining frame dicts in file order."""
+        for kind, value in self._items:
+            if kind == 'frame':
+                yield value
+
+    def read_section(self, name: str) -> Any:
+        """Return a non-frame top-level value (e.g. ``events``).
+
+        Any frames before the section are skipped.
+        """
+        if name not in self._sections:
+            self._advance_until(lambda: name in self._sections)
+        return self._sections.get(name)
+
+    def _advance_until(self, predicate):
+        """Consume items until `predicate` holds or the document ends."""
+        for _ in self._items:
+            if predicate():
+                return
+
+    def _fill(self) -> bool:
+        """Append the next chunk to the buffer; return False at EOF."""
+        if self._eof:
+            return False
+        if self._pos > self.chunk_size:
+            # Drop the consumed prefix so memory stays bounded
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        chunk = self._file.read(self.chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer += chunk
+        return True
+
+    def _peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in self._WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise json.JSONDecodeError("Unexpected end of replay", self._buffer, self._pos)
+
+    def _expect(self, chars: str) -> str:
+        """Consume one of `chars` (after whitespace) and return it."""
+        char = self._peek()
+        if char not in chars:
+            raise json.JSONDecodeError(f"Expected one of {chars!r}", self._buffer, self._pos)
+        self._pos += 1
+        return char
+
+    def _decode_value(self) -> Any:
+        """Decode the next JSON value, reading more input as needed."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A scalar ending exactly at the buffer edge may be truncated
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def _walk(self) -> Iterator[Tuple[str, Any]]:
+        """Yield ``('frame', dict)`` items and record other sections."""
+        self._expect('{')
+        if self._peek() == '}':
+            return
+        while True:
+            key = self._decode_value()
+            self._expect(':')
+            if key == 'frames':
+                self._expect('[')
+                if self._peek() == ']':
+                    self._pos += 1
+                else:
+                    while True:
+                        yield 'frame', self._decode_value()
+                        if self._expect(',]') == ']':
+                            break
+            else:
+                self._sections[key] = self._decode_value()
+                yield 'section', key
+            if self._expect(',}') == '}':
+                return
+
+
+def iter_replay_frames(filepath: str) -> Iterator[Dict[str, Any]]:
+    """Yield the frame dicts of a replay one at a time."""
+    with ReplayStreamReader(filepath) as reader:
+        yield from reader.iter_frames()
+
+
 class ReplayRecorder:
     """Records game sessions for later playback."""
 
-    def __init__(self):
-        """Initialize the replay recorder."""
+    def __init__(self, compression: Optional[str] = None, clock: Optional[GameClock] = None):
+        """Initialize the replay recorder.
+
+        `compression` is a ``"codec[:level]"`` spec; when omitted the
+        ``replay_compression`` user setting is used. Frame timestamps are
+        game time read from `clock` (the shared game clock by default).
+        """
+        self.compression = compression
+        self.clock = clock or game_clock
         self.recording = False
         self.frames: List[GameFrame] = []
         self.events: List[GameEvent] = []
@@ -90,32 +390,50 @@ class ReplayRecorder:
         self.recording = True
         self.frames = []
         self.events = []
-        self.start_time = time.time()
+        self.start_time = self.clock.now
         self.last_frame_time = 0
         self.metadata = {
             'version': '1.1',
             'difficulty': difficulty,
             'ship_type': ship_type,
-            'start_time': self.start_time,
+            'start_time': time.time(),
             'frame_rate_hz': round(1.0 / self.frame_interval, 2),
             'format': 'json',
-            'compression': 'gzip',
+            'seed': rng.run_seed(),
         }
-
-    def stop_recording(self, final_score: int, final_level: int):
-        """Stop recording and finalize metadata."""
+        codec, level = self._resolve_codec()
+        self.metadata['compression'] = codec.name
+        self.metadata['compression_level'] = level
+
+    def _resolve_codec(self) -> Tuple[ReplayCodec, Optional[int]]:
+        """Return the codec and level configured for new replay files."""
+        spec = self.compression
+        if spec is None:
+            settings = getattr(settings_mod, "current_settings", None)
+            spec = getattr(settings, "replay_compression", None)
+        return parse_compression(spec)
+
+    def stop_recording(self, final_score: int, final_level: int, game_over: bool = False):
+        """Stop recording and finalize metadata.
+
+        `game_over` marks a run that ended by losing the last life rather
+        than by quitting or restarting.
+        """
         self.recording = False
-        end_time = time.time()
-        start_time = self.start_time or end_time
         self.metadata.update({
-            'end_time': end_time,
-            'duration': max(0.0, end_time - start_time),
+            'end_time': time.time(),
+            'game_over': game_over,
+            'duration': self.elapsed(),
             'final_score': final_score,
             'final_level': final_level,
             'frame_count': len(self.frames),
             'event_count': len(self.events),
         })
 
+    def elapsed(self) -> float:
+        """Return the game seconds since recording started."""
+        return max(0.0, self.clock.now - self.start_time)
+
     def record_frame(self, game_state: Dict[str, Any], current_time: float):
         """Record a single frame of game state."""
         if not self.recording:
@@ -193,10 +511,19 @@ class ReplayRecorder:
     def save_replay(self, filename: Optional[str] = None) -> str:
         """Save the replay to a file."""
         try:
+            codec, level = self._resolve_codec()
             if filename is None:
-                filename = f"replay_{int(self.start_time * 1000)}.json.gz"
-            elif not filename.endswith(('.json', '.json.gz')):
-                filename = f"{filename}.json.gz"
+                started = self.metadata.get('start_time') or time.time()
+                filename = f"replay_{int(started * 1000)}{codec.extension}"
+            elif codec_for_extension(filename) is None:
+                filename = f"{filename}{codec.extension}"
+            else:
+                # An explicit extension picks its own codec
+                explicit = cast(ReplayCodec, codec_for_extension(filename))
+                if explicit is not codec:
+                    codec, level = explicit, explicit.default_level
+            self.metadata['compression'] = codec.name
+            self.metadata['compression_level'] = level
 
             # Ensure replays directory exists
             os.makedirs("replays", exist_ok=True)
@@ -206,9 +533,9 @@ class ReplayRecorder:
             if os.path.exists(filepath):
                 base, ext = os.path.splitext(filename)
                 # Handle double extensions like .json.gz
-                if ext == '.gz' and base.endswith('.json'):
+                if ext != '.json' and base.endswith('.json'):
                     base, _ = os.path.splitext(base)
-                    ext = '.json.gz'
+                    ext = f'.json{ext}'
                 i = 1
                 while True:
                     candidate = os.path.join("replays", f"{base}_{i}{ext}")
@@ -223,23 +550,7 @@ class ReplayRecorder:
                 'events': [asdict(event) for event in self.events],
             }
 
-            def _json_default(obj):
-                """Convert non-JSON objects to serializable format."""
-                if hasattr(obj, "x") and hasattr(obj, "y"):
-                    try:
-                        return {"x": float(obj.x), "y": float(obj.y)}
-                    except (TypeError, ValueError, AttributeError):
-                        pass
-                return str(obj)
-
-            with cast(TextIO, _open_replay(filepath, 'wt')) as f:
-                json.dump(
-                    replay_data,
-                    f,
-                    indent=None,
-                    separators=(",", ":"),
-                    default=_json_default,
-                )
+            _write_replay(filepath, replay_data, codec, level)
 
             logger.info("Successfully saved replay to: %s", filepath)
             return filepath
@@ -267,6 +578,8 @@ class ReplayPlayer:
         # Track paused timestamp when toggling pause; initialize here to
         # avoid attributes created outside __init__ (W0201).
         self._paused_timestamp: Optional[float] = None
+        # Sorted frame timestamps used for binary-search lookups
+        self._frame_timestamps: List[float] = []
 
     def load_replay(self, filepath: str):
         """Load a replay from file."""
@@ -289,6 +602,7 @@ class ReplayPlayer:
             # Ensure chronological order
             self.frames.sort(key=lambda fr: fr.timestamp)
             self.events.sort(key=lambda ev: ev.timestamp)
+            self._frame_timestamps = [fr.timestamp for fr in self.frames]
 
             self.current_frame_index = 0
             logger.info("Successfully loaded replay: %s", filepath)
@@ -390,6 +704,20 @@ class ReplayPlayer:
 
         return self.frames[self.current_frame_index]
 
+    def get_frame_at(self, timestamp: float) -> Optional[GameFrame]:
+        """Return the last frame recorded at or before `timestamp`.
+
+        Unlike `get_current_frame` this does not depend on wall-clock
+        playback state, so offline tools can sample the timeline directly.
+        Timestamps before the first frame return the first frame.
+        """
+        if not self.frames:
+            return None
+        if len(self._frame_timestamps) != len(self.frames):
+            self._frame_timestamps = [fr.timestamp for fr in self.frames]
+        index = bisect.bisect_right(self._frame_timestamps, timestamp) - 1
+        return self.frames[max(0, index)]
+
     def seek_to_time(self, timestamp: float):
         """Seek to a specific time in the replay."""
         if not self.frames:
@@ -430,12 +758,111 @@ class ReplayPlayer:
         return min(100.0, (current / duration) * 100.0)
 
 
+@dataclass
+class RetentionPolicy:
+    """Disk budget for the replays directory.
+
+    The `keep_top` best-scoring and `keep_recent` newest replays are never
+    pruned or compacted. Other replays are compacted to
+    `compact_frame_rate_hz` with `compact_compression`, and the oldest of
+    them are pruned while the directory exceeds `max_count` files or
+    `max_bytes` bytes. A budget of 0 disables that limit.
+    """
+    max_count: int = 100
+    max_bytes: int = 200 * 1024 * 1024
+    keep_top: int = 10
+    keep_recent: int = 10
+    compact_frame_rate_hz: float = 10.0
+    compact_compression: str = 'lzma:6'
+
+    @classmethod
+    def from_settings(cls, settings=None) -> 'RetentionPolicy':
+        """Build a policy from the user settings, falling back to defaults."""
+        if settings is None:
+            settings = getattr(settings_mod, "current_settings", None)
+        policy = cls()
+        fields = {
+            'replay_max_count': 'max_count',
+            'replay_keep_top': 'keep_top',
+            'replay_keep_recent': 'keep_recent',
+            'replay_compact_frame_rate_hz': 'compact_frame_rate_hz',
+            'replay_compact_compression': 'compact_compression',
+        }
+        for setting, name in fields.items():
+            value = getattr(settings, setting, None)
+            if isinstance(value, type(getattr(policy, name))) or (
+                    isinstance(value, int) and isinstance(getattr(policy, name), float)):
+                setattr(policy, name, value)
+        megabytes = getattr(settings, 'replay_max_megabytes', None)
+        if isinstance(megabytes, (int, float)):
+            policy.max_bytes = int(megabytes * 1024 * 1024)
+        return policy
+
+
+@dataclass
+class RetentionPlan:
+    """What enforcing a `RetentionPolicy` would do to the replays directory."""
+    keep: List[str] = field(default_factory=list)
+    compact: List[str] = field(default_factory=list)
+    prune: List[str] = field(default_factory=list)
+    total_bytes: int = 0
+    bytes_reclaimed: int = 0
+
+    def summary(self) -> str:
+        """Return a human-readable description of the plan."""
+        lines = [
+            f"{len(self.keep) + len(self.compact) + len(self.prune)} replays, "
+            f"{self.total_bytes / 1024:.0f} KiB: keep {len(self.keep)}, "
+            f"compact {len(self.compact)}, prune {len(self.prune)} "
+            f"({self.bytes_reclaimed / 1024:.0f} KiB reclaimed by pruning)"
+        ]
+        lines.extend(f"  prune   {path}" for path in self.prune)
+        lines.extend(f"  compact {path}" for path in self.compact)
+        return "\n".join(lines)
+
+
+def _downsample_frames(frames: Iterator[Dict[str, Any]], frame_rate_hz: float) -> List[Dict[str, Any]]:
+    """Keep at most `frame_rate_hz` frames per second, plus the final frame."""
+    interval = 1.0 / frame_rate_hz if frame_rate_hz > 0 else 0.0
+    kept: List[Dict[str, Any]] = []
+    last = None
+    for frame in frames:
+        if not kept or frame.get('timestamp', 0.0) - kept[-1].get('timestamp', 0.0) >= interval:
+            kept.append(frame)
+            last = None
+        else:
+            last = frame
+    if last is not None:
+        kept.append(last)
+    return kept
+
+
+def _lower_thread_priority():
+    """Best-effort: make the calling thread yield CPU to the game loop.
+
+    Only done on Linux, where a native thread id is a valid PRIO_PROCESS
+    target. Elsewhere the id may name an unrelated process, so the thread
+    keeps its normal priority.
+    """
+    if not sys.platform.startswith("linux"):
+        return
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 10)
+    except (AttributeError, OSError):
+        pass
+
+
 class ReplayManager:
     """Manages replay files and provides listing/deletion capabilities."""
 
     def __init__(self):
         """Initialize the replay manager."""
         self.replays_dir = "replays"
+        # Background retention: at most one pass runs, one more may be queued
+        self._retention_lock = threading.Lock()
+        self._retention_thread: Optional[threading.Thread] = None
+        self._retention_pending = False
+        self._retention_policy: Optional[RetentionPolicy] = None
 
     def _validate_filepath(self, filepath: str) -> bool:
         """Validate that filepath is within the replays directory."""
@@ -454,7 +881,7 @@ class ReplayManager:
 
         replays = []
         for filename in os.listdir(self.replays_dir):
-            if filename.endswith('.json') or filename.endswith('.json.gz'):
+            if filename.endswith(REPLAY_EXTENSIONS):
                 filepath = os.path.join(self.replays_dir, filename)
                 try:
                     with _open_replay(filepath, 'rt') as f:
@@ -506,6 +933,181 @@ class ReplayManager:
             except Exception as e:  # pylint: disable=broad-exception-caught
                 logger.exception("Failed to delete replay file '%s': %s", filepath, e)
 
+    def _scan_replays(self) -> List[Dict[str, Any]]:
+        """Return path, size and metadata for every replay, reading headers only."""
+        if not os.path.exists(self.replays_dir):
+            return []
+
+        entries = []
+        for filename in os.listdir(self.replays_dir):
+            if not filename.endswith(REPLAY_EXTENSIONS):
+                continue
+            filepath = os.path.join(self.replays_dir, filename)
+            try:
+                with ReplayStreamReader(filepath) as reader:
+                    metadata = reader.metadata
+                entries.append({
+                    'filepath': filepath,
+                    'size': os.path.getsize(filepath),
+                    'metadata': metadata,
+                })
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.warning("Skipping replay '%s' during retention scan: %s", filename, e)
+        return entries
+
+    def find_personal_best(
+        self,
+        difficulty: Optional[str] = None,
+        ship_type: Optional[str] = None,
+    ) -> Optional[str]:
+        """Return the path of the highest-scoring replay, optionally filtered."""
+        best_path, best_score = None, None
+        for entry in self._scan_replays():
+            metadata = entry['metadata']
+            if difficulty is not None and metadata.get('difficulty') != difficulty:
+                continue
+            if ship_type is not None and metadata.get('ship_type') != ship_type:
+                continue
+            score = metadata.get('final_score', 0)
+            if best_score is None or score > best_score:
+                best_path, best_score = entry['filepath'], score
+        return best_path
+
+    def plan_retention(self, policy: Optional[RetentionPolicy] = None) -> RetentionPlan:
+        """Decide which replays to keep, compact and prune without touching files."""
+        policy = policy or RetentionPolicy.from_settings()
+        entries = self._scan_replays()
+        by_age = sorted(entries, key=lambda e: e['metadata'].get('start_time', 0), reverse=True)
+        by_score = sorted(entries, key=lambda e: e['metadata'].get('final_score', 0), reverse=True)
+        protected = {e['filepath'] for e in by_age[:max(0, policy.keep_recent)]}
+        protected.update(e['filepath'] for e in by_score[:max(0, policy.keep_top)])
+
+        plan = RetentionPlan(total_bytes=sum(e['size'] for e in entries))
+        count, size = len(entries), plan.total_bytes
+        pruned = set()
+        # Oldest unprotected replays go first
+        for entry in reversed(by_age):
+            over_count = policy.max_count > 0 and count > policy.max_count
+            over_bytes = policy.max_bytes > 0 and size > policy.max_bytes
+            if not (over_count or over_bytes):
+                break
+            if entry['filepath'] in protected:
+                continue
+            pruned.add(entry['filepath'])
+            plan.prune.append(entry['filepath'])
+            plan.bytes_reclaimed += entry['size']
+            count -= 1
+            size -= entry['size']
+
+        for entry in by_age:
+            path = entry['filepath']
+            if path in pruned:
+                continue
+            if path in protected or entry['metadata'].get('compacted'):
+                plan.keep.append(path)
+            else:
+                plan.compact.append(path)
+        return plan
+
+    def enforce_retention(
+        self,
+        policy: Optional[RetentionPolicy] = None,
+        dry_run: bool = False,
+    ) -> RetentionPlan:
+        """Prune and compact replays according to `policy`.
+
+        With `dry_run` the plan is only computed and logged.
+        """
+        policy = policy or RetentionPolicy.from_settings()
+        plan = self.plan_retention(policy)
+        logger.info("Replay retention%s: %s", " (dry run)" if dry_run else "", plan.summary())
+        if dry_run:
+            return plan
+
+        for filepath in plan.prune:
+            self.delete_replay(filepath)
+        for filepath in plan.compact:
+            try:
+                self.compact_replay(filepath, policy.compact_frame_rate_hz, policy.compact_compression)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.exception("Failed to compact replay '%s': %s", filepath, e)
+        return plan
+
+    def enforce_retention_async(self, policy: Optional[RetentionPolicy] = None) -> threading.Thread:
+        """Run `enforce_retention` on a low-priority daemon thread.
+
+        Passes never overlap: a request made while one is running is queued,
+        and the running thread makes one more pass with the latest `policy`.
+        Returns the thread doing the work.
+        """
+        with self._retention_lock:
+            self._retention_policy = policy
+            if self._retention_thread is not None:
+                self._retention_pending = True
+                return self._retention_thread
+            thread = threading.Thread(target=self._run_retention, name="replay-retention", daemon=True)
+            self._retention_thread = thread
+            self._retention_pending = False
+        thread.start()
+        return thread
+
+    def _run_retention(self):
+        """Body of the retention thread: pass until no request is queued."""
+        _lower_thread_priority()
+        while True:
+            with self._retention_lock:
+                policy = self._retention_policy
+                self._retention_pending = False
+            try:
+                self.enforce_retention(policy)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.exception("Replay retention failed: %s", e)
+            with self._retention_lock:
+                if not self._retention_pending:
+                    self._retention_thread = None
+                    return
+
+    def compact_replay(self, filepath: str, frame_rate_hz: float, compression: str) -> str:
+        """Downsample a replay's frames and rewrite it with `compression`.
+
+        Returns the path of the compacted file, whose extension follows the
+        new codec.
+        """
+        if not self._validate_filepath(filepath):
+            raise ValueError(f"Replay outside replays directory: {filepath}")
+
+        with ReplayStreamReader(filepath) as reader:
+            metadata = dict(reader.metadata)
+            frames = _downsample_frames(reader.iter_frames(), frame_rate_hz)
+            events = reader.read_section('events') or []
+
+        codec, level = parse_compression(compression)
+        metadata.update({
+            'compacted': True,
+            'frame_rate_hz': frame_rate_hz,
+            'frame_count': len(frames),
+            'compression': codec.name,
+            'compression_level': level,
+        })
+
+        base = filepath
+        for extension in sorted(REPLAY_EXTENSIONS, key=len, reverse=True):
+            if base.endswith(extension):
+                base = base[:-len(extension)]
+                break
+        target = base + codec.extension
+        suffix = 1
+        while target != filepath and os.path.exists(target):
+            target = f"{base}_{suffix}{codec.extension}"
+            suffix += 1
+        temp_path = target + '.tmp'
+        _write_replay(temp_path, {'metadata': metadata, 'frames': frames, 'events': events}, codec, level)
+        os.replace(temp_path, target)
+        if target != filepath:
+            os.remove(filepath)
+        logger.info("Compacted replay %s -> %s (%d frames)", filepath, target, len(frames))
+        return target
+
     def get_replay_count(self) -> int:
         """Get the number of replay files."""
         return len(self.list_replays())
@@ -8,7 +8,7 @@ from modul.constants import (MENU_BACKGROUND_ALPHA, MENU_ITEM_FONT_SIZE,
                              MENU_TITLE_FONT_SIZE, MENU_TRANSITION_SPEED,
                              MENU_UNSELECTED_COLOR, SCREEN_HEIGHT,
                              SCREEN_WIDTH)
-from modul.replay_system import ReplayManager, ReplayPlayer
+from modul.replay_system import GameFrame, ReplayManager, ReplayPlayer
 try:
     from modul.i18n import gettext
 except (ImportError, ModuleNotFoundError):  # pragma: no cover - fallback when i18n unavailable
@@ -28,6 +28,52 @@ except (ImportError, ModuleNotFoundError):  # pragma: no cover - minimal stub fo
     input_utils = _InputUtilsStub()
 
 
+def draw_replay_frame(screen, frame: GameFrame, font):
+    """Draw the entities and score HUD of a recorded frame.
+
+    Shared by the in-game replay viewer and the headless exporter so both
+    produce identical images for the same frame.
+    """
+    # Draw player
+    pygame.draw.circle(screen, (0, 200, 255), (int(frame.player_pos[0]), int(frame.player_pos[1])), 10)
+
+    # Draw asteroids
+    for a in frame.asteroids:
+        x = int(a.get('x', 0))
+        y = int(a.get('y', 0))
+        r = int(a.get('radius', 12))
+        pygame.draw.circle(screen, (180, 180, 180), (x, y), r, 2)
+
+    # Draw enemies
+    for e in frame.enemies:
+        x = int(e.get('x', 0))
+        y = int(e.get('y', 0))
+        r = int(e.get('radius', 14))
+        pygame.draw.circle(screen, (255, 80, 80), (x, y), r, 2)
+
+    # Draw shots
+    for s in frame.shots:
+        x = int(s.get('x', 0))
+        y = int(s.get('y', 0))
+        pygame.draw.circle(screen, (255, 255, 0), (x, y), 3)
+
+    # Draw powerups
+    for p in frame.powerups:
+        x = int(p.get('x', 0))
+        y = int(p.get('y', 0))
+        pygame.draw.circle(screen, (0, 255, 0), (x, y), 6, 1)
+
+    # HUD text
+    score_text = font.render(f"Score: {frame.score}", True, (255, 255, 255))
+    screen.blit(score_text, (20, 20))
+
+    lives_text = font.render(f"Lives: {frame.lives}", True, (255, 255, 255))
+    screen.blit(lives_text, (20, 50))
+
+    level_text = font.render(f"Level: {frame.level}", True, (200, 200, 200))
+    screen.blit(level_text, (20, 80))
+
+
 class ReplayListMenu:
     """Menu for listing and selecting replays."""
 
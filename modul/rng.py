@@ -0,0 +1,66 @@
+"""Named random number streams seeded from a single run seed.
+
+Each subsystem draws from its own `random.Random` instead of the shared
+`random` module, so adding an explosion or a star never shifts the numbers
+the asteroid field or the enemy spawner will see next. All streams are
+derived from one run seed, which is recorded in replay metadata; seeding the
+same run seed again reproduces a run exactly.
+
+Streams are created once and reseeded in place, so modules may keep a
+reference obtained with `stream()` at import time.
+"""
+
+import os
+import random
+from typing import Dict, Optional
+
+# Streams that decide gameplay outcomes; snapshots store their state
+ASTEROIDS = "asteroids"
+POWERUPS = "powerups"
+ENEMIES = "enemies"
+BOSS = "boss"
+GAMEPLAY_STREAMS = (ASTEROIDS, POWERUPS, ENEMIES, BOSS)
+
+# Purely visual streams; free to be consumed at any rate
+PARTICLES = "particles"
+STARS = "stars"
+COSMETIC_STREAMS = (PARTICLES, STARS)
+
+_streams: Dict[str, random.Random] = {name: random.Random() for name in GAMEPLAY_STREAMS + COSMETIC_STREAMS}
+_run_seed: Optional[int] = None
+
+
+def new_seed() -> int:
+    """Return a fresh 32-bit seed from the operating system."""
+    return int.from_bytes(os.urandom(4), "little")
+
+
+def seed_run(seed: Optional[int] = None) -> int:
+    """Reseed every stream from `seed` (a new random seed if None) and return it."""
+    global _run_seed  # pylint: disable=global-statement
+    _run_seed = new_seed() if seed is None else int(seed)
+    for name, rng in _streams.items():
+        # String seeds are hashed with SHA-512, independent of PYTHONHASHSEED
+        rng.seed(f"{_run_seed}:{name}")
+    return _run_seed
+
+
+def run_seed() -> Optional[int]:
+    """Return the seed of the current run, or None if never seeded."""
+    return _run_seed
+
+
+def stream(name: str) -> random.Random:
+    """Return the generator for subsystem `name`."""
+    return _streams[name]
+
+
+def get_state(names=GAMEPLAY_STREAMS) -> Dict[str, tuple]:
+    """Return the internal state of the named streams."""
+    return {name: _streams[name].getstate() for name in names}
+
+
+def set_state(states: Dict[str, tuple]):
+    """Restore stream states captured with `get_state`."""
+    for name, state in states.items():
+        _streams[name].setstate(state)
@@ -62,6 +62,19 @@ class Settings:
         self.tts_voice_language = self.language
         # Whether to show the TTS voice selection directly in the Options menu
         self.show_tts_in_options = False
+        # Replay file codec as "name[:level]": none, gzip, bz2 or lzma
+        self.replay_compression = "gzip:6"
+        # Replay retention budget (0 disables a limit); see
+        # replay_system.RetentionPolicy
+        self.replay_max_count = 100
+        self.replay_max_megabytes = 200
+        self.replay_keep_top = 10
+        self.replay_keep_recent = 10
+        # How replays outside the protected ones are compacted
+        self.replay_compact_frame_rate_hz = 10.0
+        self.replay_compact_compression = "lzma:6"
+        # Race a translucent ghost of the personal-best replay
+        self.ghost_racing_enabled = False
         self.load()
         # Register this instance as the active settings for runtime consumers
         global current_settings
@@ -93,6 +106,14 @@ class Settings:
             "tts_voice": self.tts_voice,
             "tts_voice_language": self.tts_voice_language,
             "show_tts_in_options": self.show_tts_in_options,
+            "replay_compression": self.replay_compression,
+            "replay_max_count": self.replay_max_count,
+            "replay_max_megabytes": self.replay_max_megabytes,
+            "replay_keep_top": self.replay_keep_top,
+            "replay_keep_recent": self.replay_keep_recent,
+            "replay_compact_frame_rate_hz": self.replay_compact_frame_rate_hz,
+            "replay_compact_compression": self.replay_compact_compression,
+            "ghost_racing_enabled": self.ghost_racing_enabled,
         }
 
         try:
@@ -154,6 +175,16 @@ class Settings:
                     self.show_tts_in_options,
                 )
                 self.show_tts_in_options = _show
+                _rc = settings_data.get(
+                    "replay_compression",
+                    self.replay_compression,
+                )
+                self.replay_compression = _rc
+                for key in ("replay_max_count", "replay_max_megabytes",
+                            "replay_keep_top", "replay_keep_recent",
+                            "replay_compact_frame_rate_hz", "replay_compact_compression",
+                            "ghost_racing_enabled"):
+                    setattr(self, key, settings_data.get(key, getattr(self, key)))
                 print("Settings loaded")
             return True
         except Exception as e:  # pylint: disable=broad-exception-caught
@@ -1,9 +1,18 @@
-"""Ship definitions, persistence and rendering helpers."""
+"""Ship definitions, persistence and rendering helpers.
+
+Ships are drawn from `ship_sprites`, a cache of pre-rasterized sprites per
+ship look (shape, scale and colour) and rotation, rounded to
+`SHIP_SPRITE_ANGLE_STEP` degrees. Each sprite is rendered once with the
+vector drawing code; setting `ship_sprites.enabled` to False (or
+`SHIP_SPRITE_CACHE` in the constants) draws every ship with exact vector
+geometry instead.
+"""
 
 import json
 import math
 import os
 import pygame
+import modul.constants as C
 try:
     from modul.i18n import gettext
 except (ImportError, ModuleNotFoundError):  # pragma: no cover - fallback when i18n unavailable
@@ -169,12 +178,95 @@ class ShipManager:
             achievement_system.unlock("Fleet Commander")
 
 
+# Ship shapes drawn by `ShipRenderer`
+SHIP_SHAPES = frozenset({"triangle", "standard", "arrow", "heavy", "destroyer"})
+# Farthest a ship shape reaches from its centre at scale 1, and room for line widths
+_SHIP_EXTENT = 24
+_SPRITE_MARGIN = 3
+
+
+class ShipSpriteCache:
+    """Pre-rasterized ship sprites per look and rotation bucket.
+
+    A look is any hashable key; `render(surface, x, y, rotation)` draws it
+    centred on (x, y) with vector geometry, rotated by `rotation` degrees.
+    """
+
+    def __init__(self, angle_step=C.SHIP_SPRITE_ANGLE_STEP, enabled=C.SHIP_SPRITE_CACHE):
+        """Round rotations to `angle_step` degrees; draw vectors unless `enabled`."""
+        self.enabled = enabled
+        self.set_angle_step(angle_step)
+
+    def set_angle_step(self, angle_step):
+        """Change the angular resolution, dropping all cached sprites."""
+        self.buckets = max(1, round(360 / angle_step))
+        self.angle_step = 360 / self.buckets
+        self.clear()
+
+    def clear(self):
+        """Drop all cached sprites and zero the counters."""
+        self._sprites = {}
+        self.memory = 0
+        self.hits = 0
+        self.misses = 0
+
+    def sprite(self, key, rotation, half, render):
+        """Return the sprite of look `key` at `rotation`, `2 * half` pixels wide."""
+        bucket = round(rotation / self.angle_step) % self.buckets
+        sprite = self._sprites.get((key, bucket))
+        if sprite is None:
+            sprite = pygame.Surface((2 * half, 2 * half), pygame.SRCALPHA)
+            render(sprite, half, half, bucket * self.angle_step)
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()
+            self._sprites[(key, bucket)] = sprite
+            self.memory += sprite.get_bytesize() * sprite.get_width() * sprite.get_height()
+            self.misses += 1
+        else:
+            self.hits += 1
+        return sprite
+
+    def draw(self, screen, x, y, rotation, key, half, render):
+        """Draw look `key` centred on (x, y), from the cache when enabled."""
+        if not self.enabled:
+            render(screen, x, y, rotation)
+            return
+        sprite = self.sprite(key, rotation, half, render)
+        screen.blit(sprite, (int(x) - half, int(y) - half))
+
+    def stats(self):
+        """Return cache size and memory footprint for the profiler."""
+        lookups = self.hits + self.misses
+        return {
+            'sprites': len(self._sprites),
+            'bytes': self.memory,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'angle_step': self.angle_step,
+        }
+
+
 class ShipRenderer:
     """Utility class that draws different ship shapes to a surface."""
 
     @staticmethod
     def draw_ship(screen, x, y, rotation, ship_type, scale=1.0, color=(255, 255, 255)):
-        """Draw the specified `ship_type` at position with rotation and color."""
+        """Draw the specified `ship_type` at position with rotation and color.
+
+        Known shapes come from the `ship_sprites` cache.
+        """
+        if ship_type not in SHIP_SHAPES:
+            ShipRenderer.draw_question_mark(screen, x, y, scale, color)
+            return
+
+        def render(surface, sx, sy, angle):
+            ShipRenderer.draw_ship_vector(surface, sx, sy, angle, ship_type, scale, color)
+
+        half = math.ceil(_SHIP_EXTENT * scale) + _SPRITE_MARGIN
+        ship_sprites.draw(screen, x, y, rotation, (ship_type, scale, color), half, render)
+
+    @staticmethod
+    def draw_ship_vector(screen, x, y, rotation, ship_type, scale=1.0, color=(255, 255, 255)):
+        """Draw `ship_type` with exact vector geometry."""
         if ship_type == "triangle" or ship_type == "standard":
             ShipRenderer.draw_triangle_ship(screen, x, y, rotation, scale, color)
         elif ship_type == "arrow":
@@ -297,4 +389,5 @@ class ShipRenderer:
         screen.blit(text, text_rect)
 
 
+ship_sprites = ShipSpriteCache()
 ship_manager = ShipManager()
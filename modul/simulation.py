@@ -0,0 +1,435 @@
+"""Headless gameplay simulation.
+
+`GameWorld` steps the rules of the ``playing`` state without a window, sound
+or wall-clock time: enemy spawns follow simulated time, the player is driven
+by an action mapping, and gameplay outcomes are returned as `WorldEvent`
+objects instead of triggering sounds, achievements or menus. Tools such as
+the determinism checker build on it.
+
+The step phases at module level are shared with the fixed-step loop in
+``main.py``: both call them in the same order, and the game turns the
+returned events into sounds, achievements and messages, so the two cannot
+drift apart.
+"""
+
+import math
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Dict, List, Optional
+
+import pygame
+
+import modul.constants as C
+from modul import rng
+from modul.asteroid import Asteroid, EnemyShip
+from modul.asteroidfield import AsteroidField
+from modul.boss import Boss
+from modul.game_clock import GameClock
+from modul.bossprojectile import BossProjectile
+from modul.particle import Particle
+from modul.player import Player
+from modul.powerup import PowerUp
+from modul.shot import Shot
+from modul.snapshot import restore_world, snapshot_world
+
+# Step at the interactive game's rate so tools simulate the shipped physics
+DEFAULT_TICK_RATE = C.SIMULATION_TICK_RATE
+MAX_ENEMY_SHIPS = {"easy": 1, "normal": 2, "hard": 3}
+ACTIONS = ("rotate_left", "rotate_right", "thrust", "reverse", "shoot", "switch_weapon")
+
+
+def resolve_asteroid_collisions(asteroids):
+    """Separate overlapping asteroids and swap their velocities."""
+    asteroid_list = list(asteroids)
+    for i, a1 in enumerate(asteroid_list):
+        for j in range(i + 1, len(asteroid_list)):
+            a2 = asteroid_list[j]
+            dx = a2.position.x - a1.position.x
+            dy = a2.position.y - a1.position.y
+            dist = math.hypot(dx, dy)
+            min_dist = a1.radius + a2.radius
+            if dist < min_dist and dist > 0:
+
+                overlap = min_dist - dist
+                nx = dx / dist
+                ny = dy / dist
+                a1.position.x -= nx * overlap / 2
+                a1.position.y -= ny * overlap / 2
+                a2.position.x += nx * overlap / 2
+                a2.position.y += ny * overlap / 2
+
+                v1 = a1.velocity
+                v2 = a2.velocity
+                a1.velocity, a2.velocity = v2, v1
+
+
+def wrap_positions(objects):
+    """Wrap objects around the screen edges; shots leaving the screen die."""
+    for obj in list(objects):
+        if not hasattr(obj, "position"):
+            continue
+
+        if isinstance(obj, Shot):
+            if (
+                obj.position.x < 0
+                or obj.position.x > C.SCREEN_WIDTH
+                or obj.position.y < 0
+                or obj.position.y > C.SCREEN_HEIGHT
+            ):
+                obj.kill()
+            continue
+
+        if obj.position.x < 0:
+            obj.position.x = C.SCREEN_WIDTH
+        elif obj.position.x > C.SCREEN_WIDTH:
+            obj.position.x = 0
+        if obj.position.y < 0:
+            obj.position.y = C.SCREEN_HEIGHT
+        elif obj.position.y > C.SCREEN_HEIGHT:
+            obj.position.y = 0
+
+
+def asteroid_score(asteroid) -> int:
+    """Return the points awarded for destroying `asteroid`."""
+    if asteroid.radius >= C.ASTEROID_MIN_RADIUS * 2:
+        base_score = C.SCORE_LARGE
+    elif asteroid.radius > C.ASTEROID_MIN_RADIUS:
+        base_score = C.SCORE_MEDIUM
+    else:
+        base_score = C.SCORE_SMALL
+    type_multiplier = C.ASTEROID_TYPE_SCORE_MULTIPLIERS.get(asteroid.asteroid_type, 1.0)
+    return int(round(base_score * type_multiplier))
+
+
+def boss_attack_projectiles(boss, attack, player_position, ticks_ms) -> int:
+    """Spawn the projectiles for a boss `attack` payload; returns how many."""
+    if attack["type"] == "circle":
+        for i in range(attack["count"]):
+            angle = math.radians(i * (360 / attack["count"]))
+            velocity = pygame.Vector2(math.cos(angle), math.sin(angle)) * C.BOSS_PROJECTILE_SPEED
+            BossProjectile(boss.position.x, boss.position.y, velocity, "normal")
+        return attack["count"]
+
+    if attack["type"] == "spiral":
+        base_angle = ticks_ms % 360
+        for i in range(attack["count"]):
+            angle = math.radians(base_angle + i * (360 / attack["count"]))
+            velocity = pygame.Vector2(math.cos(angle), math.sin(angle)) * C.BOSS_PROJECTILE_SPEED
+            BossProjectile(boss.position.x, boss.position.y, velocity, "normal")
+        return attack["count"]
+
+    if attack["type"] == "targeted" and player_position is not None:
+        direction = (player_position - boss.position).normalize()
+        BossProjectile(boss.position.x, boss.position.y, direction * C.BOSS_PROJECTILE_SPEED, "homing")
+        for i in range(1, attack["count"]):
+            offset = 10 * i if i % 2 == 0 else -10 * i
+            offset_dir = direction.rotate(offset)
+            BossProjectile(boss.position.x, boss.position.y, offset_dir * C.BOSS_PROJECTILE_SPEED, "normal")
+        return attack["count"]
+    return 0
+
+
+@dataclass
+class WorldEvent:
+    """Something that happened during a simulation step."""
+    kind: str
+    data: Dict[str, Any] = field(default_factory=dict)
+
+
+def player_vulnerable(player) -> bool:
+    """Return True when a collision would cost `player` a life."""
+    return not player.invincible and not player.shield_active
+
+
+def next_spawn_interval() -> float:
+    """Return the seconds until the next enemy ship may spawn."""
+    return rng.stream(rng.ENEMIES).uniform(10, 30)
+
+
+def spawn_enemy_ship(enemies, groups):
+    """Spawn an enemy ship at a random position into `groups` and `enemies`."""
+    enemy_rng = rng.stream(rng.ENEMIES)
+    enemy_ship = EnemyShip(enemy_rng.randint(0, C.SCREEN_WIDTH), enemy_rng.randint(0, C.SCREEN_HEIGHT), 30)
+    for group in groups:
+        group.add(enemy_ship)
+    enemies.append(enemy_ship)
+    return enemy_ship
+
+
+def update_entities(updatable, player, dt):
+    """Update every entity; enemy ships steer towards the player."""
+    for obj in list(updatable):
+        if isinstance(obj, EnemyShip):
+            obj.update(dt, player.position)
+        else:
+            obj.update(dt)
+
+
+def collide_asteroids(asteroids, shots, powerups, player, hit_player) -> List[WorldEvent]:
+    """Resolve player and shot hits against asteroids.
+
+    `hit_player()` is called whenever a vulnerable player touches an
+    asteroid. Large asteroids may drop a power-up when shot.
+    """
+    events = []
+    powerup_rng = rng.stream(rng.POWERUPS)
+    for asteroid in list(asteroids):
+        if asteroid.collides_with(player) and player_vulnerable(player):
+            hit_player()
+
+        for shot in list(shots):
+            if asteroid.collides_with(shot):
+                data = {"points": asteroid_score(asteroid), "radius": asteroid.radius, "powerup": None}
+                Particle.create_asteroid_explosion(asteroid.position.x, asteroid.position.y)
+
+                is_large_asteroid = asteroid.radius >= C.ASTEROID_MIN_RADIUS * 2
+                if is_large_asteroid and powerup_rng.random() < C.POWERUP_SPAWN_CHANCE:
+                    if len(powerups) < C.POWERUP_MAX_COUNT:
+                        data["powerup"] = powerup_rng.choice(C.POWERUP_TYPES)
+                        PowerUp(asteroid.position.x, asteroid.position.y, data["powerup"])
+
+                events.append(WorldEvent("asteroid_destroyed", data))
+                asteroid.split()
+                shot.kill()
+                break
+    return events
+
+
+def collide_enemies(enemies, shots, player, hit_player) -> List[WorldEvent]:
+    """Resolve player and shot hits against enemy ships.
+
+    Destroyed ships are removed from the `enemies` list in place.
+    """
+    events = []
+    for enemy in list(enemies):
+        if enemy.collides_with(player) and player_vulnerable(player):
+            enemy.split()
+            hit_player()
+
+        for shot in list(shots):
+            if enemy.collides_with(shot):
+                enemy.split()
+                shot.kill()
+                events.append(WorldEvent("enemy_destroyed", {"points": C.SCORE_MEDIUM}))
+                break
+    enemies[:] = [ship for ship in enemies if ship.alive()]
+    return events
+
+
+def deflect_enemies(enemies, asteroids):
+    """Send enemy ships touching an asteroid off in a random direction."""
+    enemy_rng = rng.stream(rng.ENEMIES)
+    for enemy_ship in enemies:
+        for asteroid in asteroids:
+            if enemy_ship.collides_with(asteroid):
+                speed = enemy_ship.velocity.length()
+                enemy_ship.velocity = pygame.Vector2(enemy_rng.uniform(-1, 1), enemy_rng.uniform(-1, 1)).normalize() * speed
+
+
+def advance_level(score, level, asteroids, asteroid_field) -> List[WorldEvent]:
+    """Return the events for reaching the level `score` earns, if above `level`.
+
+    Every BOSS_LEVEL_INTERVAL-th level clears the asteroids and spawns a
+    boss, passed in the ``boss_spawned`` event.
+    """
+    current_level = min(score // C.POINTS_PER_LEVEL + 1, C.MAX_LEVEL)
+    if current_level <= level:
+        return []
+    events = []
+    if current_level % C.BOSS_LEVEL_INTERVAL == 0:
+        for asteroid in list(asteroids):
+            asteroid.kill()
+        events.append(WorldEvent("boss_spawned", {"level": current_level, "boss": Boss(current_level)}))
+    if current_level <= 10:
+        asteroid_field.asteroid_count = min(
+            C.BASE_ASTEROID_COUNT + (current_level - 1) * C.ASTEROID_COUNT_PER_LEVEL, 12)
+        asteroid_field.spawn_interval = max(
+            C.BASE_SPAWN_INTERVAL - (current_level - 1) * C.SPAWN_INTERVAL_REDUCTION, 1.0)
+    events.append(WorldEvent("level_up", {"level": current_level}))
+    return events
+
+
+def collect_powerups(powerups, player) -> List[WorldEvent]:
+    """Apply the power-ups touched by the player."""
+    events = []
+    for powerup in list(powerups):
+        if powerup.collides_with(player):
+            player.activate_powerup(powerup.type)
+            powerup.kill()
+            events.append(WorldEvent("powerup_collected", {"type": powerup.type}))
+    return events
+
+
+def update_boss(boss, dt, player, updatable, shots, now) -> List[WorldEvent]:
+    """Run the boss's attacks and resolve shots hitting it at game time `now`."""
+    events = []
+    attack = boss.update(dt, player.position)
+    if attack:
+        player_position = player.position if player in updatable else None
+        projectiles = boss_attack_projectiles(boss, attack, player_position, int(now * 1000))
+        events.append(WorldEvent("boss_attack", {"type": attack["type"], "projectiles": projectiles}))
+
+    for shot in list(shots):
+        if boss.collides_with(shot):
+            defeated = boss.take_damage(shot.damage)
+            shot.kill()
+            events.append(WorldEvent("boss_hit"))
+            if defeated:
+                events.append(WorldEvent("boss_defeated", {"points": C.BOSS_SCORE}))
+    return events
+
+
+
+class GameWorld:
+    """Self-contained, headless instance of the gameplay rules."""
+
+    def __init__(
+        self,
+        difficulty: str = "normal",
+        ship_type: str = "standard",
+        seed: Optional[int] = None,
+        tick_rate: int = DEFAULT_TICK_RATE,
+    ):
+        """Create a fresh world; `seed` reseeds the run's random streams."""
+        self.difficulty = difficulty
+        self.ship_type = ship_type
+        self.seed = seed
+        self.dt = 1.0 / tick_rate
+
+        self.asteroids = pygame.sprite.Group()
+        self.shots = pygame.sprite.Group()
+        self.particles = pygame.sprite.Group()
+        self.powerups = pygame.sprite.Group()
+        self.updatable = pygame.sprite.Group()
+        self.drawable = pygame.sprite.Group()
+        self.bind()
+
+        if seed is not None:
+            rng.seed_run(seed)
+
+        self.player = Player(C.SCREEN_WIDTH / 2, C.SCREEN_HEIGHT / 2, ship_type)
+        # No audio in the simulation; shooting checks for a falsy `sounds`
+        self.player.sounds = None
+        self.player.input_state = {}
+        self.asteroid_field = AsteroidField()
+        self.enemies: List[EnemyShip] = []
+        self.boss: Optional[Boss] = None
+        self.boss_active = False
+
+        self.score = 0
+        self.lives = C.PLAYER_LIVES
+        self.level = 1
+        self.tick = 0
+        self.clock = GameClock()
+        self.last_spawn_time = 0.0
+        self.spawn_interval = next_spawn_interval()
+        self.game_over = False
+
+    @property
+    def time(self) -> float:
+        """Simulated seconds since the world was created."""
+        return self.clock.now
+
+    @time.setter
+    def time(self, value: float):
+        """Set the simulated time, e.g. when restoring a snapshot."""
+        self.clock.now = value
+
+    def bind(self):
+        """Point the entity classes' shared containers at this world's groups.
+
+        Entity constructors register themselves through class-level
+        ``containers``, so only one world (or the interactive game) can be
+        active at a time; call this before stepping after switching.
+        """
+        Asteroid.containers = self.asteroids, self.updatable, self.drawable
+        Shot.containers = self.shots, self.updatable, self.drawable
+        Particle.containers = self.particles, self.updatable, self.drawable
+        PowerUp.containers = self.powerups, self.updatable, self.drawable
+        Player.containers = self.updatable, self.drawable
+        Boss.containers = self.updatable, self.drawable
+        BossProjectile.containers = self.updatable, self.drawable
+        Shot.set_asteroids(self.asteroids)
+
+    def snapshot(self) -> bytes:
+        """Return the full gameplay state, including the RNG, as bytes."""
+        return snapshot_world(self)
+
+    def restore(self, data: bytes):
+        """Rewind or fast-forward this world to a `snapshot` blob."""
+        self.bind()
+        restore_world(self, data)
+
+    def set_actions(self, actions: Dict[str, bool]):
+        """Set which player actions are held for the following steps."""
+        self.player.input_state = dict(actions)
+
+    def step(self, dt: Optional[float] = None) -> List[WorldEvent]:
+        """Advance the world by `dt` seconds (default: one tick)."""
+        if self.game_over:
+            return []
+        dt = self.dt if dt is None else dt
+        events: List[WorldEvent] = []
+        player = self.player
+
+        self.tick += 1
+        self.clock.advance(dt)
+
+        self.asteroid_field.update(dt)
+        self._spawn_enemies(events)
+        update_entities(self.updatable, player, dt)
+
+        resolve_asteroid_collisions(self.asteroids)
+        lose_life = partial(self._lose_life, events)
+        self._score(collide_asteroids(self.asteroids, self.shots, self.powerups, player, lose_life), events)
+        self._score(collide_enemies(self.enemies, self.shots, player, lose_life), events)
+        deflect_enemies(self.enemies, self.asteroids)
+        wrap_positions(self.updatable)
+
+        for event in advance_level(self.score, self.level, self.asteroids, self.asteroid_field):
+            if event.kind == "boss_spawned":
+                self.boss = event.data["boss"]
+                self.boss_active = True
+            elif event.kind == "level_up":
+                self.level = event.data["level"]
+            events.append(event)
+
+        events.extend(collect_powerups(self.powerups, player))
+
+        if self.boss_active and self.boss is not None and self.boss in self.updatable:
+            for event in update_boss(self.boss, dt, player, self.updatable, self.shots, self.time):
+                if event.kind == "boss_defeated":
+                    self.score += event.data["points"]
+                    self.boss_active = False
+                    self.lives += 1
+                events.append(event)
+        return events
+
+    def _score(self, outcomes, events):
+        """Add the points of destroyed entities and pass their events on."""
+        for event in outcomes:
+            self.score += event.data["points"]
+            events.append(event)
+
+    def _spawn_enemies(self, events):
+        """Spawn enemy ships on simulated time, capped per difficulty."""
+        if self.time - self.last_spawn_time > self.spawn_interval:
+            if len(self.enemies) < MAX_ENEMY_SHIPS.get(self.difficulty, 2):
+                spawn_enemy_ship(self.enemies, (self.updatable, self.drawable))
+                self.last_spawn_time = self.time
+                self.spawn_interval = next_spawn_interval()
+                events.append(WorldEvent("enemy_spawned"))
+        self.enemies = [ship for ship in self.enemies if ship in self.updatable]
+
+    def _lose_life(self, events):
+        """Apply a player hit: respawn or end the game."""
+        if self.game_over:
+            return
+        self.lives -= 1
+        Particle.create_ship_explosion(self.player.position.x, self.player.position.y)
+        events.append(WorldEvent("player_hit", {"lives": self.lives}))
+        if self.lives <= 0:
+            self.game_over = True
+            events.append(WorldEvent("game_over", {"score": self.score, "level": self.level}))
+        else:
+            self.player.respawn()
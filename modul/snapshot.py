@@ -0,0 +1,288 @@
+"""Compact binary snapshots of the gameplay state.
+
+`snapshot_world` packs everything that influences future ticks — counters,
+the asteroid field timers, every live entity in update order and the state of
+the gameplay random streams (`modul.rng`) — into a `bytes` blob with fixed-layout
+`struct` records. `restore_world` rebuilds the entities in the same order
+without running their constructors, so restoring neither draws random numbers
+nor creates sounds, and a restored world steps exactly like the original.
+
+Particles are purely cosmetic and are not stored; restoring clears them.
+Cosmetic random streams are not stored either.
+
+The world argument is duck-typed: `GameWorld` provides every attribute used
+here, and the interactive game can pass an equivalent namespace.
+"""
+
+import struct
+from array import array
+from typing import List
+
+import pygame
+
+import modul.constants as C
+from modul import rng
+from modul.asteroid import Asteroid, EnemyShip
+from modul.boss import Boss
+from modul.bossprojectile import BossProjectile
+from modul.particle import Particle
+from modul.player import Player
+from modul.powerup import PowerUp
+from modul.shot import Shot
+
+SNAPSHOT_MAGIC = b"AJSN"
+SNAPSHOT_VERSION = 2
+
+_ASTEROID_TYPES = list(C.ASTEROID_TYPES)
+_WEAPONS = list(C.WEAPON_COLORS)
+_POWERUP_TYPES = list(C.POWERUP_TYPES)
+_PROJECTILE_TYPES = list(C.BOSS_PROJECTILE_COLORS)
+_BOSS_PHASES = ["center", "random", "chase"]
+
+# Entity kind tags, one byte before each record
+_PLAYER, _ASTEROID, _SHOT, _POWERUP, _ENEMY, _BOSS, _PROJECTILE = range(7)
+
+_HEADER = struct.Struct("<4sBIdiiidd??dId")
+# tick, time, score, lives, level, last_spawn_time, spawn_interval, game_over,
+# boss_active, field spawn_timer, field asteroid_count, field spawn_interval
+_RNG = struct.Struct("<B?dH")  # generator version, has gauss_next, gauss_next, state length
+_COUNT = struct.Struct("<I")
+_KIND = struct.Struct("<B")
+_PLAYER_REC = struct.Struct("<5dd?d?d?d?dBd4i")
+_ASTEROID_REC = struct.Struct("<7dBiB")
+_SHOT_REC = struct.Struct("<5dBdidd??di")
+_POWERUP_REC = struct.Struct("<6dB")
+_ENEMY_REC = struct.Struct("<6d")
+_BOSS_REC = struct.Struct("<5diiid2ddBddBdd?")
+_PROJECTILE_REC = struct.Struct("<4dBdidd")
+
+
+class SnapshotError(ValueError):
+    """Raised when a blob is not a snapshot this version can restore."""
+
+
+def _pack_entity(parts: List[bytes], obj, index_of) -> None:
+    """Append the kind tag and record for one entity."""
+    x, y = obj.position.x, obj.position.y
+    vx, vy = obj.velocity.x, obj.velocity.y
+    if isinstance(obj, Player):
+        ammo = [obj.weapons.get(w, 0) for w in _WEAPONS]
+        parts.append(_KIND.pack(_PLAYER))
+        parts.append(_PLAYER_REC.pack(
+            x, y, vx, vy, obj.rotation, obj.shoot_timer,
+            obj.invincible, obj.invincible_timer, obj.shield_active, obj.shield_timer,
+            obj.triple_shot_active, obj.triple_shot_timer, obj.rapid_fire_active, obj.rapid_fire_timer,
+            _WEAPONS.index(obj.current_weapon), obj.weapon_switch_timer, *ammo))
+    elif isinstance(obj, Asteroid):
+        parts.append(_KIND.pack(_ASTEROID))
+        parts.append(_ASTEROID_REC.pack(
+            x, y, vx, vy, obj.radius, obj.rotation, obj.rotation_speed,
+            _ASTEROID_TYPES.index(obj.asteroid_type), obj.health, len(obj.vertices)))
+        parts.append(array("d", [c for vertex in obj.vertices for c in vertex]).tobytes())
+    elif isinstance(obj, Shot):
+        target = obj.target
+        parts.append(_KIND.pack(_SHOT))
+        parts.append(_SHOT_REC.pack(
+            x, y, vx, vy, obj.radius, _WEAPONS.index(obj.shot_type), obj.lifetime, obj.damage,
+            obj.homing_power, getattr(obj, "max_turn_rate", 0.0),
+            hasattr(obj, "penetrating"), getattr(obj, "penetrating", False), obj.rotation,
+            index_of.get(id(target), -1) if target is not None and target.alive() else -1))
+    elif isinstance(obj, PowerUp):
+        parts.append(_KIND.pack(_POWERUP))
+        parts.append(_POWERUP_REC.pack(x, y, vx, vy, obj.rotation, obj.lifetime, _POWERUP_TYPES.index(obj.type)))
+    elif isinstance(obj, EnemyShip):
+        parts.append(_KIND.pack(_ENEMY))
+        parts.append(_ENEMY_REC.pack(x, y, vx, vy, obj.rotation, obj.rotation_speed))
+    elif isinstance(obj, Boss):
+        parts.append(_KIND.pack(_BOSS))
+        parts.append(_BOSS_REC.pack(
+            x, y, vx, vy, obj.rotation, obj.boss_level, obj.max_health, obj.health, obj.pulse_timer,
+            obj.target_position.x, obj.target_position.y, obj.movement_timer,
+            _BOSS_PHASES.index(obj.movement_phase), obj.attack_timer, obj.attack_interval,
+            obj.attack_pattern, obj.hit_flash, obj.death_timer, obj.death_particles_emitted))
+    elif isinstance(obj, BossProjectile):
+        parts.append(_KIND.pack(_PROJECTILE))
+        parts.append(_PROJECTILE_REC.pack(
+            x, y, vx, vy, _PROJECTILE_TYPES.index(obj.type), obj.lifetime, obj.damage,
+            obj.rotation, obj.rotation_speed))
+
+
+def _is_stored(obj) -> bool:
+    """Return True for entities that carry gameplay state."""
+    return hasattr(obj, "position") and not isinstance(obj, Particle)
+
+
+def snapshot_world(world) -> bytes:
+    """Return the gameplay state of `world` as a compact binary blob."""
+    field = world.asteroid_field
+    entities = [obj for obj in world.updatable if _is_stored(obj)]
+    index_of = {id(obj): i for i, obj in enumerate(entities)}
+
+    parts = [
+        _HEADER.pack(
+            SNAPSHOT_MAGIC, SNAPSHOT_VERSION, world.tick, world.time, world.score, world.lives, world.level,
+            world.last_spawn_time, world.spawn_interval, world.game_over, world.boss_active,
+            field.spawn_timer, field.asteroid_count, field.spawn_interval),
+    ]
+    for version, internal, gauss_next in rng.get_state().values():
+        parts.append(_RNG.pack(version, gauss_next is not None, gauss_next or 0.0, len(internal)))
+        parts.append(array("I", internal).tobytes())
+    parts.append(_COUNT.pack(len(entities)))
+    for obj in entities:
+        _pack_entity(parts, obj, index_of)
+    return b"".join(parts)
+
+
+def _new(cls, x, y, vx, vy, radius):
+    """Create an entity without running its constructor."""
+    obj = cls.__new__(cls)
+    pygame.sprite.Sprite.__init__(obj)
+    obj.position = pygame.Vector2(x, y)
+    obj.velocity = pygame.Vector2(vx, vy)
+    obj.radius = radius
+    obj.rotation = 0
+    return obj
+
+
+def _register(obj, groups):
+    """Add a restored entity to its sprite groups."""
+    for group in groups:
+        group.add(obj)
+
+
+def restore_world(world, data: bytes) -> None:
+    """Replace the gameplay state of `world` with a `snapshot_world` blob.
+
+    Entity classes must be bound to the world's groups (see
+    `GameWorld.bind`); enemy ships go to ``world.enemy_groups`` when
+    present, otherwise to ``world.updatable`` and ``world.drawable``.
+    """
+    view = memoryview(data)
+    try:
+        header = _HEADER.unpack_from(view, 0)
+    except struct.error as e:
+        raise SnapshotError(f"Snapshot too short: {e}") from e
+    if header[0] != SNAPSHOT_MAGIC or header[1] != SNAPSHOT_VERSION:
+        raise SnapshotError(f"Not a version {SNAPSHOT_VERSION} world snapshot")
+    offset = _HEADER.size
+
+    states = {}
+    for name in rng.GAMEPLAY_STREAMS:
+        rng_version, has_gauss, gauss_next, state_len = _RNG.unpack_from(view, offset)
+        offset += _RNG.size
+        internal = array("I")
+        internal.frombytes(view[offset:offset + 4 * state_len])
+        offset += 4 * state_len
+        states[name] = (rng_version, tuple(internal), gauss_next if has_gauss else None)
+    (count,) = _COUNT.unpack_from(view, offset)
+    offset += _COUNT.size
+
+    # Drop current entities without kill() side effects (explosions, sounds)
+    for obj in list(world.updatable):
+        pygame.sprite.Sprite.kill(obj)
+    for group in (getattr(world, "particles", None), getattr(world, "drawable", None)):
+        if group is not None:
+            for obj in list(group):
+                if isinstance(obj, Particle):
+                    pygame.sprite.Sprite.kill(obj)
+
+    (_, _, world.tick, world.time, world.score, world.lives, world.level, world.last_spawn_time,
+     world.spawn_interval, world.game_over, world.boss_active, spawn_timer, asteroid_count,
+     field_interval) = header
+    field = world.asteroid_field
+    field.spawn_timer, field.asteroid_count, field.spawn_interval = spawn_timer, asteroid_count, field_interval
+
+    enemy_groups = getattr(world, "enemy_groups", (world.updatable, world.drawable))
+    entities = []
+    targets = []
+    world.enemies = []
+    world.boss = None
+    for _ in range(count):
+        (kind,) = _KIND.unpack_from(view, offset)
+        offset += _KIND.size
+        if kind == _PLAYER:
+            rec = _PLAYER_REC.unpack_from(view, offset)
+            offset += _PLAYER_REC.size
+            obj = world.player
+            obj.position = pygame.Vector2(rec[0], rec[1])
+            obj.velocity = pygame.Vector2(rec[2], rec[3])
+            (obj.rotation, obj.shoot_timer, obj.invincible, obj.invincible_timer, obj.shield_active,
+             obj.shield_timer, obj.triple_shot_active, obj.triple_shot_timer, obj.rapid_fire_active,
+             obj.rapid_fire_timer) = rec[4:14]
+            obj.current_weapon = _WEAPONS[rec[14]]
+            obj.weapon_switch_timer = rec[15]
+            obj.weapons = dict(zip(_WEAPONS, rec[16:20]))
+            _register(obj, Player.containers)
+        elif kind == _ASTEROID:
+            rec = _ASTEROID_REC.unpack_from(view, offset)
+            offset += _ASTEROID_REC.size
+            obj = _new(Asteroid, *rec[:5])
+            obj.rotation, obj.rotation_speed = rec[5], rec[6]
+            obj.asteroid_type = _ASTEROID_TYPES[rec[7]]
+            obj.health = rec[8]
+            coords = array("d")
+            coords.frombytes(view[offset:offset + 16 * rec[9]])
+            offset += 16 * rec[9]
+            obj.vertices = list(zip(coords[::2], coords[1::2]))
+            obj.image = pygame.Surface((obj.radius * 2, obj.radius * 2), pygame.SRCALPHA)
+            obj.rect = obj.image.get_rect(center=(obj.position.x, obj.position.y))
+            _register(obj, Asteroid.containers)
+        elif kind == _SHOT:
+            rec = _SHOT_REC.unpack_from(view, offset)
+            offset += _SHOT_REC.size
+            obj = _new(Shot, *rec[:5])
+            obj.shot_type = _WEAPONS[rec[5]]
+            obj.lifetime, obj.damage, obj.homing_power = rec[6], rec[7], rec[8]
+            if obj.shot_type == C.WEAPON_MISSILE:
+                obj.max_turn_rate = rec[9]
+            if rec[10]:
+                obj.penetrating = rec[11]
+            obj.rotation = rec[12]
+            obj.color = C.WEAPON_COLORS[obj.shot_type]
+            obj.target = None
+            targets.append((obj, rec[13]))
+            _register(obj, Shot.containers)
+        elif kind == _POWERUP:
+            rec = _POWERUP_REC.unpack_from(view, offset)
+            offset += _POWERUP_REC.size
+            obj = _new(PowerUp, *rec[:4], C.POWERUP_RADIUS)
+            obj.rotation, obj.lifetime = rec[4], rec[5]
+            obj.type = _POWERUP_TYPES[rec[6]]
+            obj.color = C.POWERUP_COLORS[obj.type]
+            _register(obj, PowerUp.containers)
+        elif kind == _ENEMY:
+            rec = _ENEMY_REC.unpack_from(view, offset)
+            offset += _ENEMY_REC.size
+            obj = _new(EnemyShip, *rec[:4], C.PLAYER_RADIUS)
+            obj.rotation, obj.rotation_speed = rec[4], rec[5]
+            _register(obj, enemy_groups)
+            world.enemies.append(obj)
+        elif kind == _BOSS:
+            rec = _BOSS_REC.unpack_from(view, offset)
+            offset += _BOSS_REC.size
+            obj = _new(Boss, *rec[:4], C.BOSS_RADIUS)
+            (obj.rotation, obj.boss_level, obj.max_health, obj.health, obj.pulse_timer) = rec[4:9]
+            obj.target_position = pygame.Vector2(rec[9], rec[10])
+            obj.movement_timer = rec[11]
+            obj.movement_phase = _BOSS_PHASES[rec[12]]
+            (obj.attack_timer, obj.attack_interval, obj.attack_pattern, obj.hit_flash, obj.death_timer,
+             obj.death_particles_emitted) = rec[13:19]
+            obj.color = C.BOSS_COLOR
+            _register(obj, Boss.containers)
+            world.boss = obj
+        elif kind == _PROJECTILE:
+            rec = _PROJECTILE_REC.unpack_from(view, offset)
+            offset += _PROJECTILE_REC.size
+            obj = _new(BossProjectile, *rec[:4], C.BOSS_PROJECTILE_RADIUS)
+            obj.type = _PROJECTILE_TYPES[rec[4]]
+            obj.lifetime, obj.damage, obj.rotation, obj.rotation_speed = rec[5:9]
+            obj.color = C.BOSS_PROJECTILE_COLORS.get(obj.type, C.BOSS_COLOR)
+            _register(obj, BossProjectile.containers)
+        else:
+            raise SnapshotError(f"Unknown entity kind {kind}")
+        entities.append(obj)
+
+    for shot, index in targets:
+        shot.target = entities[index] if index >= 0 else None
+
+    rng.set_state(states)
@@ -1,19 +1,28 @@
 """Starfield background rendering utilities."""
 
 import math
-import random
 import pygame
 import modul.constants as C
+from modul import rng
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is listed in requirements.txt
+    np = None
+
+_rng = rng.stream(rng.STARS)
+# Pixel offsets of a filled circle, per radius
+_CIRCLE_OFFSETS = {}
 
 
 class Star:
     """Represents a twinkling star."""
     def __init__(self):
         """Initialize star with random properties."""
-        self.position = pygame.Vector2(random.randint(0, C.SCREEN_WIDTH), random.randint(0, C.SCREEN_HEIGHT))
-        self.size = random.choice(C.STAR_SIZES)
-        self.color = random.choice(C.STAR_COLORS)
-        self.twinkle_timer = random.random() * 2 * math.pi
+        self.position = pygame.Vector2(_rng.randint(0, C.SCREEN_WIDTH), _rng.randint(0, C.SCREEN_HEIGHT))
+        self.size = _rng.choice(C.STAR_SIZES)
+        self.color = _rng.choice(C.STAR_COLORS)
+        self.twinkle_timer = _rng.random() * 2 * math.pi
         # Cache parsed color for safe use in update()
         try:
             color_obj = pygame.Color(self.color)
@@ -36,93 +45,227 @@ class Star:
 
 
 class Starfield:
-    """Manages background starfield."""
-    def __init__(self):
-        """Initialize starfield with stars."""
-        self.stars = [Star() for _ in range(C.STAR_COUNT)]
+    """Manages background starfield.
+
+    Star state lives in NumPy arrays (positions, sizes, colours, twinkle
+    phases), and drawing writes the pixels of every star in one vectorized
+    assignment through `pygame.surfarray`. Stars do not move, so the pixels
+    each star covers are computed once per surface size. Without numpy the
+    field falls back to one `Star` object per star.
+    """
+    def __init__(self, count=None):
+        """Initialize starfield with `count` stars (default `STAR_COUNT`)."""
+        self.count = C.STAR_COUNT if count is None else count
+        self._stamps = {}
+        if np is None:
+            self.stars = [Star() for _ in range(self.count)]
+            return
+        self.stars = None
+        # Derived from the stars stream so seeded runs get the same sky
+        generator = np.random.default_rng(_rng.getrandbits(64))
+        self.positions = np.column_stack((
+            generator.integers(0, C.SCREEN_WIDTH, self.count, endpoint=True),
+            generator.integers(0, C.SCREEN_HEIGHT, self.count, endpoint=True),
+        )).astype(np.intp)
+        weights = np.array(C.STAR_SIZE_WEIGHTS, dtype=float)
+        self.sizes = generator.choice(C.STAR_SIZES, size=self.count, p=weights / weights.sum())
+        palette = np.array([tuple(pygame.Color(color))[:3] for color in C.STAR_COLORS], dtype=np.float32)
+        self.base_colors = palette[generator.integers(0, len(palette), self.count)]
+        self.phases = generator.random(self.count) * 2 * math.pi
+        self.brightness = np.abs(np.sin(self.phases)).astype(np.float32)
+
+    def __len__(self):
+        """Number of stars."""
+        return self.count
 
     def update(self, dt):
         """Update all stars."""
-        for star in self.stars:
-            star.update(dt)
+        if self.stars is not None:
+            for star in self.stars:
+                star.update(dt)
+            return
+        self.phases += dt
+        # |sin| repeats every pi; wrapping keeps the phases precise
+        np.remainder(self.phases, math.pi, out=self.phases)
+        self.brightness[:] = np.abs(np.sin(self.phases))
+
+    def _stamp(self, size):
+        """Return (xs, ys, owner) for the on-screen pixels of every star.
+
+        `owner` maps each pixel to its star; pixels are ordered by star so
+        overlapping stars cover each other as if drawn one after another.
+        """
+        stamp = self._stamps.get(size)
+        if stamp is not None:
+            return stamp
+        width, height = size
+        xs, ys, owners = [], [], []
+        for radius in np.unique(self.sizes):
+            offsets = _circle_offsets(int(radius))
+            (members,) = np.nonzero(self.sizes == radius)
+            xs.append((self.positions[members, 0, None] + offsets[:, 0]).ravel())
+            ys.append((self.positions[members, 1, None] + offsets[:, 1]).ravel())
+            owners.append(np.repeat(members, len(offsets)))
+        xs, ys, owners = np.concatenate(xs), np.concatenate(ys), np.concatenate(owners)
+        order = np.argsort(owners, kind="stable")
+        xs, ys, owners = xs[order], ys[order], owners[order]
+        visible = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        stamp = self._stamps[size] = (xs[visible], ys[visible], owners[visible])
+        return stamp
 
     def draw(self, screen):
         """Draw all stars."""
-        for star in self.stars:
-            star.draw(screen)
+        if self.stars is not None:
+            for star in self.stars:
+                star.draw(screen)
+            return
+        colors = (self.base_colors * self.brightness[:, None]).astype(np.uint8)
+        if screen.get_bytesize() < 3:
+            # surfarray cannot address the channels of low-depth surfaces
+            for position, size, color in zip(self.positions.tolist(), self.sizes.tolist(), colors.tolist()):
+                pygame.draw.circle(screen, color, position, size)
+            return
+        xs, ys, owners = self._stamp(screen.get_size())
+        _write_pixels(screen, xs, ys, colors, owners)
+
+
+def _write_pixels(screen, xs, ys, colors, owners):
+    """Set pixel (xs[i], ys[i]) to colors[owners[i]] on a 24 or 32-bit surface.
+
+    Later entries overwrite earlier ones, as if drawn one after another.
+    """
+    if screen.get_bytesize() == 4:
+        # Pack whole pixels in the surface's own format and write them
+        # through the flat pixel buffer: one store per pixel
+        red, green, blue, _ = screen.get_shifts()
+        wide = colors.astype(np.uint32)
+        packed = (wide[:, 0] << red) | (wide[:, 1] << green) | (wide[:, 2] << blue) | np.uint32(screen.get_masks()[3])
+        buffer = screen.get_buffer()
+        try:
+            pixels = np.frombuffer(buffer, dtype=np.uint32)
+            pixels[ys * (screen.get_pitch() // 4) + xs] = packed[owners]
+            del pixels
+        finally:
+            del buffer
+        return
+    pixels = pygame.surfarray.pixels3d(screen)
+    try:
+        pixels[xs, ys] = colors[owners]
+    finally:
+        del pixels
+
+
+def _circle_offsets(radius):
+    """Pixel offsets `pygame.draw.circle` fills for `radius`, relative to the center."""
+    offsets = _CIRCLE_OFFSETS.get(radius)
+    if offsets is None:
+        center = radius + 1
+        surface = pygame.Surface((center * 2 + 1, center * 2 + 1))
+        pygame.draw.circle(surface, (255, 255, 255), (center, center), radius)
+        # array2d is indexed [x, y], so each row is an (x, y) pair
+        offsets = np.argwhere(pygame.surfarray.array2d(surface) != 0) - center
+        _CIRCLE_OFFSETS[radius] = offsets
+    return offsets
 
 
 class MenuStarfield:
-    """Manages animated starfield for menus."""
+    """Manages animated starfield for menus.
+
+    Stars fly outwards from the screen center. `stars` is an array of
+    ``[x, y, z, brightness]`` rows; all stars move, leave and respawn in
+    vectorized steps, and are drawn by writing their pixels in one
+    assignment. Without numpy `stars` is a list of such lists.
+    """
+    # Stars are drawn as circles of this radius (3 * the depth scale, truncated)
+    STAR_RADIUS = 2
+
     def __init__(self, num_stars=150):
         """Initialize menu starfield."""
-        self.stars = []
         self.speed = 0.4
-        self.respawn_counter = 0
-        self.max_respawns_per_frame = 1
-        self.respawn_delay = 0.2
-        self.respawn_delay_max = 0.2
-        for _ in range(num_stars):
-            if random.random() < 0.7:
-                distance = random.uniform(50, C.SCREEN_WIDTH / 2)
-                angle = random.random() * 2 * math.pi
-                x = C.SCREEN_WIDTH / 2 + math.cos(angle) * distance
-                y = C.SCREEN_HEIGHT / 2 + math.sin(angle) * distance
-            else:
-                distance = random.random() * 50
-                angle = random.random() * 2 * math.pi
-                x = C.SCREEN_WIDTH / 2 + math.cos(angle) * distance
-                y = C.SCREEN_HEIGHT / 2 + math.sin(angle) * distance
-            z = random.randint(1, 8)
-            brightness = random.uniform(100, 255)
-            self.stars.append([x, y, z, brightness])
+        if np is None:
+            self.stars = [self._new_star(spawn=False) for _ in range(num_stars)]
+            return
+        self._generator = np.random.default_rng(_rng.getrandbits(64))
+        generator = self._generator
+        # 70% spread over the screen, the rest close to the center
+        distance = np.where(generator.random(num_stars) < 0.7,
+                            generator.uniform(50, C.SCREEN_WIDTH / 2, num_stars),
+                            generator.random(num_stars) * 50)
+        self.stars = np.empty((num_stars, 4))
+        self._place(np.arange(num_stars), distance)
+
+    def _place(self, indices, distance):
+        """Put the stars at `indices` at `distance` from the center in random directions."""
+        generator = self._generator
+        angle = generator.random(len(indices)) * 2 * math.pi
+        self.stars[indices, 0] = C.SCREEN_WIDTH / 2 + np.cos(angle) * distance
+        self.stars[indices, 1] = C.SCREEN_HEIGHT / 2 + np.sin(angle) * distance
+        self.stars[indices, 2] = generator.integers(1, 8, len(indices), endpoint=True)
+        self.stars[indices, 3] = generator.uniform(100, 255, len(indices))
+
+    @staticmethod
+    def _new_star(spawn=True):
+        """Return a star near the center (`spawn`) or anywhere on the screen."""
+        if spawn:
+            distance = _rng.uniform(5, 15)
+        elif _rng.random() < 0.7:
+            distance = _rng.uniform(50, C.SCREEN_WIDTH / 2)
+        else:
+            distance = _rng.random() * 50
+        angle = _rng.random() * 2 * math.pi
+        return [C.SCREEN_WIDTH / 2 + math.cos(angle) * distance, C.SCREEN_HEIGHT / 2 + math.sin(angle) * distance,
+                _rng.randint(1, 8), _rng.uniform(100, 255)]
 
     def update(self, dt):
-        """Update starfield animation."""
+        """Move stars outwards and respawn every star that left the screen."""
         center_x = C.SCREEN_WIDTH / 2
         center_y = C.SCREEN_HEIGHT / 2
-        stars_to_respawn = []
-        for star in self.stars:
-            dx = star[0] - center_x
-            dy = star[1] - center_y
-            speed_factor = (star[2] / 2) * self.speed * dt * 60
-            star[0] += dx * speed_factor * 0.01
-            star[1] += dy * speed_factor * 0.01
-            if star[0] < -50 or star[0] > C.SCREEN_WIDTH + 50 or star[1] < -50 or star[1] > C.SCREEN_HEIGHT + 50:
-                stars_to_respawn.append(star)
-        self.respawn_delay -= dt
-        if self.respawn_delay <= 0 and stars_to_respawn:
-            self.respawn_delay = self.respawn_delay_max
-            star = stars_to_respawn.pop(0)
-            angle = random.random() * 2 * math.pi
-            distance = random.uniform(5, 15)
-            star[0] = center_x + math.cos(angle) * distance
-            star[1] = center_y + math.sin(angle) * distance
-            star[2] = random.randint(1, 8)
-            if len(star) >= 4:
-                star[3] = random.uniform(100, 255)
+        step = self.speed * dt * 60 * 0.01 / 2
+        if np is None:
+            for i, star in enumerate(self.stars):
+                speed_factor = star[2] * step
+                star[0] += (star[0] - center_x) * speed_factor
+                star[1] += (star[1] - center_y) * speed_factor
+                if not (-50 <= star[0] <= C.SCREEN_WIDTH + 50 and -50 <= star[1] <= C.SCREEN_HEIGHT + 50):
+                    self.stars[i] = self._new_star()
+            return
+        stars = self.stars
+        speed_factor = stars[:, 2] * step
+        stars[:, 0] += (stars[:, 0] - center_x) * speed_factor
+        stars[:, 1] += (stars[:, 1] - center_y) * speed_factor
+        outside = ((stars[:, 0] < -50) | (stars[:, 0] > C.SCREEN_WIDTH + 50)
+                   | (stars[:, 1] < -50) | (stars[:, 1] > C.SCREEN_HEIGHT + 50))
+        (leaving,) = np.nonzero(outside)
+        if len(leaving):
+            self._place(leaving, self._generator.uniform(5, 15, len(leaving)))
 
     def draw(self, screen):
         """Draw starfield on screen."""
-        for star in self.stars:
-            try:
-                if len(star) >= 4:
-                    x, y, z, brightness = star[0], star[1], star[2], star[3]
-                    if not all(isinstance(val, (int, float)) for val in [x, y, z, brightness]):
-                        continue
-                    scale = 200 / (z + 200)
-                    screen_x = C.SCREEN_WIDTH / 2 + (x - C.SCREEN_WIDTH / 2) * scale
-                    screen_y = C.SCREEN_HEIGHT / 2 + (y - C.SCREEN_HEIGHT / 2) * scale
-                    size = max(1, int(3 * scale))
-                    color_value = min(255, int(brightness * scale))
-                    color = (color_value, color_value, color_value)
-                    if (
-                        0 <= screen_x < C.SCREEN_WIDTH
-                        and 0 <= screen_y < C.SCREEN_HEIGHT
-                        and isinstance(screen_x, (int, float))
-                        and isinstance(screen_y, (int, float))
-                    ):
-                        pygame.draw.circle(screen, color, (int(screen_x), int(screen_y)), max(1, size))
-            except (IndexError, TypeError, ValueError) as e:
-                print(f"Skipped faulty star: {star}, Error: {e}")
-                continue
+        center_x = C.SCREEN_WIDTH / 2
+        center_y = C.SCREEN_HEIGHT / 2
+        if np is None or screen.get_bytesize() < 3:
+            for x, y, z, brightness in self.stars:
+                scale = 200 / (z + 200)
+                screen_x = center_x + (x - center_x) * scale
+                screen_y = center_y + (y - center_y) * scale
+                if 0 <= screen_x < C.SCREEN_WIDTH and 0 <= screen_y < C.SCREEN_HEIGHT:
+                    value = min(255, int(brightness * scale))
+                    pygame.draw.circle(screen, (value, value, value), (int(screen_x), int(screen_y)),
+                                       max(1, int(3 * scale)))
+            return
+        stars = self.stars
+        scale = 200 / (stars[:, 2] + 200)
+        screen_x = center_x + (stars[:, 0] - center_x) * scale
+        screen_y = center_y + (stars[:, 1] - center_y) * scale
+        (visible,) = np.nonzero((screen_x >= 0) & (screen_x < C.SCREEN_WIDTH)
+                                & (screen_y >= 0) & (screen_y < C.SCREEN_HEIGHT))
+        values = np.minimum(255, (stars[visible, 3] * scale[visible]).astype(np.intp)).astype(np.uint8)
+        colors = np.repeat(values[:, None], 3, axis=1)
+
+        offsets = _circle_offsets(self.STAR_RADIUS)
+        xs = (screen_x[visible].astype(np.intp)[:, None] + offsets[:, 0]).ravel()
+        ys = (screen_y[visible].astype(np.intp)[:, None] + offsets[:, 1]).ravel()
+        owners = np.repeat(np.arange(len(visible)), len(offsets))
+        width, height = screen.get_size()
+        inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        _write_pixels(screen, xs[inside], ys[inside], colors, owners[inside])
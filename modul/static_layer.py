@@ -0,0 +1,77 @@
+"""Pre-rendered layers for screens whose content rarely changes.
+
+Credits, help, tutorial pages, the highscore list and the statistics
+dashboard used to render every text line each frame although their content
+only changes with the language or the underlying data. A `StaticLayer`
+runs the screen's drawing code once, recording the rendered surfaces and
+their positions, and replays them with a single `blits` call until the key
+describing the content changes.
+
+The pieces are kept separate rather than flattened into one transparent
+surface: blending a mostly empty screen-sized surface costs more than
+blending the few text surfaces it would hold.
+"""
+
+import pygame
+
+# One opaque black surface per screen size, blended at the fade's alpha
+_backdrops = {}
+
+
+def draw_backdrop(screen, alpha):
+    """Darken `screen` with black at `alpha` using a cached surface."""
+    size = screen.get_size()
+    backdrop = _backdrops.get(size)
+    if backdrop is None:
+        backdrop = _backdrops[size] = pygame.Surface(size)
+    backdrop.set_alpha(int(alpha))
+    screen.blit(backdrop, (0, 0))
+
+
+class StaticLayer:
+    """Surfaces drawn once and replayed until their key changes.
+
+    `render(layer)` draws the content by calling `layer.blit(surface, dest)`
+    exactly as it would on the screen.
+    """
+
+    def __init__(self, render):
+        """Record the layer with `render` on first use."""
+        self.render = render
+        self.pieces = None
+        self.key = None
+        self.alpha = 255
+        self.renders = 0
+
+    def blit(self, source, dest):
+        """Record `source` at `dest` (a position or rect), like `Surface.blit`."""
+        if isinstance(dest, pygame.Rect):
+            dest = dest.topleft
+        self.pieces.append((source, dest))
+        return source.get_rect(topleft=dest)
+
+    def get(self, key):
+        """Return the (surface, position) pieces for `key`."""
+        if self.pieces is None or key != self.key:
+            self.pieces = []
+            self.alpha = 255
+            self.render(self)
+            self.key = key
+            self.renders += 1
+        return self.pieces
+
+    def draw(self, screen, key, offset=None, alpha=255):
+        """Blit the layer for `key`, shifted by `offset` and faded to `alpha`."""
+        pieces = self.get(key)
+        if alpha != self.alpha:
+            for source, _ in pieces:
+                source.set_alpha(alpha)
+            self.alpha = alpha
+        if offset is not None:
+            dx, dy = offset
+            pieces = [(source, (x + dx, y + dy)) for source, (x, y) in pieces]
+        screen.blits(pieces, doreturn=False)
+
+    def invalidate(self):
+        """Render the layer again on its next use."""
+        self.pieces = None
@@ -4,6 +4,7 @@ import pygame
 from modul.constants import (MENU_BACKGROUND_ALPHA, MENU_TITLE_COLOR,
                              MENU_TITLE_FONT_SIZE, MENU_TRANSITION_SPEED,
                              SCREEN_HEIGHT, SCREEN_WIDTH)
+from modul.static_layer import StaticLayer, draw_backdrop
 try:
     from modul.i18n import gettext
 except (ImportError, ModuleNotFoundError):  # pragma: no cover - fallback when i18n unavailable
@@ -35,6 +36,12 @@ class StatsDashboard:
         self.small_font = pygame.font.Font(None, 24)
         self.background_alpha = 0
         self.fade_in = False
+        # Everything but the ticking session duration, rendered per stats change
+        self._layer = StaticLayer(self._render_stats)
+        # Bar surfaces per (size, colours, filled width)
+        self._bars = {}
+        self._session_time_surface = None
+        self._session_time_text = None
 
     def activate(self):
         """Activate the stats dashboard."""
@@ -62,14 +69,29 @@ class StatsDashboard:
     def draw(self, screen):
         """Draw the stats dashboard."""
         # Semi-transparent background
-        background = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-        background.fill((0, 0, 0, self.background_alpha))
-        screen.blit(background, (0, 0))
+        draw_backdrop(screen, self.background_alpha)
 
+        stats = self.session_stats.get_summary()
+        session_duration = stats.pop('session_duration')
+        # The translated title identifies the language the layer was rendered in
+        key = (gettext("session_statistics"), tuple(stats.items()), self.session_stats.get_accuracy())
+        self._layer.draw(screen, key)
+
+        # Session duration
+        session_time = self.session_stats.format_time(session_duration)
+        time_text = gettext("session_duration_format").format(time=session_time)
+        if time_text != self._session_time_text:
+            self._session_time_surface = self.section_font.render(time_text, True, (100, 200, 255))
+            self._session_time_text = time_text
+        time_rect = self._session_time_surface.get_rect(center=(SCREEN_WIDTH / 2, 560))
+        screen.blit(self._session_time_surface, time_rect)
+
+    def _render_stats(self, layer):
+        """Render title, statistics, bars and footer onto the layer."""
         # Title
         title_surf = self.title_font.render(gettext("session_statistics"), True, pygame.Color(MENU_TITLE_COLOR))
         title_rect = title_surf.get_rect(center=(SCREEN_WIDTH / 2, 60))
-        screen.blit(title_surf, title_rect)
+        layer.blit(title_surf, title_rect)
 
         stats = self.session_stats.get_summary()
 
@@ -77,7 +99,7 @@ class StatsDashboard:
         left_x = SCREEN_WIDTH / 4
         y_pos = 140
 
-        self._draw_section(screen, gettext("game_stats"), left_x, y_pos)
+        self._draw_section(layer, gettext("game_stats"), left_x, y_pos)
         y_pos += 50
 
         game_stats = [
@@ -89,14 +111,14 @@ class StatsDashboard:
         ]
 
         for label, value in game_stats:
-            self._draw_stat_line(screen, label, value, y_pos)
+            self._draw_stat_line(layer, label, value, y_pos)
             y_pos += 35
 
         # Right column - Combat Statistics
         right_x = SCREEN_WIDTH * 3 / 4
         y_pos = 140
 
-        self._draw_section(screen, gettext("combat_stats"), right_x, y_pos)
+        self._draw_section(layer, gettext("combat_stats"), right_x, y_pos)
         y_pos += 50
 
         combat_stats = [
@@ -108,26 +130,18 @@ class StatsDashboard:
         ]
 
         for label, value in combat_stats:
-            self._draw_stat_line(screen, label, value, y_pos)
+            self._draw_stat_line(layer, label, value, y_pos)
             y_pos += 35
 
         # Accuracy and efficiency bars
         y_pos = 400
-        self._draw_progress_bars(screen, stats, y_pos)
-
-        # Session duration
-        y_pos = 560
-        session_time = self.session_stats.format_time(stats['session_duration'])
-        time_text = gettext("session_duration_format").format(time=session_time)
-        time_surf = self.section_font.render(time_text, True, (100, 200, 255))
-        time_rect = time_surf.get_rect(center=(SCREEN_WIDTH / 2, y_pos))
-        screen.blit(time_surf, time_rect)
+        self._draw_progress_bars(layer, stats, y_pos)
 
         # Footer instructions
         footer_text = gettext("press_esc_space_return")
         footer_surf = self.small_font.render(footer_text, True, (150, 150, 150))
         footer_rect = footer_surf.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT - 30))
-        screen.blit(footer_surf, footer_rect)
+        layer.blit(footer_surf, footer_rect)
 
     def _draw_section(self, screen, title, x, y):
         """Draw a section header."""
@@ -195,20 +209,32 @@ class StatsDashboard:
         perf_rect = perf_surf.get_rect(center=(center_x, y + bar_height / 2))
         screen.blit(perf_surf, perf_rect)
 
-    def _draw_bar(self, screen, x, y, width, height, value, max_value, start_color, end_color):
-        """Draw a progress bar with gradient."""
-        # Background
-        pygame.draw.rect(screen, (50, 50, 50), (x, y, width, height))
-        pygame.draw.rect(screen, (100, 100, 100), (x, y, width, height), 2)
-
-        # Fill
-        if max_value > 0:
-            fill_width = (value / max_value) * width
-            if fill_width > 0:
+    def _bar_surface(self, width, height, filled, start_color, end_color):
+        """Return the bar of `width` x `height` with `filled` pixels filled."""
+        key = (width, height, start_color, end_color, filled)
+        bar = self._bars.get(key)
+        if bar is None:
+            bar = pygame.Surface((width, height))
+            # Background
+            bar.fill((50, 50, 50))
+            pygame.draw.rect(bar, (100, 100, 100), (0, 0, width, height), 2)
+
+            # Fill
+            if filled > 0:
                 # Simple gradient effect
-                progress = value / max_value
+                progress = filled / width
                 r = int(start_color[0] + (end_color[0] - start_color[0]) * progress)
                 g = int(start_color[1] + (end_color[1] - start_color[1]) * progress)
                 b = int(start_color[2] + (end_color[2] - start_color[2]) * progress)
 
-                pygame.draw.rect(screen, (r, g, b), (x, y, fill_width, height))
+                pygame.draw.rect(bar, (r, g, b), (0, 0, filled, height))
+            self._bars[key] = bar
+        return bar
+
+    def _draw_bar(self, screen, x, y, width, height, value, max_value, start_color, end_color):
+        """Draw a progress bar with gradient."""
+        filled = 0
+        if max_value > 0:
+            # Bars are cached per whole filled pixel
+            filled = max(0, min(width, round(value / max_value * width)))
+        screen.blit(self._bar_surface(width, height, filled, start_color, end_color), (x, y))
@@ -2,6 +2,7 @@
 
 import pygame
 import modul.constants as C
+from modul.static_layer import StaticLayer
 
 # Ensure `MenuStarfield` is available at module level so tests can patch it
 try:
@@ -162,6 +163,9 @@ class Tutorial:
         self.font_title = pygame.font.Font(None, 48)
         self.font_content = pygame.font.Font(None, 28)
         self.font_navigation = pygame.font.Font(None, 24)
+        # The current page and the navigation, rendered once per page
+        self._page_layer = StaticLayer(self._render_page)
+        self._navigation_layer = StaticLayer(self._render_navigation)
 
         # Use the module-level `MenuStarfield` symbol so tests can patch it.
         if MenuStarfield is None:
@@ -229,16 +233,19 @@ class Tutorial:
             progress = self.transition_timer / self.transition_duration
             alpha = int(255 * (1 - abs(progress - 0.5) * 2))
 
+        page = self.pages[self.current_page]
+        # Pages fade through the transition as a whole
+        self._page_layer.draw(screen, (self.current_page, page["title"]), alpha=alpha)
+        self._navigation_layer.draw(screen, (self.current_page, len(self.pages), gettext("tutorial_nav")))
+
+    def _render_page(self, layer):
+        """Render the current page's title and content onto `layer`."""
         page = self.pages[self.current_page]
         y_offset = 80
 
-        title_color = (100, 200, 255) if alpha == 255 else (100, 200, 255, alpha)
-        title_surface = self.font_title.render(page["title"], True, title_color)
+        title_surface = self.font_title.render(page["title"], True, (100, 200, 255))
         title_rect = title_surface.get_rect(center=(C.SCREEN_WIDTH / 2, y_offset))
-
-        if alpha < 255:
-            title_surface.set_alpha(alpha)
-        screen.blit(title_surface, title_rect)
+        layer.blit(title_surface, title_rect)
 
         y_offset += 80
 
@@ -250,7 +257,7 @@ class Tutorial:
             if (line.startswith("[") and "]" in line) or (
                 ":" in line and any(weapon in line for weapon in ["STANDARD", "LASER", "ROCKET", "SHOTGUN"])
             ):
-                self.draw_colored_line(screen, line, C.SCREEN_WIDTH // 2, y_offset)
+                self.draw_colored_line(layer, line, C.SCREEN_WIDTH // 2, y_offset)
             else:
                 color = (255, 255, 255)
 
@@ -275,39 +282,40 @@ class Tutorial:
                     color = (200, 200, 200)
 
                 content_surface = self.font_content.render(line, True, color)
-                if alpha < 255:
-                    content_surface.set_alpha(alpha)
-
                 content_rect = content_surface.get_rect(center=(C.SCREEN_WIDTH / 2, y_offset))
-                screen.blit(content_surface, content_rect)
+                layer.blit(content_surface, content_rect)
 
             y_offset += 35
 
+    def _render_navigation(self, layer):
+        """Render page number, navigation hint and progress bar onto `layer`."""
         nav_y = C.SCREEN_HEIGHT - 80
 
         page_info = f"Page {self.current_page + 1} of {len(self.pages)}"
         page_surface = self.font_navigation.render(page_info, True, (150, 150, 150))
         page_rect = page_surface.get_rect(center=(C.SCREEN_WIDTH / 2, nav_y))
-        screen.blit(page_surface, page_rect)
+        layer.blit(page_surface, page_rect)
 
         nav_text = gettext("tutorial_nav")
         nav_surface = self.font_navigation.render(nav_text, True, (100, 100, 100))
         nav_rect = nav_surface.get_rect(center=(C.SCREEN_WIDTH / 2, nav_y + 30))
-        screen.blit(nav_surface, nav_rect)
+        layer.blit(nav_surface, nav_rect)
 
         progress_width = 300
         progress_height = 4
         progress_x = (C.SCREEN_WIDTH - progress_width) // 2
         progress_y = nav_y - 30
 
-        pygame.draw.rect(screen, (50, 50, 50), (progress_x, progress_y, progress_width, progress_height))
+        progress_bar = pygame.Surface((progress_width, progress_height))
+        progress_bar.fill((50, 50, 50))
 
         current_progress = (self.current_page + 1) / len(self.pages)
         progress_fill_width = int(progress_width * current_progress)
-        pygame.draw.rect(screen, (100, 200, 255), (progress_x, progress_y, progress_fill_width, progress_height))
+        progress_bar.fill((100, 200, 255), (0, 0, progress_fill_width, progress_height))
+        layer.blit(progress_bar, (progress_x, progress_y))
 
     def draw_colored_line(self, screen, line, x, y):
-        """Render a colored title/content line used in tutorial pages."""
+        """Render a colored title/content line onto a tutorial page layer."""
         if line.startswith("[") and "]" in line:
             bracket_end = line.find("]") + 1
             name_part = line[:bracket_end]
@@ -1,6 +1,5 @@
 """Tests for achievement notification behavior and manager."""
 
-import time
 from unittest.mock import MagicMock
 
 import pygame
@@ -55,7 +54,7 @@ class TestAchievementNotification:
     def test_notification_update_display_phase(self):
         """Test notification stays visible during display phase"""
         notification = AchievementNotification("Test", "Description")
-        notification.start_time = time.time() - 2.0  # Simulate 2 seconds elapsed
+        notification.elapsed = 2.0  # Simulate 2 seconds elapsed
 
         result = notification.update(0.1)
 
@@ -66,7 +65,7 @@ class TestAchievementNotification:
     def test_notification_update_fade_out(self):
         """Test notification fades out at the end"""
         notification = AchievementNotification("Test", "Description")
-        notification.start_time = time.time() - 3.5  # Near end of display
+        notification.elapsed = 3.5  # Near end of display
 
         result = notification.update(0.1)
 
@@ -77,7 +76,7 @@ class TestAchievementNotification:
     def test_notification_update_expired(self):
         """Test notification returns False when expired"""
         notification = AchievementNotification("Test", "Description")
-        notification.start_time = time.time() - 5.0  # Past display time
+        notification.elapsed = 5.0  # Past display time
 
         result = notification.update(0.1)
 
@@ -125,6 +124,24 @@ class TestAchievementNotification:
 
         notification.draw(screen)  # Should handle partial alpha
 
+    def test_notification_panel_rendered_once_and_faded(self):
+        """Test the panel is rendered on first draw and only its alpha animates"""
+        notification = AchievementNotification("Test", "Description")
+        notification.current_x = 100
+        notification.current_y = 50
+        notification.animation_progress = 1.0
+        screen = pygame.Surface((800, 600))
+        notification.draw(screen)
+        panel = notification._panel
+        opaque = screen.get_at((101, 51))
+        assert opaque == pygame.Color(255, 215, 0)
+
+        screen.fill((0, 0, 0))
+        notification.animation_progress = 0.5
+        notification.draw(screen)
+        assert notification._panel is panel
+        assert 0 < screen.get_at((101, 51)).r < opaque.r
+
 
 class TestAchievementNotificationManager:
     """Test suite for AchievementNotificationManager class"""
@@ -225,7 +242,7 @@ class TestAchievementNotificationManager:
         """Test update removes expired notifications"""
         manager = AchievementNotificationManager()
         notification = AchievementNotification("Test", "Description")
-        notification.start_time = time.time() - 10.0  # Expired
+        notification.elapsed = 10.0  # Expired
         manager.notifications.append(notification)
 
         manager.update(0.1)
@@ -266,6 +283,15 @@ class TestAchievementNotificationManager:
 
         manager.draw(screen)  # Should not raise exception
 
+    def test_manager_shares_fonts_between_notifications(self):
+        """Test notifications reuse the manager's fonts"""
+        manager = AchievementNotificationManager()
+        manager.add_notification("Achievement 1", "Description 1")
+        manager.add_notification("Achievement 2", "Description 2")
+        first, second = manager.notifications
+        assert first.title_font is second.title_font is manager.fonts[0]
+        assert first.desc_font is second.desc_font is manager.fonts[1]
+
     def test_manager_draw_empty(self):
         """Test drawing with no notifications"""
         manager = AchievementNotificationManager()
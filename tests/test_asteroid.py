@@ -266,6 +266,18 @@ class TestEnemyShip:
         # Should not be chasing (velocity should decay)
         # Just verify no crash
 
+    def test_enemyship_slowdown_independent_of_step_rate(self):
+        """Test a distant enemy ship loses the same speed at 60 Hz and 120 Hz steps"""
+        player_pos = pygame.Vector2(5000, 5000)
+        speeds = []
+        for tick_rate in (60, 120):
+            enemy = EnemyShip(100, 100, 50)
+            enemy.velocity = pygame.Vector2(50, 0)
+            for _ in range(tick_rate // 10):
+                enemy.update(1 / tick_rate, player_position=player_pos)
+            speeds.append(enemy.velocity.length())
+        assert speeds[1] == pytest.approx(speeds[0])
+
     def test_enemyship_collides_with(self):
         """Test enemy ship collision detection"""
         enemy = EnemyShip(100, 100, 50)
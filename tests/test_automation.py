@@ -0,0 +1,100 @@
+"""Tests for the local automation server."""
+
+import socket
+import time
+
+import pytest
+
+from modul.automation import AutomationClient, AutomationServer, parse_address
+
+
+def _poll_until(server, count=1, timeout=2.0):
+    """Poll `server` like the frame loop until `count` requests arrived."""
+    requests = []
+    deadline = time.monotonic() + timeout
+    while len(requests) < count and time.monotonic() < deadline:
+        requests.extend(server.poll())
+        time.sleep(0.001)
+    return requests
+
+
+@pytest.fixture
+def server():
+    """A server on a free loopback port."""
+    server = AutomationServer("127.0.0.1:0")
+    yield server
+    server.close()
+
+
+def test_parse_address_accepts_only_loopback():
+    assert parse_address("7777") == (socket.AF_INET, ("127.0.0.1", 7777))
+    assert parse_address("localhost:80") == (socket.AF_INET, ("localhost", 80))
+    with pytest.raises(ValueError):
+        parse_address("0.0.0.0:7777")
+    with pytest.raises(ValueError):
+        parse_address("127.0.0.1:http")
+
+
+def test_poll_returns_without_blocking_when_idle(server):
+    started = time.perf_counter()
+    for _ in range(100):
+        assert server.poll() == []
+    assert time.perf_counter() - started < 0.5
+
+
+def test_requests_are_answered_by_the_caller(server):
+    client = AutomationClient(server.describe())
+    try:
+        request_id = client.send("input", actions={"thrust": True})
+        (request,) = _poll_until(server)
+        assert request.id == request_id
+        assert request.command == "input"
+        assert request.params == {"actions": {"thrust": True}}
+
+        server.reply(request, {"done": True}, payload=b"\x00\x01\x02")
+        response = client.receive()
+        assert response["ok"] and response["result"] == {"done": True}
+        assert response["payload"] == b"\x00\x01\x02"
+
+        client.send("world")
+        (request,) = _poll_until(server)
+        server.reply(request, error="no world")
+        assert client.receive() == {"id": request.id, "ok": False, "error": "no world"}
+    finally:
+        client.close()
+
+
+def test_builtin_commands_and_bad_requests(server):
+    for dt in (0.016, 0.017, 0.050):
+        server.record_frame(dt)
+    client = AutomationClient(server.describe())
+    try:
+        client.send("ping")
+        client.send("frame_stats")
+        client.sock.sendall(b"not json\n")
+        # Answered by the server itself; nothing reaches the game loop
+        assert _poll_until(server, timeout=0.2) == []
+        assert client.receive()["result"] == {"pong": True}
+        stats = client.receive()["result"]
+        assert stats["frames"] == 3
+        assert stats["max_ms"] == pytest.approx(50.0)
+        assert stats["p50_ms"] == pytest.approx(17.0)
+        assert client.receive()["ok"] is False
+    finally:
+        client.close()
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets unavailable")
+def test_unix_socket_is_private_and_removed(tmp_path):
+    path = tmp_path / "ajitroids.sock"
+    server = AutomationServer(f"unix:{path}")
+    try:
+        assert path.stat().st_mode & 0o777 == 0o600
+        client = AutomationClient(f"unix:{path}")
+        client.send("ping")
+        _poll_until(server, timeout=0.2)
+        assert client.receive()["ok"]
+        client.close()
+    finally:
+        server.close()
+    assert not path.exists()
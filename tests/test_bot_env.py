@@ -0,0 +1,122 @@
+"""Tests for the bot training environment."""
+
+import pygame
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from modul.asteroid import Asteroid  # noqa: E402
+from modul.boss import Boss  # noqa: E402
+from modul.bossprojectile import BossProjectile  # noqa: E402
+from modul.bot_env import ACTION_TABLE, AjitroidsEnv, VectorEnv, observation_size  # noqa: E402
+from modul.particle import Particle  # noqa: E402
+from modul.player import Player  # noqa: E402
+from modul.powerup import PowerUp  # noqa: E402
+from modul.shot import Shot  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def init_pygame(monkeypatch):
+    """Initialize pygame and restore class-level containers after each test"""
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    for cls in (Asteroid, Shot, Particle, PowerUp, Player, Boss, BossProjectile):
+        monkeypatch.setattr(cls, "containers", getattr(cls, "containers", ()), raising=False)
+    monkeypatch.setattr(Shot, "asteroids_group", Shot.asteroids_group)
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def _rollout(env, seed, steps=300, action=None):
+    """Return the observations and rewards of a fixed action sequence."""
+    obs, _ = env.reset(seed)
+    observations, rewards = [obs], []
+    for i in range(steps):
+        obs, reward, terminated, _, _ = env.step(i % len(ACTION_TABLE) if action is None else action)
+        observations.append(obs)
+        rewards.append(reward)
+        if terminated:
+            break
+    return np.array(observations), rewards
+
+
+def test_observation_layout_and_reward():
+    """Observations have a fixed size; rewards add up to the score."""
+    env = AjitroidsEnv(k_asteroids=4, k_enemies=2, frame_skip=4)
+    # Turn right while shooting
+    observations, rewards = _rollout(env, seed=3, action=8)
+    assert observations.shape[1] == observation_size(4, 2) == env.observation_size
+    assert observations.dtype == np.float32
+    assert sum(rewards) == env.world.score > 0
+    # The nearest asteroid slot is filled and flagged present
+    assert observations[-1][9 + 5] == 1.0
+
+
+def test_same_seed_same_episode_with_interleaved_envs():
+    """Environments sharing a process do not disturb each other's randomness."""
+    expected, expected_rewards = _rollout(AjitroidsEnv(), seed=8)
+
+    first, second = AjitroidsEnv(), AjitroidsEnv()
+    first.reset(8)
+    second.reset(99)
+    got, got_rewards = [first.observe()], []
+    for i in range(300):
+        second.step((i * 7) % len(ACTION_TABLE))
+        obs, reward, terminated, _, _ = first.step(i % len(ACTION_TABLE))
+        got.append(obs)
+        got_rewards.append(reward)
+        if terminated:
+            break
+    assert np.array_equal(np.array(got), expected)
+    assert got_rewards == expected_rewards
+
+
+def test_actions_accept_flags_and_mappings():
+    """Flag sequences and mappings are equivalent to table indices."""
+    env = AjitroidsEnv()
+    env.reset(1)
+    env.step({"thrust": True})
+    env.step([0, 0, 1, 0, 0, 0])
+    with pytest.raises(ValueError):
+        env.step([1, 0])
+    assert env.world.player.velocity.length() > 0
+
+
+def test_vector_env_matches_single_env():
+    """Worker processes produce the same observations as in-process envs."""
+    with VectorEnv(3, num_workers=2, k_asteroids=4, k_enemies=2, max_steps=5) as envs:
+        obs, _ = envs.reset(seed=10)
+        assert obs.shape == (3, observation_size(4, 2))
+        for _ in range(4):
+            obs, rewards, terminated, truncated, _ = envs.step([5, 5, 5])
+        assert not truncated.any()
+        obs, rewards, terminated, truncated, infos = envs.step([5, 5, 5])
+        assert truncated.all()
+        assert "final_observation" in infos[0]
+
+    env = AjitroidsEnv(k_asteroids=4, k_enemies=2)
+    env.reset(11)
+    for _ in range(5):
+        single, _, _, _, _ = env.step(5)
+    assert np.array_equal(infos[1]["final_observation"], single)
+
+
+def test_vector_env_auto_resets_are_seeded():
+    """Every episode of a seeded vector env is reproducible and seeded per env."""
+    def run():
+        with VectorEnv(2, num_workers=1, max_steps=2) as envs:
+            envs.reset(seed=20)
+            seeds, observations = [], []
+            for _ in range(4):
+                obs, _, _, truncated, infos = envs.step([5, 5])
+                if truncated.all():
+                    seeds.append([info["reset_seed"] for info in infos])
+                    observations.append(obs)
+        return seeds, np.array(observations)
+
+    seeds, observations = run()
+    assert seeds == [[22, 23], [24, 25]]
+    assert np.array_equal(run()[1], observations)
+    env = AjitroidsEnv()
+    assert np.array_equal(env.reset(24)[0], observations[1][0])
@@ -0,0 +1,74 @@
+"""Tests for the simulation determinism checker."""
+
+import pygame
+import pytest
+
+from modul import determinism
+from modul.asteroid import Asteroid
+from modul.boss import Boss
+from modul.bossprojectile import BossProjectile
+from modul.particle import Particle
+from modul.player import Player
+from modul.powerup import PowerUp
+from modul.shot import Shot
+
+
+@pytest.fixture(autouse=True)
+def init_pygame(monkeypatch):
+    """Initialize pygame and restore class-level containers after each test"""
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    for cls in (Asteroid, Shot, Particle, PowerUp, Player, Boss, BossProjectile):
+        monkeypatch.setattr(cls, "containers", getattr(cls, "containers", ()), raising=False)
+    monkeypatch.setattr(Shot, "asteroids_group", Shot.asteroids_group)
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def test_same_seed_is_deterministic():
+    """Two runs from one seed produce identical per-tick hashes."""
+    first = determinism.run_trace(11, ticks=300)
+    second = determinism.run_trace(11, ticks=300)
+    assert first.ticks == second.ticks > 0
+    assert determinism.compare_traces(first, second) is None
+
+
+def test_divergence_names_tick_and_entity(monkeypatch):
+    """A perturbed simulation is reported at the first differing tick."""
+    expected = determinism.run_trace(4, ticks=120, keep_states=True)
+
+    original_update = Shot.update
+
+    def drifting_update(self, dt):
+        original_update(self, dt)
+        if determinism_tick[0] >= 60:
+            self.position.x += 0.5
+
+    determinism_tick = [0]
+    original_step = determinism.GameWorld.step
+
+    def counting_step(self, dt=None):
+        determinism_tick[0] = self.tick
+        return original_step(self, dt)
+
+    monkeypatch.setattr(Shot, "update", drifting_update)
+    monkeypatch.setattr(determinism.GameWorld, "step", counting_step)
+    actual = determinism.run_trace(4, ticks=120, keep_states=True)
+
+    divergence = determinism.compare_traces(expected, actual)
+    assert divergence.tick >= 60
+    assert divergence.category == "shots"
+    assert divergence.expected != divergence.actual
+    assert all(a == b for a, b in zip(expected.rolling[:divergence.tick], actual.rolling))
+    assert f"tick {divergence.tick}" in divergence.describe()
+
+
+def test_trace_file_round_trip(tmp_path):
+    """Recorded traces load back and compare equal; CLI reports a match."""
+    path = str(tmp_path / "trace.json.gz")
+    trace = determinism.run_trace(3, ticks=60)
+    determinism.save_trace(trace, path)
+
+    assert determinism.compare_traces(trace, determinism.load_trace(path)) is None
+    assert determinism.main(["compare", path, path]) == 0
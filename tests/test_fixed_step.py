@@ -0,0 +1,99 @@
+"""Tests for the fixed-timestep stepper and render interpolation."""
+
+import pygame
+import pytest
+
+from modul.asteroid import Asteroid
+from modul.fixed_step import FixedStepper, capture_positions, interpolated
+from modul.game_clock import GameClock
+from modul.particle import Particle
+
+
+@pytest.fixture(autouse=True)
+def init_pygame(monkeypatch):
+    """Initialize pygame and isolate sprite containers"""
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    for cls in (Asteroid, Particle):
+        monkeypatch.setattr(cls, "containers", (), raising=False)
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def _run(frame_times):
+    """Move an asteroid through `frame_times` with a 120 Hz stepper."""
+    stepper = FixedStepper(tick_rate=120, max_steps=8)
+    asteroid = Asteroid(100, 100, 30)
+    asteroid.velocity = pygame.Vector2(37.5, -12.25)
+    steps = 0
+    for frame_dt in frame_times:
+        stepper.add(frame_dt)
+        while stepper.step():
+            asteroid.update(stepper.step_dt)
+            steps += 1
+    return steps, tuple(asteroid.position)
+
+
+def test_result_is_independent_of_frame_rate():
+    """The same game time simulates identically at any frame rate."""
+    at_30 = _run([1 / 30] * 30)
+    at_144 = _run([1 / 144] * 144 + [0.001])
+    assert at_30[0] == at_144[0] == 120
+    assert at_30[1] == at_144[1]
+
+
+def test_catch_up_is_capped():
+    """A stall runs at most `max_steps` steps and drops the rest."""
+    stepper = FixedStepper(tick_rate=120, max_steps=4)
+    stepper.add(1.0)
+    steps = 0
+    while stepper.step():
+        steps += 1
+    assert steps == 4
+    assert stepper.dropped_time == pytest.approx(1.0 - 4 / 120)
+    assert stepper.alpha == pytest.approx(0.0)
+
+
+def test_fast_forward_simulates_all_scaled_time():
+    """At 8x, 60 fps frames still simulate eight times the real time."""
+    clock = GameClock(scale=8.0)
+    stepper = FixedStepper(tick_rate=120, max_steps=8)
+    steps = 0
+    for _ in range(60):
+        stepper.add(clock.tick(1 / 60), clock.scale)
+        while stepper.step():
+            steps += 1
+    assert steps * stepper.step_dt + stepper.accumulator == pytest.approx(clock.now)
+    assert clock.now == pytest.approx(8.0)
+    assert stepper.dropped_time == 0.0
+
+
+def test_interpolated_positions_are_restored():
+    """Sprites are drawn between states and put back afterwards; wraps snap."""
+    near = Asteroid(100, 100, 30)
+    wrapped = Asteroid(5, 100, 30)
+    previous = capture_positions([near, wrapped])
+    near.position.update(110, 100)
+    wrapped.position.update(1275, 100)
+
+    with interpolated([near, wrapped], previous, 0.25):
+        assert tuple(near.position) == (102.5, 100)
+        assert tuple(wrapped.position) == (1275, 100)
+    assert tuple(near.position) == (110, 100)
+
+
+
+def test_capture_reuses_vectors_and_drops_dead_sprites():
+    """Capturing into the previous dict updates it in place."""
+    kept = Asteroid(100, 100, 30)
+    gone = Asteroid(200, 100, 30)
+    spark = Particle(50, 50, "white")
+    previous = capture_positions([kept, gone, spark], exclude=(Particle,))
+    assert set(previous) == {kept, gone}
+    vector = previous[kept]
+
+    kept.position.update(120, 100)
+    assert capture_positions([kept, spark], previous, exclude=(Particle,)) is previous
+    assert set(previous) == {kept}
+    assert previous[kept] is vector
+    assert tuple(vector) == (120, 100)
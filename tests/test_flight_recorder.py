@@ -0,0 +1,120 @@
+"""Tests for the flight recorder ring buffer and kill-cam."""
+
+import pygame
+import pytest
+
+from modul.flight_recorder import FlightRecorder, KillCam
+from modul.replay_system import ReplayPlayer
+
+
+@pytest.fixture(autouse=True)
+def init_pygame(monkeypatch):
+    """Initialize pygame for each test (headless-safe)"""
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def _state(i, asteroids=3):
+    """Return a replay-style frame dict for tick `i`."""
+    return {
+        'player_x': float(i), 'player_y': 200.0, 'player_rotation': 45.0,
+        'player_vx': 1.0, 'player_vy': 0.0,
+        'score': i * 10, 'lives': 3, 'level': 1,
+        'asteroids': [{'x': float(i), 'y': 1.0, 'radius': 20}] * asteroids,
+        'enemies': [], 'shots': [{'x': 5.0, 'y': 6.0, 'radius': 4}],
+        'powerups': [{'x': 7.0, 'y': 8.0, 'radius': 6, 'type': 'shield'}],
+        'particles': [],
+    }
+
+
+@pytest.mark.parametrize("fps", [60, 144, 1000])
+def test_buffer_spans_its_duration_at_any_frame_rate(fps):
+    """Frames offered faster than the sample rate are skipped, not buffered."""
+    recorder = FlightRecorder(seconds=5.0, rate_hz=60)
+    for i in range(fps * 8):
+        recorder.record(_state(i), i / fps)
+
+    frames = recorder.frames()
+    assert frames[-1].timestamp == pytest.approx(5.0, abs=0.05)
+    assert len(recorder.frames(3.0)) == pytest.approx(180, abs=3)
+
+
+def test_ring_buffer_keeps_only_latest_frames():
+    """Old frames are overwritten and order is oldest to newest."""
+    recorder = FlightRecorder(seconds=1.0, rate_hz=10)
+    for i in range(25):
+        recorder.record(_state(i), i * 0.1)
+
+    frames = recorder.frames()
+    assert len(frames) == 10
+    assert [f.score for f in frames] == [i * 10 for i in range(15, 25)]
+    assert frames[0].timestamp == 0.0
+    assert frames[-1].player_pos == (24.0, 200.0)
+    assert len(frames[-1].asteroids) == 3
+    assert frames[-1].powerups[0]['x'] == pytest.approx(7.0)
+
+    recent = recorder.frames(seconds=0.25)
+    assert [f.score for f in recent] == [220, 230, 240]
+
+
+def test_memory_is_constant_and_entities_are_capped():
+    """Recording never allocates more buffer space, even with huge frames."""
+    recorder = FlightRecorder(seconds=1.0, rate_hz=10, caps={"asteroids": 4, "shots": 2, "enemies": 1, "powerups": 1})
+    before = recorder.memory_bytes
+    for i in range(100):
+        recorder.record(_state(i, asteroids=500), float(i))
+    assert recorder.memory_bytes == before
+    assert len(recorder.frames()[-1].asteroids) == 4
+
+    recorder.clear()
+    assert recorder.frames() == []
+
+
+def test_dump_is_a_loadable_replay(tmp_path):
+    """A dump can be opened by the normal replay player."""
+    recorder = FlightRecorder(seconds=1.0, rate_hz=10)
+    assert recorder.dump(str(tmp_path)) is None
+    for i in range(5):
+        recorder.record(_state(i), 100.0 + i * 0.1)
+
+    path = recorder.dump(str(tmp_path), reason="test")
+    player = ReplayPlayer()
+    player.load_replay(path)
+    assert player.metadata['source'] == 'flight_recorder'
+    assert [f.score for f in player.frames] == [0, 10, 20, 30, 40]
+
+
+def test_hitch_dump_is_rate_limited(tmp_path, monkeypatch):
+    """Only frames over the threshold dump, and not twice within the cooldown."""
+    monkeypatch.chdir(tmp_path)
+    recorder = FlightRecorder(seconds=1.0, rate_hz=10)
+    recorder.record(_state(0), 0.0)
+    assert recorder.check_hitch(0.016, now=50.0) is None
+    assert recorder.check_hitch(0.25, now=50.0) is not None
+    assert recorder.check_hitch(0.25, now=51.0) is None
+    assert recorder.check_hitch(0.25, now=61.0) is not None
+
+
+def test_kill_cam_plays_in_slow_motion_and_can_be_skipped():
+    """The kill-cam runs at half speed and ends on any key press."""
+    recorder = FlightRecorder(seconds=1.0, rate_hz=10)
+    for i in range(10):
+        recorder.record(_state(i), i * 0.1)
+
+    kill_cam = KillCam(speed=0.5)
+    assert not kill_cam.start([])
+    assert kill_cam.start(recorder.frames())
+    screen = pygame.Surface((800, 600))
+    font = pygame.font.Font(None, 24)
+
+    assert not kill_cam.update(0.9, [])
+    kill_cam.draw(screen, font)
+    assert kill_cam.index == 4
+    assert kill_cam.update(1.0, [])
+
+    kill_cam.start(recorder.frames())
+    key = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)
+    assert kill_cam.update(0.0, [key])
@@ -0,0 +1,68 @@
+"""Tests for the frozen playfield behind paused states."""
+
+import pygame
+import pytest
+
+from modul.asteroid import Asteroid
+from modul.freeze_frame import FreezeFrame
+from modul.particle import Particle
+
+
+@pytest.fixture(autouse=True)
+def init_pygame(monkeypatch):
+    """Initialize pygame and keep sprites out of shared groups"""
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    for cls in (Asteroid, Particle):
+        monkeypatch.setattr(cls, "containers", (), raising=False)
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+class CountingSprite:
+    """Sprite that records how often it is drawn."""
+
+    def __init__(self, position):
+        self.position = position
+        self.draws = 0
+
+    def draw(self, screen):
+        self.draws += 1
+        pygame.draw.circle(screen, (255, 255, 255), self.position, 10)
+
+
+def test_playfield_is_drawn_once_until_invalidated():
+    freeze = FreezeFrame()
+    sprite = CountingSprite((50, 50))
+    screen = pygame.Surface((100, 100))
+    for _ in range(5):
+        screen.fill((0, 0, 0))
+        freeze.draw(screen, [sprite])
+        assert screen.get_at((50, 50)) == pygame.Color(255, 255, 255)
+    assert sprite.draws == 1
+
+    freeze.invalidate()
+    sprite.position = (20, 20)
+    freeze.draw(screen, [sprite])
+    assert sprite.draws == 2
+    assert screen.get_at((20, 20)) == pygame.Color(255, 255, 255)
+
+
+def test_snapshot_matches_live_drawing():
+    sprites = [Asteroid(60, 60, 40), Particle(150, 40, "yellow")]
+    live = pygame.Surface((200, 120))
+    for sprite in sprites:
+        sprite.draw(live)
+    frozen = pygame.Surface((200, 120))
+    FreezeFrame().draw(frozen, sprites)
+    assert pygame.image.tobytes(frozen, "RGB") == pygame.image.tobytes(live, "RGB")
+
+
+def test_blur_and_dim_soften_the_snapshot():
+    sprite = CountingSprite((50, 50))
+    sharp = FreezeFrame().capture((100, 100), [sprite])
+    soft = FreezeFrame(blur=4, dim=0.5).capture((100, 100), [sprite])
+    assert soft.get_at((50, 50)).r < sharp.get_at((50, 50)).r
+    # The blur spreads light just past the circle's edge
+    assert sharp.get_at((50, 62)).r == 0
+    assert soft.get_at((50, 62)).r > 0
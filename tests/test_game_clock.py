@@ -0,0 +1,106 @@
+"""Tests for the game clock and the systems timed by it."""
+
+import time
+
+import pygame
+import pytest
+
+from modul.achievement_notification import AchievementNotificationManager
+from modul.asteroid import Asteroid
+from modul.audio_enhancements import VoiceAnnouncement
+from modul.boss import Boss
+from modul.bossprojectile import BossProjectile
+from modul.determinism import hash_state, quantize_world, scripted_actions
+from modul.game_clock import MAX_TIME_SCALE, GameClock
+from modul.particle import Particle
+from modul.player import Player
+from modul.powerup import PowerUp
+from modul.replay_system import ReplayRecorder
+from modul.shot import Shot
+from modul.simulation import GameWorld
+
+
+@pytest.fixture(autouse=True)
+def init_pygame(monkeypatch):
+    """Initialize pygame and restore class-level containers after each test"""
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    for cls in (Asteroid, Shot, Particle, PowerUp, Player, Boss, BossProjectile):
+        monkeypatch.setattr(cls, "containers", getattr(cls, "containers", ()), raising=False)
+    monkeypatch.setattr(Shot, "asteroids_group", Shot.asteroids_group)
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def test_tick_applies_pause_and_scale():
+    """Paused clocks stand still; the scale stretches or compresses time."""
+    clock = GameClock()
+    assert clock.tick(0.5) == 0.5
+    clock.pause()
+    assert clock.tick(0.5) == 0.0
+    clock.resume()
+    clock.set_scale(0.5)
+    assert clock.tick(1.0) == 0.5
+    assert clock.now == pytest.approx(1.0)
+    # Backwards wall-clock steps never move game time back
+    assert clock.tick(-3.0) == 0.0
+    assert clock.set_scale(1000) == MAX_TIME_SCALE
+
+
+def test_max_step_caps_stalls():
+    """A long stall advances at most `max_step` real seconds."""
+    clock = GameClock(scale=2.0, max_step=0.25)
+    assert clock.tick(5.0) == pytest.approx(0.5)
+
+
+def test_announcement_gap_follows_game_time(monkeypatch):
+    """Announcements are spaced by game time, not by the wall clock."""
+    clock = GameClock()
+    voice = VoiceAnnouncement(clock=clock)
+    voice.trigger("level_up")
+    assert voice.current_announcement == "Level up!"
+
+    monkeypatch.setattr(time, "time", lambda: 1e12)
+    voice.trigger("boss_incoming")
+    assert voice.announcement_queue == [("boss_incoming", 5.0)]
+
+    clock.tick(2.0)
+    voice.trigger("extra_life")
+    assert voice.current_announcement == "Extra life!"
+
+
+def _session(monkeypatch, speed):
+    """Run a headless session while the wall clock runs `speed` times slower than game time."""
+    wall = [1000.0]
+    monkeypatch.setattr(time, "time", lambda: wall[0])
+    world = GameWorld(seed=21)
+    voice = VoiceAnnouncement(clock=world.clock)
+    notifications = AchievementNotificationManager()
+    recorder = ReplayRecorder(compression="none", clock=world.clock)
+    recorder.start_recording("normal", "standard")
+    pilot = scripted_actions(21)
+    log = []
+    for tick in range(1200):
+        world.set_actions(next(pilot))
+        for event in world.step():
+            voice.trigger("level_up" if event.kind == "level_up" else "extra_life")
+        if tick % 250 == 0:
+            notifications.add_notification(f"Badge {tick}", "")
+        notifications.update(world.dt)
+        voice.update(world.dt)
+        recorder.record_frame({
+            'player_x': world.player.position.x, 'player_y': world.player.position.y,
+            'player_rotation': world.player.rotation, 'player_vx': 0.0, 'player_vy': 0.0,
+            'score': world.score, 'lives': world.lives, 'level': world.level,
+        }, world.time)
+        wall[0] += world.dt / speed
+        log.append((hash_state(quantize_world(world)), voice.current_announcement,
+                    [n.name for n in notifications.notifications]))
+    recorder.stop_recording(world.score, world.level)
+    return log, [f.timestamp for f in recorder.frames], recorder.metadata['duration']
+
+
+def test_fast_forward_matches_real_time(monkeypatch):
+    """A session run at 50x real time produces the same timings as one at 1x."""
+    assert _session(monkeypatch, 50.0) == _session(monkeypatch, 1.0)
@@ -0,0 +1,83 @@
+"""Tests for ghost racing against a saved replay."""
+
+import time
+
+import pygame
+import pytest
+
+from modul.ghost_racer import GhostRacer
+from modul.replay_system import ReplayManager, ReplayRecorder
+
+
+@pytest.fixture(autouse=True)
+def init_pygame(monkeypatch):
+    """Initialize pygame for each test (headless-safe)"""
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def _save_run(name, score, ship="standard", seconds=2.0):
+    """Save a replay whose ship moves right at 100 px/s."""
+    recorder = ReplayRecorder()
+    recorder.start_recording("normal", ship)
+    recorder.start_time = 0.0
+    steps = int(seconds * 30)
+    for i in range(steps + 1):
+        t = i / 30
+        recorder.record_frame({
+            'player_x': 100.0 + 100.0 * t, 'player_y': 300.0,
+            'player_rotation': 90.0, 'player_vx': 100.0, 'player_vy': 0.0,
+            'score': i, 'lives': 3, 'level': 1,
+            'asteroids': [{'x': 10.0, 'y': 10.0, 'radius': 40}] * 8,
+        }, t)
+    recorder.stop_recording(score, 1)
+    return recorder.save_replay(name)
+
+
+def test_personal_best_selects_highest_score(tmp_path, monkeypatch):
+    """The ghost follows the best replay for the chosen ship."""
+    monkeypatch.chdir(tmp_path)
+    _save_run("low", 100)
+    best = _save_run("best", 900)
+    _save_run("other_ship", 5000, ship="tank")
+
+    ghost = GhostRacer.for_personal_best(ReplayManager(), "normal", "standard")
+    assert ghost.replay_path == best
+    ghost.close()
+    assert GhostRacer.for_personal_best(ReplayManager(), "hard") is None
+
+
+def test_ghost_interpolates_and_finishes(tmp_path, monkeypatch):
+    """Positions are interpolated between samples and the stream ends cleanly."""
+    monkeypatch.chdir(tmp_path)
+    ghost = GhostRacer(_save_run("run", 10))
+
+    ghost.update(1.0 + 1 / 60)
+    assert ghost.position.x == pytest.approx(100.0 + 100.0 * (1.0 + 1 / 60), abs=0.5)
+    assert ghost.rotation == 90.0
+
+    ghost.update(10.0)
+    assert ghost.finished
+    screen = pygame.Surface((200, 200))
+    ghost.draw(screen)  # no-op once finished
+
+
+def test_ghost_frame_cost_under_budget(tmp_path, monkeypatch):
+    """Streaming and drawing the ghost costs well under a millisecond."""
+    monkeypatch.chdir(tmp_path)
+    ghost = GhostRacer(_save_run("budget", 10, seconds=10.0))
+    screen = pygame.Surface((1280, 720))
+
+    frames = 600
+    started = time.perf_counter()
+    for i in range(frames):
+        ghost.update(i / 60)
+        ghost.draw(screen)
+    per_frame_ms = (time.perf_counter() - started) * 1000 / frames
+
+    assert per_frame_ms < 1.0
+    assert ghost.frame_cost_ms < 1.0
+    ghost.close()
@@ -445,6 +445,45 @@ class TestMenu:
         menu.add_item("Start", "start")
         menu.draw(mock_screen)
 
+    def test_menu_backdrop_matches_translucent_fill(self, mock_screen):
+        """Test the cached backdrop darkens like a per-frame SRCALPHA fill"""
+        mock_screen.fill((200, 120, 40))
+        expected = mock_screen.copy()
+        overlay = pygame.Surface(expected.get_size(), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 150))
+        expected.blit(overlay, (0, 0))
+        menu = Menu("")
+        menu.background_alpha = 150.7
+        menu.draw(mock_screen)
+        assert mock_screen.get_at((5, 5)) == expected.get_at((5, 5))
+
+    def test_menu_renders_text_once_per_hover_step(self, mock_screen):
+        """Test titles and item frames are rendered once and reused"""
+        menu = Menu("Test")
+        menu.add_item("Start", "start")
+        menu.add_item("Exit", "exit")
+        with patch("modul.menu.pygame.font.Font", wraps=pygame.font.Font) as font_cls:
+            for _ in range(3):
+                menu.draw(mock_screen)
+            fonts_created = font_cls.call_count
+            assert fonts_created == len(menu.items)
+            menu.items[1].hover_animation = 0.5
+            menu.draw(mock_screen)
+            menu.draw(mock_screen)
+            assert font_cls.call_count == fonts_created + 1
+        title = menu._rendered_title()
+        assert menu._rendered_title() is title
+        menu.title = "Other"
+        assert menu._rendered_title() is not title
+
+    def test_menuitem_rerenders_after_text_change(self, mock_screen):
+        """Test changing an item's text drops its pre-rendered frames"""
+        item = MenuItem("Music: ON", "music")
+        narrow = item.draw(mock_screen, (640, 360))
+        item.text = "Music: OFF, longer"
+        wide = item.draw(mock_screen, (640, 360))
+        assert wide.width > narrow.width
+
 
 class TestMainMenu:
     """
@@ -473,6 +512,20 @@ class TestMainMenu:
         assert menu.items[7].text == "Credits"
         assert menu.items[8].text == "Exit"
 
+    def test_mainmenu_continue_item_toggles(self):
+        """Test MainMenu shows Continue first only while a quick-save exists"""
+        menu = MainMenu()
+        menu.set_continue_available(True)
+        menu.set_continue_available(True)
+        assert len(menu.items) == 10
+        assert menu.items[0].action == "continue_game"
+        assert menu.items[0].selected and menu.selected_index == 0
+
+        menu.set_continue_available(False)
+        assert len(menu.items) == 9
+        assert menu.items[0].action == "start_game"
+        assert menu.items[0].selected
+
     def test_mainmenu_draw(self, mock_screen):
         """Test MainMenu draws version number"""
         menu = MainMenu()
@@ -669,6 +722,17 @@ class TestOptionsMenu:
             menu.update(0.1, [event])
             assert mock_settings.music_volume == 0.0
 
+    def test_optionsmenu_toggle_ghost_racing(self, mock_settings, mock_sounds):
+        """Ghost racing toggle appears when the setting exists and flips it"""
+        mock_settings.ghost_racing_enabled = False
+        menu = OptionsMenu(mock_settings, mock_sounds)
+        item = next(it for it in menu.items if it.action == "toggle_ghost_racing")
+
+        menu.handle_action("toggle_ghost_racing", mock_sounds)
+        assert mock_settings.ghost_racing_enabled is True
+        assert item.text.endswith(": ON")
+        mock_settings.save.assert_called()
+
 
 class TestCreditsScreen:
     """
@@ -1021,6 +1085,18 @@ class TestAchievementsMenu:
         menu.background_alpha = 180
         menu.draw(mock_screen)
 
+    def test_achievementsmenu_renders_list_once_per_unlock(self, mock_screen, mock_achievement_system):
+        """Test the achievement list is rendered again only after an unlock"""
+        menu = AchievementsMenu(mock_achievement_system)
+        menu.draw(mock_screen)
+        with patch("modul.menu.pygame.font.Font", wraps=pygame.font.Font) as font_cls:
+            menu.draw(mock_screen)
+            assert font_cls.call_count == 0
+        assert menu._layer.renders == 1
+        mock_achievement_system.achievements[0].unlocked = not mock_achievement_system.achievements[0].unlocked
+        menu.draw(mock_screen)
+        assert menu._layer.renders == 2
+
 
 class TestShipSelectionMenu:
     """
@@ -1114,6 +1190,33 @@ class TestShipSelectionMenu:
         menu = ShipSelectionMenu()
         menu.draw(mock_screen)
 
+    @patch('modul.menu.ship_manager')
+    @patch('modul.menu.ShipRenderer')
+    def test_shipselectionmenu_renders_text_once_per_selection(self, mock_renderer, mock_ship_manager, mock_screen):
+        """Test repeated draws reuse fonts and text until the selection changes"""
+        mock_ship_manager.get_available_ships.return_value = ["ship1", "ship2"]
+        mock_ship_manager.get_ship_data.return_value = {
+            "unlocked": True,
+            "name": "Test Ship",
+            "color": (255, 255, 255),
+            "shape": "triangle",
+            "description": "Test",
+            "speed_multiplier": 1.0,
+            "turn_speed_multiplier": 1.0,
+            "special_ability": "none"
+        }
+        menu = ShipSelectionMenu()
+        with patch("modul.menu.pygame.font.Font", wraps=pygame.font.Font) as font_cls:
+            for _ in range(3):
+                menu.animation_time += 0.1
+                menu.draw(mock_screen)
+            assert font_cls.call_count == 0
+        assert menu._layer.renders == 1
+        assert mock_renderer.draw_ship.call_count == 6
+        menu.selected_ship_index = 1
+        menu.draw(mock_screen)
+        assert menu._layer.renders == 2
+
     @patch('modul.menu.ship_manager')
     def test_shipselectionmenu_update_animation(self, mock_ship_manager):
         """Test animation time updates"""
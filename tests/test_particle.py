@@ -3,8 +3,9 @@
 import pygame
 import pytest
 
-from modul.constants import EXPLOSION_PARTICLES
-from modul.particle import Particle
+from modul import particle as particle_module
+from modul.constants import EXPLOSION_PARTICLES, PARTICLE_SIZE
+from modul.particle import Particle, ParticlePool
 
 
 @pytest.fixture(autouse=True)
@@ -128,3 +129,58 @@ class TestParticle:
         # All velocities should be in expected range (50-150)
         for vel in velocities:
             assert 50 <= vel <= 150
+
+
+class TestParticlePool:
+    @pytest.fixture(autouse=True)
+    def pool(self, monkeypatch):
+        """Give each test its own pool"""
+        pool = ParticlePool(budget=60)
+        monkeypatch.setattr(particle_module, "particle_pool", pool)
+        return pool
+
+    def test_killed_particles_are_reused(self, pool):
+        """Explosions after the first recycle expired particles"""
+        group = pygame.sprite.Group()
+
+        class TestParticle(Particle):
+            containers = (group,)
+
+        TestParticle.create_ship_explosion(100, 100)
+        first = set(group)
+        for particle in list(group):
+            particle.update(1.0)
+        assert len(group) == 0
+
+        TestParticle.create_asteroid_explosion(200, 200)
+        assert set(group) == first
+        assert pool.stats()["created"] == EXPLOSION_PARTICLES
+        assert pool.stats()["reused"] == EXPLOSION_PARTICLES
+        for particle in group:
+            assert particle.position == pygame.Vector2(200, 200)
+            assert particle.lifetime == 0.5 and particle.alpha == 255
+
+    def test_bursts_degrade_within_budget(self, pool):
+        """Over half the budget, bursts get fewer but larger particles"""
+        group = pygame.sprite.Group()
+
+        class TestParticle(Particle):
+            containers = (group,)
+
+        for _ in range(20):
+            TestParticle.create_asteroid_explosion(300, 300)
+        assert len(group) <= pool.budget
+        assert pool.culled == 20 * EXPLOSION_PARTICLES - len(group)
+        assert max(particle.size for particle in group) > PARTICLE_SIZE
+
+    def test_offscreen_emitters_are_skipped(self, pool):
+        """Bursts too far off-screen to be seen spawn nothing"""
+        group = pygame.sprite.Group()
+
+        class TestParticle(Particle):
+            containers = (group,)
+
+        TestParticle.create_ship_explosion(-500, 100)
+        assert len(group) == 0
+        assert pool.skipped_emitters == 1
+        assert pool.culled == EXPLOSION_PARTICLES
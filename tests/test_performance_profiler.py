@@ -186,3 +186,45 @@ class TestPerformanceProfiler:
 
         # Verify some drawing operations were called
         assert mock_screen.blit.call_count > 0
+
+    def test_profiler_draw_particle_stats(self, mock_pygame):
+        """Test particle pool stats are kept and drawn."""
+        profiler = PerformanceProfiler()
+        profiler.enabled = True
+        mock_clock = MagicMock()
+        mock_clock.get_fps.return_value = 60.0
+        stats = {'hit_rate': 0.9, 'free': 12, 'culled': 30, 'skipped_emitters': 1}
+        profiler.update(0.016, mock_clock, None, stats)
+        assert profiler.particle_stats == stats
+
+        mock_screen = MagicMock()
+        mock_screen.get_width.return_value = 1280
+        mock_screen.get_height.return_value = 720
+        profiler.draw(mock_screen)
+        with_stats = mock_screen.blit.call_count
+
+        profiler.particle_stats = None
+        mock_screen.reset_mock()
+        profiler.draw(mock_screen)
+        assert mock_screen.blit.call_count == with_stats - 2
+
+    def test_profiler_draw_sprite_stats(self, mock_pygame):
+        """Test ship sprite cache stats are kept and drawn."""
+        profiler = PerformanceProfiler()
+        profiler.enabled = True
+        mock_clock = MagicMock()
+        mock_clock.get_fps.return_value = 60.0
+        stats = {'sprites': 180, 'bytes': 2048000, 'hit_rate': 0.99, 'angle_step': 2.0}
+        profiler.update(0.016, mock_clock, None, None, stats)
+        assert profiler.sprite_stats == stats
+
+        mock_screen = MagicMock()
+        mock_screen.get_width.return_value = 1280
+        mock_screen.get_height.return_value = 720
+        profiler.draw(mock_screen)
+        with_stats = mock_screen.blit.call_count
+
+        profiler.sprite_stats = None
+        mock_screen.reset_mock()
+        profiler.draw(mock_screen)
+        assert mock_screen.blit.call_count == with_stats - 1
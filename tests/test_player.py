@@ -284,6 +284,26 @@ class TestPlayer:
 
         assert player.velocity.length() < initial_velocity.length()
 
+    @pytest.mark.parametrize("ship_type", ["standard", "speedster"])
+    def test_player_thrust_and_drift_independent_of_step_rate(self, mock_pygame, ship_type):
+        """Test top speed and drift distance match at 60 Hz and 120 Hz steps"""
+        def fly(tick_rate):
+            player = Player(0, 0, ship_type)
+            player.input_state = {"thrust": True}
+            for _ in range(3 * tick_rate):
+                player.update(1 / tick_rate)
+            top_speed = player.velocity.length()
+            player.input_state = {}
+            start = player.position.copy()
+            for _ in range(tick_rate):
+                player.update(1 / tick_rate)
+            return top_speed, player.position.distance_to(start)
+
+        speed_60, drift_60 = fly(60)
+        speed_120, drift_120 = fly(120)
+        assert speed_120 == pytest.approx(speed_60, rel=0.02)
+        assert drift_120 == pytest.approx(drift_60, rel=0.02)
+
     def test_player_update_position_movement(self, mock_pygame):
         """Test position updates based on velocity"""
         player = Player(100, 100)
@@ -1,11 +1,13 @@
 """Tests for PowerUp class and behavior."""
 
+from unittest.mock import patch
+
 import pygame
 import pytest
 
 from modul.constants import (POWERUP_COLORS, POWERUP_LIFETIME, POWERUP_RADIUS,
                              POWERUP_TYPES)
-from modul.powerup import PowerUp
+from modul.powerup import PowerUp, PowerUpAtlas, _pulse_scale, draw_icon
 
 
 @pytest.fixture(autouse=True)
@@ -133,6 +135,20 @@ class TestPowerUp:
         screen = pygame.Surface((800, 600))
         powerup.draw(screen)  # Should pulse, not crash
 
+    def test_powerup_pulse_follows_game_time(self):
+        """Test the pulse depends on lifetime only, not on the wall clock"""
+        powerup = PowerUp(100, 100, powerup_type="shield")
+        powerup.lifetime = 1.3
+        frames = []
+        for ticks in (0, 777):
+            screen = pygame.Surface((200, 200))
+            with patch("pygame.time.get_ticks", return_value=ticks):
+                powerup.draw(screen)
+            frames.append(pygame.image.tobytes(screen, "RGB"))
+        assert frames[0] == frames[1]
+        assert _pulse_scale(1.3) != _pulse_scale(1.2)
+        assert _pulse_scale(5.0) == 1.0
+
     def test_powerup_pulse_when_not_expiring(self):
         """Test powerup doesn't pulse with high lifetime"""
         powerup = PowerUp(100, 100)
@@ -195,3 +211,35 @@ class TestPowerUp:
             powerup = PowerUp(100, 100, powerup_type=powerup_type)
             assert powerup.type == powerup_type
             assert powerup.color == POWERUP_COLORS[powerup_type]
+
+
+class TestPowerUpAtlas:
+    def test_frames_match_direct_drawing(self):
+        """Atlas frames look like the icon drawn straight onto the screen"""
+        atlas = PowerUpAtlas()
+        for powerup_type in ("shield", "laser_weapon", "missile_weapon"):
+            color = POWERUP_COLORS[powerup_type]
+            direct = pygame.Surface((100, 100))
+            draw_icon(direct, powerup_type, color, pygame.Vector2(50, 50), POWERUP_RADIUS)
+            blitted = pygame.Surface((100, 100))
+            atlas.draw(blitted, powerup_type, color, (50, 50))
+            assert pygame.image.tobytes(blitted, "RGB") == pygame.image.tobytes(direct, "RGB")
+
+    def test_pulse_scales_pick_smaller_frames(self):
+        """Lower pulse scales use smaller pre-rendered icons"""
+        atlas = PowerUpAtlas(steps=4)
+        assert atlas.step(1.0) == 4
+        assert atlas.step(0.7) == 0
+        assert atlas.step(0.85) == 2
+        full = pygame.mask.from_surface(atlas.frame("shield", "blue", 4))
+        small = pygame.mask.from_surface(atlas.frame("shield", "blue", 0))
+        assert small.get_bounding_rects()[0].width < full.get_bounding_rects()[0].width
+
+    def test_frames_are_rendered_once(self):
+        """Drawing power-ups reuses the cached frames"""
+        atlas = PowerUpAtlas()
+        screen = pygame.Surface((200, 200))
+        for _ in range(10):
+            for powerup_type in POWERUP_TYPES:
+                atlas.draw(screen, powerup_type, POWERUP_COLORS[powerup_type], (100, 100))
+        assert atlas.cache_size() == len(POWERUP_TYPES)
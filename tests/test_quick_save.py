@@ -0,0 +1,131 @@
+"""Tests for quick-saving and resuming a run."""
+
+import os
+
+import pygame
+import pytest
+
+from modul.asteroid import Asteroid
+from modul.boss import Boss
+from modul.bossprojectile import BossProjectile
+from modul.determinism import hash_state, quantize_world, scripted_actions
+from modul.particle import Particle
+from modul.player import Player
+from modul.powerup import PowerUp
+from modul.quick_save import QuickSave
+from modul.replay_system import ReplayRecorder
+from modul.shot import Shot
+from modul.simulation import GameWorld
+
+
+@pytest.fixture(autouse=True)
+def init_pygame(monkeypatch):
+    """Initialize pygame and restore class-level containers after each test"""
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    for cls in (Asteroid, Shot, Particle, PowerUp, Player, Boss, BossProjectile):
+        monkeypatch.setattr(cls, "containers", getattr(cls, "containers", ()), raising=False)
+    monkeypatch.setattr(Shot, "asteroids_group", Shot.asteroids_group)
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def _record(recorder, world, count, start=0):
+    """Record `count` replay frames of `world`."""
+    for i in range(start, start + count):
+        recorder.record_frame({
+            'player_x': world.player.position.x, 'player_y': world.player.position.y,
+            'player_rotation': world.player.rotation, 'player_vx': 0.0, 'player_vy': 0.0,
+            'score': i, 'lives': world.lives, 'level': world.level,
+            'asteroids': [{'x': a.position.x, 'y': a.position.y, 'radius': a.radius} for a in world.asteroids],
+        }, recorder.start_time + i * 0.05)
+
+
+def _started_run(tmp_path):
+    """Return a quick-save, world and recorder for a run in progress."""
+    quick_save = QuickSave(str(tmp_path / "quicksave.bin"))
+    quick_save.begin_run()
+    world = GameWorld(seed=11)
+    pilot = scripted_actions(11)
+    for _ in range(240):
+        world.set_actions(next(pilot))
+        world.step()
+    recorder = ReplayRecorder(compression="none")
+    recorder.start_recording("normal", "standard")
+    recorder.start_time = recorder.clock.now - 10.0
+    _record(recorder, world, 100)
+    recorder.record_event("asteroid_destroyed", {"points": 20}, recorder.start_time + 1.0)
+    return quick_save, world, recorder, pilot
+
+
+def test_save_and_continue_round_trip(tmp_path):
+    """A loaded quick-save restores the world and resumes the replay recording."""
+    quick_save, world, recorder, pilot = _started_run(tmp_path)
+    quick_save.save(world, recorder, "normal", "standard", extra={"asteroids_destroyed": 4})
+    assert quick_save.exists()
+
+    actions = [next(pilot) for _ in range(120)]
+    expected = []
+    for action in actions:
+        world.set_actions(action)
+        world.step()
+        expected.append(hash_state(quantize_world(world)))
+
+    saved = QuickSave(quick_save.path).load()
+    assert saved.difficulty == "normal" and saved.extra == {"asteroids_destroyed": 4}
+    assert [f.score for f in saved.frames] == [f.score for f in recorder.frames]
+    assert saved.events[0].event_type == "asteroid_destroyed"
+
+    other = GameWorld(seed=1)
+    other.restore(saved.world)
+    got = []
+    for action in actions:
+        other.set_actions(action)
+        other.step()
+        got.append(hash_state(quantize_world(other)))
+    assert got == expected
+
+    resumed = ReplayRecorder(compression="none")
+    saved.apply_to_recorder(resumed)
+    assert resumed.recording
+    assert len(resumed.frames) == 100
+    assert resumed.elapsed() == pytest.approx(10.0)
+
+
+def test_saves_only_append_new_replay_frames(tmp_path):
+    """Frames already journaled are not rewritten by later saves."""
+    quick_save, world, recorder, _ = _started_run(tmp_path)
+    assert quick_save.sync_replay(recorder) == 100
+    journal_size = os.path.getsize(quick_save.journal_path)
+    assert quick_save.sync_replay(recorder) == 0
+
+    _record(recorder, world, 20, start=100)
+    quick_save.save(world, recorder, "normal", "standard")
+    assert os.path.getsize(quick_save.journal_path) > journal_size
+
+    # Frames journaled after the last state write are ignored on load
+    _record(recorder, world, 20, start=120)
+    quick_save.sync_replay(recorder)
+    saved = QuickSave(quick_save.path).load()
+    assert [f.score for f in saved.frames] == list(range(120))
+
+
+def test_unusable_quick_save_is_discarded(tmp_path):
+    """Missing, corrupt or mismatched files load as None."""
+    quick_save, world, recorder, _ = _started_run(tmp_path)
+    assert quick_save.load() is None
+
+    quick_save.save(world, recorder, "normal", "standard")
+    with open(quick_save.journal_path, "r+b") as f:
+        f.seek(5)
+        f.write(b"0" * 32)
+    assert QuickSave(quick_save.path).load() is None
+
+    with open(quick_save.path, "wb") as f:
+        f.write(b"garbage")
+    assert QuickSave(quick_save.path).load() is None
+
+    quick_save.begin_run()
+    assert not quick_save.exists()
+    assert not os.path.exists(quick_save.journal_path)
@@ -0,0 +1,71 @@
+"""Tests for low-resolution raster observations."""
+
+import pygame
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from modul.asteroid import Asteroid  # noqa: E402
+from modul.boss import Boss  # noqa: E402
+from modul.bossprojectile import BossProjectile  # noqa: E402
+from modul.bot_env import AjitroidsEnv  # noqa: E402
+from modul.particle import Particle  # noqa: E402
+from modul.player import Player  # noqa: E402
+from modul.powerup import PowerUp  # noqa: E402
+from modul.raster_obs import DEFAULT_INTENSITIES, RasterRenderer  # noqa: E402
+from modul.shot import Shot  # noqa: E402
+from modul.simulation import GameWorld  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def init_pygame(monkeypatch):
+    """Initialize pygame and restore class-level containers after each test"""
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    for cls in (Asteroid, Shot, Particle, PowerUp, Player, Boss, BossProjectile):
+        monkeypatch.setattr(cls, "containers", getattr(cls, "containers", ()), raising=False)
+    monkeypatch.setattr(Shot, "asteroids_group", Shot.asteroids_group)
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def _world():
+    """Return a world with one asteroid in the top-left corner."""
+    world = GameWorld(seed=4)
+    for asteroid in list(world.asteroids):
+        asteroid.kill()
+    Asteroid(160, 90, 60)
+    return world
+
+
+def test_entities_are_drawn_at_scaled_positions():
+    """The player and asteroids land where the playfield scaling puts them."""
+    world = _world()
+    frame = RasterRenderer((84, 84)).render(world)
+    assert frame.shape == (84, 84) and frame.dtype == np.uint8
+    # Player in the centre, asteroid at an eighth of the field
+    assert frame[42, 42] == DEFAULT_INTENSITIES["player"]
+    assert frame[10, 10] == DEFAULT_INTENSITIES["asteroid"]
+    assert set(np.unique(frame)) == {0, DEFAULT_INTENSITIES["player"], DEFAULT_INTENSITIES["asteroid"]}
+
+
+def test_particles_are_not_drawn_and_out_is_reused():
+    """Particles leave the raster unchanged; `out` receives the pixels."""
+    world = _world()
+    renderer = RasterRenderer((84, 84))
+    before = renderer.render(world)
+    Particle.create_asteroid_explosion(640, 360)
+    out = np.zeros(renderer.shape, dtype=np.uint8)
+    assert renderer.render(world, out) is out
+    assert np.array_equal(out, before)
+
+
+def test_rgb_and_env_render():
+    """RGB rasters have three channels; the env renders its own world."""
+    world = _world()
+    assert RasterRenderer((64, 48), grayscale=False).render(world).shape == (48, 64, 3)
+    env = AjitroidsEnv()
+    env.reset(2)
+    frame = env.render()
+    assert frame.shape == (84, 84) and frame.max() == DEFAULT_INTENSITIES["player"]
@@ -0,0 +1,99 @@
+"""Tests for streaming replay analytics."""
+
+import numpy as np
+import pygame
+import pytest
+
+from modul.replay_analytics import (HEATMAP_BINS, analyze_directory,
+                                    analyze_frames, load_results,
+                                    save_heatmaps, save_results)
+from modul.replay_system import ReplayRecorder
+
+
+@pytest.fixture(autouse=True)
+def init_pygame(monkeypatch):
+    """Initialize pygame for each test (headless-safe)"""
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def _frame(t, x, y, lives, score, asteroids=()):
+    return {
+        'timestamp': t,
+        'player_pos': [x, y],
+        'lives': lives,
+        'score': score,
+        'asteroids': [{'x': ax, 'y': ay, 'radius': 20} for ax, ay in asteroids],
+    }
+
+
+def _record(difficulty, ship, lives_sequence, game_over=False):
+    recorder = ReplayRecorder()
+    recorder.start_recording(difficulty, ship)
+    recorder.start_time = 500.0
+    for i, lives in enumerate(lives_sequence):
+        recorder.record_frame({
+            'player_x': 10.0 * i, 'player_y': 20.0, 'player_rotation': 0.0,
+            'player_vx': 0.0, 'player_vy': 0.0,
+            'score': 100 * i, 'lives': lives, 'level': 1,
+            'asteroids': [{'x': 640.0, 'y': 360.0, 'radius': 40}],
+        }, 500.0 + i)
+    recorder.stop_recording(100 * len(lives_sequence), 1, game_over=game_over)
+    return recorder.save_replay()
+
+
+def test_analyze_frames_counts_deaths_and_positions():
+    """Life losses are located at the previous frame's player position."""
+    frames = [
+        _frame(0.0, 100, 100, 3, 0, asteroids=[(640, 360)]),
+        _frame(1.0, 200, 100, 3, 50),
+        _frame(2.0, 640, 360, 2, 60),
+        _frame(61.0, 640, 360, 1, 500),
+    ]
+    stats = analyze_frames(frames, game_over=True)
+
+    assert stats["player_position"].shape == HEATMAP_BINS
+    assert stats["player_position"].sum() == 4
+    assert stats["asteroid_density"].sum() == 1
+    # Two hits plus losing the final life at the last position
+    assert stats["death_locations"].sum() == 3
+    assert stats["death_locations"][10, 5] == 1
+    assert stats["death_locations"][32, 18] == 2
+    assert stats["time_to_death"].sum() == 3
+    assert stats["score_per_minute"][0] == 60
+    assert stats["score_per_minute"][1] == 440
+    assert stats["runs"][0] == 1
+
+    # A run that was quit on its last life did not lose it
+    quit_run = analyze_frames(frames)
+    assert quit_run["death_locations"].sum() == 2
+    assert quit_run["time_to_death"].sum() == 2
+
+
+def test_analyze_directory_groups_by_difficulty_and_ship(tmp_path, monkeypatch):
+    """Replays are merged per difficulty/ship group and round-trip to npz."""
+    monkeypatch.chdir(tmp_path)
+    _record("easy", "standard", [3, 3, 2, 2])
+    _record("easy", "standard", [3, 2, 1], game_over=True)
+    _record("hard", "tank", [1, 1, 1])
+    (tmp_path / "replays" / "broken.json").write_text("{not json", encoding="utf-8")
+
+    groups = analyze_directory("replays", workers=1)
+
+    assert set(groups) == {"easy/standard", "hard/tank"}
+    assert groups["easy/standard"]["runs"][0] == 2
+    assert groups["easy/standard"]["frames"][0] == 7
+    # Two drops in lives plus the game over; the quit runs lost nothing more
+    assert groups["easy/standard"]["death_locations"].sum() == 4
+    assert groups["hard/tank"]["death_locations"].sum() == 0
+
+    out = tmp_path / "stats.npz"
+    save_results(groups, str(out))
+    loaded = load_results(str(out))
+    assert np.array_equal(loaded["easy/standard"]["death_locations"], groups["easy/standard"]["death_locations"])
+
+    paths = save_heatmaps(groups, str(tmp_path / "png"))
+    assert len(paths) == 6
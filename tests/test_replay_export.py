@@ -0,0 +1,109 @@
+"""Tests for the headless replay exporter."""
+
+import os
+
+import pygame
+import pytest
+
+from modul.replay_export import export_replay, split_segments
+from modul.replay_system import ReplayRecorder
+
+
+@pytest.fixture(autouse=True)
+def init_pygame(monkeypatch):
+    """Initialize pygame for each test (headless-safe)"""
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    pygame.font.init()
+    yield
+    pygame.quit()
+
+
+@pytest.fixture
+def saved_replay(tmp_path, monkeypatch):
+    """Record a short two-second replay into a temporary directory."""
+    monkeypatch.chdir(tmp_path)
+    recorder = ReplayRecorder()
+    recorder.start_recording("normal", "standard")
+    recorder.start_time = 1000.0
+    for i in range(21):
+        recorder.record_frame({
+            'player_x': 100.0 + i * 10,
+            'player_y': 200.0,
+            'player_rotation': 0.0,
+            'player_vx': 10.0,
+            'player_vy': 0.0,
+            'score': i * 10,
+            'lives': 3,
+            'level': 1,
+            'asteroids': [{'x': 300.0, 'y': 300.0, 'radius': 40}],
+        }, 1000.0 + i * 0.1)
+    recorder.stop_recording(200, 1)
+    recorder.metadata['duration'] = 2.0
+    return recorder.save_replay("export_test")
+
+
+def test_split_segments_covers_every_frame_in_order():
+    """Segments are contiguous and cover the whole timeline."""
+    segments = split_segments(10, 3)
+    assert segments == [(0, 4), (4, 8), (8, 10)]
+    assert split_segments(0, 4) == []
+    assert split_segments(2, 8) == [(0, 1), (1, 2)]
+
+
+def test_export_png_sequence(saved_replay, tmp_path):
+    """A single-worker export writes one numbered PNG per output frame."""
+    out_dir = tmp_path / "frames"
+    report = export_replay(saved_replay, output_dir=str(out_dir), fps=5, workers=1, scale=0.25)
+
+    files = sorted(os.listdir(out_dir))
+    assert report.frames == 11
+    assert len(files) == 11
+    assert files[0] == "frame_000000.png"
+    assert files[-1] == "frame_000010.png"
+    assert report.frames_per_second_per_core > 0
+
+    image = pygame.image.load(str(out_dir / files[0]))
+    assert image.get_size() == (320, 180)
+
+
+def test_export_with_process_pool(saved_replay, tmp_path):
+    """Multiple workers render the same frame set as a single worker."""
+    out_dir = tmp_path / "pool_frames"
+    report = export_replay(saved_replay, output_dir=str(out_dir), fps=5, workers=2, scale=0.1)
+
+    assert report.workers == 2
+    assert len(os.listdir(out_dir)) == report.frames == 11
+    starts = [segment.start_frame for segment in report.segments]
+    assert starts == sorted(starts)
+
+
+def test_export_missing_encoder_falls_back_to_png(saved_replay, tmp_path):
+    """Requesting a video without an encoder still produces frames."""
+    video = tmp_path / "run.mp4"
+    report = export_replay(
+        saved_replay, fps=2, workers=1, scale=0.1, video_path=str(video), encoder="definitely-not-an-encoder"
+    )
+    assert not video.exists()
+    assert report.output.endswith("run_frames")
+    assert len(os.listdir(report.output)) == report.frames
+
+
+def test_replay_is_decoded_once_per_process(saved_replay, tmp_path, monkeypatch):
+    """Segments reuse the decoded replay instead of loading the file again."""
+    from modul import replay_export
+    from modul.replay_system import ReplayPlayer
+
+    loads = []
+    original = ReplayPlayer.load_replay
+
+    def counting_load(self, path):
+        loads.append(path)
+        return original(self, path)
+
+    monkeypatch.setattr(replay_export, "_loaded_replay", None)
+    monkeypatch.setattr(ReplayPlayer, "load_replay", counting_load)
+    report = export_replay(saved_replay, output_dir=str(tmp_path / "once"), fps=5, workers=1, scale=0.1)
+    assert len(report.segments) > 1
+    assert loads == [saved_replay]
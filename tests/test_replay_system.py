@@ -2,6 +2,7 @@
 
 import json
 import os
+import threading
 from unittest.mock import MagicMock, patch
 
 import pygame
@@ -538,3 +539,251 @@ def test_replay_recorder_save_with_error_handling(tmp_path):
             os.chmod(invalid_dir, 0o755)
         except PermissionError:
             pass
+
+
+def test_replay_player_get_frame_at():
+    """Timestamp lookup returns the last frame at or before the time."""
+    player = ReplayPlayer()
+    player.frames = [
+        GameFrame(timestamp=t, player_pos=(0, 0), player_rotation=0,
+                  player_velocity=(0, 0), score=int(t * 10), lives=3, level=1)
+        for t in (0.0, 0.5, 1.0)
+    ]
+
+    assert player.get_frame_at(-1.0).timestamp == 0.0
+    assert player.get_frame_at(0.49).timestamp == 0.0
+    assert player.get_frame_at(0.5).timestamp == 0.5
+    assert player.get_frame_at(5.0).timestamp == 1.0
+    assert ReplayPlayer().get_frame_at(0.0) is None
+
+
+def test_replay_stream_reader_matches_full_load(tmp_path, monkeypatch):
+    """Streaming with a tiny buffer yields the same frames as a full load."""
+    from modul.replay_system import ReplayStreamReader
+
+    monkeypatch.chdir(tmp_path)
+    recorder = ReplayRecorder()
+    recorder.start_recording("hard", "tank")
+    recorder.start_time = 100.0
+    for i in range(30):
+        recorder.record_frame({
+            'player_x': 1.5 * i, 'player_y': 2.25, 'player_rotation': 90.0,
+            'player_vx': 0.0, 'player_vy': -1.0, 'score': 12345 * i,
+            'lives': 3, 'level': 1,
+            'asteroids': [{'x': 10.0, 'y': 20.0, 'radius': 40}],
+        }, 100.0 + i)
+    recorder.record_event("boss", {"hp": 3}, 101.0)
+    recorder.stop_recording(999, 1)
+    path = recorder.save_replay()
+
+    player = ReplayPlayer()
+    player.load_replay(path)
+
+    with ReplayStreamReader(path, chunk_size=7) as reader:
+        assert reader.metadata['difficulty'] == "hard"
+        frames = list(reader.iter_frames())
+        events = reader.read_section('events')
+
+    assert [GameFrame(**f) for f in frames] == player.frames
+    assert events[0]['event_type'] == "boss"
+
+
+def _record_short_replay(compression=None):
+    """Record a tiny replay using the given compression spec."""
+    recorder = ReplayRecorder(compression=compression)
+    recorder.start_recording("normal", "standard")
+    recorder.start_time = 50.0
+    for i in range(5):
+        recorder.record_frame({
+            'player_x': float(i), 'player_y': 0.0, 'player_rotation': 0.0,
+            'player_vx': 0.0, 'player_vy': 0.0, 'score': i,
+            'lives': 3, 'level': 1,
+        }, 50.0 + i)
+    recorder.stop_recording(4, 1)
+    return recorder
+
+
+@pytest.mark.parametrize("spec, extension, magic", [
+    ("none", ".json", b"{"),
+    ("gzip:1", ".json.gz", b"\x1f\x8b"),
+    ("bz2:9", ".json.bz2", b"BZh"),
+    ("lzma:0", ".json.xz", b"\xfd7zXZ\x00"),
+])
+def test_replay_codecs_round_trip(tmp_path, monkeypatch, spec, extension, magic):
+    """Each codec writes its own format and records itself in metadata."""
+    monkeypatch.chdir(tmp_path)
+    recorder = _record_short_replay(spec)
+    path = recorder.save_replay("codec_test")
+
+    assert path.endswith(extension)
+    with open(path, 'rb') as f:
+        assert f.read(len(magic)) == magic
+
+    player = ReplayPlayer()
+    player.load_replay(path)
+    assert [f.score for f in player.frames] == [0, 1, 2, 3, 4]
+    assert player.metadata['compression'] == spec.split(':')[0]
+
+
+def test_replay_codec_detected_by_magic_bytes(tmp_path, monkeypatch):
+    """Loading ignores a misleading extension and sniffs the content."""
+    monkeypatch.chdir(tmp_path)
+    path = _record_short_replay("lzma:1").save_replay("mislabelled")
+    renamed = os.path.join("replays", "mislabelled.json")
+    os.rename(path, renamed)
+
+    player = ReplayPlayer()
+    player.load_replay(renamed)
+    assert len(player.frames) == 5
+    assert player.metadata['compression_level'] == 1
+
+
+def test_replay_compression_from_settings(tmp_path, monkeypatch):
+    """The recorder falls back to the user's replay_compression setting."""
+    from modul import settings as settings_mod
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(settings_mod, "current_settings", MagicMock(replay_compression="bz2:3"))
+    path = _record_short_replay().save_replay()
+    assert path.endswith(".json.bz2")
+
+    monkeypatch.setattr(settings_mod, "current_settings", MagicMock(replay_compression="bogus"))
+    codec, level = ReplayRecorder()._resolve_codec()
+    assert (codec.name, level) == ("gzip", 6)
+
+    # A hand-edited settings file may hold any JSON value
+    for bad in (9, ["lzma"], {"codec": "bz2"}):
+        monkeypatch.setattr(settings_mod, "current_settings", MagicMock(replay_compression=bad))
+        codec, level = ReplayRecorder()._resolve_codec()
+        assert (codec.name, level) == ("gzip", 6)
+
+
+def test_replay_manager_lists_all_codecs(tmp_path, monkeypatch):
+    """Replays in every supported format are listed."""
+    monkeypatch.chdir(tmp_path)
+    for spec in ("none", "gzip", "bz2", "lzma"):
+        _record_short_replay(spec).save_replay(f"list_{spec}")
+
+    assert ReplayManager().get_replay_count() == 4
+
+
+def _save_scored_replay(name, score, start_time, frames=30):
+    """Save a replay with the given final score and start time."""
+    recorder = ReplayRecorder(compression="gzip:1")
+    recorder.start_recording("normal", "standard")
+    recorder.start_time = start_time
+    for i in range(frames):
+        recorder.record_frame({
+            'player_x': float(i), 'player_y': 0.0, 'player_rotation': 0.0,
+            'player_vx': 0.0, 'player_vy': 0.0, 'score': i,
+            'lives': 3, 'level': 1,
+        }, start_time + i * 0.05)
+    recorder.stop_recording(score, 1)
+    recorder.metadata['start_time'] = start_time
+    return recorder.save_replay(name)
+
+
+def test_replay_retention_dry_run_reports_prunes(tmp_path, monkeypatch):
+    """A dry run lists pruned files and bytes but leaves them on disk."""
+    from modul.replay_system import RetentionPolicy
+
+    monkeypatch.chdir(tmp_path)
+    paths = {score: _save_scored_replay(f"r{score}", score, 1000.0 + i)
+             for i, score in enumerate([500, 10, 20, 30, 40])}
+    policy = RetentionPolicy(max_count=3, max_bytes=0, keep_top=1, keep_recent=1)
+
+    plan = ReplayManager().enforce_retention(policy, dry_run=True)
+
+    # Best score (oldest) and newest are protected; the next oldest go
+    assert plan.prune == [paths[10], paths[20]]
+    assert plan.bytes_reclaimed == sum(os.path.getsize(paths[s]) for s in (10, 20))
+    assert sorted(plan.compact) == [paths[30]]
+    assert all(os.path.exists(p) for p in paths.values())
+    assert "prune 2" in plan.summary()
+
+
+def test_replay_retention_applies_and_compacts(tmp_path, monkeypatch):
+    """Enforcing prunes files and compacts older replays in place."""
+    from modul.replay_system import RetentionPolicy
+
+    monkeypatch.chdir(tmp_path)
+    old = _save_scored_replay("old", 5, 1000.0)
+    new = _save_scored_replay("new", 1, 2000.0)
+    policy = RetentionPolicy(max_count=0, max_bytes=0, keep_top=0, keep_recent=1,
+                             compact_frame_rate_hz=5.0, compact_compression="bz2:9")
+
+    plan = ReplayManager().enforce_retention(policy)
+
+    assert plan.compact == [old]
+    assert not os.path.exists(old)
+    compacted = old.replace(".json.gz", ".json.bz2")
+    player = ReplayPlayer()
+    player.load_replay(compacted)
+    assert player.metadata['compacted'] is True
+    assert player.metadata['compression'] == "bz2"
+    # 30 frames over 1.45s thinned to ~5 Hz, keeping the final frame
+    assert 7 <= len(player.frames) <= 9
+    gaps = [b.timestamp - a.timestamp for a, b in zip(player.frames, player.frames[1:-1])]
+    assert min(gaps) >= 0.2 - 1e-6
+    assert player.frames[-1].score == 29
+    assert os.path.exists(new)
+
+    # Compacted replays are left alone on the next pass
+    assert ReplayManager().plan_retention(policy).compact == []
+
+
+def test_replay_retention_async_runs_in_background(tmp_path, monkeypatch):
+    """The background task finishes and applies the policy."""
+    from modul.replay_system import RetentionPolicy
+
+    monkeypatch.chdir(tmp_path)
+    for i in range(3):
+        _save_scored_replay(f"bg{i}", i, 1000.0 + i)
+    thread = ReplayManager().enforce_retention_async(
+        RetentionPolicy(max_count=1, max_bytes=0, keep_top=0, keep_recent=1))
+    thread.join(timeout=10)
+
+    assert not thread.is_alive()
+    assert ReplayManager().get_replay_count() == 1
+
+
+@pytest.mark.parametrize("platform, calls", [("linux", 1), ("darwin", 0), ("freebsd14", 0)])
+def test_retention_priority_lowered_only_on_linux(monkeypatch, platform, calls):
+    """Thread ids are only passed to setpriority where they name a thread."""
+    from modul import replay_system
+
+    monkeypatch.setattr(replay_system.sys, "platform", platform)
+    with patch.object(replay_system.os, "setpriority", create=True) as setpriority:
+        replay_system._lower_thread_priority()
+    assert setpriority.call_count == calls
+
+
+def test_replay_retention_async_passes_never_overlap(monkeypatch):
+    """Requests during a running pass are queued into one follow-up pass."""
+    manager = ReplayManager()
+    started, release = threading.Event(), threading.Event()
+    running, passes = [], []
+
+    def slow_pass(policy=None, dry_run=False):
+        running.append(policy)
+        started.set()
+        assert len(running) == 1
+        release.wait(timeout=10)
+        passes.append(policy)
+        running.pop()
+
+    monkeypatch.setattr(manager, "enforce_retention", slow_pass)
+    first = manager.enforce_retention_async("a")
+    assert started.wait(timeout=10)
+    assert manager.enforce_retention_async("b") is first
+    assert manager.enforce_retention_async("c") is first
+    release.set()
+    first.join(timeout=10)
+
+    assert not first.is_alive()
+    assert passes == ["a", "c"]
+    # Once idle, the next request starts a fresh thread
+    second = manager.enforce_retention_async("d")
+    second.join(timeout=10)
+    assert second is not first
+    assert passes == ["a", "c", "d"]
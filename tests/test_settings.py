@@ -129,6 +129,21 @@ class TestSettings:
         assert settings2.fullscreen is True
         assert settings2.music_volume == 0.6
 
+    def test_replay_retention_settings_reach_policy(self, clean_settings_file):
+        """Test retention settings persist and configure the retention policy"""
+        from modul.replay_system import RetentionPolicy
+
+        settings1 = Settings()
+        settings1.replay_keep_top = 3
+        settings1.replay_compact_frame_rate_hz = 4
+        settings1.replay_compact_compression = "bz2:9"
+        settings1.save()
+
+        policy = RetentionPolicy.from_settings(Settings())
+        assert policy.keep_top == 3
+        assert policy.compact_frame_rate_hz == 4
+        assert policy.compact_compression == "bz2:9"
+
     def test_settings_save_error_handling(self, clean_settings_file, monkeypatch):
         """Test error handling during save"""
         settings = Settings()
@@ -6,7 +6,7 @@ import os
 import pygame
 import pytest
 
-from modul.ships import ShipManager, ShipRenderer
+from modul.ships import ShipManager, ShipRenderer, ShipSpriteCache
 
 
 @pytest.fixture(autouse=True)
@@ -369,3 +369,41 @@ class TestShipRenderer:
         screen = pygame.Surface((800, 600))
         ShipRenderer.draw_destroyer_ship(screen, 100, 100, 0, 1.0, (255, 0, 0))
         # Should not raise exception
+
+
+class TestShipSpriteCache:
+    def test_sprites_match_vector_drawing_at_bucket_angles(self):
+        """Cached ships look exactly like vector ships at cached angles"""
+        for shape in ("triangle", "arrow", "heavy", "destroyer"):
+            for angle in (0, 30, 90):
+                vector = pygame.Surface((200, 200))
+                ShipRenderer.draw_ship_vector(vector, 100, 100, angle, shape, 1.0, (0, 255, 0))
+                cached = pygame.Surface((200, 200))
+                ShipRenderer.draw_ship(cached, 100, 100, angle, shape, 1.0, (0, 255, 0))
+                assert pygame.image.tobytes(cached, "RGB") == pygame.image.tobytes(vector, "RGB")
+
+    def test_rotations_share_buckets_and_memory_is_reported(self):
+        """Nearby rotations reuse one sprite; stats count sprites and bytes"""
+        cache = ShipSpriteCache(angle_step=10)
+        screen = pygame.Surface((100, 100))
+        calls = []
+
+        def render(surface, x, y, rotation):
+            calls.append(rotation)
+            pygame.draw.circle(surface, (255, 255, 255), (x, y), 5)
+
+        for rotation in (0, 2, -3, 11, 364):
+            cache.draw(screen, 50, 50, rotation, "dot", 10, render)
+        assert calls == [0, 10]
+        stats = cache.stats()
+        assert stats["sprites"] == 2
+        assert stats["bytes"] == 2 * 20 * 20 * 4
+        assert stats["hit_rate"] == pytest.approx(3 / 5)
+
+    def test_disabled_cache_draws_vectors(self):
+        """With the cache disabled every ship is drawn with its exact rotation"""
+        cache = ShipSpriteCache(enabled=False)
+        calls = []
+        cache.draw(pygame.Surface((10, 10)), 5, 5, 33.3, "look", 4, lambda *args: calls.append(args[1:]))
+        assert calls == [(5, 5, 33.3)]
+        assert cache.stats()["sprites"] == 0
@@ -0,0 +1,112 @@
+"""Tests for the headless gameplay simulation."""
+
+import pygame
+import pytest
+
+from modul.asteroid import Asteroid
+from modul.boss import Boss
+from modul.bossprojectile import BossProjectile
+from modul.constants import BOSS_LEVEL_INTERVAL, POINTS_PER_LEVEL, SCREEN_WIDTH
+from modul.particle import Particle
+from modul.player import Player
+from modul.powerup import PowerUp
+from modul.shot import Shot
+from modul.simulation import (GameWorld, advance_level, asteroid_score,
+                              boss_attack_projectiles, collide_asteroids,
+                              resolve_asteroid_collisions, wrap_positions)
+
+
+@pytest.fixture(autouse=True)
+def init_pygame(monkeypatch):
+    """Initialize pygame and restore class-level containers after each test"""
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    for cls in (Asteroid, Shot, Particle, PowerUp, Player, Boss, BossProjectile):
+        monkeypatch.setattr(cls, "containers", getattr(cls, "containers", ()), raising=False)
+    monkeypatch.setattr(Shot, "asteroids_group", Shot.asteroids_group)
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def test_world_steps_with_scripted_input():
+    """Held actions drive the player and shots land in the world groups."""
+    world = GameWorld(seed=1)
+    world.set_actions({"thrust": True, "shoot": True})
+    for _ in range(30):
+        world.step()
+
+    assert world.tick == 30
+    assert world.time == pytest.approx(30 * world.dt)
+    assert world.player.position.y < world.player.radius + 360
+    assert len(world.shots) > 0
+    assert world.player in world.updatable
+
+
+def test_world_game_over_stops_stepping():
+    """Losing the last life ends the run and further steps do nothing."""
+    world = GameWorld(seed=2)
+    world.lives = 1
+    asteroid = Asteroid(world.player.position.x, world.player.position.y, 40)
+    asteroid.velocity = pygame.Vector2(0, 0)
+
+    events = world.step()
+
+    assert world.game_over
+    assert [e.kind for e in events][-1] == "game_over"
+    assert world.step() == []
+
+
+def test_shared_physics_helpers():
+    """Overlapping asteroids separate and objects wrap or die at edges."""
+    a = Asteroid(100, 100, 40)
+    b = Asteroid(120, 100, 40)
+    a.velocity, b.velocity = pygame.Vector2(1, 0), pygame.Vector2(-1, 0)
+    resolve_asteroid_collisions([a, b])
+    assert b.position.x - a.position.x == pytest.approx(80)
+    assert a.velocity.x == -1
+
+    shot = Shot(-5, 10)
+    group = pygame.sprite.Group(shot, a)
+    a.position.x = SCREEN_WIDTH + 1
+    wrap_positions(group)
+    assert not shot.alive()
+    assert a.position.x == 0
+
+    assert asteroid_score(Asteroid(0, 0, 10)) >= asteroid_score(Asteroid(0, 0, 60))
+
+
+def test_step_phases_report_outcomes_to_the_caller():
+    """Phases call back for player hits and return events for the rest."""
+    world = GameWorld(seed=3)
+    player = world.player
+    player.invincible = False
+    for _ in range(2):
+        Asteroid(player.position.x, player.position.y, 40).velocity = pygame.Vector2(0, 0)
+    target = Asteroid(100, 100, 40)
+    Shot(100, 100)
+
+    hits = []
+    events = collide_asteroids(world.asteroids, world.shots, world.powerups, player, lambda: hits.append(1))
+    assert len(hits) == 2
+    assert [e.kind for e in events] == ["asteroid_destroyed"]
+    assert events[0].data["points"] == asteroid_score(target)
+
+    world.lives = 1
+    world.step()
+    assert world.lives == 0 and world.game_over
+
+    score = POINTS_PER_LEVEL * (BOSS_LEVEL_INTERVAL - 1)
+    events = advance_level(score, 1, world.asteroids, world.asteroid_field)
+    assert [e.kind for e in events] == ["boss_spawned", "level_up"]
+    assert isinstance(events[0].data["boss"], Boss)
+    assert advance_level(score, BOSS_LEVEL_INTERVAL, world.asteroids, world.asteroid_field) == []
+
+
+def test_boss_attack_reports_projectile_count():
+    """Each attack pattern returns how many projectiles it spawned."""
+    GameWorld(seed=4)
+    boss = Boss(10)
+    assert boss_attack_projectiles(boss, {"type": "circle", "count": 8}, None, 0) == 8
+    assert boss_attack_projectiles(boss, {"type": "targeted", "count": 3}, pygame.Vector2(0, 0), 0) == 3
+    assert boss_attack_projectiles(boss, {"type": "targeted", "count": 3}, None, 0) == 0
@@ -0,0 +1,99 @@
+"""Tests for binary world snapshots."""
+
+import pygame
+import pytest
+
+import modul.constants as C
+from modul.asteroid import Asteroid
+from modul.boss import Boss
+from modul.bossprojectile import BossProjectile
+from modul.determinism import hash_state, quantize_world, scripted_actions
+from modul.particle import Particle
+from modul.player import Player
+from modul.powerup import PowerUp
+from modul.shot import Shot
+from modul.simulation import GameWorld
+from modul.snapshot import SnapshotError
+
+
+@pytest.fixture(autouse=True)
+def init_pygame(monkeypatch):
+    """Initialize pygame and restore class-level containers after each test"""
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    for cls in (Asteroid, Shot, Particle, PowerUp, Player, Boss, BossProjectile):
+        monkeypatch.setattr(cls, "containers", getattr(cls, "containers", ()), raising=False)
+    monkeypatch.setattr(Shot, "asteroids_group", Shot.asteroids_group)
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def _run(world, actions):
+    """Step `world` through `actions` and return the per-tick hashes."""
+    hashes = []
+    for action in actions:
+        world.set_actions(action)
+        world.step()
+        hashes.append(hash_state(quantize_world(world)))
+    return hashes
+
+
+def _busy_world():
+    """Return a world with every entity kind alive."""
+    world = GameWorld(seed=5)
+    pilot = scripted_actions(5)
+    _run(world, [next(pilot) for _ in range(300)])
+    world.player.weapons[C.WEAPON_MISSILE] = 10
+    world.player.current_weapon = C.WEAPON_MISSILE
+    world.player.activate_powerup("shield")
+    PowerUp(100, 100, "rapid_fire")
+    world.boss = Boss(10)
+    world.boss.position = world.player.position + pygame.Vector2(300, 0)
+    world.boss_active = True
+    BossProjectile(200, 200, pygame.Vector2(50, 0), "homing")
+    world.player.shoot_timer = 0
+    world.set_actions({"shoot": True, "rotate_left": True})
+    world.step()
+    return world, pilot
+
+
+def test_restored_world_steps_identically():
+    """Stepping after restore reproduces the original ticks exactly."""
+    world, pilot = _busy_world()
+    assert any(shot.shot_type == C.WEAPON_MISSILE for shot in world.shots)
+    blob = world.snapshot()
+    actions = [next(pilot) for _ in range(300)]
+
+    expected = _run(world, actions)
+    world.restore(blob)
+    assert _run(world, actions) == expected
+
+
+def test_snapshot_restores_into_another_world():
+    """A blob fully defines the state, independent of the target world."""
+    world, pilot = _busy_world()
+    blob = world.snapshot()
+    world_weapons = dict(world.player.weapons)
+    actions = [next(pilot) for _ in range(120)]
+    expected = _run(world, actions)
+
+    other = GameWorld(difficulty="normal", seed=99)
+    other.restore(blob)
+    assert other.snapshot() == blob
+    assert other.player.shield_active
+    assert other.player.weapons == world_weapons
+    assert other.boss is not None and other.boss_active
+    assert not other.particles
+    assert _run(other, actions) == expected
+
+
+def test_invalid_blob_is_rejected():
+    """Foreign or truncated data raises SnapshotError and leaves the world alone."""
+    world = GameWorld(seed=1)
+    world.step()
+    with pytest.raises(SnapshotError):
+        world.restore(b"nope")
+    with pytest.raises(SnapshotError):
+        world.restore(b"XXXX" + world.snapshot()[4:])
+    assert world.player in world.updatable
@@ -0,0 +1,86 @@
+"""Tests for batched particle and shot drawing."""
+
+import pygame
+import pytest
+
+import modul.constants as C
+from modul.asteroid import Asteroid
+from modul.particle import Particle
+from modul.shot import Shot
+from modul.sprite_batch import SpriteBatch
+
+
+@pytest.fixture(autouse=True)
+def init_pygame(monkeypatch):
+    """Initialize pygame and keep sprites out of shared groups"""
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    for cls in (Asteroid, Particle, Shot):
+        monkeypatch.setattr(cls, "containers", (), raising=False)
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def _pixels(surface):
+    return pygame.image.tobytes(surface, "RGB")
+
+
+def _draw_both(sprite):
+    """Draw `sprite` per object and batched; return both surfaces."""
+    direct = pygame.Surface((200, 200))
+    sprite.draw(direct)
+    batched = pygame.Surface((200, 200))
+    SpriteBatch().draw(batched, [sprite])
+    return direct, batched
+
+
+def test_opaque_particles_and_shots_match_per_object_drawing():
+    particle = Particle(50, 60, "yellow")
+    particle.size = 3
+    shot = Shot(120, 80, C.WEAPON_SHOTGUN)
+    for sprite in (particle, shot):
+        direct, batched = _draw_both(sprite)
+        assert _pixels(batched) == _pixels(direct)
+
+
+def test_particles_fade_through_prefaded_sprites():
+    batch = SpriteBatch()
+    particle = Particle(50, 50, (255, 255, 255))
+    screen = pygame.Surface((100, 100))
+
+    particle.alpha = 64
+    batch.draw(screen, [particle])
+    faded = screen.get_at((50, 50))
+    assert 0 < faded.r < 128
+
+    screen.fill((0, 0, 0))
+    particle.alpha = 0
+    batch.draw(screen, [particle])
+    assert screen.get_at((50, 50)) == pygame.Color(0, 0, 0)
+
+
+def test_lasers_point_along_their_velocity():
+    shot = Shot(100, 100, C.WEAPON_LASER)
+    shot.velocity = pygame.Vector2(0, -500)
+    _, batched = _draw_both(shot)
+    assert batched.get_at((100, 85)) != pygame.Color(0, 0, 0)
+    assert batched.get_at((100, 115)) == pygame.Color(0, 0, 0)
+
+
+def test_other_sprites_draw_themselves_and_sprites_are_cached():
+    batch = SpriteBatch()
+    screen = pygame.Surface((C.SCREEN_WIDTH, C.SCREEN_HEIGHT))
+    asteroid = Asteroid(300, 300, 40)
+    sprites = [asteroid] + [Particle(100 + i, 100, "red") for i in range(50)]
+    batch.draw(screen, sprites)
+    outline = pygame.Surface(screen.get_size())
+    asteroid.draw(outline)
+    mask = pygame.mask.from_threshold(outline, (0, 0, 0), (1, 1, 1, 255))
+    mask.invert()
+    drawn = pygame.mask.from_threshold(screen, (0, 0, 0), (1, 1, 1, 255))
+    drawn.invert()
+    assert mask.count() > 0
+    assert mask.overlap_area(drawn, (0, 0)) == mask.count()
+    cached = batch.cache_size()
+    batch.draw(screen, sprites)
+    assert batch.cache_size() == cached == 1
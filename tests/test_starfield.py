@@ -1,9 +1,13 @@
 import pygame
 import pytest
 
-from modul.constants import STAR_COUNT
+from modul import starfield as starfield_module
+import modul.constants as C
+from modul.constants import STAR_COUNT, STAR_SIZES
 from modul.starfield import MenuStarfield, Star, Starfield
 
+np = pytest.importorskip("numpy")
+
 
 @pytest.fixture(autouse=True)
 def init_pygame(monkeypatch):
@@ -56,13 +60,9 @@ class TestStarfield:
     def test_starfield_initialization(self):
         """Test Starfield initialization"""
         starfield = Starfield()
-        assert len(starfield.stars) == STAR_COUNT
-
-    def test_starfield_all_stars_initialized(self):
-        """Test all stars are Star instances"""
-        starfield = Starfield()
-        for star in starfield.stars:
-            assert isinstance(star, Star)
+        assert len(starfield) == STAR_COUNT
+        assert starfield.positions.shape == (STAR_COUNT, 2)
+        assert set(np.unique(starfield.sizes)) <= set(STAR_SIZES)
 
     def test_starfield_update(self):
         """Test Starfield update"""
@@ -79,12 +79,32 @@ class TestStarfield:
     def test_starfield_stars_update(self):
         """Test that all stars are updated"""
         starfield = Starfield()
-        initial_timers = [star.twinkle_timer for star in starfield.stars]
+        initial_brightness = starfield.brightness.copy()
         starfield.update(0.1)
-        updated_timers = [star.twinkle_timer for star in starfield.stars]
+        assert not np.array_equal(initial_brightness, starfield.brightness)
+
+    @pytest.mark.parametrize("depth", [32, 24, 16])
+    def test_starfield_draw_matches_per_star_circles(self, depth):
+        """Vectorized drawing produces the same pixels as one circle per star"""
+        starfield = Starfield(count=300)
+        starfield.update(0.7)
+        screen = pygame.Surface((800, 600), 0, depth)
+        starfield.draw(screen)
 
-        # All timers should have changed
-        assert initial_timers != updated_timers
+        expected = pygame.Surface((800, 600), 0, depth)
+        colors = (starfield.base_colors * starfield.brightness[:, None]).astype(np.uint8)
+        for position, size, color in zip(starfield.positions.tolist(), starfield.sizes.tolist(), colors.tolist()):
+            pygame.draw.circle(expected, color, position, size)
+        assert pygame.image.tobytes(screen, "RGB") == pygame.image.tobytes(expected, "RGB")
+
+    def test_starfield_without_numpy(self, monkeypatch):
+        """Without numpy the field keeps one Star object per star"""
+        monkeypatch.setattr(starfield_module, "np", None)
+        starfield = Starfield(count=20)
+        assert len(starfield) == 20
+        assert all(isinstance(star, Star) for star in starfield.stars)
+        starfield.update(0.1)
+        starfield.draw(pygame.Surface((800, 600)))
 
 
 class TestMenuStarfield:
@@ -106,7 +126,7 @@ class TestMenuStarfield:
             assert len(star) == 4  # [x, y, z, brightness]
             assert isinstance(star[0], (int, float))  # x
             assert isinstance(star[1], (int, float))  # y
-            assert isinstance(star[2], int)  # z
+            assert star[2] == int(star[2])  # z
             assert isinstance(star[3], (int, float))  # brightness
 
     def test_menustarfield_update(self):
@@ -125,13 +145,23 @@ class TestMenuStarfield:
         screen = pygame.Surface((800, 600))
         starfield.draw(screen)  # Should not raise exception
 
-    def test_menustarfield_respawn_delay(self):
-        """Test respawn delay mechanism"""
-        starfield = MenuStarfield(num_stars=10)
-        # Initial delay is 0, after update it might reset to max
-        starfield.update(0.1)
-        # Just verify the mechanism works without crashes
-        assert starfield.respawn_delay_max == 0.2
+    def test_menustarfield_respawns_all_leaving_stars(self):
+        """Every star that leaves the screen respawns near the center at once"""
+        starfield = MenuStarfield(num_stars=100)
+        starfield.stars[:50, 0] = -100
+        starfield.update(0.016)
+        center = np.array([C.SCREEN_WIDTH / 2, C.SCREEN_HEIGHT / 2])
+        distances = np.hypot(*(starfield.stars[:50, :2] - center).T)
+        assert distances.max() < 16
+
+    def test_menustarfield_density_is_steady(self):
+        """The field does not thin out over time"""
+        starfield = MenuStarfield(num_stars=500)
+        for _ in range(600):
+            starfield.update(1 / 60)
+        x, y = starfield.stars[:, 0], starfield.stars[:, 1]
+        on_screen = (x >= 0) & (x < C.SCREEN_WIDTH) & (y >= 0) & (y < C.SCREEN_HEIGHT)
+        assert on_screen.sum() > 400
 
     def test_menustarfield_star_respawn(self):
         """Test star respawning when out of bounds"""
@@ -172,17 +202,27 @@ class TestMenuStarfield:
         delta2 = abs(starfield2.stars[0][0] - initial_pos2)
         assert delta2 >= delta1
 
-    def test_menustarfield_draw_with_faulty_stars(self):
-        """Test drawing handles faulty star data gracefully"""
-        starfield = MenuStarfield(num_stars=5)
+    def test_menustarfield_draw_matches_per_star_circles(self, monkeypatch):
+        """Batched drawing produces the same pixels as one circle per star"""
+        starfield = MenuStarfield(num_stars=400)
+        for _ in range(30):
+            starfield.update(1 / 60)
+        screen = pygame.Surface((C.SCREEN_WIDTH, C.SCREEN_HEIGHT))
+        starfield.draw(screen)
 
-        # Add some faulty data
-        starfield.stars.append([None, None, 1, 100])
-        starfield.stars.append([100, 100])  # Missing fields
+        expected = pygame.Surface((C.SCREEN_WIDTH, C.SCREEN_HEIGHT))
+        monkeypatch.setattr(starfield_module, "np", None)
+        starfield.draw(expected)
+        assert pygame.image.tobytes(screen, "RGB") == pygame.image.tobytes(expected, "RGB")
 
-        screen = pygame.Surface((800, 600))
-        # Should not crash
-        starfield.draw(screen)
+    def test_menustarfield_without_numpy(self, monkeypatch):
+        """Without numpy the stars are plain lists and still respawn"""
+        monkeypatch.setattr(starfield_module, "np", None)
+        starfield = MenuStarfield(num_stars=5)
+        starfield.stars[0][0] = -100
+        starfield.update(0.016)
+        assert abs(starfield.stars[0][0] - C.SCREEN_WIDTH / 2) < 16
+        starfield.draw(pygame.Surface((800, 600)))
 
     def test_menustarfield_z_depth_variation(self):
         """Test that stars have varying z depths"""
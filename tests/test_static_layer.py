@@ -0,0 +1,56 @@
+"""Tests for pre-rendered static screen layers."""
+
+import pygame
+import pytest
+
+from modul.static_layer import StaticLayer
+
+
+@pytest.fixture(autouse=True)
+def init_pygame(monkeypatch):
+    """Initialize pygame for each test"""
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def _square(color):
+    surface = pygame.Surface((4, 4))
+    surface.fill(color)
+    return surface
+
+
+def test_layer_renders_once_per_key():
+    calls = []
+
+    def render(layer):
+        calls.append(1)
+        layer.blit(_square((255, 0, 0)), (2, 3))
+        layer.blit(_square((0, 255, 0)), pygame.Rect(10, 3, 4, 4))
+
+    layer = StaticLayer(render)
+    screen = pygame.Surface((20, 20))
+    for _ in range(3):
+        layer.draw(screen, "en")
+    assert len(calls) == layer.renders == 1
+    assert screen.get_at((3, 4)) == pygame.Color(255, 0, 0)
+    assert screen.get_at((11, 4)) == pygame.Color(0, 255, 0)
+
+    layer.draw(screen, "de")
+    layer.invalidate()
+    layer.draw(screen, "de")
+    assert len(calls) == 3
+
+
+def test_layer_offset_and_alpha():
+    layer = StaticLayer(lambda layer: layer.blit(_square((200, 200, 200)), (0, 0)))
+    screen = pygame.Surface((20, 20))
+    layer.draw(screen, None, offset=(5.7, 6), alpha=128)
+    assert screen.get_at((4, 6)) == pygame.Color(0, 0, 0)
+    faded = screen.get_at((5, 6))
+    assert 90 < faded.r < 110
+
+    layer.draw(screen, None)
+    assert screen.get_at((0, 0)) == pygame.Color(200, 200, 200)
+
@@ -111,6 +111,31 @@ def test_stats_dashboard_with_no_games(session_stats):
     assert True
 
 
+def test_stats_dashboard_renders_layer_only_on_data_change(session_stats):
+    """Static content is rendered once and again only when the stats change."""
+    screen = pygame.Surface((1280, 720))
+    dashboard = StatsDashboard(session_stats)
+    for _ in range(3):
+        dashboard.draw(screen)
+    assert dashboard._layer.renders == 1
+
+    session_stats.total_bosses_defeated += 1
+    dashboard.draw(screen)
+    assert dashboard._layer.renders == 2
+
+
+def test_stats_dashboard_bars_cached_per_filled_width(session_stats):
+    """Bars with the same size, colours and filled width share one surface."""
+    dashboard = StatsDashboard(session_stats)
+    colors = ((255, 100, 100), (255, 215, 0))
+    first = dashboard._bar_surface(400, 30, 200, *colors)
+    assert dashboard._bar_surface(400, 30, 200, *colors) is first
+    assert dashboard._bar_surface(400, 30, 201, *colors) is not first
+    # The fill colour moves from the start towards the end colour
+    assert first.get_at((100, 15)) == pygame.Color(255, 157, 50)
+    assert first.get_at((300, 15)) == pygame.Color(50, 50, 50)
+
+
 def test_stats_dashboard_get_summary(session_stats):
     """Test that stats summary has all required fields."""
     summary = session_stats.get_summary()